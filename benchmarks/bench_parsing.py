@@ -0,0 +1,159 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark comparing the message command tokenizer against the old shlex based tokenizer.
+
+Run with `python benchmarks/bench_parsing.py` with Tanjun installed.
+"""
+from __future__ import annotations
+
+import shlex
+import timeit
+import typing
+
+from tanjun import parsing
+
+_NUMBER = 2_000
+_REPEAT = 5
+
+_INPUTS: dict[str, str] = {
+    "short": "123 meow",
+    "options": 'meow --name "nyaa nyaa" -f --colour red echo --count 5',
+    "quoted": " ".join(f'"quoted \\"argument\\" {index}"' for index in range(20)),
+    "long greedy": " ".join(f"word{index}" for index in range(500)),
+    "long multi": " ".join(f"{index} --opt {index}" for index in range(250)),
+}
+
+
+class _LegacyShlexTokenizer:
+    """The shlex based tokenizer which [tanjun.parsing][] used to use."""
+
+    __slots__ = ("__arg_buffer", "__last_name", "__options_buffer", "__shlex")
+
+    def __init__(self, content: str, /) -> None:
+        self.__arg_buffer: list[str] = []
+        self.__last_name: str | None = None
+        self.__options_buffer: list[tuple[str, str | None]] = []
+        self.__shlex = shlex.shlex(content, posix=True)
+        self.__shlex.commenters = ""
+        self.__shlex.quotes = '"'
+        self.__shlex.whitespace = " "
+        self.__shlex.whitespace_split = True
+
+    def collect_raw_options(self) -> dict[str, list[str | None]]:
+        results: dict[str, list[str | None]] = {}
+
+        while (option := self.next_raw_option()) is not None:
+            name, value = option
+
+            if name not in results:
+                results[name] = []
+
+            results[name].append(value)
+
+        return results
+
+    def iter_raw_arguments(self) -> typing.Iterator[str]:
+        while (argument := self.next_raw_argument()) is not None:
+            yield argument
+
+    def next_raw_argument(self) -> str | None:
+        if self.__arg_buffer:
+            return self.__arg_buffer.pop(0)
+
+        while (value := self.__seek_shlex()) and value[0] == 1:
+            self.__options_buffer.append(value[1])
+
+        return value[1] if value else None
+
+    def next_raw_option(self) -> tuple[str, str | None] | None:
+        if self.__options_buffer:
+            return self.__options_buffer.pop(0)
+
+        while (value := self.__seek_shlex()) and value[0] == 0:
+            self.__arg_buffer.append(value[1])
+
+        return value[1] if value else None
+
+    def __seek_shlex(self) -> tuple[typing.Literal[0], str] | tuple[typing.Literal[1], tuple[str, str | None]] | None:
+        option_name = self.__last_name
+
+        try:
+            value = next(self.__shlex)
+
+        except StopIteration:
+            if option_name is not None:
+                self.__last_name = None
+                return (1, (option_name, None))
+
+            return None
+
+        is_option = value.startswith("-")
+        if is_option and option_name is not None:
+            self.__last_name = value
+            return (1, (option_name, None))
+
+        if is_option:
+            self.__last_name = value
+            return self.__seek_shlex()
+
+        if option_name:
+            self.__last_name = None
+            return (1, (option_name, value))
+
+        return (0, value)
+
+
+def _legacy_tokens(content: str, /) -> list[typing.Any]:
+    tokenizer = _LegacyShlexTokenizer(content)
+    return [*tokenizer.collect_raw_options().items(), *tokenizer.iter_raw_arguments()]
+
+
+def _tokenizer_tokens(content: str, /) -> list[typing.Any]:
+    tokenizer = parsing._ShlexTokenizer(content)
+    return [*tokenizer.collect_raw_options().items(), *tokenizer.iter_raw_arguments()]
+
+
+def _time(callback: typing.Callable[[str], typing.Any], content: str, /) -> float:
+    return min(timeit.repeat(lambda: callback(content), number=_NUMBER, repeat=_REPEAT)) / _NUMBER
+
+
+def main() -> None:
+    print(f"{'input':<12} {'shlex (us)':>12} {'tokenizer (us)':>16} {'speedup':>9}")
+    for name, content in _INPUTS.items():
+        assert _legacy_tokens(content) == _tokenizer_tokens(content)
+        shlex_time = _time(_legacy_tokens, content)
+        tokenizer_time = _time(_tokenizer_tokens, content)
+        print(
+            f"{name:<12} {shlex_time * 1e6:>12.2f} {tokenizer_time * 1e6:>16.2f} {shlex_time / tokenizer_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
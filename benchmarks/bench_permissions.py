@@ -0,0 +1,169 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark comparing the bulk permission calculators against calling calculate_permissions in a loop.
+
+Run with `python benchmarks/bench_permissions.py` with Tanjun installed.
+"""
+from __future__ import annotations
+
+import timeit
+import typing
+
+import hikari
+
+from tanjun import permissions
+
+_NUMBER = 20
+_REPEAT = 5
+_GUILD_ID = hikari.Snowflake(1)
+_ROLE_COUNT = 50
+
+
+class _Role:
+    __slots__ = ("id", "permissions")
+
+    def __init__(self, id_: int, permissions_: hikari.Permissions, /) -> None:
+        self.id = hikari.Snowflake(id_)
+        self.permissions = permissions_
+
+
+class _User:
+    __slots__ = ("id",)
+
+    def __init__(self, id_: int, /) -> None:
+        self.id = hikari.Snowflake(id_)
+
+
+class _Member:
+    __slots__ = ("guild_id", "role_ids", "user")
+
+    def __init__(self, user_id: int, role_ids: list[hikari.Snowflake], /) -> None:
+        self.guild_id = _GUILD_ID
+        self.role_ids = role_ids
+        self.user = _User(user_id)
+
+
+class _Guild:
+    __slots__ = ("id", "owner_id")
+
+    def __init__(self) -> None:
+        self.id = _GUILD_ID
+        self.owner_id = hikari.Snowflake(2)
+
+
+class _Channel:
+    __slots__ = ("guild_id", "id", "permission_overwrites")
+
+    def __init__(self, id_: int, overwrites: dict[hikari.Snowflake, hikari.PermissionOverwrite], /) -> None:
+        self.guild_id = _GUILD_ID
+        self.id = hikari.Snowflake(id_)
+        self.permission_overwrites = overwrites
+
+
+def _overwrite(id_: int, /) -> hikari.PermissionOverwrite:
+    return hikari.PermissionOverwrite(
+        id=hikari.Snowflake(id_),
+        type=hikari.PermissionOverwriteType.ROLE,
+        allow=hikari.Permissions.SEND_MESSAGES,
+        deny=hikari.Permissions.ADD_REACTIONS,
+    )
+
+
+_ROLES: dict[hikari.Snowflake, typing.Any] = {
+    _GUILD_ID: _Role(_GUILD_ID, hikari.Permissions.VIEW_CHANNEL),
+    **{hikari.Snowflake(id_): _Role(id_, hikari.Permissions.ADD_REACTIONS) for id_ in range(100, 100 + _ROLE_COUNT)},
+}
+
+
+def _make_channels(count: int, /) -> list[typing.Any]:
+    return [
+        _Channel(id_, {overwrite.id: overwrite for overwrite in map(_overwrite, (1, 100 + id_ % _ROLE_COUNT))})
+        for id_ in range(1000, 1000 + count)
+    ]
+
+
+def _make_members(count: int, /) -> list[typing.Any]:
+    # Members are spread over a limited set of role combinations like they would be in a real guild.
+    return [
+        _Member(id_, [hikari.Snowflake(100 + (id_ + offset) % _ROLE_COUNT) for offset in range(id_ % 5)])
+        for id_ in range(10_000, 10_000 + count)
+    ]
+
+
+def _time(callback: typing.Callable[[], typing.Any], /) -> float:
+    return min(timeit.repeat(callback, number=_NUMBER, repeat=_REPEAT)) / _NUMBER
+
+
+def _print_row(name: str, count: int, loop_time: float, bulk_time: float, /) -> None:
+    print(f"{name:<8} {count:<6} {loop_time * 1e6:>12.2f} {bulk_time * 1e6:>12.2f} {loop_time / bulk_time:>8.1f}x")
+
+
+def main() -> None:
+    guild: typing.Any = _Guild()
+    print(f"{'scaling':<8} {'count':<6} {'loop (us)':>12} {'bulk (us)':>12} {'speedup':>9}")
+    member = _make_members(4)[-1]
+    for count in (10, 100, 500, 1000):
+        channels = _make_channels(count)
+        assert permissions.calculate_permissions_for_channels(member, guild, _ROLES, channels) == {
+            channel.id: permissions.calculate_permissions(member, guild, _ROLES, channel=channel)
+            for channel in channels
+        }
+        loop_time = _time(
+            lambda: {
+                channel.id: permissions.calculate_permissions(member, guild, _ROLES, channel=channel)
+                for channel in channels  # noqa: B023
+            }
+        )
+        bulk_time = _time(
+            lambda: permissions.calculate_permissions_for_channels(member, guild, _ROLES, channels)  # noqa: B023
+        )
+        _print_row("channels", count, loop_time, bulk_time)
+
+    channel = _make_channels(1)[0]
+    for count in (10, 100, 1000, 10_000):
+        members = _make_members(count)
+        assert permissions.calculate_permissions_for_members(members, guild, _ROLES, channel=channel) == {
+            member.user.id: permissions.calculate_permissions(member, guild, _ROLES, channel=channel)
+            for member in members
+        }
+        loop_time = _time(
+            lambda: {
+                member.user.id: permissions.calculate_permissions(member, guild, _ROLES, channel=channel)
+                for member in members  # noqa: B023
+            }
+        )
+        bulk_time = _time(
+            lambda: permissions.calculate_permissions_for_members(members, guild, _ROLES, channel=channel)  # noqa: B023
+        )
+        _print_row("members", count, loop_time, bulk_time)
+
+
+if __name__ == "__main__":
+    main()
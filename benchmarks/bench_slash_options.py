@@ -0,0 +1,172 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark comparing slash command option processing against the old per-invocation type dispatch.
+
+Run with `python benchmarks/bench_slash_options.py` with Tanjun installed.
+"""
+from __future__ import annotations
+
+import timeit
+import typing
+
+import hikari
+
+import tanjun
+from tanjun.commands import slash
+
+_NUMBER = 20_000
+_REPEAT = 5
+
+
+class _Option:
+    __slots__ = ("type", "value")
+
+    def __init__(self, type_: hikari.OptionType, value: typing.Any, /) -> None:
+        self.type = type_
+        self.value = value
+
+    def resolve_to_attachment(self) -> typing.Any:
+        return self.value
+
+    def resolve_to_channel(self) -> typing.Any:
+        return self.value
+
+    def resolve_to_member(self, *, default: typing.Any) -> typing.Any:  # noqa: ARG002
+        return self.value
+
+    def resolve_to_mentionable(self) -> typing.Any:
+        return self.value
+
+    def resolve_to_role(self) -> typing.Any:
+        return self.value
+
+    def resolve_to_user(self) -> typing.Any:
+        return self.value
+
+
+class _Context:
+    __slots__ = ("options",)
+
+    def __init__(self, options: dict[str, _Option], /) -> None:
+        self.options = options
+
+
+def _legacy_collect(command: tanjun.SlashCommand[typing.Any], ctx: typing.Any, /) -> dict[str, typing.Any]:
+    """Process the options using the if/elif chain which `SlashCommand._process_args` used to use."""
+    keyword_args: dict[str, typing.Any] = {}
+    for tracked_option in command._tracked_options.values():
+        if not (option := ctx.options.get(tracked_option.name)):
+            if tracked_option.default is tanjun.abc.NO_DEFAULT:
+                raise RuntimeError
+
+            if tracked_option.default is not tanjun.abc.NO_PASS:
+                keyword_args[tracked_option.key] = tracked_option.default
+
+        elif option.type is hikari.OptionType.USER:
+            member: typing.Any = None
+            if tracked_option.is_only_member and not (member := option.resolve_to_member(default=None)):
+                raise tanjun.ConversionError(tracked_option.name, tracked_option.name)
+
+            keyword_args[tracked_option.key] = member or option.resolve_to_user()
+
+        elif option.type is hikari.OptionType.CHANNEL:
+            keyword_args[tracked_option.key] = option.resolve_to_channel()
+
+        elif option.type is hikari.OptionType.ROLE:
+            keyword_args[tracked_option.key] = option.resolve_to_role()
+
+        elif option.type is hikari.OptionType.MENTIONABLE:
+            keyword_args[tracked_option.key] = option.resolve_to_mentionable()
+
+        elif option.type is hikari.OptionType.ATTACHMENT:
+            keyword_args[tracked_option.key] = option.resolve_to_attachment()
+
+        else:
+            value = option.value
+            if tracked_option.type is hikari.OptionType.FLOAT and tracked_option.is_always_float:
+                value = float(value)
+
+            keyword_args[tracked_option.key] = value
+
+    return keyword_args
+
+
+def _collect(command: tanjun.SlashCommand[typing.Any], ctx: typing.Any, /) -> dict[str, typing.Any]:
+    keyword_args: dict[str, typing.Any] = {}
+    command._collect_args(ctx, keyword_args, [])
+    return keyword_args
+
+
+async def _callback(ctx: tanjun.abc.SlashContext, **kwargs: typing.Any) -> None: ...
+
+
+def _make_command(count: int, /) -> tuple[slash.SlashCommand[typing.Any], _Context]:
+    command = slash.SlashCommand[typing.Any](_callback, "name", "description", validate_arg_keys=False)
+    options: dict[str, _Option] = {}
+    adders = [
+        (command.add_str_option, hikari.OptionType.STRING, "value"),
+        (command.add_int_option, hikari.OptionType.INTEGER, 1),
+        (command.add_float_option, hikari.OptionType.FLOAT, 1),
+        (command.add_bool_option, hikari.OptionType.BOOLEAN, True),
+        (command.add_member_option, hikari.OptionType.USER, object()),
+        (command.add_role_option, hikari.OptionType.ROLE, object()),
+        (command.add_channel_option, hikari.OptionType.CHANNEL, object()),
+    ]
+    for index in range(count):
+        add, type_, value = adders[index % len(adders)]
+        name = f"option{index}"
+        if index % 3:
+            add(name, "description")
+            options[name] = _Option(type_, value)
+
+        else:
+            add(name, "description", default=None)
+
+    return command, _Context(options)
+
+
+def _time(
+    callback: typing.Callable[[typing.Any, typing.Any], typing.Any], command: typing.Any, ctx: typing.Any, /
+) -> float:
+    return min(timeit.repeat(lambda: callback(command, ctx), number=_NUMBER, repeat=_REPEAT)) / _NUMBER
+
+
+def main() -> None:
+    print(f"{'options':<8} {'if/elif (us)':>14} {'table (us)':>12} {'speedup':>9}")
+    for count in (1, 5, 10, 20, 25):
+        command, ctx = _make_command(count)
+        assert _legacy_collect(command, ctx) == _collect(command, ctx)
+        legacy_time = _time(_legacy_collect, command, ctx)
+        table_time = _time(_collect, command, ctx)
+        print(f"{count:<8} {legacy_time * 1e6:>14.2f} {table_time * 1e6:>12.2f} {legacy_time / table_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
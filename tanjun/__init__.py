@@ -97,6 +97,8 @@ from __future__ import annotations as _
 __all__: list[str] = [
     "AnyHooks",
     "BucketResource",
+    "CheckCost",
+    "CheckMode",
     "Client",
     "ClientCallbackNames",
     "CommandError",
@@ -143,6 +145,7 @@ __all__: list[str] = [
     "as_time_schedule",
     "as_unloader",
     "as_user_menu",
+    "autocomplete",
     "cached_inject",
     "checks",
     "clients",
@@ -213,9 +216,12 @@ from alluka import inject as injected
 
 from . import abc
 from . import annotations
+from . import autocomplete
 from . import context
 from . import permissions
 from . import utilities
+from .abc import CheckCost
+from .abc import CheckMode
 from .abc import ClientCallbackNames
 from .checks import with_all_checks
 from .checks import with_any_checks
@@ -33,32 +33,41 @@ from __future__ import annotations
 __all__: list[str] = []
 
 import asyncio
+import collections as collections_
 import copy as copy_
 import enum
 import functools
+import heapq
 import inspect
 import itertools
 import logging
+import math
 import operator
+import sys
+import time
 import types
 import typing
+import weakref
 from collections import abc as collections
 
 import hikari
 
+from tanjun import abc as tanjun
 from tanjun import errors
 
 if typing.TYPE_CHECKING:
-    from tanjun import abc as tanjun
-
     _T = typing.TypeVar("_T")
     _P = typing.ParamSpec("_P")
 
     _ContextT = typing.TypeVar("_ContextT", bound=tanjun.Context)
     _CoroT = collections.Coroutine[typing.Any, typing.Any, _T]
     _TreeT = dict["str | _IndexKeys", "_TreeT | list[tuple[list[str], tanjun.MessageCommand[typing.Any]]]"]
+    _PrefixNodeT = dict["str | _IndexKeys", "_PrefixNodeT | str"]
+    _MergedEntryT = tuple[list[str], tanjun.Component, tanjun.MessageCommand[typing.Any]]
+    _MergedTreeT = dict["str | _IndexKeys", "_MergedTreeT | list[_MergedEntryT]"]
 
 
+_HooksT = typing.TypeVar("_HooksT")
 _KeyT = typing.TypeVar("_KeyT")
 _OtherT = typing.TypeVar("_OtherT")
 
@@ -78,14 +87,179 @@ Default = typing.Literal[_DefaultEnum.VALUE]
 """The type of `DEFAULT`."""
 
 
+class _CheckMemo(dict[int, bool]):
+    __slots__ = ()
+
+
+_CHECK_MEMO_KEY = typing.cast("collections.Callable[[], _CheckMemo]", object())
+"""Sentinel key a context's check memo is cached under."""
+
+
+CHECK_MEMOISE_ATTRIBUTE = "__tanjun_check_memoise__"
+"""Name of the attribute checks use to opt out of per-context memoisation."""
+
+
+def enable_check_memo(ctx: tanjun.Context, /) -> None:
+    """Enable memoising check results for the lifetime of a context.
+
+    Parameters
+    ----------
+    ctx
+        The context to enable check memoisation for.
+    """
+    ctx.cache_result(_CHECK_MEMO_KEY, _CheckMemo())
+
+
+def is_memoisable(check: tanjun.AnyCheckSig, /) -> bool:
+    """Whether a check's result may be memoised for a context.
+
+    Parameters
+    ----------
+    check
+        The check to get this for.
+
+    Returns
+    -------
+    bool
+        Whether the check's result may be memoised.
+    """
+    return getattr(check, CHECK_MEMOISE_ATTRIBUTE, True)
+
+
 async def _execute_check(ctx: _ContextT, callback: tanjun.CheckSig[_ContextT], /) -> bool:
-    if result := await ctx.call_with_async_di(callback, ctx):
+    memo = ctx.get_cached_result(_CHECK_MEMO_KEY, default=None)
+    if not isinstance(memo, _CheckMemo) or not is_memoisable(callback):
+        if result := await ctx.call_with_async_di(callback, ctx):
+            return result
+
+        raise errors.FailedCheck
+
+    key = id(callback)
+    if (result := memo.get(key)) is None:
+        try:
+            result = memo[key] = bool(await ctx.call_with_async_di(callback, ctx))
+
+        except errors.FailedCheck:
+            memo[key] = False
+            raise
+
+    if result:
         return result
 
     raise errors.FailedCheck
 
 
-async def gather_checks(ctx: _ContextT, checks: collections.Iterable[tanjun.CheckSig[_ContextT]], /) -> bool:
+class ChoicesRecord:
+    """Record of the choices an autocomplete context responded with."""
+
+    __slots__ = ("choices",)
+
+    def __init__(self) -> None:
+        self.choices: dict[str, typing.Any] | None = None
+
+
+_CHOICES_RECORD_KEY = typing.cast("collections.Callable[[], ChoicesRecord]", object())
+"""Sentinel key a context's choices record is cached under."""
+
+
+def record_choices(ctx: tanjun.AutocompleteContext, /) -> ChoicesRecord:
+    """Start recording the choices an autocomplete context responds with.
+
+    Parameters
+    ----------
+    ctx
+        The autocomplete context to record the choices for.
+
+    Returns
+    -------
+    ChoicesRecord
+        The record which the choices will be stored in.
+    """
+    record = ChoicesRecord()
+    ctx.cache_result(_CHOICES_RECORD_KEY, record)
+    return record
+
+
+def set_recorded_choices(ctx: tanjun.AutocompleteContext, choices: dict[str, typing.Any], /) -> None:
+    """Store the choices a context responded with if they're being recorded.
+
+    Parameters
+    ----------
+    ctx
+        The autocomplete context.
+    choices
+        The choices it responded with.
+    """
+    if isinstance(record := ctx.get_cached_result(_CHOICES_RECORD_KEY, default=None), ChoicesRecord):
+        record.choices = choices
+
+
+CHECK_COST_ATTRIBUTE = "__tanjun_check_cost__"
+"""Name of the attribute checks use to declare their [tanjun.abc.CheckCost][]."""
+
+
+def get_check_cost(check: tanjun.AnyCheckSig, /) -> tanjun.CheckCost:
+    """Get the cost hint of a check.
+
+    Parameters
+    ----------
+    check
+        The check to get the cost of.
+
+    Returns
+    -------
+    tanjun.abc.CheckCost
+        The check's declared cost.
+
+        If the check doesn't declare a cost then this will be
+        [tanjun.abc.CheckCost.CHEAP][] for synchronous checks and
+        [tanjun.abc.CheckCost.EXPENSIVE][] for asynchronous checks.
+    """
+    if (cost := getattr(check, CHECK_COST_ATTRIBUTE, None)) is not None:
+        return tanjun.CheckCost(cost)
+
+    callback = check if inspect.isroutine(check) or isinstance(check, functools.partial) else type(check).__call__
+    if inspect.iscoroutinefunction(callback):
+        return tanjun.CheckCost.EXPENSIVE
+
+    return tanjun.CheckCost.CHEAP
+
+
+async def _gather_ordered(ctx: _ContextT, checks: collections.Iterable[tanjun.CheckSig[_ContextT]], /) -> None:
+    expensive_checks: list[tanjun.CheckSig[_ContextT]] = []
+    for check in checks:
+        if get_check_cost(check) is tanjun.CheckCost.CHEAP:
+            await _execute_check(ctx, check)
+
+        else:
+            expensive_checks.append(check)
+
+    if len(expensive_checks) == 1:
+        await _execute_check(ctx, expensive_checks[0])
+        return
+
+    tasks = [asyncio.ensure_future(_execute_check(ctx, check)) for check in expensive_checks]
+    try:
+        for future in asyncio.as_completed(tasks):
+            await future
+
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+            elif not task.cancelled():
+                # Mark any other failures as retrieved.
+                task.exception()
+
+
+async def gather_checks(
+    ctx: _ContextT,
+    checks: collections.Iterable[tanjun.CheckSig[_ContextT]],
+    /,
+    *,
+    mode: tanjun.CheckMode = tanjun.CheckMode.GATHER,
+) -> bool:
     """Gather a collection of checks.
 
     Parameters
@@ -94,6 +268,8 @@ async def gather_checks(ctx: _ContextT, checks: collections.Iterable[tanjun.Chec
         The context to check.
     checks : collections.abc.Iterable[tanjun.abc.CheckSig]
         An iterable of injectable checks.
+    mode
+        The strategy to use to evaluate the checks.
 
     Returns
     -------
@@ -101,7 +277,11 @@ async def gather_checks(ctx: _ContextT, checks: collections.Iterable[tanjun.Chec
         Whether all the checks passed or not.
     """
     try:
-        await asyncio.gather(*(_execute_check(ctx, check) for check in checks))
+        if mode is tanjun.CheckMode.ORDERED:
+            await _gather_ordered(ctx, checks)
+
+        else:
+            await asyncio.gather(*(_execute_check(ctx, check) for check in checks))
 
     except errors.FailedCheck:
         return False
@@ -132,16 +312,580 @@ class CastedView(collections.Mapping[_KeyT, _OtherT]):
         except KeyError:
             pass
 
-        entry = self._raw_data[key]
-        result = self._cast(entry)
-        self._buffer[key] = result
-        return result
+        entry = self._raw_data[key]
+        result = self._cast(entry)
+        self._buffer[key] = result
+        return result
+
+    def __iter__(self) -> collections.Iterator[_KeyT]:
+        return iter(self._raw_data)
+
+    def __len__(self) -> int:
+        return len(self._raw_data)
+
+
+class TimedLRUCache(typing.Generic[_KeyT, _OtherT]):
+    """Utility class for a size-bounded least-recently-used cache with optional expiry."""
+
+    __slots__ = ("_data", "_expire_after", "_max_size")
+
+    def __init__(self, *, expire_after: float | None = None, max_size: int | None = None) -> None:
+        """Initialise a timed LRU cache.
+
+        Parameters
+        ----------
+        expire_after
+            How many seconds entries should be kept for.
+
+            If this is [None][] then entries will never expire.
+        max_size
+            The maximum amount of entries to store.
+
+            If this is [None][] then the cache's size won't be bounded.
+        """
+        # dicts keep insertion order so the first entry is always the least recently used one.
+        self._data: dict[_KeyT, tuple[float, _OtherT]] = {}
+        self._expire_after = expire_after
+        self._max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Remove all the entries from the cache."""
+        self._data.clear()
+
+    def copy_empty(self) -> TimedLRUCache[_KeyT, _OtherT]:
+        """Create an empty cache with the same configuration as this one.
+
+        Returns
+        -------
+        TimedLRUCache[_KeyT, _OtherT]
+            The new cache.
+        """
+        return TimedLRUCache(expire_after=self._expire_after, max_size=self._max_size)
+
+    def get(self, key: _KeyT, /) -> _OtherT | None:
+        """Get an entry from the cache.
+
+        Parameters
+        ----------
+        key
+            The entry's key.
+
+        Returns
+        -------
+        _OtherT | None
+            The cached value or [None][] if it wasn't found or has expired.
+        """
+        try:
+            expires_at, value = self._data.pop(key)
+
+        except KeyError:
+            return None
+
+        if expires_at <= time.monotonic():
+            return None
+
+        self._data[key] = (expires_at, value)
+        return value
+
+    def values(self) -> collections.Iterator[_OtherT]:
+        """Iterate over the values of the entries which haven't expired.
+
+        Returns
+        -------
+        collections.abc.Iterator[_OtherT]
+            Iterator of the cached values.
+        """
+        now = time.monotonic()
+        return (value for expires_at, value in self._data.values() if expires_at > now)
+
+    def pop(self, key: _KeyT, /) -> None:
+        """Remove an entry from the cache if present.
+
+        Parameters
+        ----------
+        key
+            The entry's key.
+        """
+        self._data.pop(key, None)
+
+    def set(self, key: _KeyT, value: _OtherT, /) -> None:
+        """Set an entry in the cache.
+
+        This will evict the least recently used entry if the cache is full.
+
+        Parameters
+        ----------
+        key
+            The entry's key.
+        value
+            The value to cache.
+        """
+        expires_at = math.inf if self._expire_after is None else time.monotonic() + self._expire_after
+        self._data.pop(key, None)
+        self._data[key] = (expires_at, value)
+        if self._max_size is not None and len(self._data) > self._max_size:
+            del self._data[next(iter(self._data))]
+
+
+class SingleFlight(typing.Generic[_KeyT, _OtherT]):
+    """Utility class for sharing one call between concurrent requests for the same key."""
+
+    __slots__ = ("_calls",)
+
+    def __init__(self) -> None:
+        self._calls: dict[_KeyT, asyncio.Task[_OtherT]] = {}
+
+    async def call(self, key: _KeyT, callback: collections.Callable[[], _CoroT[_OtherT]], /) -> _OtherT:
+        """Call a callback, joining any in-progress call for the same key.
+
+        The call is run as a task so one caller being cancelled won't cancel
+        the call for other callers.
+
+        Parameters
+        ----------
+        key
+            Key used to identify the call.
+        callback
+            Callback which returns the coroutine to run if there's no
+            in-progress call for `key`.
+
+        Returns
+        -------
+        _OtherT
+            The call's result.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.get_running_loop().create_task(callback())
+            task.add_done_callback(lambda t: self._calls.get(key) is t and self._calls.pop(key))
+
+        return await asyncio.shield(task)
+
+    def forget(self, key: _KeyT, /) -> None:
+        """Stop later calls from joining the in-progress call for a key.
+
+        Parameters
+        ----------
+        key
+            Key of the call to forget.
+        """
+        self._calls.pop(key, None)
+
+    def forget_all(self) -> None:
+        """Stop later calls from joining any of the in-progress calls."""
+        self._calls.clear()
+
+
+class RestFlights:
+    """Utility class for sharing concurrent identical REST fetches.
+
+    Concurrent fetches for the same resource share one request and its result
+    (or error).
+    """
+
+    __slots__ = ("_flights", "_rest")
+
+    def __init__(self, rest: hikari.api.RESTClient, /) -> None:
+        """Initialise a REST flights instance.
+
+        Parameters
+        ----------
+        rest
+            The REST client to make the requests with.
+        """
+        self._flights = SingleFlight[tuple[typing.Any, ...], typing.Any]()
+        self._rest = rest
+
+    async def fetch_channel(self, channel: hikari.SnowflakeishOr[hikari.PartialChannel], /) -> hikari.PartialChannel:
+        """Fetch a channel.
+
+        Parameters
+        ----------
+        channel
+            Object or ID of the channel to fetch.
+
+        Returns
+        -------
+        hikari.channels.PartialChannel
+            The fetched channel.
+        """
+        channel_id = hikari.Snowflake(channel)
+        return await self._flights.call(("channel", channel_id), lambda: self._rest.fetch_channel(channel_id))
+
+    async def fetch_guild(self, guild: hikari.SnowflakeishOr[hikari.PartialGuild], /) -> hikari.RESTGuild:
+        """Fetch a guild.
+
+        Parameters
+        ----------
+        guild
+            Object or ID of the guild to fetch.
+
+        Returns
+        -------
+        hikari.guilds.RESTGuild
+            The fetched guild.
+        """
+        guild_id = hikari.Snowflake(guild)
+        return await self._flights.call(("guild", guild_id), lambda: self._rest.fetch_guild(guild_id))
+
+    async def fetch_member(
+        self, guild: hikari.SnowflakeishOr[hikari.PartialGuild], user: hikari.SnowflakeishOr[hikari.PartialUser], /
+    ) -> hikari.Member:
+        """Fetch a guild member.
+
+        Parameters
+        ----------
+        guild
+            Object or ID of the guild to fetch the member from.
+        user
+            Object or ID of the user to fetch the member for.
+
+        Returns
+        -------
+        hikari.guilds.Member
+            The fetched member.
+        """
+        guild_id = hikari.Snowflake(guild)
+        user_id = hikari.Snowflake(user)
+        return await self._flights.call(
+            ("member", guild_id, user_id), lambda: self._rest.fetch_member(guild_id, user_id)
+        )
+
+    async def fetch_roles(
+        self, guild: hikari.SnowflakeishOr[hikari.PartialGuild], /
+    ) -> collections.Sequence[hikari.Role]:
+        """Fetch a guild's roles.
+
+        Parameters
+        ----------
+        guild
+            Object or ID of the guild to fetch the roles for.
+
+        Returns
+        -------
+        collections.abc.Sequence[hikari.guilds.Role]
+            The fetched roles.
+        """
+        guild_id = hikari.Snowflake(guild)
+        return await self._flights.call(("roles", guild_id), lambda: self._rest.fetch_roles(guild_id))
+
+
+class SeenIdSet(typing.Generic[_KeyT]):
+    """Utility class for a bounded set of recently seen IDs.
+
+    This acts as a ring buffer: IDs are forgotten once `expire_after` seconds
+    have passed since they were added or once `max_size` newer IDs have been
+    added.
+    """
+
+    __slots__ = ("_expire_after", "_ids", "_max_size", "_order")
+
+    def __init__(self, *, expire_after: float, max_size: int) -> None:
+        """Initialise a seen ID set.
+
+        Parameters
+        ----------
+        expire_after
+            How many seconds IDs should be remembered for.
+        max_size
+            The maximum amount of IDs to remember.
+        """
+        self._expire_after = expire_after
+        self._ids: set[_KeyT] = set()
+        self._max_size = max_size
+        self._order: collections_.deque[tuple[float, _KeyT]] = collections_.deque()
+
+    def __contains__(self, id_: object, /) -> bool:
+        return id_ in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, id_: _KeyT, /) -> bool:
+        """Add an ID to the set.
+
+        Parameters
+        ----------
+        id_
+            The ID to add.
+
+        Returns
+        -------
+        bool
+            Whether the ID was added.
+
+            This will be [False][] if the ID was already seen within the window.
+        """
+        now = time.monotonic()
+        # IDs are always added with the same expiry so the oldest is at the front.
+        while self._order and self._order[0][0] <= now:
+            self._ids.discard(self._order.popleft()[1])
+
+        if id_ in self._ids:
+            return False
+
+        self._ids.add(id_)
+        self._order.append((now + self._expire_after, id_))
+        if len(self._order) > self._max_size:
+            self._ids.discard(self._order.popleft()[1])
+
+        return True
+
+    def clear(self) -> None:
+        """Forget all the seen IDs."""
+        self._ids.clear()
+        self._order.clear()
+
+
+class TimerEntry:
+    """A callback scheduled on a [TimerWheel][tanjun._internal.TimerWheel]."""
+
+    __slots__ = ("_callback",)
+
+    def __init__(self, callback: collections.Callable[[], None], /) -> None:
+        self._callback: collections.Callable[[], None] | None = callback
+
+    def cancel(self) -> None:
+        """Cancel this timer if it hasn't been called yet."""
+        self._callback = None
+
+    def cancelled(self) -> bool:
+        """Whether this timer was cancelled or has already been called."""
+        return self._callback is None
+
+    def _call(self) -> None:
+        if callback := self._callback:
+            self._callback = None
+            callback()
+
+
+class TimerWheel:
+    """Utility class for batching many short-lived timers into a single event loop timer.
+
+    Deadlines are rounded up to `resolution` and grouped into buckets so only
+    one [asyncio.TimerHandle][] is ever scheduled, and cancelling an entry is
+    O(1) (cancelled entries are skipped when their bucket is reached).
+    """
+
+    __slots__ = ("_buckets", "_handle", "_heap", "_loop", "_resolution")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, /, *, resolution: float = 0.05) -> None:
+        """Initialise a timer wheel.
+
+        Parameters
+        ----------
+        loop
+            The event loop the timers should be called in.
+        resolution
+            How many seconds deadlines should be grouped by.
+        """
+        self._buckets: dict[int, list[TimerEntry]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._heap: list[int] = []
+        self._loop = loop
+        self._resolution = resolution
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._buckets.values())
+
+    def call_later(self, delay: float, callback: collections.Callable[[], None], /) -> TimerEntry:
+        """Schedule a callback to be called after a delay.
+
+        Parameters
+        ----------
+        delay
+            How many seconds to wait before calling the callback.
+
+            The callback may be called up to `resolution` seconds late.
+        callback
+            The callback to call.
+
+        Returns
+        -------
+        TimerEntry
+            The scheduled timer.
+        """
+        entry = TimerEntry(callback)
+        bucket = math.ceil((self._loop.time() + delay) / self._resolution)
+        if (entries := self._buckets.get(bucket)) is None:
+            entries = self._buckets[bucket] = []
+            heapq.heappush(self._heap, bucket)
+            if self._heap[0] == bucket:
+                self._reschedule()
+
+        entries.append(entry)
+        return entry
+
+    def _reschedule(self) -> None:
+        if self._handle:
+            self._handle.cancel()
+
+        self._handle = self._loop.call_at(self._heap[0] * self._resolution, self._fire) if self._heap else None
+
+    def _fire(self) -> None:
+        self._handle = None
+        now = self._loop.time()
+        while self._heap and self._heap[0] * self._resolution <= now:
+            for entry in self._buckets.pop(heapq.heappop(self._heap)):
+                try:
+                    entry._call()  # noqa: SLF001
+
+                except Exception as exc:  # noqa: BLE001
+                    self._loop.call_exception_handler(
+                        {"message": "Exception in timer wheel callback", "exception": exc}
+                    )
+
+        self._reschedule()
+
+
+_TIMER_WHEELS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TimerWheel] = weakref.WeakKeyDictionary()
+
+
+def get_timer_wheel() -> TimerWheel:
+    """Get the shared timer wheel for the running event loop.
+
+    Returns
+    -------
+    TimerWheel
+        The running event loop's timer wheel.
+    """
+    loop = asyncio.get_running_loop()
+    if (wheel := _TIMER_WHEELS.get(loop)) is None:
+        wheel = _TIMER_WHEELS[loop] = TimerWheel(loop)
+
+    return wheel
+
+
+def create_eager_task(
+    loop: asyncio.AbstractEventLoop,
+    coro: collections.Coroutine[typing.Any, typing.Any, _T],
+    /,
+    *,
+    name: str | None = None,
+) -> asyncio.Task[_T]:
+    """Create a task which starts running the coroutine straight away.
+
+    On Python 3.12+ the coroutine is run up until its first suspension (with
+    the task set as the current task) before this returns, and if it finishes
+    without suspending it's never scheduled on the event loop. On older
+    versions this falls back to a normal task.
+
+    Parameters
+    ----------
+    loop
+        The event loop to create the task in.
+    coro
+        The coroutine to run.
+    name
+        Name of the task.
+
+    Returns
+    -------
+    asyncio.Task
+        The created task.
+    """
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=loop, name=name, eager_start=True)
+
+    return loop.create_task(coro, name=name)
+
+
+class MergedHooks(typing.Generic[_HooksT]):
+    """Cached set of hooks made by adding a level's own hooks to its parent's.
+
+    This avoids building a new set of hooks for every command execution.
+    The cached set is only rebuilt when a different parent set is passed or
+    [MergedHooks.clear][] is called, so the sets returned by this should never
+    be mutated.
+    """
+
+    __slots__ = ("_parent", "_result")
+
+    def __init__(self) -> None:
+        self._parent: collections.MutableSet[_HooksT] | None = None
+        self._result: collections.MutableSet[_HooksT] | None | Default = DEFAULT
+
+    def clear(self) -> None:
+        """Clear the cached set.
+
+        This should be called whenever the level's own hooks change.
+        """
+        self._parent = None
+        self._result = DEFAULT
+
+    def merge(
+        self, parent: collections.MutableSet[_HooksT] | None, first: _HooksT | None, second: _HooksT | None = None, /
+    ) -> collections.MutableSet[_HooksT] | None:
+        """Get the set of hooks made by adding this level's hooks to its parent's.
+
+        Parameters
+        ----------
+        parent
+            The set of hooks passed down from the parent level.
+        first
+            The first of this level's hooks to add.
+        second
+            The second of this level's hooks to add.
+
+        Returns
+        -------
+        collections.abc.MutableSet[_HooksT] | None
+            The merged set of hooks.
+
+            If this level has no hooks of its own then this will be `parent`.
+        """
+        if self._result is not DEFAULT and self._parent is parent:
+            return self._result
+
+        result = parent
+        if first or second:
+            result = set(parent) if parent else set()
+            if first:
+                result.add(first)
+
+            if second:
+                result.add(second)
+
+        self._parent = parent
+        self._result = result
+        return result
+
+
+class StandardCommand:
+    """Marker base class for Tanjun's own command implementations.
+
+    These never mutate the hooks passed to their execute methods, meaning
+    that they can be passed the sets cached by [MergedHooks][] as-is.
+    """
+
+    __slots__ = ()
+
+
+def hooks_for(
+    command: typing.Any, hooks: collections.MutableSet[_HooksT] | None, /
+) -> collections.MutableSet[_HooksT] | None:
+    """Get the hooks to pass to a command's execute method.
 
-    def __iter__(self) -> collections.Iterator[_KeyT]:
-        return iter(self._raw_data)
+    Parameters
+    ----------
+    command
+        The command which is being executed.
+    hooks
+        The (possibly cached) set of hooks to pass to the command.
 
-    def __len__(self) -> int:
-        return len(self._raw_data)
+    Returns
+    -------
+    collections.abc.MutableSet[_HooksT] | None
+        `hooks` if the command is one of Tanjun's standard implementations,
+        else a copy of `hooks` which the command can safely mutate.
+    """
+    if hooks is None or isinstance(command, StandardCommand):
+        return hooks
+
+    return set(hooks)
 
 
 _KEYWORD_TYPES = {inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD}
@@ -484,12 +1228,139 @@ def cmp_all_commands(
 class _IndexKeys(enum.Enum):
     COMMANDS = enum.auto()
     PARENT = enum.auto()
+    PREFIX = enum.auto()
+
+
+class PrefixTrie:
+    """A compiled prefix matcher.
+
+    This finds the longest prefix a string starts with in a single pass over
+    the string's first characters.
+    """
+
+    __slots__ = ("_prefixes", "_root")
+
+    def __init__(self, prefixes: collections.Iterable[str] = (), /) -> None:
+        """Initialise a prefix trie.
+
+        Parameters
+        ----------
+        prefixes
+            The prefixes to initially add to the trie.
+        """
+        # A dict is used as an insertion ordered set here.
+        self._prefixes: dict[str, None] = {}
+        self._root: _PrefixNodeT = {}
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def __contains__(self, prefix: object, /) -> bool:
+        return prefix in self._prefixes
+
+    def __iter__(self) -> collections.Iterator[str]:
+        return iter(self._prefixes)
+
+    def __len__(self) -> int:
+        return len(self._prefixes)
+
+    def add(self, prefix: str, /) -> bool:
+        """Add a prefix to the trie.
+
+        Parameters
+        ----------
+        prefix
+            The prefix to add.
+
+        Returns
+        -------
+        bool
+            Whether the prefix was added.
+
+            If this is [False][] then the prefix was already in the trie.
+        """
+        if prefix in self._prefixes:
+            return False
+
+        node = self._root
+        for char in prefix:
+            try:
+                node = typing.cast("_PrefixNodeT", node[char])
+
+            except KeyError:
+                new_node: _PrefixNodeT = {}
+                node[char] = node = new_node
+
+        node[_IndexKeys.PREFIX] = prefix
+        self._prefixes[prefix] = None
+        return True
+
+    def match(self, content: str, /) -> str | None:
+        """Find the longest prefix which a string starts with.
+
+        Parameters
+        ----------
+        content
+            The string to match against.
+
+        Returns
+        -------
+        str | None
+            The longest matching prefix or [None][] if no prefix matched.
+        """
+        node = self._root
+        result = typing.cast("str | None", node.get(_IndexKeys.PREFIX))
+        for char in content:
+            try:
+                node = typing.cast("_PrefixNodeT", node[char])
+
+            except KeyError:
+                break
+
+            if (prefix := node.get(_IndexKeys.PREFIX)) is not None:
+                result = typing.cast("str", prefix)
+
+        return result
+
+    def remove(self, prefix: str, /) -> None:
+        """Remove a prefix from the trie.
+
+        Parameters
+        ----------
+        prefix
+            The prefix to remove.
+
+        Raises
+        ------
+        ValueError
+            If the prefix is not in the trie.
+        """
+        try:
+            del self._prefixes[prefix]
+
+        except KeyError:
+            error_message = f"Prefix {prefix!r} not found"
+            raise ValueError(error_message) from None
+
+        nodes: list[tuple[str, _PrefixNodeT]] = []
+        node = self._root
+        for char in prefix:
+            nodes.append((char, node))
+            node = typing.cast("_PrefixNodeT", node[char])
+
+        del node[_IndexKeys.PREFIX]
+
+        # Prune any branches which no-longer lead to a prefix.
+        for char, parent in reversed(nodes):
+            if parent[char]:
+                break
+
+            del parent[char]
 
 
 class MessageCommandIndex:
     """A searchable message command index."""
 
-    __slots__ = ("commands", "is_strict", "names_to_commands", "search_tree")
+    __slots__ = ("commands", "is_strict", "names_to_commands", "search_tree", "watchers")
 
     def __init__(
         self,
@@ -513,6 +1384,11 @@ class MessageCommandIndex:
         self.is_strict = strict
         self.names_to_commands = names_to_commands or {}
         self.search_tree = search_tree or {}
+        self.watchers: dict[MergedMessageIndex, tanjun.Component] = {}
+        """Merged indexes which should be kept up to date with this index's commands.
+
+        These are mapped to the component which owns this index.
+        """
 
     def add(self, command: tanjun.MessageCommand[typing.Any], /) -> bool:
         """Add a command to the index.
@@ -585,6 +1461,9 @@ class MessageCommandIndex:
                     node[_IndexKeys.COMMANDS] = [(name_parts, command)]
 
         self.commands.append(command)
+        for index, component in self.watchers.items():
+            index.add_command(component, command)
+
         return True
 
     def copy(self, *, parent: tanjun.MessageCommandGroup[typing.Any] | None = None) -> MessageCommandIndex:
@@ -680,6 +1559,8 @@ class MessageCommandIndex:
             If the command is not in the index.
         """
         self.commands.remove(command)
+        for index, component in self.watchers.items():
+            index.remove_command(component, command)
 
         if self.is_strict:
             for name in map(str.casefold, filter(None, command.names)):
@@ -727,3 +1608,383 @@ class MessageCommandIndex:
 
                     assert isinstance(parent, dict)
                     del parent[chars]
+
+
+class MergedMessageIndex:
+    """A searchable message command index which spans multiple components.
+
+    This lets a client find the message commands which match a message with
+    a single lookup rather than searching every component's index.
+    """
+
+    __slots__ = ("_components", "_counter", "_search_tree")
+
+    def __init__(self) -> None:
+        """Initialise a merged message command index."""
+        # Components are mapped to their priority and to their command index or
+        # None if their commands can't be tracked.
+        self._components: dict[tanjun.Component, tuple[int, MessageCommandIndex | None]] = {}
+        self._counter = itertools.count()
+        self._search_tree: _MergedTreeT = {}
+
+    def add_component(self, component: tanjun.Component, index: MessageCommandIndex | None, /) -> None:
+        """Add a component to the index.
+
+        Components are prioritised in the order they're added.
+
+        Parameters
+        ----------
+        component
+            The component to add.
+        index
+            The component's message command index.
+
+            If this is [None][] then the component's commands can't be tracked
+            and it will be returned as a candidate for every lookup.
+        """
+        if component in self._components:
+            return
+
+        self._components[component] = (next(self._counter), index)
+        if index is not None:
+            index.watchers[self] = component
+            for command in index.commands:
+                self.add_command(component, command)
+
+    def remove_component(self, component: tanjun.Component, /) -> None:
+        """Remove a component from the index.
+
+        Parameters
+        ----------
+        component
+            The component to remove.
+        """
+        _, index = self._components.pop(component, (None, None))
+        if index is not None:
+            del index.watchers[self]
+            for command in index.commands:
+                self.remove_command(component, command)
+
+    def add_command(self, component: tanjun.Component, command: tanjun.MessageCommand[typing.Any], /) -> None:
+        """Add a component's command to the index.
+
+        Parameters
+        ----------
+        component
+            The component which owns the command.
+        command
+            The command to add.
+        """
+        # This needs to be explicitly typed for MyPy.
+        node: _MergedTreeT | list[_MergedEntryT]
+        for name in filter(None, command.names):
+            node = self._search_tree
+            # The search tree is kept case-insensitive as a check against the actual name
+            # can be used to ensure case-sensitivity.
+            for chars in name.casefold().split(" "):
+                try:
+                    node = node[chars]
+
+                except KeyError:
+                    new_node: _MergedTreeT = {}
+                    node[chars] = node = new_node
+
+                assert isinstance(node, dict)
+
+            entry = (name.split(" "), component, command)
+            try:
+                entries = node[_IndexKeys.COMMANDS]
+                assert isinstance(entries, list)
+                entries.append(entry)
+
+            except KeyError:
+                node[_IndexKeys.COMMANDS] = [entry]
+
+    def remove_command(self, component: tanjun.Component, command: tanjun.MessageCommand[typing.Any], /) -> None:
+        """Remove a component's command from the index.
+
+        Parameters
+        ----------
+        component
+            The component which owns the command.
+        command
+            The command to remove.
+        """
+        # This needs to be explicitly typed for MyPy.
+        node: _MergedTreeT | list[_MergedEntryT]
+        for name in filter(None, command.names):
+            nodes: list[tuple[str, _MergedTreeT]] = []
+            node = self._search_tree
+            for chars in name.casefold().split(" "):
+                nodes.append((chars, node))
+                try:
+                    node = node[chars]
+
+                except KeyError:
+                    break
+
+                assert isinstance(node, dict)
+
+            else:
+                entries = node.get(_IndexKeys.COMMANDS)
+                assert isinstance(entries, list)
+                entries.remove((name.split(" "), component, command))
+                if not entries:
+                    del node[_IndexKeys.COMMANDS]
+
+                # Prune any branches which no-longer lead to a command.
+                for chars, parent in reversed(nodes):
+                    if parent[chars]:
+                        break
+
+                    del parent[chars]
+
+    def find(
+        self, content: str, /, *, case_sensitive: bool
+    ) -> list[tuple[tanjun.Component, list[tuple[str, tanjun.MessageCommand[typing.Any]]] | None]]:
+        """Find the candidate commands for a message.
+
+        Parameters
+        ----------
+        content
+            The content to search for.
+        case_sensitive
+            Whether the search should be case-sensitive for components which
+            don't override this.
+
+        Returns
+        -------
+        list[tuple[tanjun.abc.Component, list[tuple[str, tanjun.abc.MessageCommand[typing.Any]]] | None]]
+            List of the components with candidate commands in order of priority.
+
+            Each component is paired with a list of its matching names and
+            commands ordered from longest to shortest name, or [None][] if
+            the component's commands aren't tracked by this index.
+        """
+        # This needs to be explicitly typed for MyPy.
+        node: _MergedTreeT | list[_MergedEntryT]
+        node = self._search_tree
+        results: dict[tanjun.Component, list[tuple[str, tanjun.MessageCommand[typing.Any]]] | None] = {}
+        segments: list[tuple[int, list[_MergedEntryT]]] = []
+        split = content.split(" ")
+        for index, chars in enumerate(split):
+            try:
+                node = node[chars.casefold()]
+
+            except KeyError:
+                break
+
+            assert isinstance(node, dict)
+            if entries := node.get(_IndexKeys.COMMANDS):
+                assert isinstance(entries, list)
+                segments.append((index, entries))
+
+        for index, segment in reversed(segments):
+            name_parts = split[: index + 1]
+            name = " ".join(name_parts)
+            for entry_parts, component, command in segment:
+                component_case_sensitive = component.is_case_sensitive
+                if component_case_sensitive is None:
+                    component_case_sensitive = case_sensitive
+
+                if component_case_sensitive and entry_parts != name_parts:
+                    continue
+
+                try:
+                    candidates = results[component]
+
+                except KeyError:
+                    results[component] = [(name, command)]
+
+                else:
+                    assert candidates is not None
+                    candidates.append((name, command))
+
+        for component, (_, index) in self._components.items():
+            if index is None:
+                results[component] = None
+
+        return sorted(results.items(), key=lambda entry: self._components[entry[0]][0])
+
+
+class AppCommandRoutes:
+    """Routing table for finding the components which may own an app command.
+
+    This lets a client find the components to try for an app command with a
+    single lookup rather than trying every component.
+    """
+
+    __slots__ = ("_components", "_counter", "_menu_routes", "_slash_routes", "_untracked")
+
+    def __init__(self) -> None:
+        """Initialise an app command routing table."""
+        # Components are mapped to their priority.
+        self._components: dict[tanjun.Component, int] = {}
+        self._counter = itertools.count()
+        self._menu_routes: dict[tuple[hikari.CommandType, str], tuple[tanjun.Component, ...]] = {}
+        self._slash_routes: dict[str, tuple[tanjun.Component, ...]] = {}
+        self._untracked: tuple[tanjun.Component, ...] = ()
+
+    def _sorted(self, components: collections.Iterable[tanjun.Component], /) -> tuple[tanjun.Component, ...]:
+        return tuple(sorted(components, key=self._components.__getitem__))
+
+    def add_component(
+        self,
+        component: tanjun.Component,
+        /,
+        *,
+        tracked: bool,
+        menu_keys: collections.Iterable[tuple[hikari.CommandType, str]] = (),
+        slash_names: collections.Iterable[str] = (),
+    ) -> None:
+        """Add a component to the routing table.
+
+        Components are prioritised in the order they're added.
+
+        Parameters
+        ----------
+        component
+            The component to add.
+        tracked
+            Whether the component's app commands are tracked by this table.
+
+            If this is [False][] then the component will be returned as a
+            candidate for every lookup.
+        menu_keys
+            The types and names of the component's menu commands.
+        slash_names
+            The names of the component's top-level slash commands.
+        """
+        if component in self._components:
+            return
+
+        self._components[component] = next(self._counter)
+        if not tracked:
+            self._untracked = (*self._untracked, component)
+            return
+
+        for key in menu_keys:
+            self.add_menu(component, key)
+
+        for name in slash_names:
+            self.add_slash(component, name)
+
+    def remove_component(self, component: tanjun.Component, /) -> None:
+        """Remove a component from the routing table.
+
+        Parameters
+        ----------
+        component
+            The component to remove.
+        """
+        if self._components.pop(component, None) is None:
+            return
+
+        self._untracked = tuple(c for c in self._untracked if c != component)
+        for routes in (self._menu_routes, self._slash_routes):
+            for key, components in list(routes.items()):
+                if component in components:
+                    _remove_route(routes, key, component)
+
+    def add_menu(self, component: tanjun.Component, key: tuple[hikari.CommandType, str], /) -> None:
+        """Add a route for a component's menu command.
+
+        Parameters
+        ----------
+        component
+            The component which owns the command.
+        key
+            The command's type and name.
+        """
+        components = self._menu_routes.get(key, ())
+        if component in self._components and component not in components:
+            self._menu_routes[key] = self._sorted((*components, component))
+
+    def add_slash(self, component: tanjun.Component, name: str, /) -> None:
+        """Add a route for a component's top-level slash command.
+
+        Parameters
+        ----------
+        component
+            The component which owns the command.
+        name
+            The command's name.
+        """
+        components = self._slash_routes.get(name, ())
+        if component in self._components and component not in components:
+            self._slash_routes[name] = self._sorted((*components, component))
+
+    def remove_menu(self, component: tanjun.Component, key: tuple[hikari.CommandType, str], /) -> None:
+        """Remove the route for a component's menu command.
+
+        Parameters
+        ----------
+        component
+            The component which owns the command.
+        key
+            The command's type and name.
+        """
+        _remove_route(self._menu_routes, key, component)
+
+    def remove_slash(self, component: tanjun.Component, name: str, /) -> None:
+        """Remove the route for a component's top-level slash command.
+
+        Parameters
+        ----------
+        component
+            The component which owns the command.
+        name
+            The command's name.
+        """
+        _remove_route(self._slash_routes, name, component)
+
+    def find_menu(self, command_type: hikari.CommandType, name: str, /) -> tuple[tanjun.Component, ...]:
+        """Find the components which may own a menu command.
+
+        Parameters
+        ----------
+        command_type
+            The menu command's type.
+        name
+            The menu command's name.
+
+        Returns
+        -------
+        tuple[tanjun.abc.Component, ...]
+            The candidate components in order of priority.
+        """
+        components = self._menu_routes.get((command_type, name), ())
+        if self._untracked:
+            return self._sorted((*components, *self._untracked))
+
+        return components
+
+    def find_slash(self, name: str, /) -> tuple[tanjun.Component, ...]:
+        """Find the components which may own a top-level slash command.
+
+        Parameters
+        ----------
+        name
+            The slash command's top-level name.
+
+        Returns
+        -------
+        tuple[tanjun.abc.Component, ...]
+            The candidate components in order of priority.
+        """
+        components = self._slash_routes.get(name, ())
+        if self._untracked:
+            return self._sorted((*components, *self._untracked))
+
+        return components
+
+
+def _remove_route(
+    routes: dict[_KeyT, tuple[tanjun.Component, ...]], key: _KeyT, component: tanjun.Component, /
+) -> None:
+    components = tuple(c for c in routes.get(key, ()) if c != component)
+    if components:
+        routes[key] = components
+
+    else:
+        routes.pop(key, None)
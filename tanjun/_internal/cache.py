@@ -36,6 +36,7 @@ import typing
 
 import hikari
 
+from tanjun import _internal
 from tanjun.dependencies import async_cache
 
 if typing.TYPE_CHECKING:
@@ -89,7 +90,8 @@ async def get_perm_channel(client: tanjun.Client, channel_id: hikari.Snowflake,
         if channel := await channel_cache.get(channel_id, default=None):
             return channel
 
-    channel = await client.rest.fetch_channel(channel_id)
+    rest = client.injector.get_type_dependency(_internal.RestFlights, default=None) or client.rest
+    channel = await rest.fetch_channel(channel_id)
     if channel.type not in _THREAD_CHANNEL_TYPES:
         assert isinstance(channel, hikari.PermissibleGuildChannel)
         return channel
@@ -104,6 +106,6 @@ async def get_perm_channel(client: tanjun.Client, channel_id: hikari.Snowflake,
         if channel_ := await channel_cache.get(channel.parent_id, default=None):
             return channel_
 
-    channel = await client.rest.fetch_channel(channel.parent_id)
+    channel = await rest.fetch_channel(channel.parent_id)
     assert isinstance(channel, hikari.PermissibleGuildChannel)
     return channel
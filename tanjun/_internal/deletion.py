@@ -0,0 +1,324 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Scheduler used to delete command responses after a delay."""
+from __future__ import annotations
+
+__all__: list[str] = ["DeleteScheduler"]
+
+import asyncio
+import datetime
+import json
+import logging
+import time
+import typing
+
+import hikari
+
+from . import TimerEntry
+from . import TimerWheel
+
+if typing.TYPE_CHECKING:
+    import pathlib
+    from collections import abc as collections
+
+_LOGGER = logging.getLogger("hikari.tanjun")
+_BULK_DELETE_MAX_AGE = datetime.timedelta(days=14) - datetime.timedelta(minutes=5)
+"""How old a message can be before it can't be bulk deleted (with some leeway)."""
+
+
+class _PendingDelete(typing.NamedTuple):
+    deadline: float
+    """Unix timestamp of when the message should be deleted."""
+
+    bulk: bool
+    """Whether this message can be bulk deleted."""
+
+    entry: TimerEntry
+
+
+class DeleteScheduler:
+    """Batches the delayed deletion of command responses.
+
+    Rather than spawning a sleeping task for every response which should be
+    deleted after a delay, this schedules the deletions on a
+    [TimerWheel][tanjun._internal.TimerWheel] and only spawns a task once
+    they're due. Messages in the same channel which are due at the same time
+    are deleted together, using Discord's bulk delete endpoint where allowed.
+    """
+
+    __slots__ = ("_due", "_flush_handle", "_loop", "_pending", "_register_task", "_resolution", "_rest", "_wheel")
+
+    def __init__(
+        self,
+        rest: hikari.api.RESTClient,
+        register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
+        /,
+        *,
+        resolution: float = 1.0,
+    ) -> None:
+        """Initialise a delete scheduler.
+
+        Parameters
+        ----------
+        rest
+            The REST client to use to delete messages.
+        register_task
+            Callback used to register the deletion tasks spawned by this.
+        resolution
+            How many seconds deletion deadlines should be grouped by.
+        """
+        self._due: dict[hikari.Snowflake, list[tuple[hikari.Snowflake, bool]]] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[tuple[hikari.Snowflake, hikari.Snowflake], _PendingDelete] = {}
+        self._register_task = register_task
+        self._resolution = resolution
+        self._rest = rest
+        self._wheel: TimerWheel | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _get_wheel(self) -> TimerWheel:
+        loop = asyncio.get_running_loop()
+        if self._wheel is None or self._loop is not loop:
+            self._loop = loop
+            self._wheel = TimerWheel(loop, resolution=self._resolution)
+            self._rearm(self._wheel)
+
+        return self._wheel
+
+    def _rearm(self, wheel: TimerWheel, /) -> None:
+        # Timers and handles from a previous event loop will never be called,
+        # so move any deletions which are still pending over to the new wheel.
+        self._flush_handle = None
+        now = time.time()
+        for (channel_id, message_id), pending in self._pending.items():
+            pending.entry.cancel()
+            entry = self._call_later(wheel, pending.deadline - now, channel_id, message_id, pending.bulk)
+            self._pending[(channel_id, message_id)] = pending._replace(entry=entry)
+
+        due = self._due
+        self._due = {}
+        for channel_id, messages in due.items():
+            for message_id, bulk in messages:
+                entry = self._call_later(wheel, 0.0, channel_id, message_id, bulk)
+                self._pending[(channel_id, message_id)] = _PendingDelete(now, bulk, entry)
+
+    def _call_later(
+        self,
+        wheel: TimerWheel,
+        delay: float,
+        channel_id: hikari.Snowflake,
+        message_id: hikari.Snowflake,
+        bulk: bool,  # noqa: FBT001
+        /,
+    ) -> TimerEntry:
+        return wheel.call_later(max(0.0, delay), lambda: self._queue(channel_id, message_id, bulk))
+
+    def schedule_message(
+        self, delay: float, channel_id: hikari.Snowflakeish, message_id: hikari.Snowflakeish, /, *, bulk: bool = False
+    ) -> None:
+        """Schedule a message to be deleted using the bot's token.
+
+        If the message is already scheduled to be deleted then the earliest
+        deadline is kept.
+
+        Parameters
+        ----------
+        delay
+            How many seconds to wait before deleting the message.
+        channel_id
+            ID of the channel the message is in.
+        message_id
+            ID of the message to delete.
+        bulk
+            Whether the message may be deleted using the bulk delete endpoint.
+
+            This should only be [True][] for messages in guild channels.
+        """
+        self._schedule_message(time.time() + delay, hikari.Snowflake(channel_id), hikari.Snowflake(message_id), bulk)
+
+    def _schedule_message(
+        self, deadline: float, channel_id: hikari.Snowflake, message_id: hikari.Snowflake, bulk: bool, /  # noqa: FBT001
+    ) -> None:
+        wheel = self._get_wheel()
+        key = (channel_id, message_id)
+        if (pending := self._pending.get(key)) is not None:
+            if pending.deadline <= deadline:
+                return
+
+            pending.entry.cancel()
+
+        entry = self._call_later(wheel, deadline - time.time(), channel_id, message_id, bulk)
+        self._pending[key] = _PendingDelete(deadline, bulk, entry)
+
+    def schedule_callback(
+        self, delay: float, callback: collections.Callable[[], collections.Coroutine[typing.Any, typing.Any, None]], /
+    ) -> TimerEntry:
+        """Schedule an asynchronous deletion callback to be called after a delay.
+
+        This is used for messages which have to be deleted through an
+        interaction's webhook.
+
+        Parameters
+        ----------
+        delay
+            How many seconds to wait before calling the callback.
+        callback
+            The asynchronous callback to call.
+
+        Returns
+        -------
+        TimerEntry
+            The scheduled timer.
+        """
+        return self._get_wheel().call_later(delay, lambda: self._register_task(asyncio.create_task(callback())))
+
+    def _queue(self, channel_id: hikari.Snowflake, message_id: hikari.Snowflake, bulk: bool, /) -> None:  # noqa: FBT001
+        del self._pending[(channel_id, message_id)]
+        self._due.setdefault(channel_id, []).append((message_id, bulk))
+        # Entries due in the same timer wheel bucket are all called before the
+        # loop gets round to this, letting them be grouped by channel.
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        due = self._due
+        self._due = {}
+        for channel_id, messages in due.items():
+            self._register_task(asyncio.create_task(self._delete_messages(channel_id, messages)))
+
+    async def _delete_messages(
+        self, channel_id: hikari.Snowflake, messages: list[tuple[hikari.Snowflake, bool]], /
+    ) -> None:
+        min_created_at = datetime.datetime.now(tz=datetime.UTC) - _BULK_DELETE_MAX_AGE
+        bulk_ids = [message_id for message_id, bulk in messages if bulk and message_id.created_at > min_created_at]
+        single_ids = [message_id for message_id, _ in messages]
+        if len(bulk_ids) > 1:
+            try:
+                await self._rest.delete_messages(channel_id, bulk_ids)
+
+            except hikari.BulkDeleteError as exc:
+                _LOGGER.debug("Failed to bulk delete %s response messages", len(bulk_ids), exc_info=exc)
+                deleted = {hikari.Snowflake(message) for message in exc.deleted_messages}
+                single_ids = [message_id for message_id in single_ids if message_id not in deleted]
+
+            else:
+                deleted = set(bulk_ids)
+                single_ids = [message_id for message_id in single_ids if message_id not in deleted]
+
+        for message_id in single_ids:
+            try:
+                await self._rest.delete_message(channel_id, message_id)
+
+            except hikari.NotFoundError as exc:
+                _LOGGER.debug("Failed to delete response message %s", message_id, exc_info=exc)
+
+            except hikari.HTTPError as exc:
+                _LOGGER.warning("Failed to delete response message %s", message_id, exc_info=exc)
+
+    def cancel_messages(self) -> list[tuple[hikari.Snowflake, hikari.Snowflake, float, bool]]:
+        """Cancel all the pending message deletions.
+
+        Returns
+        -------
+        list[tuple[hikari.snowflakes.Snowflake, hikari.snowflakes.Snowflake, float, bool]]
+            The cancelled deletions as `(channel_id, message_id, deadline, bulk)`
+            tuples where `deadline` is a unix timestamp.
+        """
+        pending = self._pending
+        self._pending = {}
+        for value in pending.values():
+            value.entry.cancel()
+
+        return [
+            (channel_id, message_id, value.deadline, value.bulk) for (channel_id, message_id), value in pending.items()
+        ]
+
+    async def save(self, path: pathlib.Path, /) -> None:
+        """Cancel the pending message deletions and save them to a file.
+
+        If there are no pending deletions then the file will be removed.
+
+        Parameters
+        ----------
+        path
+            Path of the JSON file to save the pending deletions to.
+        """
+        pending = [[int(c), int(m), deadline, bulk] for c, m, deadline, bulk in self.cancel_messages()]
+        await asyncio.get_running_loop().run_in_executor(None, _write_pending, path, pending)
+
+    async def load(self, path: pathlib.Path, /) -> None:
+        """Load and schedule the pending message deletions saved by [DeleteScheduler.save][].
+
+        Deletions which were due while they weren't scheduled will be done
+        straight away.
+
+        Parameters
+        ----------
+        path
+            Path of the JSON file to load the pending deletions from.
+
+            Nothing will be loaded if this doesn't exist or is invalid.
+        """
+        try:
+            pending = await asyncio.get_running_loop().run_in_executor(None, _read_pending, path)
+
+        except FileNotFoundError:
+            return
+
+        except (TypeError, ValueError) as exc:
+            _LOGGER.warning("Ignoring invalid pending deletions file %s", path, exc_info=exc)
+            return
+
+        for deadline, channel_id, message_id, bulk in pending:
+            self._schedule_message(deadline, channel_id, message_id, bulk)
+
+
+def _write_pending(path: pathlib.Path, pending: list[list[typing.Any]], /) -> None:
+    if pending:
+        path.write_text(json.dumps(pending))
+
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _read_pending(path: pathlib.Path, /) -> list[tuple[float, hikari.Snowflake, hikari.Snowflake, bool]]:
+    data = json.loads(path.read_text())
+    if not isinstance(data, list):
+        error_message = "Expected a list of pending deletions"
+        raise TypeError(error_message)
+
+    return [
+        (float(deadline), hikari.Snowflake(channel_id), hikari.Snowflake(message_id), bool(bulk))
+        for channel_id, message_id, deadline, bulk in data
+    ]
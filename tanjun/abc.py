@@ -39,6 +39,8 @@ __all__: list[str] = [
     "AutocompleteContext",
     "AutocompleteSig",
     "BaseSlashCommand",
+    "CheckCost",
+    "CheckMode",
     "CheckSig",
     "Client",
     "ClientCallbackNames",
@@ -3790,6 +3792,44 @@ class ClientCallbackNames(str, enum.Enum):
     """
 
 
+class CheckCost(int, enum.Enum):
+    """Hint of how expensive a check is to run.
+
+    This is used by [CheckMode.ORDERED][tanjun.abc.CheckMode.ORDERED] to decide
+    which checks can be run inline. Checks declare this by setting a
+    `__tanjun_check_cost__` attribute (see
+    [tanjun.checks.set_check_cost][]); synchronous checks which don't declare
+    a cost are treated as [CheckCost.CHEAP][tanjun.abc.CheckCost.CHEAP] and
+    asynchronous checks which don't declare a cost are treated as
+    [CheckCost.EXPENSIVE][tanjun.abc.CheckCost.EXPENSIVE].
+    """
+
+    CHEAP = 0
+    """The check is cheap to run and doesn't make any requests."""
+
+    EXPENSIVE = 1
+    """The check may be expensive to run (e.g. it may make REST requests)."""
+
+
+class CheckMode(str, enum.Enum):
+    """The possible strategies for evaluating a collection of checks."""
+
+    GATHER = "GATHER"
+    """Run all the checks concurrently.
+
+    This is the default.
+    """
+
+    ORDERED = "ORDERED"
+    """Run cheap checks inline first then gather the remaining expensive checks.
+
+    The cheap checks are run one at a time in the order they were added and
+    evaluation stops at the first failing check. The remaining checks are then
+    run concurrently and any which are still pending get cancelled as soon as
+    one fails.
+    """
+
+
 class Client(abc.ABC):
     """Abstract interface of a Tanjun client.
 
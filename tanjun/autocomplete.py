@@ -0,0 +1,368 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Indexed choice sources for autocomplete callbacks."""
+from __future__ import annotations
+
+__all__: list[str] = ["ChoiceSource"]
+
+import bisect
+import heapq
+import itertools
+import typing
+from collections import abc as collections
+
+if typing.TYPE_CHECKING:
+    from typing import Self
+
+    import hikari
+
+    from . import abc as tanjun
+
+
+_MAX_CHOICES = 25
+
+
+def _trigrams(text: str, /) -> set[str]:
+    # Padding means that the start and end of a name have their own trigrams
+    # and that names shorter than 3 characters still get indexed.
+    text = f"  {text} "
+    return {text[index : index + 3] for index in range(len(text) - 2)}
+
+
+class _NameIndex:
+    """Prefix and trigram index of the names for a single locale."""
+
+    __slots__ = ("_names", "_sorted", "_trigrams")
+
+    def __init__(self) -> None:
+        self._names: dict[str, str] = {}
+        self._sorted: list[tuple[str, str]] = []
+        self._trigrams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, value: str, name: str, /) -> None:
+        self.remove(value)
+        folded = name.casefold()
+        self._names[value] = folded
+        bisect.insort(self._sorted, (folded, value))
+        for trigram in _trigrams(folded):
+            self._trigrams.setdefault(trigram, set()).add(value)
+
+    def remove(self, value: str, /) -> None:
+        folded = self._names.pop(value, None)
+        if folded is None:
+            return
+
+        del self._sorted[bisect.bisect_left(self._sorted, (folded, value))]
+        for trigram in _trigrams(folded):
+            values = self._trigrams[trigram]
+            values.discard(value)
+            if not values:
+                del self._trigrams[trigram]
+
+    def prefix(self, query: str, /) -> collections.Iterator[str]:
+        for folded, value in itertools.islice(self._sorted, bisect.bisect_left(self._sorted, (query,)), None):
+            if not folded.startswith(query):
+                break
+
+            yield value
+
+    def substring(self, query: str, limit: int, /) -> list[str]:
+        if len(query) < 3:  # noqa: PLR2004
+            # Short queries don't narrow the trigram index down, so walk the
+            # already sorted names instead and stop once there's enough.
+            return list(itertools.islice((value for folded, value in self._sorted if query in folded), limit))
+
+        trigram_sets = sorted(
+            (self._trigrams.get(query[index : index + 3], set()) for index in range(len(query) - 2)), key=len
+        )
+        candidates = trigram_sets[0].intersection(*trigram_sets[1:])
+        matches = ((self._names[value], value) for value in candidates if query in self._names[value])
+        return [value for _, value in heapq.nsmallest(limit, matches)]
+
+    def fuzzy(self, query: str, threshold: float, /) -> list[tuple[float, str]]:
+        query_trigrams = _trigrams(query)
+        counts: dict[str, int] = {}
+        for trigram in query_trigrams:
+            for value in self._trigrams.get(trigram, ()):
+                counts[value] = counts.get(value, 0) + 1
+
+        results: list[tuple[float, str]] = []
+        for value, count in counts.items():
+            # Jaccard similarity between the two trigram sets, where a name has
+            # len(name) + 1 padded trigrams (ignoring repeated trigrams).
+            score = count / (len(query_trigrams) + len(self._names[value]) + 1 - count)
+            if score >= threshold:
+                results.append((score, value))
+
+        results.sort(key=lambda entry: (-entry[0], self._names[entry[1]]))
+        return results
+
+
+class ChoiceSource:
+    """Indexed source of choices for a string option's autocomplete.
+
+    This keeps a sorted index and a trigram index of the choice names so
+    prefix, substring and fuzzy matches can be found without scanning every
+    choice, and can be updated in place.
+
+    Instances of this can be directly used as an autocomplete callback for
+    string options.
+
+    Examples
+    --------
+    ```py
+    colours = tanjun.autocomplete.ChoiceSource(["Red", "Green", "Blue"])
+
+    @tanjun.with_str_slash_option("colour", "A colour", autocomplete=colours)
+    @tanjun.as_slash_command("paint", "Paint something")
+    async def paint(ctx: tanjun.abc.SlashContext, colour: str) -> None:
+        ...
+    ```
+    """
+
+    __slots__ = ("_default_index", "_fuzzy_threshold", "_locale_indexes", "_localised", "_max_results", "_names")
+
+    def __init__(
+        self,
+        choices: collections.Mapping[str, str] | collections.Iterable[str] = (),
+        /,
+        *,
+        fuzzy_threshold: float | None = 0.3,
+        max_results: int = _MAX_CHOICES,
+    ) -> None:
+        """Initialise a choice source.
+
+        Parameters
+        ----------
+        choices
+            Either a mapping of choice names to their values or an iterable of
+            choice names which will also be used as the values.
+        fuzzy_threshold
+            The minimum trigram similarity (between 0 and 1) a choice's name
+            must have with the query to be returned as a fuzzy match.
+
+            If this is [None][] then fuzzy matching will be disabled.
+        max_results
+            The maximum amount of choices to return for a query.
+
+        Raises
+        ------
+        ValueError
+            If `max_results` isn't between 1 and 25 (inclusive).
+            If `fuzzy_threshold` isn't between 0 and 1 (inclusive).
+        """
+        if not 1 <= max_results <= _MAX_CHOICES:
+            error_message = f"max_results must be between 1 and {_MAX_CHOICES}"
+            raise ValueError(error_message)
+
+        if fuzzy_threshold is not None and not 0 <= fuzzy_threshold <= 1:
+            error_message = "fuzzy_threshold must be between 0 and 1"
+            raise ValueError(error_message)
+
+        self._default_index = _NameIndex()
+        self._fuzzy_threshold = fuzzy_threshold
+        self._localised: dict[str, dict[str, str]] = {}
+        self._locale_indexes: dict[str, _NameIndex] = {}
+        self._max_results = max_results
+        self._names: dict[str, str] = {}
+
+        if isinstance(choices, collections.Mapping):
+            for name, value in choices.items():
+                self.add(name, value)
+
+        else:
+            for name in choices:
+                self.add(name)
+
+    def __contains__(self, value: object, /) -> bool:
+        return value in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    async def __call__(self, ctx: tanjun.AutocompleteContext, value: str, /) -> None:
+        await ctx.set_choices(self.search(value, locale=ctx.interaction.locale))
+
+    def add(
+        self,
+        name: str,
+        value: str | None = None,
+        /,
+        *,
+        localisations: collections.Mapping[str, str] | collections.Mapping[hikari.Locale, str] | None = None,
+    ) -> Self:
+        """Add or replace a choice.
+
+        Parameters
+        ----------
+        name
+            The choice's default name.
+        value
+            The choice's value.
+
+            If this is left as [None][] then `name` will be used as the value.
+        localisations
+            Mapping of locales to the choice's name in that locale.
+
+        Returns
+        -------
+        Self
+            The choice source to enable chained calls.
+        """
+        value = name if value is None else value
+        self.remove(value)
+        self._names[value] = name
+        self._default_index.add(value, name)
+        if localisations:
+            localised = self._localised[value] = {str(locale): name for locale, name in localisations.items()}
+            for locale, localised_name in localised.items():
+                index = self._locale_indexes.get(locale)
+                if index is None:
+                    index = self._locale_indexes[locale] = _NameIndex()
+
+                index.add(value, localised_name)
+
+        return self
+
+    def clear(self) -> Self:
+        """Remove all the choices.
+
+        Returns
+        -------
+        Self
+            The choice source to enable chained calls.
+        """
+        self._default_index = _NameIndex()
+        self._localised.clear()
+        self._locale_indexes.clear()
+        self._names.clear()
+        return self
+
+    def remove(self, value: str, /) -> Self:
+        """Remove a choice if present.
+
+        Parameters
+        ----------
+        value
+            The value of the choice to remove.
+
+        Returns
+        -------
+        Self
+            The choice source to enable chained calls.
+        """
+        if self._names.pop(value, None) is None:
+            return self
+
+        self._default_index.remove(value)
+        for locale in self._localised.pop(value, ()):
+            index = self._locale_indexes[locale]
+            index.remove(value)
+            if not index:
+                del self._locale_indexes[locale]
+
+        return self
+
+    def search(
+        self, query: str, /, *, locale: str | hikari.Locale | None = None, limit: int | None = None
+    ) -> list[tuple[str, str]]:
+        """Find the choices which match a query.
+
+        Prefix matches are returned first, followed by substring matches and
+        then fuzzy matches (ordered by how similar they are to the query).
+        Matching is case-insensitive.
+
+        Parameters
+        ----------
+        query
+            The query to match choices against.
+        locale
+            The locale to match localised names for.
+
+            Choices are matched against both their name in this locale and
+            their default name.
+        limit
+            The maximum amount of choices to return.
+
+            Defaults to the source's `max_results`.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            A list of the matching choices' names (localised if possible) and
+            their values.
+        """
+        limit = self._max_results if limit is None else limit
+        locale = str(locale) if locale is not None else None
+        indexes = [self._default_index]
+        if locale is not None and (locale_index := self._locale_indexes.get(locale)):
+            indexes.insert(0, locale_index)
+
+        query = query.casefold()
+        found: dict[str, None] = {}
+
+        def extend(values: collections.Iterable[str], /) -> bool:
+            for value in values:
+                found[value] = None
+                if len(found) >= limit:
+                    return True
+
+            return False
+
+        for index in indexes:
+            if extend(index.prefix(query)):
+                return self._to_choices(found, locale)
+
+        if query:
+            for index in indexes:
+                # Prefix matches already found may be repeated in these results.
+                if extend(index.substring(query, limit + len(found))):
+                    return self._to_choices(found, locale)
+
+            if self._fuzzy_threshold is not None:
+                matches = sorted(
+                    itertools.chain.from_iterable(index.fuzzy(query, self._fuzzy_threshold) for index in indexes),
+                    key=lambda entry: -entry[0],
+                )
+                extend(value for _, value in matches)
+
+        return self._to_choices(found, locale)
+
+    def _to_choices(self, values: collections.Iterable[str], locale: str | None, /) -> list[tuple[str, str]]:
+        results: list[tuple[str, str]] = []
+        for value in values:
+            localised = self._localised.get(value)
+            name = localised.get(locale) if localised and locale else None
+            results.append((name or self._names[value], value))
+
+        return results
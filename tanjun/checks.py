@@ -41,6 +41,8 @@ __all__: list[str] = [
     "SfwCheck",
     "all_checks",
     "any_checks",
+    "set_check_cost",
+    "set_check_memoisable",
     "with_all_checks",
     "with_any_checks",
     "with_author_permission_check",
@@ -78,6 +80,7 @@ if typing.TYPE_CHECKING:
         ) -> bool:
             raise NotImplementedError
 
+    _CheckSigT = typing.TypeVar("_CheckSigT", bound=tanjun.AnyCheckSig)
     _CommandT = typing.TypeVar("_CommandT", bound=tanjun.ExecutableCommand[typing.Any])
     _CallbackReturnT = _CommandT | collections.Callable[[_CommandT], _CommandT]
     _MenuCommandT = typing.TypeVar("_MenuCommandT", bound=tanjun.MenuCommand[typing.Any, typing.Any])
@@ -520,6 +523,8 @@ class OwnPermissionCheck(_Check):
         localiser: alluka.Injected[dependencies.AbstractLocaliser | None] = None,
         my_user: hikari.OwnUser = dependencies.inject_lc(hikari.OwnUser),  # noqa: B008
         member_cache: alluka.Injected[_MemberCacheT] = None,
+        own_permissions_cache: alluka.Injected[permissions.OwnPermissionsCache | None] = None,
+        rest_flights: alluka.Injected[_internal.RestFlights | None] = None,
     ) -> bool:
         if ctx.guild_id is None:
             perms = permissions.DM_PERMISSIONS
@@ -528,13 +533,23 @@ class OwnPermissionCheck(_Check):
             assert ctx.interaction.app_permissions is not None
             perms = ctx.interaction.app_permissions
 
-        elif ctx.cache and (member := ctx.cache.get_member(ctx.guild_id, my_user)):
-            perms = await permissions.fetch_permissions(ctx.client, member, channel=ctx.channel_id)
+        elif own_permissions_cache and (cached := own_permissions_cache.get(ctx.guild_id, ctx.channel_id)) is not None:
+            perms = cached
 
         else:
-            member = await member_cache.get_from_guild(ctx.guild_id, my_user.id, default=None) if member_cache else None
-            member = member or await ctx.rest.fetch_member(ctx.guild_id, my_user.id)
-            perms = await permissions.fetch_permissions(ctx.client, member, channel=ctx.channel_id)
+            generation = own_permissions_cache.get_generation(ctx.guild_id) if own_permissions_cache else None
+            if ctx.cache and (member := ctx.cache.get_member(ctx.guild_id, my_user)):
+                perms = await permissions.fetch_permissions(ctx.client, member, channel=ctx.channel_id)
+
+            else:
+                member = (
+                    await member_cache.get_from_guild(ctx.guild_id, my_user.id, default=None) if member_cache else None
+                )
+                member = member or await (rest_flights or ctx.rest).fetch_member(ctx.guild_id, my_user.id)
+                perms = await permissions.fetch_permissions(ctx.client, member, channel=ctx.channel_id)
+
+            if own_permissions_cache:
+                own_permissions_cache.set(ctx.guild_id, ctx.channel_id, perms, generation=generation)
 
         missing_perms = ~perms & self._permissions
         return self._handle_result(ctx, localiser, missing_perms, result=missing_perms is hikari.Permissions.NONE)
@@ -1014,12 +1029,71 @@ def with_check(
     return lambda command: _add_to_command(command, check, follow_wrapped=follow_wrapped)
 
 
+def set_check_cost(check: _CheckSigT, cost: tanjun.CheckCost, /) -> _CheckSigT:
+    """Declare how expensive a check is to run.
+
+    This is used by [CheckMode.ORDERED][tanjun.abc.CheckMode.ORDERED] to
+    decide which checks can be run inline before the others.
+
+    !!! note
+        Check classes can instead declare this by setting the class attribute
+        `__tanjun_check_cost__`.
+
+    Parameters
+    ----------
+    check
+        The check to set the cost of.
+    cost
+        The check's cost.
+
+    Returns
+    -------
+    _CheckSigT
+        The check to allow for chaining.
+    """
+    setattr(check, _internal.CHECK_COST_ATTRIBUTE, tanjun.CheckCost(cost))
+    return check
+
+
+def set_check_memoisable(check: _CheckSigT, state: bool, /) -> _CheckSigT:  # noqa: FBT001
+    """Set whether a check's result may be memoised for a context.
+
+    Checks are memoisable by default and should only opt out of this if their
+    result depends on the command set on the context (or otherwise isn't
+    deterministic for a single message or interaction). This only has an
+    effect when [Client.set_memoise_checks][tanjun.Client.set_memoise_checks]
+    is enabled.
+
+    !!! note
+        Check classes can instead declare this by setting the class attribute
+        `__tanjun_check_memoise__`.
+
+    Parameters
+    ----------
+    check
+        The check to set this for.
+    state
+        Whether the check's result may be memoised.
+
+    Returns
+    -------
+    _CheckSigT
+        The check to allow for chaining.
+    """
+    setattr(check, _internal.CHECK_MEMOISE_ATTRIBUTE, state)
+    return check
+
+
 class _AllChecks(typing.Generic[_ContextT]):
     __slots__ = ("__weakref__", "_checks")
 
     def __init__(self, checks: list[tanjun.CheckSig[_ContextT]]) -> None:
         self._checks = checks
 
+    @property
+    def __tanjun_check_memoise__(self) -> bool:
+        return all(map(_internal.is_memoisable, self._checks))
+
     async def __call__(self, ctx: _ContextT, /) -> bool:
         for check in self._checks:
             if not await ctx.call_with_async_di(check, ctx):
@@ -1131,6 +1205,10 @@ class _AnyChecks(_Check, typing.Generic[_ContextT]):
         self._checks = checks
         self._suppress = suppress
 
+    @property
+    def __tanjun_check_memoise__(self) -> bool:
+        return all(map(_internal.is_memoisable, self._checks))
+
     async def __call__(
         self, ctx: _ContextT, /, *, localiser: alluka.Injected[dependencies.AbstractLocaliser | None] = None
     ) -> bool:
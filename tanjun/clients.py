@@ -35,6 +35,7 @@ __all__: list[str] = [
     "ClientCallbackNames",
     "InteractionAcceptsEnum",
     "MessageAcceptsEnum",
+    "PrefixCandidateSig",
     "PrefixGetterSig",
     "as_loader",
     "as_unloader",
@@ -43,6 +44,7 @@ __all__: list[str] = [
 
 import asyncio
 import dataclasses
+import datetime
 import enum
 import functools
 import importlib
@@ -63,10 +65,12 @@ import typing_extensions
 
 from . import _internal
 from . import abc as tanjun
+from . import components
 from . import context
 from . import dependencies
 from . import errors
 from . import hooks
+from ._internal import deletion
 from ._internal import localisation
 
 if typing.TYPE_CHECKING:
@@ -105,6 +109,7 @@ if typing.TYPE_CHECKING:
             register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
             *,
             default_to_ephemeral: bool = False,
+            delete_scheduler: deletion.DeleteScheduler | None = None,
             future: asyncio.Future[_AppCmdResponse] | None = None,
             on_not_found: None | collections.Callable[[tanjun.MenuContext], collections.Awaitable[None]] = None,
         ) -> context.MenuContext:
@@ -118,6 +123,7 @@ if typing.TYPE_CHECKING:
             message: hikari.Message,
             register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
             *,
+            delete_scheduler: deletion.DeleteScheduler | None = None,
             triggering_name: str = "",
             triggering_prefix: str = "",
         ) -> context.MessageContext:
@@ -131,6 +137,7 @@ if typing.TYPE_CHECKING:
             register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
             *,
             default_to_ephemeral: bool = False,
+            delete_scheduler: deletion.DeleteScheduler | None = None,
             future: asyncio.Future[_AppCmdResponse] | None = None,
             on_not_found: None | collections.Callable[[tanjun.SlashContext], collections.Awaitable[None]] = None,
         ) -> context.SlashContext:
@@ -150,6 +157,14 @@ This represents the callback `async def (tanjun.abc.MessageContext, ...) -> coll
 where dependency injection is supported.
 """
 
+PrefixCandidateSig = collections.Callable[[hikari.Message], bool]
+"""Type hint of a callable used to pre-filter messages before the prefix getter is called.
+
+This represents the synchronous callback `def (hikari.Message) -> bool` which
+should return [True][] if the message could start with a prefix returned by
+the prefix getter. Dependency injection isn't supported for this callback.
+"""
+
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.tanjun.clients")
 _MENU_TYPES = frozenset((hikari.CommandType.MESSAGE, hikari.CommandType.USER))
 
@@ -530,17 +545,23 @@ class Client(tanjun.Client):
     """
 
     __slots__ = (
+        "_app_command_routes",
         "_auto_defer_after",
+        "_autocomplete_tasks",
         "_cache",
         "_cached_application_id",
+        "_check_mode",
         "_checks",
         "_client_callbacks",
         "_components",
         "_default_app_cmd_permissions",
         "_defaults_to_ephemeral",
+        "_delete_scheduler",
         "_dms_enabled_for_app_cmds",
+        "_dropped_interactions",
         "_events",
         "_grab_mention_prefix",
+        "_guild_prefixes",
         "_hooks",
         "_injector",
         "_interaction_accepts",
@@ -552,20 +573,33 @@ class Client(tanjun.Client):
         "_make_menu_context",
         "_make_message_context",
         "_make_slash_context",
+        "_memoise_checks",
         "_menu_hooks",
         "_menu_not_found",
+        "_merged_menu_hooks",
+        "_merged_message_hooks",
+        "_merged_slash_hooks",
         "_message_accepts",
         "_message_hooks",
+        "_message_index",
         "_metadata",
         "_modules",
         "_path_modules",
+        "_pending_deletions_path",
+        "_prefix_cache",
+        "_prefix_cache_epoch",
+        "_prefix_candidate_check",
+        "_prefix_flights",
         "_prefix_getter",
+        "_prefix_key_epochs",
         "_prefixes",
         "_rest",
+        "_seen_interactions",
         "_server",
         "_shards",
         "_slash_hooks",
         "_slash_not_found",
+        "_supersede_autocompletes",
         "_tasks",
         "_voice",
     )
@@ -733,15 +767,20 @@ class Client(tanjun.Client):
                 "automatic command dispatch will be unavailable."
             )
 
+        self._app_command_routes = _internal.AppCommandRoutes()
         self._auto_defer_after: float | None = 2.0
+        self._autocomplete_tasks: dict[tuple[hikari.Snowflake, str, str], asyncio.Task[None]] = {}
         self._cache = cache
         self._cached_application_id: hikari.Snowflake | None = None
+        self._check_mode = tanjun.CheckMode.GATHER
         self._checks: list[tanjun.AnyCheckSig] = []
         self._client_callbacks: dict[str, list[tanjun.MetaEventSig]] = {}
         self._components: dict[str, tanjun.Component] = {}
         self._default_app_cmd_permissions = hikari.Permissions.NONE
         self._defaults_to_ephemeral = False
+        self._delete_scheduler = deletion.DeleteScheduler(rest, self._add_task)
         self._dms_enabled_for_app_cmds = True
+        self._dropped_interactions = 0
         self._events = events
         self._grab_mention_prefix = mention_prefix
         self._hooks: tanjun.AnyHooks | None = hooks.AnyHooks().set_on_parser_error(on_parser_error)
@@ -751,6 +790,7 @@ class Client(tanjun.Client):
         self._menu_not_found: str | None = "Command not found"
         self._slash_hooks: tanjun.SlashHooks | None = None
         self._slash_not_found: str | None = self._menu_not_found
+        self._supersede_autocompletes = False
         # TODO: test coverage
         self._injector = injector or alluka.Client()
         self._is_closing = False
@@ -762,14 +802,27 @@ class Client(tanjun.Client):
         self._make_menu_context: _MenuContextMakerProto = context.MenuContext
         self._make_message_context: _MessageContextMakerProto = context.MessageContext
         self._make_slash_context: _SlashContextMakerProto = context.SlashContext
+        self._memoise_checks = False
         self._message_accepts = MessageAcceptsEnum.ALL if events else MessageAcceptsEnum.NONE
+        self._merged_menu_hooks = _internal.MergedHooks[tanjun.MenuHooks]()
+        self._merged_message_hooks = _internal.MergedHooks[tanjun.MessageHooks]()
+        self._merged_slash_hooks = _internal.MergedHooks[tanjun.SlashHooks]()
         self._message_hooks: tanjun.MessageHooks | None = None
+        self._message_index = _internal.MergedMessageIndex()
         self._metadata: dict[typing.Any, typing.Any] = {}
         self._modules: dict[str, types.ModuleType] = {}
         self._path_modules: dict[pathlib.Path, types.ModuleType] = {}
+        self._pending_deletions_path: pathlib.Path | None = None
+        self._prefix_cache: _internal.TimedLRUCache[hikari.Snowflake, _internal.PrefixTrie] | None = None
+        self._prefix_cache_epoch = 0
+        self._prefix_key_epochs: dict[hikari.Snowflake, int] = {}
+        self._prefix_candidate_check: PrefixCandidateSig | None = None
+        self._prefix_flights = _internal.SingleFlight[hikari.Snowflake, _internal.PrefixTrie]()
         self._prefix_getter: PrefixGetterSig | None = None
-        self._prefixes: list[str] = []
+        self._guild_prefixes: dict[hikari.Snowflake, _internal.PrefixTrie] = {}
+        self._prefixes = _internal.PrefixTrie()
         self._rest = rest
+        self._seen_interactions: _internal.SeenIdSet[hikari.Snowflake] | None = None
         self._server = server
         self._shards = shards
         self._tasks: list[asyncio.Task[typing.Any]] = []
@@ -789,6 +842,7 @@ class Client(tanjun.Client):
             .set_type_dependency(type(self), self)
             .set_type_dependency(hikari.api.RESTClient, rest)
             .set_type_dependency(type(rest), rest)
+            .set_type_dependency(_internal.RestFlights, _internal.RestFlights(rest))
             ._maybe_set_type_dep(hikari.api.Cache, cache)
             ._maybe_set_type_dep(type(cache), cache)
             ._maybe_set_type_dep(hikari.api.EventManager, events)
@@ -1151,7 +1205,7 @@ class Client(tanjun.Client):
         await self.close()
 
     def __repr__(self) -> str:
-        return f"CommandClient <{type(self).__name__!r}, {len(self._components)} components, {self._prefixes}>"
+        return f"CommandClient <{type(self).__name__!r}, {len(self._components)} components, {list(self._prefixes)}>"
 
     @property
     def default_app_cmd_permissions(self) -> hikari.Permissions:
@@ -1202,6 +1256,31 @@ class Client(tanjun.Client):
         """
         return self._checks.copy()
 
+    @property
+    def check_mode(self) -> tanjun.CheckMode:
+        """The strategy used to evaluate this client's checks."""
+        return self._check_mode
+
+    @property
+    def memoises_checks(self) -> bool:
+        """Whether check results are memoised for each command dispatch."""
+        return self._memoise_checks
+
+    @property
+    def supersedes_autocompletes(self) -> bool:
+        """Whether newer autocomplete interactions cancel older in-flight ones."""
+        return self._supersede_autocompletes
+
+    @property
+    def deduplicates_interactions(self) -> bool:
+        """Whether interactions which have already been received are ignored."""
+        return self._seen_interactions is not None
+
+    @property
+    def dropped_duplicate_interactions(self) -> int:
+        """How many duplicate interactions have been ignored by this client."""
+        return self._dropped_interactions
+
     @property
     def components(self) -> collections.Collection[tanjun.Component]:
         # <<inherited docstring from tanjun.abc.Client>>.
@@ -1280,10 +1359,24 @@ class Client(tanjun.Client):
         """
         return self._prefix_getter
 
+    @property
+    def prefix_candidate_check(self) -> PrefixCandidateSig | None:
+        """Callback used to pre-filter messages before the prefix getter is called.
+
+        For more information on this callback's signature see
+        [PrefixCandidateSig][tanjun.clients.PrefixCandidateSig].
+        """
+        return self._prefix_candidate_check
+
     @property
     def prefixes(self) -> collections.Collection[str]:
         """Collection of the standard prefixes set for this client."""
-        return self._prefixes.copy()
+        return list(self._prefixes)
+
+    @property
+    def guild_prefixes(self) -> collections.Mapping[hikari.Snowflake, collections.Collection[str]]:
+        """Mapping of guild IDs to the guild specific prefixes set for this client."""
+        return _internal.CastedView(self._guild_prefixes, list)
 
     @property
     def rest(self) -> hikari.api.RESTClient:
@@ -1577,6 +1670,175 @@ class Client(tanjun.Client):
         self._is_case_sensitive = state
         return self
 
+    def set_check_mode(self, mode: tanjun.CheckMode, /) -> Self:
+        """Set the strategy used to evaluate this client's checks.
+
+        Parameters
+        ----------
+        mode
+            The check evaluation strategy.
+
+            This defaults to [CheckMode.GATHER][tanjun.abc.CheckMode.GATHER].
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        self._check_mode = tanjun.CheckMode(mode)
+        return self
+
+    def set_memoise_checks(self, state: bool, /) -> Self:  # noqa: FBT001
+        """Set whether check results should be memoised for each command dispatch.
+
+        When enabled, each check object will only be called once per message or
+        interaction dispatch and its result will be reused when the same check
+        is hit again while searching for a command (e.g. a check which is
+        shared between several commands).
+
+        Checks which depend on the command set on the context can opt out of
+        this with [tanjun.checks.set_check_memoisable][].
+
+        Parameters
+        ----------
+        state
+            Whether check results should be memoised.
+
+            This defaults to [False][].
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        self._memoise_checks = state
+        return self
+
+    def set_supersede_autocompletes(self, state: bool, /) -> Self:  # noqa: FBT001
+        """Set whether newer autocomplete interactions should cancel older in-flight ones.
+
+        When enabled, receiving an autocomplete interaction will cancel the
+        execution of any in-flight autocomplete for the same user, command and
+        focused option, as Discord will discard the older response anyways.
+
+        Parameters
+        ----------
+        state
+            Whether newer autocomplete interactions should supersede older ones.
+
+            This defaults to [False][].
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        self._supersede_autocompletes = state
+        if not state:
+            self._autocomplete_tasks.clear()
+
+        return self
+
+    def set_deduplicate_interactions(
+        self,
+        state: bool,  # noqa: FBT001
+        /,
+        *,
+        expire_after: int | float | datetime.timedelta = datetime.timedelta(minutes=15),
+        max_size: int = 10_000,
+    ) -> Self:
+        """Set whether interactions which have already been received should be ignored.
+
+        This is useful when receiving interactions through both the gateway and
+        an interaction server (e.g. during a migration) or when interactions
+        may be redelivered, as it stops the same interaction from being
+        executed twice. The IDs of recently received command and autocomplete
+        interactions are tracked and duplicates are dropped before a context is
+        built for them.
+
+        Duplicates received through the REST flow are responded to with an
+        empty response.
+
+        Parameters
+        ----------
+        state
+            Whether duplicate interactions should be ignored.
+
+            This defaults to [False][].
+        expire_after
+            How long interaction IDs should be remembered for.
+
+            This defaults to 15 minutes (the lifetime of an interaction).
+        max_size
+            The maximum amount of interaction IDs to remember.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+
+        Raises
+        ------
+        ValueError
+            If `expire_after` is less than or equal to 0 seconds.
+            If `max_size` is less than 1.
+        """
+        if not state:
+            self._seen_interactions = None
+            return self
+
+        if isinstance(expire_after, datetime.timedelta):
+            expire_after = expire_after.total_seconds()
+
+        else:
+            expire_after = float(expire_after)
+
+        if expire_after <= 0:
+            error_message = "expire_after must be more than 0 seconds"
+            raise ValueError(error_message)
+
+        if max_size < 1:
+            error_message = "max_size must be greater than 0"
+            raise ValueError(error_message)
+
+        self._seen_interactions = _internal.SeenIdSet(expire_after=expire_after, max_size=max_size)
+        return self
+
+    def _is_duplicate(self, interaction: hikari.PartialInteraction, /) -> bool:
+        if self._seen_interactions is None or self._seen_interactions.add(interaction.id):
+            return False
+
+        self._dropped_interactions += 1
+        _LOGGER.debug("Ignoring duplicate interaction %s", interaction.id)
+        return True
+
+    def set_pending_deletions_path(self, path: str | pathlib.Path | None, /) -> Self:
+        """Set the file pending response deletions should be persisted to.
+
+        Message command responses which are scheduled to be deleted (using the
+        `delete_after` argument) but haven't been deleted yet will be saved to
+        this file when the client is closed and rescheduled when it's next
+        opened, with any that became due while it was closed being deleted
+        straight away.
+
+        Interaction responses aren't persisted as the interaction will likely
+        have expired by the time the client is restarted.
+
+        Parameters
+        ----------
+        path
+            Path of the JSON file to persist pending deletions to.
+
+            If this is [None][] then pending deletions won't be persisted.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        self._pending_deletions_path = pathlib.Path(path) if path is not None else None
+        return self
+
     def set_default_app_command_permissions(self, permissions: int | hikari.Permissions, /) -> Self:
         """Set the default member permissions needed for this client's commands.
 
@@ -1958,7 +2220,7 @@ class Client(tanjun.Client):
         return check
 
     async def check(self, ctx: tanjun.Context, /) -> bool:
-        return await _internal.gather_checks(ctx, self._checks)
+        return await _internal.gather_checks(ctx, self._checks, mode=self._check_mode)
 
     def add_component(self, component: tanjun.Component, /) -> Self:
         """Add a component to this client.
@@ -1984,6 +2246,23 @@ class Client(tanjun.Client):
 
         component.bind_client(self)
         self._components[component.name] = component
+        if isinstance(component, components.Component):
+            self._app_command_routes.add_component(
+                component,
+                tracked=True,
+                menu_keys=((command.type, command.name) for command in component.menu_commands),
+                slash_names=(command.name for command in component.slash_commands),
+            )
+            component._app_command_routes.append(self._app_command_routes)  # noqa: SLF001
+            if _has_standard_message_execution(component):
+                self._message_index.add_component(component, component._message_commands)  # noqa: SLF001
+
+            else:
+                self._message_index.add_component(component, None)
+
+        else:
+            self._app_command_routes.add_component(component, tracked=False)
+            self._message_index.add_component(component, None)
 
         if self._loop:
             self._add_task(self._loop.create_task(component.open()))
@@ -2005,6 +2284,10 @@ class Client(tanjun.Client):
             raise ValueError(error_message)
 
         del self._components[component.name]
+        self._app_command_routes.remove_component(component)
+        self._message_index.remove_component(component)
+        if isinstance(component, components.Component):
+            component._app_command_routes.remove(self._app_command_routes)  # noqa: SLF001
 
         if self._loop:
             self._add_task(self._loop.create_task(component.close(unbind=True)))
@@ -2142,11 +2425,11 @@ class Client(tanjun.Client):
             The client instance to enable chained calls.
         """
         if isinstance(prefixes, str):
-            if prefixes not in self._prefixes:
-                self._prefixes.append(prefixes)
+            self._prefixes.add(prefixes)
 
         else:
-            self._prefixes.extend(prefix for prefix in prefixes if prefix not in self._prefixes)
+            for prefix in prefixes:
+                self._prefixes.add(prefix)
 
         return self
 
@@ -2171,7 +2454,112 @@ class Client(tanjun.Client):
         self._prefixes.remove(prefix)
         return self
 
-    def set_prefix_getter(self, getter: PrefixGetterSig | None, /) -> Self:
+    def add_guild_prefix(
+        self, guild: hikari.SnowflakeishOr[hikari.PartialGuild], prefixes: collections.Iterable[str] | str, /
+    ) -> Self:
+        """Add a message command prefix which only applies within a specific guild.
+
+        These are matched alongside the client's standard prefixes, with the
+        longest matching prefix being used.
+
+        Parameters
+        ----------
+        guild
+            The guild to add the prefix(es) for.
+        prefixes
+            Either a single string or an iterable of strings to be used as
+            prefixes.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        guild_id = hikari.Snowflake(guild)
+        try:
+            trie = self._guild_prefixes[guild_id]
+
+        except KeyError:
+            trie = self._guild_prefixes[guild_id] = _internal.PrefixTrie()
+
+        if isinstance(prefixes, str):
+            trie.add(prefixes)
+
+        else:
+            for prefix in prefixes:
+                trie.add(prefix)
+
+        return self
+
+    def remove_guild_prefix(self, guild: hikari.SnowflakeishOr[hikari.PartialGuild], prefix: str, /) -> Self:
+        """Remove a guild specific message command prefix from the client.
+
+        Parameters
+        ----------
+        guild
+            The guild to remove the prefix from.
+        prefix
+            The prefix to remove.
+
+        Raises
+        ------
+        ValueError
+            If the prefix is not registered for the guild.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        guild_id = hikari.Snowflake(guild)
+        if not (trie := self._guild_prefixes.get(guild_id)):
+            error_message = f"Prefix {prefix!r} not found"
+            raise ValueError(error_message)
+
+        trie.remove(prefix)
+        if not trie:
+            del self._guild_prefixes[guild_id]
+
+        return self
+
+    def set_guild_prefixes(
+        self, guild: hikari.SnowflakeishOr[hikari.PartialGuild], prefixes: collections.Iterable[str], /
+    ) -> Self:
+        """Replace the guild specific message command prefixes for a guild.
+
+        Parameters
+        ----------
+        guild
+            The guild to set the prefixes for.
+        prefixes
+            Iterable of the prefixes to use for this guild.
+
+            If this is empty then the guild's specific prefixes will be cleared.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        guild_id = hikari.Snowflake(guild)
+        if trie := _internal.PrefixTrie(prefixes):
+            self._guild_prefixes[guild_id] = trie
+
+        else:
+            self._guild_prefixes.pop(guild_id, None)
+
+        return self
+
+    def set_prefix_getter(
+        self,
+        getter: PrefixGetterSig | None,
+        /,
+        *,
+        cache: bool = False,
+        cache_expire_after: int | float | datetime.timedelta | None = datetime.timedelta(minutes=5),
+        cache_max_size: int | None = 1024,
+        candidate_check: PrefixCandidateSig | None = None,
+    ) -> Self:
         """Set the callback used to retrieve message prefixes set for the relevant guild.
 
         Parameters
@@ -2184,15 +2572,109 @@ class Client(tanjun.Client):
             This should be an async callback which one argument of type
             [tanjun.abc.MessageContext][] and returns an iterable of string prefixes.
             Dependency injection is supported for this callback's keyword arguments.
+        cache
+            Whether the prefixes returned by `getter` should be cached.
+
+            These are cached per guild (or per channel for DMs) and concurrent
+            cache misses for the same guild will share a single call to `getter`.
+
+            [Client.invalidate_prefixes][tanjun.Client.invalidate_prefixes]
+            should be called when a guild's prefixes change.
+        cache_expire_after
+            How long cached prefixes should be kept for in seconds.
+
+            If this is [None][] then cached prefixes will only be removed when
+            they're invalidated or evicted.
+        cache_max_size
+            The maximum amount of guilds to cache prefixes for.
+
+            If this is [None][] then the cache's size won't be bounded.
+        candidate_check
+            A cheap synchronous callback used to decide whether a message could
+            start with one of the prefixes returned by `getter`.
+
+            Messages which this returns [False][] for will only be matched
+            against the client's static prefixes and won't have a message
+            context built for them unless one of those matches.
+
+            If this is left as [None][] then a context will be built and
+            `getter` will be called for every message.
 
         Returns
         -------
         Self
             The client instance to enable chained calls.
+
+        Raises
+        ------
+        ValueError
+            If `cache_expire_after` is less than or equal to 0 seconds.
+            If `cache_max_size` is less than 1.
         """
+        if cache and getter:
+            if isinstance(cache_expire_after, datetime.timedelta):
+                cache_expire_after = cache_expire_after.total_seconds()
+
+            elif cache_expire_after is not None:
+                cache_expire_after = float(cache_expire_after)
+
+            if cache_expire_after is not None and cache_expire_after <= 0:
+                error_message = "cache_expire_after must be more than 0 seconds"
+                raise ValueError(error_message)
+
+            if cache_max_size is not None and cache_max_size < 1:
+                error_message = "cache_max_size must be greater than 0"
+                raise ValueError(error_message)
+
+            self._prefix_cache = _internal.TimedLRUCache(expire_after=cache_expire_after, max_size=cache_max_size)
+
+        else:
+            self._prefix_cache = None
+
+        self.invalidate_prefixes()
+        self._prefix_candidate_check = candidate_check if getter else None
         self._prefix_getter = getter
         return self
 
+    def invalidate_prefixes(
+        self, target: hikari.SnowflakeishOr[hikari.PartialGuild | hikari.PartialChannel] | None = None, /
+    ) -> Self:
+        """Invalidate the cached prefixes returned by the prefix getter.
+
+        This does nothing if prefix caching isn't enabled through
+        [Client.set_prefix_getter][tanjun.Client.set_prefix_getter].
+
+        Parameters
+        ----------
+        target
+            The guild to invalidate the cached prefixes for.
+
+            For DMs this should be the DM channel.
+
+            If this is [None][] then all the cached prefixes will be invalidated.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        # Bumping these stops in-progress getter calls from caching stale results.
+        if target is None:
+            self._prefix_cache_epoch += 1
+            self._prefix_key_epochs.clear()
+            self._prefix_flights.forget_all()
+            if self._prefix_cache is not None:
+                self._prefix_cache.clear()
+
+        else:
+            target = hikari.Snowflake(target)
+            self._prefix_key_epochs[target] = self._prefix_key_epochs.get(target, 0) + 1
+            self._prefix_flights.forget(target)
+            if self._prefix_cache is not None:
+                self._prefix_cache.pop(target)
+
+        return self
+
     def with_prefix_getter(self, getter: _PrefixGetterSigT, /) -> _PrefixGetterSigT:
         """Set the prefix getter callback for this client through decorator call.
 
@@ -2288,18 +2770,49 @@ class Client(tanjun.Client):
             component.check_slash_name(name) for component in self._components.values()
         )
 
+    def _match_prefix(self, content: str, guild_id: hikari.Snowflake | None, /) -> str | None:
+        prefix = self._prefixes.match(content)
+        if guild_id is not None and (trie := self._guild_prefixes.get(guild_id)):
+            guild_prefix = trie.match(content)
+            if guild_prefix is not None and (prefix is None or len(guild_prefix) > len(prefix)):
+                return guild_prefix
+
+        return prefix
+
+    def _get_prefix_epoch(self, key: hikari.Snowflake, /) -> tuple[int, int]:
+        return (self._prefix_cache_epoch, self._prefix_key_epochs.get(key, 0))
+
+    async def _fetch_prefixes(
+        self, ctx: tanjun.MessageContext, getter: PrefixGetterSig, key: hikari.Snowflake, epoch: tuple[int, int], /
+    ) -> _internal.PrefixTrie:
+        prefixes = _internal.PrefixTrie(await ctx.call_with_async_di(getter, ctx))
+        if self._prefix_cache is not None and epoch == self._get_prefix_epoch(key):
+            self._prefix_cache.set(key, prefixes)
+
+        return prefixes
+
     async def _check_prefix(self, ctx: tanjun.MessageContext, /) -> str | None:
-        prefix: str  # MyPy fubs up its introspection here so we explicitly annotate.
-        if self._prefix_getter:
-            for prefix in await ctx.call_with_async_di(self._prefix_getter, ctx):
-                if ctx.content.startswith(prefix):
-                    return prefix
-
-        for prefix in self._prefixes:
-            if ctx.content.startswith(prefix):
+        if getter := self._prefix_getter:
+            if self._prefix_cache is not None:
+                key = ctx.guild_id or ctx.channel_id
+                prefixes = self._prefix_cache.get(key)
+                if prefixes is None:
+                    epoch = self._get_prefix_epoch(key)
+                    prefixes = await self._prefix_flights.call(
+                        key, lambda: self._fetch_prefixes(ctx, getter, key, epoch)
+                    )
+
+                prefix = prefixes.match(ctx.content)
+
+            else:
+                prefix = max(
+                    filter(ctx.content.startswith, await ctx.call_with_async_di(getter, ctx)), key=len, default=None
+                )
+
+            if prefix is not None:
                 return prefix
 
-        return None  # MyPy compat
+        return self._match_prefix(ctx.content, ctx.guild_id)
 
     async def close(self, *, deregister_listeners: bool = True) -> None:
         """Close the client.
@@ -2342,6 +2855,9 @@ class Client(tanjun.Client):
 
         await asyncio.gather(*(component.close() for component in self._components.copy().values()))
 
+        if self._pending_deletions_path:
+            await self._delete_scheduler.save(self._pending_deletions_path)
+
         self._loop = None
         await self.dispatch_client_callback(ClientCallbackNames.CLOSED)
         self._is_closing = False
@@ -2381,14 +2897,16 @@ class Client(tanjun.Client):
             if not user:
                 user = await self._rest.fetch_my_user()
 
-            for prefix in f"<@{user.id}>", f"<@!{user.id}>":
-                if prefix not in self._prefixes:
-                    self._prefixes.append(prefix)
+            self._prefixes.add(f"<@{user.id}>")
+            self._prefixes.add(f"<@!{user.id}>")
 
             self._grab_mention_prefix = False
 
         await asyncio.gather(*(component.open() for component in self._components.copy().values()))
 
+        if self._pending_deletions_path:
+            await self._delete_scheduler.load(self._pending_deletions_path)
+
         if register_listeners and self._server:
             if self._interaction_accepts & InteractionAcceptsEnum.COMMANDS:
                 self._server.set_listener(hikari.CommandInteraction, self.on_command_interaction_request)
@@ -2459,6 +2977,9 @@ class Client(tanjun.Client):
             The client instance to enable chained calls.
         """
         self._hooks = hooks
+        self._merged_menu_hooks.clear()
+        self._merged_message_hooks.clear()
+        self._merged_slash_hooks.clear()
         return self
 
     def set_menu_hooks(self, hooks: tanjun.MenuHooks | None, /) -> Self:
@@ -2481,6 +3002,7 @@ class Client(tanjun.Client):
             The client instance to enable chained calls.
         """
         self._menu_hooks = hooks
+        self._merged_menu_hooks.clear()
         return self
 
     def set_slash_hooks(self, hooks: tanjun.SlashHooks | None, /) -> Self:
@@ -2503,6 +3025,7 @@ class Client(tanjun.Client):
             The client instance to enable chained calls.
         """
         self._slash_hooks = hooks
+        self._merged_slash_hooks.clear()
         return self
 
     def set_message_hooks(self, hooks: tanjun.MessageHooks | None, /) -> Self:
@@ -2525,6 +3048,7 @@ class Client(tanjun.Client):
             The client instance to enable chained calls.
         """
         self._message_hooks = hooks
+        self._merged_message_hooks.clear()
         return self
 
     def load_directory(self, directory: str | pathlib.Path, /, *, namespace: str | None = None) -> Self:
@@ -2813,30 +3337,56 @@ class Client(tanjun.Client):
         event
             The event to handle.
         """
-        if event.message.content is None:
+        if (content := event.message.content) is None:
             return
 
-        ctx = self._make_message_context(
-            client=self, register_task=self._add_task, content=event.message.content, message=event.message
-        )
-        if (prefix := await self._check_prefix(ctx)) is None:
-            return
+        if self._prefix_getter and (not self._prefix_candidate_check or self._prefix_candidate_check(event.message)):
+            ctx = self._make_message_context(
+                client=self,
+                register_task=self._add_task,
+                delete_scheduler=self._delete_scheduler,
+                content=content,
+                message=event.message,
+            )
+            prefix = await self._check_prefix(ctx)
 
-        ctx.set_content(ctx.content.lstrip()[len(prefix) :].lstrip()).set_triggering_prefix(prefix)
-        hooks: set[tanjun.MessageHooks] | None = None
-        if self._hooks and self._message_hooks:
-            hooks = {self._hooks, self._message_hooks}
+        # Most messages aren't commands so the static prefixes are checked against
+        # the raw content before a (relatively expensive) context is built.
+        elif (prefix := self._match_prefix(content, event.message.guild_id)) is not None:
+            ctx = self._make_message_context(
+                client=self,
+                register_task=self._add_task,
+                delete_scheduler=self._delete_scheduler,
+                content=content,
+                message=event.message,
+            )
 
-        elif self._hooks:
-            hooks = {self._hooks}
+        else:
+            return
 
-        elif self._message_hooks:
-            hooks = {self._message_hooks}
+        if prefix is None:
+            return
 
+        if self._memoise_checks:
+            _internal.enable_check_memo(ctx)
+
+        ctx.set_content(ctx.content.lstrip()[len(prefix) :].lstrip()).set_triggering_prefix(prefix)
+        hooks = self._merged_message_hooks.merge(None, self._hooks, self._message_hooks)
         try:
             if await self.check(ctx):
-                for component in self._components.values():
-                    if await component.execute_message(ctx, hooks=hooks):
+                # The merged index is used to only try the components which have
+                # a command that could match this message.
+                for component, candidates in self._message_index.find(
+                    ctx.content, case_sensitive=self._is_case_sensitive
+                ):
+                    if candidates is None:
+                        if await component.execute_message(ctx, hooks=_copy_hooks(hooks)):
+                            return
+
+                    # Only standard components are indexed with their candidates.
+                    elif await typing.cast("components.Component", component)._execute_message(  # noqa: SLF001
+                        ctx, candidates, hooks=hooks
+                    ):
                         return
 
         except errors.HaltExecution:
@@ -2848,31 +3398,11 @@ class Client(tanjun.Client):
 
         await self.dispatch_client_callback(ClientCallbackNames.MESSAGE_COMMAND_NOT_FOUND, ctx)
 
-    def _get_slash_hooks(self) -> set[tanjun.SlashHooks] | None:
-        hooks: set[tanjun.SlashHooks] | None = None
-        if self._hooks and self._slash_hooks:
-            hooks = {self._hooks, self._slash_hooks}
-
-        elif self._hooks:
-            hooks = {self._hooks}
-
-        elif self._slash_hooks:
-            hooks = {self._slash_hooks}
-
-        return hooks
-
-    def _get_menu_hooks(self) -> set[tanjun.MenuHooks] | None:
-        hooks: set[tanjun.MenuHooks] | None = None
-        if self._hooks and self._menu_hooks:
-            hooks = {self._hooks, self._menu_hooks}
+    def _get_slash_hooks(self) -> collections.MutableSet[tanjun.SlashHooks] | None:
+        return self._merged_slash_hooks.merge(None, self._hooks, self._slash_hooks)
 
-        elif self._hooks:
-            hooks = {self._hooks}
-
-        elif self._menu_hooks:
-            hooks = {self._menu_hooks}
-
-        return hooks
+    def _get_menu_hooks(self) -> collections.MutableSet[tanjun.MenuHooks] | None:
+        return self._merged_menu_hooks.merge(None, self._hooks, self._menu_hooks)
 
     async def _on_menu_not_found(self, ctx: tanjun.MenuContext, /) -> None:
         await self.dispatch_client_callback(ClientCallbackNames.MENU_COMMAND_NOT_FOUND, ctx)
@@ -2884,6 +3414,14 @@ class Client(tanjun.Client):
         if self._slash_not_found and not ctx.has_responded:
             await ctx.create_initial_response(self._slash_not_found)
 
+    def _track_autocomplete(self, ctx: tanjun.AutocompleteContext, task: asyncio.Task[None], /) -> None:
+        key = (ctx.author.id, ctx.triggering_name, ctx.focused.name)
+        if (old_task := self._autocomplete_tasks.get(key)) and not old_task.done():
+            old_task.cancel()
+
+        self._autocomplete_tasks[key] = task
+        task.add_done_callback(lambda t: self._autocomplete_tasks.get(key) is t and self._autocomplete_tasks.pop(key))
+
     async def on_gateway_autocomplete_create(self, interaction: hikari.AutocompleteInteraction, /) -> None:
         """Execute command autocomplete based on a received gateway interaction create.
 
@@ -2892,12 +3430,33 @@ class Client(tanjun.Client):
         interaction
             The interaction to execute a command based on.
         """
+        if self._is_duplicate(interaction):
+            return
+
         ctx = self._make_autocomplete_context(self, interaction)
-        for component in self._components.values():
-            if coro := component.execute_autocomplete(ctx):
+        for component in self._app_command_routes.find_slash(interaction.command_name):
+            if not (coro := component.execute_autocomplete(ctx)):
+                continue
+
+            if not self._supersede_autocompletes:
                 await coro
                 return
 
+            task = asyncio.get_running_loop().create_task(coro)
+            self._track_autocomplete(ctx, task)
+            try:
+                await asyncio.wait((task,))
+
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+
+            # A task which was cancelled here was superseded by a newer interaction.
+            if not task.cancelled():
+                task.result()
+
+            return
+
     async def on_gateway_command_create(self, interaction: hikari.CommandInteraction, /) -> None:
         """Execute an app command based on a received gateway interaction create.
 
@@ -2906,21 +3465,28 @@ class Client(tanjun.Client):
         interaction
             The interaction to execute a command based on.
         """
+        if self._is_duplicate(interaction):
+            return None
+
         if interaction.command_type is hikari.CommandType.SLASH:
             ctx: context.MenuContext | context.SlashContext = self._make_slash_context(
                 client=self,
                 interaction=interaction,
                 register_task=self._add_task,
+                delete_scheduler=self._delete_scheduler,
                 on_not_found=self._on_slash_not_found,
                 default_to_ephemeral=self._defaults_to_ephemeral,
             )
-            hooks: set[tanjun.MenuHooks] | set[tanjun.SlashHooks] | None = self._get_slash_hooks()
+            hooks: collections.MutableSet[tanjun.MenuHooks] | collections.MutableSet[tanjun.SlashHooks] | None = (
+                self._get_slash_hooks()
+            )
 
         elif interaction.command_type in _MENU_TYPES:
             ctx = self._make_menu_context(
                 client=self,
                 interaction=interaction,
                 register_task=self._add_task,
+                delete_scheduler=self._delete_scheduler,
                 on_not_found=self._on_menu_not_found,
                 default_to_ephemeral=self._defaults_to_ephemeral,
             )
@@ -2930,6 +3496,9 @@ class Client(tanjun.Client):
             error_message = f"Unknown command type {interaction.command_type}"
             raise RuntimeError(error_message)
 
+        if self._memoise_checks:
+            _internal.enable_check_memo(ctx)
+
         if self._auto_defer_after is not None:
             ctx.start_defer_timer(self._auto_defer_after)
 
@@ -2938,17 +3507,28 @@ class Client(tanjun.Client):
                 await _mark_not_found_event(ctx)
                 return None
 
-            for component in self._components.values():
+            if ctx.type is hikari.CommandType.SLASH:
+                candidates = self._app_command_routes.find_slash(ctx.interaction.command_name)
+
+            else:
+                candidates = self._app_command_routes.find_menu(ctx.type, ctx.interaction.command_name)
+
+            for component in candidates:
                 # This is set on each iteration to ensure that any component
                 # state which was set to this isn't propagated to other components.
                 ctx.set_ephemeral_default(self._defaults_to_ephemeral)
+                component_hooks = hooks if isinstance(component, components.Component) else _copy_hooks(hooks)
                 if ctx.type is hikari.CommandType.SLASH:
                     assert isinstance(ctx, tanjun.SlashContext)
-                    coro = await component.execute_slash(ctx, hooks=typing.cast("set[tanjun.SlashHooks]", hooks))
+                    coro = await component.execute_slash(
+                        ctx, hooks=typing.cast("collections.MutableSet[tanjun.SlashHooks]", component_hooks)
+                    )
 
                 else:
                     assert isinstance(ctx, tanjun.MenuContext)
-                    coro = await component.execute_menu(ctx, hooks=typing.cast("set[tanjun.MenuHooks]", hooks))
+                    coro = await component.execute_menu(
+                        ctx, hooks=typing.cast("collections.MutableSet[tanjun.MenuHooks]", component_hooks)
+                    )
 
                 if coro:
                     try:
@@ -2995,7 +3575,7 @@ class Client(tanjun.Client):
 
     async def on_autocomplete_interaction_request(
         self, interaction: hikari.AutocompleteInteraction, /
-    ) -> hikari.api.InteractionAutocompleteBuilder:
+    ) -> hikari.api.InteractionAutocompleteBuilder | None:
         """Execute a command autocomplete based on received REST requests.
 
         Parameters
@@ -3005,19 +3585,36 @@ class Client(tanjun.Client):
 
         Returns
         -------
-        hikari.api.special_endpoints.InteractionAutocompleteBuilder
+        hikari.api.special_endpoints.InteractionAutocompleteBuilder | None
             The initial response to send back to Discord.
+
+            This will be [None][] if the interaction was ignored as a duplicate
+            or was superseded by a newer autocomplete request.
         """
+        if self._is_duplicate(interaction):
+            return None
+
         loop = asyncio.get_running_loop()
         future: asyncio.Future[hikari.api.InteractionAutocompleteBuilder] = loop.create_future()
         ctx = self._make_autocomplete_context(self, interaction, future=future)
 
-        for component in self._components.values():
+        for component in self._app_command_routes.find_slash(interaction.command_name):
             if coro := component.execute_autocomplete(ctx):
                 task = loop.create_task(coro)
                 task.add_done_callback(lambda _: future.cancel())
                 self._add_task(task)
-                return await future
+                if self._supersede_autocompletes:
+                    self._track_autocomplete(ctx, task)
+
+                try:
+                    return await future
+
+                except asyncio.CancelledError:
+                    # The task itself being cancelled means it was superseded.
+                    if task.cancelled():
+                        return None
+
+                    raise
 
         error_message = f"Autocomplete not found for {interaction!r}"
         raise RuntimeError(error_message)
@@ -3028,6 +3625,7 @@ class Client(tanjun.Client):
         hikari.api.InteractionMessageBuilder
         | hikari.api.InteractionDeferredBuilder
         | hikari.api.InteractionModalBuilder
+        | None
     ):
         """Execute an app command based on received REST requests.
 
@@ -3038,9 +3636,14 @@ class Client(tanjun.Client):
 
         Returns
         -------
-        hikari.api.special_endpoints.InteractionMessageBuilder | hikari.api.special_endpoints.InteractionDeferredBuilder | hikari.api.special_endpoints.InteractionModalBuilder
+        hikari.api.special_endpoints.InteractionMessageBuilder | hikari.api.special_endpoints.InteractionDeferredBuilder | hikari.api.special_endpoints.InteractionModalBuilder | None
             The initial response to send back to Discord.
+
+            This will be [None][] if the interaction was ignored as a duplicate.
         """  # noqa: E501
+        if self._is_duplicate(interaction):
+            return None
+
         loop = asyncio.get_running_loop()
         future: asyncio.Future[_AppCmdResponse] = loop.create_future()
 
@@ -3049,17 +3652,21 @@ class Client(tanjun.Client):
                 client=self,
                 interaction=interaction,
                 register_task=self._add_task,
+                delete_scheduler=self._delete_scheduler,
                 on_not_found=self._on_slash_not_found,
                 default_to_ephemeral=self._defaults_to_ephemeral,
                 future=future,
             )
-            hooks: set[tanjun.MenuHooks] | set[tanjun.SlashHooks] | None = self._get_slash_hooks()
+            hooks: collections.MutableSet[tanjun.MenuHooks] | collections.MutableSet[tanjun.SlashHooks] | None = (
+                self._get_slash_hooks()
+            )
 
         elif interaction.command_type in _MENU_TYPES:
             ctx = self._make_menu_context(
                 client=self,
                 interaction=interaction,
                 register_task=self._add_task,
+                delete_scheduler=self._delete_scheduler,
                 on_not_found=self._on_menu_not_found,
                 default_to_ephemeral=self._defaults_to_ephemeral,
                 future=future,
@@ -3070,6 +3677,9 @@ class Client(tanjun.Client):
             error_message = f"Unknown command type {interaction.command_type}"
             raise RuntimeError(error_message)
 
+        if self._memoise_checks:
+            _internal.enable_check_memo(ctx)
+
         if self._auto_defer_after is not None:
             ctx.start_defer_timer(self._auto_defer_after)
 
@@ -3078,20 +3688,34 @@ class Client(tanjun.Client):
             if not await self.check(ctx):
                 return await self._mark_not_found_request(ctx, loop, future)
 
-            for component in self._components.values():
+            if ctx.type is hikari.CommandType.SLASH:
+                candidates = self._app_command_routes.find_slash(ctx.interaction.command_name)
+
+            else:
+                candidates = self._app_command_routes.find_menu(ctx.type, ctx.interaction.command_name)
+
+            for component in candidates:
                 # This is set on each iteration to ensure that any component
                 # state which was set to this isn't propagated to other components.
                 ctx.set_ephemeral_default(self._defaults_to_ephemeral)
+                component_hooks = hooks if isinstance(component, components.Component) else _copy_hooks(hooks)
                 if ctx.type is hikari.CommandType.SLASH:
                     assert isinstance(ctx, tanjun.SlashContext)
-                    coro = await component.execute_slash(ctx, hooks=typing.cast("set[tanjun.SlashHooks]", hooks))
+                    coro = await component.execute_slash(
+                        ctx, hooks=typing.cast("collections.MutableSet[tanjun.SlashHooks]", component_hooks)
+                    )
 
                 else:
                     assert isinstance(ctx, tanjun.MenuContext)
-                    coro = await component.execute_menu(ctx, hooks=typing.cast("set[tanjun.MenuHooks]", hooks))
+                    coro = await component.execute_menu(
+                        ctx, hooks=typing.cast("collections.MutableSet[tanjun.MenuHooks]", component_hooks)
+                    )
 
                 if coro:
-                    task = loop.create_task(coro)
+                    # The command is eagerly started so that commands which respond
+                    # without suspending have their response returned without
+                    # waiting for another event loop iteration.
+                    task = _internal.create_eager_task(loop, coro)
                     task.add_done_callback(lambda _: future.cancel() and ctx.cancel_defer())
                     self._add_task(task)
                     return await future
@@ -3103,7 +3727,7 @@ class Client(tanjun.Client):
             # Under very specific timing there may be another future which could set a result while we await
             # ctx.respond therefore we create a task to avoid any erroneous behaviour from this trying to create
             # another response before it's returned the initial response.
-            task = loop.create_task(exc.send(ctx), name=f"{interaction.id} command error responder")
+            task = _internal.create_eager_task(loop, exc.send(ctx), name=f"{interaction.id} command error responder")
             task.add_done_callback(lambda _: future.cancel() and ctx.cancel_defer())
             self._add_task(task)
             return await future
@@ -3117,12 +3741,28 @@ class Client(tanjun.Client):
         future: asyncio.Future[_AppCmdResponse],
         /,
     ) -> _AppCmdResponse:
-        task = loop.create_task(ctx.mark_not_found(), name=f"{ctx.interaction.id} not found")
+        task = _internal.create_eager_task(loop, ctx.mark_not_found(), name=f"{ctx.interaction.id} not found")
         task.add_done_callback(lambda _: future.cancel() and ctx.cancel_defer())
         self._add_task(task)
         return await future
 
 
+def _has_standard_message_execution(component: components.Component, /) -> bool:
+    # Subclasses which override how message commands are matched or executed
+    # have to be called through their public execute_message method.
+    component_type = type(component)
+    return (
+        component_type.execute_message is components.Component.execute_message
+        and component_type.check_message_name is components.Component.check_message_name
+    )
+
+
+def _copy_hooks(hooks: collections.MutableSet[_T] | None, /) -> set[_T] | None:
+    # The client's cached hook sets shouldn't be passed to components which
+    # might mutate them.
+    return set(hooks) if hooks is not None else None
+
+
 async def _mark_not_found_event(ctx: context.SlashContext | context.MenuContext, /) -> None:
     try:
         await ctx.mark_not_found()
@@ -35,6 +35,7 @@ __all__: list[str] = ["PartialCommand"]
 import copy
 import typing
 
+from tanjun import _internal
 from tanjun import abc as tanjun
 from tanjun import components
 
@@ -48,7 +49,9 @@ if typing.TYPE_CHECKING:
 _ContextT = typing.TypeVar("_ContextT", bound=tanjun.Context)
 
 
-class PartialCommand(tanjun.ExecutableCommand[_ContextT], components.AbstractComponentLoader):
+class PartialCommand(
+    tanjun.ExecutableCommand[_ContextT], components.AbstractComponentLoader, _internal.StandardCommand
+):
     """Base class for the standard ExecutableCommand implementations."""
 
     __slots__ = ("_checks", "_component", "_hooks", "_metadata")
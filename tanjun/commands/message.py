@@ -373,7 +373,7 @@ class MessageCommand(base.PartialCommand[tanjun.MessageContext], tanjun.MessageC
 class MessageCommandGroup(MessageCommand[_MessageCallbackSigT], tanjun.MessageCommandGroup[_MessageCallbackSigT]):
     """Standard implementation of a message command group."""
 
-    __slots__ = ("_commands",)
+    __slots__ = ("_commands", "_merged_hooks")
 
     # While these overloads may seem redundant/unnecessary, MyPy cannot understand
     # this when expressed through `callback: _CallbackIshT[_MessageCallbackSigT]`.
@@ -435,6 +435,7 @@ class MessageCommandGroup(MessageCommand[_MessageCallbackSigT], tanjun.MessageCo
         """
         super().__init__(callback, name, *names, validate_arg_keys=validate_arg_keys, _wrapped_command=_wrapped_command)
         self._commands = _internal.MessageCommandIndex(strict=strict)
+        self._merged_hooks = _internal.MergedHooks[tanjun.MessageHooks]()
 
     def __repr__(self) -> str:
         return f"CommandGroup <{len(self._commands.commands)}: {self._names}>"
@@ -452,8 +453,15 @@ class MessageCommandGroup(MessageCommand[_MessageCallbackSigT], tanjun.MessageCo
         # <<inherited docstring from tanjun.abc.MessageCommand>>.
         inst = super().copy(parent=parent)
         inst._commands = self._commands.copy(parent=self)  # noqa: SLF001
+        inst._merged_hooks = _internal.MergedHooks[tanjun.MessageHooks]()  # noqa: SLF001
         return inst
 
+    def set_hooks(self, hooks: tanjun.MessageHooks | None, /) -> Self:
+        # <<inherited docstring from tanjun.abc.ExecutableCommand>>.
+        super().set_hooks(hooks)
+        self._merged_hooks.clear()
+        return self
+
     def add_command(self, command: tanjun.MessageCommand[typing.Any], /) -> Self:
         """Add a command to this group.
 
@@ -603,12 +611,7 @@ class MessageCommandGroup(MessageCommand[_MessageCallbackSigT], tanjun.MessageCo
             error_message = "Cannot execute a command with a content-less message"
             raise ValueError(error_message)
 
-        if self._hooks:
-            if hooks is None:
-                hooks = set()
-
-            hooks.add(self._hooks)
-
+        hooks = self._merged_hooks.merge(hooks, self._hooks)
         case_sensitive = ctx.client.is_case_sensitive
         if ctx.component and ctx.component.is_case_sensitive is not None:
             case_sensitive = ctx.component.is_case_sensitive
@@ -618,7 +621,7 @@ class MessageCommandGroup(MessageCommand[_MessageCallbackSigT], tanjun.MessageCo
                 content = ctx.content[len(name) :]
                 ctx.set_triggering_name(ctx.triggering_name + " " + name)
                 ctx.set_content(content.lstrip())
-                await command.execute(ctx, hooks=hooks)
+                await command.execute(ctx, hooks=_internal.hooks_for(command, hooks))
                 return
 
         await super().execute(ctx, hooks=hooks)
@@ -49,7 +49,10 @@ __all__: list[str] = [
     "with_user_slash_option",
 ]
 
+import asyncio
 import copy
+import datetime
+import functools
 import typing
 import unicodedata
 import warnings
@@ -87,6 +90,17 @@ if typing.TYPE_CHECKING:
     # Pyright bug doesn't accept Var = Class | Class as a type
     _CallbackishT = typing.Union["_SlashCallbackSigT", _AnyCommandT["_SlashCallbackSigT"]]  # noqa: UP007
 
+    _ConvertSig = collections.Callable[
+        [tanjun.SlashContext, typing.Any], collections.Coroutine[typing.Any, typing.Any, typing.Any]
+    ]
+    _ResolveSig = collections.Callable[[tanjun.SlashOption], typing.Any]
+    # The focused value, locale and guild ID.
+    _AutocompleteKey = tuple[typing.Any, str, hikari.Snowflake | None]
+    # The cached choices and whether they're cached per guild.
+    _AutocompleteCache = tuple[_internal.TimedLRUCache[_AutocompleteKey, dict[str, typing.Any]], bool]
+    # A tracked option's name, key, default, value resolver and converter.
+    _OptionHandler = tuple[str, str, typing.Any, _ResolveSig, _ConvertSig | None]
+
     _IntAutocompleteSigT = typing.TypeVar("_IntAutocompleteSigT", bound=tanjun.AutocompleteSig[int])
     _FloatAutocompleteSigT = typing.TypeVar("_FloatAutocompleteSigT", bound=tanjun.AutocompleteSig[float])
     _StrAutocompleteSigT = typing.TypeVar("_StrAutocompleteSigT", bound=tanjun.AutocompleteSig[str])
@@ -792,6 +806,34 @@ def with_mentionable_slash_option(
     return lambda c: c.add_mentionable_option(name, description, default=default, key=key, pass_as_kwarg=pass_as_kwarg)
 
 
+def _get_value(option: tanjun.SlashOption, /) -> typing.Any:
+    return option.value
+
+
+def _get_float_value(option: tanjun.SlashOption, /) -> float:
+    return float(option.value)
+
+
+def _resolve_user(option: tanjun.SlashOption, /) -> hikari.User:
+    return option.resolve_to_user()
+
+
+def _resolve_member(name: str, option: tanjun.SlashOption, /) -> hikari.InteractionMember:
+    if member := option.resolve_to_member(default=None):
+        return member
+
+    error_message = f"Couldn't find member for provided user: {option.value}"
+    raise errors.ConversionError(error_message, name)
+
+
+_RESOLVERS: dict[hikari.OptionType | int, _ResolveSig] = {
+    hikari.OptionType.ATTACHMENT: lambda option: option.resolve_to_attachment(),
+    hikari.OptionType.CHANNEL: lambda option: option.resolve_to_channel(),
+    hikari.OptionType.MENTIONABLE: lambda option: option.resolve_to_mentionable(),
+    hikari.OptionType.ROLE: lambda option: option.resolve_to_role(),
+}
+
+
 class _TrackedOption:
     __slots__ = ("converters", "default", "is_always_float", "is_only_member", "key", "name", "type")
 
@@ -819,6 +861,26 @@ class _TrackedOption:
             if isinstance(converter, conversion.BaseConverter):  # pyright: ignore[reportUnnecessaryIsInstance]
                 converter.check_client(client, f"{self.name} slash command option")
 
+    def compile(self) -> _OptionHandler:
+        """Work out how this option's value should be processed ahead of time."""
+        convert: _ConvertSig | None = None
+        resolve: _ResolveSig = _get_value
+        if self.type is hikari.OptionType.USER:
+            resolve = functools.partial(_resolve_member, self.name) if self.is_only_member else _resolve_user
+
+        elif (resolver := _RESOLVERS.get(self.type)) is not None:
+            resolve = resolver
+
+        elif self.converters:
+            convert = self.convert
+
+        # To be type safe we obfuscate the fact that discord's double type will provide an int or float
+        # depending on the value Discord inputs by always casting to float.
+        elif self.type is hikari.OptionType.FLOAT and self.is_always_float:
+            resolve = _get_float_value
+
+        return (self.name, self.key, self.default, resolve, convert)
+
     async def convert(self, ctx: tanjun.SlashContext, value: typing.Any, /) -> typing.Any:
         if not self.converters:
             return value
@@ -1443,7 +1505,7 @@ class SlashCommandGroup(BaseSlashCommand, tanjun.SlashCommandGroup):
                 ctx.set_ephemeral_default(command.defaults_to_ephemeral)
 
             if await command.check_context(ctx):
-                await command.execute(ctx, option=option, hooks=hooks)
+                await command.execute(ctx, option=option, hooks=_internal.hooks_for(command, hooks))
                 return
 
         await ctx.mark_not_found()
@@ -1488,11 +1550,13 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
     __slots__ = (
         "_always_defer",
         "_arg_names",
+        "_autocomplete_caches",
         "_builder",
         "_callback",
         "_client",
         "_float_autocompletes",
         "_int_autocompletes",
+        "_option_handlers",
         "_str_autocompletes",
         "_tracked_options",
         "_wrapped_command",
@@ -1645,6 +1709,7 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
 
         self._always_defer = always_defer
         self._arg_names = _internal.get_kwargs(callback) if validate_arg_keys else None
+        self._autocomplete_caches: dict[str, _AutocompleteCache] = {}
         self._builder = _SlashCommandBuilder(
             name=self.name,
             name_localizations=self.name_localisations,
@@ -1657,6 +1722,7 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
         self._client: tanjun.Client | None = None
         self._float_autocompletes: dict[str, tanjun.AutocompleteSig[float]] = {}
         self._int_autocompletes: dict[str, tanjun.AutocompleteSig[int]] = {}
+        self._option_handlers: list[_OptionHandler] | None = None
         self._str_autocompletes: dict[str, tanjun.AutocompleteSig[str]] = {}
         self._tracked_options: dict[str, _TrackedOption] = {}
         self._wrapped_command = _wrapped_command
@@ -1700,6 +1766,7 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
         for option in self._tracked_options.values():
             option.check_client(client)
 
+        self._compile_options()
         return self
 
     def build(self, *, component: tanjun.Component | None = None) -> special_endpoints_api.SlashCommandBuilder:
@@ -1836,6 +1903,7 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             )
         )
         if pass_as_kwarg:
+            self._option_handlers = None
             self._tracked_options[names.default_value] = _TrackedOption(
                 name=names.default_value,
                 option_type=type_,
@@ -2867,7 +2935,17 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             pass_as_kwarg=pass_as_kwarg,
         )
 
-    def set_float_autocomplete(self, name: str, callback: tanjun.AutocompleteSig[float] | None, /) -> Self:
+    def set_float_autocomplete(
+        self,
+        name: str,
+        callback: tanjun.AutocompleteSig[float] | None,
+        /,
+        *,
+        cache: bool = False,
+        cache_expire_after: int | float | datetime.timedelta | None = datetime.timedelta(minutes=1),
+        cache_max_size: int | None = 256,
+        cache_per_guild: bool = False,
+    ) -> Self:
         """Set the autocomplete callback for a float option.
 
         Parameters
@@ -2886,6 +2964,17 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
 
             Passing [None][] here will remove the autocomplete callback for the
             option.
+        cache
+            Whether the choices set by the autocomplete callback should be cached.
+
+            For more information on how this caching works see
+            [SlashCommand.set_str_autocomplete][tanjun.SlashCommand.set_str_autocomplete].
+        cache_expire_after
+            How long cached choices should be kept for in seconds.
+        cache_max_size
+            The maximum amount of responses to cache for this option.
+        cache_per_guild
+            Whether the choices should be cached separately for each guild.
 
         Returns
         -------
@@ -2898,6 +2987,9 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             Raises a key error if the option doesn't exist.
         TypeError
             Raises a type error if the option isn't of type `float`.
+        ValueError
+            If `cache_expire_after` is less than or equal to 0 seconds.
+            If `cache_max_size` is less than 1.
         """
         option = self._builder.get_option(name)
 
@@ -2910,17 +3002,26 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             raise TypeError(error_message)
 
         if callback:
+            self._set_autocomplete_cache(name, cache, cache_expire_after, cache_max_size, per_guild=cache_per_guild)
             option.autocomplete = True
             self._float_autocompletes[name] = callback
 
         elif name in self._float_autocompletes:
+            self._autocomplete_caches.pop(name, None)
             option.autocomplete = False
             del self._float_autocompletes[name]
 
         return self
 
     def with_float_autocomplete(
-        self, name: str, /
+        self,
+        name: str,
+        /,
+        *,
+        cache: bool = False,
+        cache_expire_after: int | float | datetime.timedelta | None = datetime.timedelta(minutes=1),
+        cache_max_size: int | None = 256,
+        cache_per_guild: bool = False,
     ) -> collections.Callable[[_FloatAutocompleteSigT], _FloatAutocompleteSigT]:
         """Set the autocomplete callback for a float option through a decorator call.
 
@@ -2931,6 +3032,17 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
 
             If localised names were provided for the option then this should
             be the default name.
+        cache
+            Whether the choices set by the autocomplete callback should be cached.
+
+            For more information on how this caching works see
+            [SlashCommand.set_str_autocomplete][tanjun.SlashCommand.set_str_autocomplete].
+        cache_expire_after
+            How long cached choices should be kept for in seconds.
+        cache_max_size
+            The maximum amount of responses to cache for this option.
+        cache_per_guild
+            Whether the choices should be cached separately for each guild.
 
         Returns
         -------
@@ -2947,15 +3059,35 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             Raises a key error if the option doesn't exist.
         TypeError
             Raises a type error if the option isn't of type `float`.
+        ValueError
+            If `cache_expire_after` is less than or equal to 0 seconds.
+            If `cache_max_size` is less than 1.
         """
 
         def decorator(callback: _FloatAutocompleteSigT, /) -> _FloatAutocompleteSigT:
-            self.set_float_autocomplete(name, callback)
+            self.set_float_autocomplete(
+                name,
+                callback,
+                cache=cache,
+                cache_expire_after=cache_expire_after,
+                cache_max_size=cache_max_size,
+                cache_per_guild=cache_per_guild,
+            )
             return callback
 
         return decorator
 
-    def set_int_autocomplete(self, name: str, callback: tanjun.AutocompleteSig[int], /) -> Self:
+    def set_int_autocomplete(
+        self,
+        name: str,
+        callback: tanjun.AutocompleteSig[int],
+        /,
+        *,
+        cache: bool = False,
+        cache_expire_after: int | float | datetime.timedelta | None = datetime.timedelta(minutes=1),
+        cache_max_size: int | None = 256,
+        cache_per_guild: bool = False,
+    ) -> Self:
         """Set the autocomplete callback for a string option.
 
         Parameters
@@ -2974,6 +3106,17 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
 
             Passing [None][] here will remove the autocomplete callback for the
             option.
+        cache
+            Whether the choices set by the autocomplete callback should be cached.
+
+            For more information on how this caching works see
+            [SlashCommand.set_str_autocomplete][tanjun.SlashCommand.set_str_autocomplete].
+        cache_expire_after
+            How long cached choices should be kept for in seconds.
+        cache_max_size
+            The maximum amount of responses to cache for this option.
+        cache_per_guild
+            Whether the choices should be cached separately for each guild.
 
         Returns
         -------
@@ -2986,6 +3129,9 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             Raises a key error if the option doesn't exist.
         TypeError
             Raises a type error if the option isn't of type `str`.
+        ValueError
+            If `cache_expire_after` is less than or equal to 0 seconds.
+            If `cache_max_size` is less than 1.
         """
         option = self._builder.get_option(name)
 
@@ -2997,11 +3143,21 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             error_message = "Option is not a int option"
             raise TypeError(error_message)
 
+        self._set_autocomplete_cache(name, cache, cache_expire_after, cache_max_size, per_guild=cache_per_guild)
         option.autocomplete = True
         self._int_autocompletes[name] = callback
         return self
 
-    def with_int_autocomplete(self, name: str, /) -> collections.Callable[[_IntAutocompleteSigT], _IntAutocompleteSigT]:
+    def with_int_autocomplete(
+        self,
+        name: str,
+        /,
+        *,
+        cache: bool = False,
+        cache_expire_after: int | float | datetime.timedelta | None = datetime.timedelta(minutes=1),
+        cache_max_size: int | None = 256,
+        cache_per_guild: bool = False,
+    ) -> collections.Callable[[_IntAutocompleteSigT], _IntAutocompleteSigT]:
         """Set the autocomplete callback for a integer option through a decorator call.
 
         Parameters
@@ -3011,6 +3167,17 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
 
             If localised names were provided for the option then this should
             be the default name.
+        cache
+            Whether the choices set by the autocomplete callback should be cached.
+
+            For more information on how this caching works see
+            [SlashCommand.set_str_autocomplete][tanjun.SlashCommand.set_str_autocomplete].
+        cache_expire_after
+            How long cached choices should be kept for in seconds.
+        cache_max_size
+            The maximum amount of responses to cache for this option.
+        cache_per_guild
+            Whether the choices should be cached separately for each guild.
 
         Returns
         -------
@@ -3027,15 +3194,35 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             Raises a key error if the option doesn't exist.
         TypeError
             Raises a type error if the option isn't of type `int`.
+        ValueError
+            If `cache_expire_after` is less than or equal to 0 seconds.
+            If `cache_max_size` is less than 1.
         """
 
         def decorator(callback: _IntAutocompleteSigT, /) -> _IntAutocompleteSigT:
-            self.set_int_autocomplete(name, callback)
+            self.set_int_autocomplete(
+                name,
+                callback,
+                cache=cache,
+                cache_expire_after=cache_expire_after,
+                cache_max_size=cache_max_size,
+                cache_per_guild=cache_per_guild,
+            )
             return callback
 
         return decorator
 
-    def set_str_autocomplete(self, name: str, callback: tanjun.AutocompleteSig[str], /) -> Self:
+    def set_str_autocomplete(
+        self,
+        name: str,
+        callback: tanjun.AutocompleteSig[str],
+        /,
+        *,
+        cache: bool = False,
+        cache_expire_after: int | float | datetime.timedelta | None = datetime.timedelta(minutes=1),
+        cache_max_size: int | None = 256,
+        cache_per_guild: bool = False,
+    ) -> Self:
         """Set the autocomplete callback for a str option.
 
         Parameters
@@ -3054,6 +3241,26 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
 
             Passing [None][] here will remove the autocomplete callback for the
             option.
+        cache
+            Whether the choices set by the autocomplete callback should be cached.
+
+            Choices are cached per focused value and locale (and per guild if
+            `cache_per_guild` is [True][]) and a cache hit responds with the
+            cached choices without calling the callback.
+
+            [SlashCommand.invalidate_autocomplete_cache][tanjun.SlashCommand.invalidate_autocomplete_cache]
+            can be used to clear the cached choices.
+        cache_expire_after
+            How long cached choices should be kept for in seconds.
+
+            If this is [None][] then cached choices will only be removed when
+            they're invalidated or evicted.
+        cache_max_size
+            The maximum amount of responses to cache for this option.
+
+            If this is [None][] then the cache's size won't be bounded.
+        cache_per_guild
+            Whether the choices should be cached separately for each guild.
 
         Returns
         -------
@@ -3066,6 +3273,9 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             Raises a key error if the option doesn't exist.
         TypeError
             Raises a type error if the option isn't of type `str`.
+        ValueError
+            If `cache_expire_after` is less than or equal to 0 seconds.
+            If `cache_max_size` is less than 1.
         """
         option = self._builder.get_option(name)
 
@@ -3077,11 +3287,21 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             error_message = "Option is not a str option"
             raise TypeError(error_message)
 
+        self._set_autocomplete_cache(name, cache, cache_expire_after, cache_max_size, per_guild=cache_per_guild)
         option.autocomplete = True
         self._str_autocompletes[name] = callback
         return self
 
-    def with_str_autocomplete(self, name: str, /) -> collections.Callable[[_StrAutocompleteSigT], _StrAutocompleteSigT]:
+    def with_str_autocomplete(
+        self,
+        name: str,
+        /,
+        *,
+        cache: bool = False,
+        cache_expire_after: int | float | datetime.timedelta | None = datetime.timedelta(minutes=1),
+        cache_max_size: int | None = 256,
+        cache_per_guild: bool = False,
+    ) -> collections.Callable[[_StrAutocompleteSigT], _StrAutocompleteSigT]:
         """Set the autocomplete callback for a string option through a decorator call.
 
         Parameters
@@ -3091,6 +3311,17 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
 
             If localised names were provided for the option then this should
             be the default name.
+        cache
+            Whether the choices set by the autocomplete callback should be cached.
+
+            For more information on how this caching works see
+            [SlashCommand.set_str_autocomplete][tanjun.SlashCommand.set_str_autocomplete].
+        cache_expire_after
+            How long cached choices should be kept for in seconds.
+        cache_max_size
+            The maximum amount of responses to cache for this option.
+        cache_per_guild
+            Whether the choices should be cached separately for each guild.
 
         Returns
         -------
@@ -3107,61 +3338,146 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             Raises a key error if the option doesn't exist.
         TypeError
             Raises a type error if the option isn't of type `str`.
+        ValueError
+            If `cache_expire_after` is less than or equal to 0 seconds.
+            If `cache_max_size` is less than 1.
         """
 
         def decorator(callback: _StrAutocompleteSigT, /) -> _StrAutocompleteSigT:
-            self.set_str_autocomplete(name, callback)
+            self.set_str_autocomplete(
+                name,
+                callback,
+                cache=cache,
+                cache_expire_after=cache_expire_after,
+                cache_max_size=cache_max_size,
+                cache_per_guild=cache_per_guild,
+            )
             return callback
 
         return decorator
 
-    async def _process_args(self, ctx: tanjun.SlashContext, /) -> collections.Mapping[str, typing.Any]:
-        keyword_args: dict[
-            str, int | float | str | hikari.Attachment | hikari.User | hikari.Role | hikari.InteractionChannel
-        ] = {}
-        for tracked_option in self._tracked_options.values():
-            if not (option := ctx.options.get(tracked_option.name)):
-                if tracked_option.default is tanjun.NO_DEFAULT:
+    def _set_autocomplete_cache(
+        self,
+        name: str,
+        cache: bool,  # noqa: FBT001
+        expire_after: int | float | datetime.timedelta | None,
+        max_size: int | None,
+        /,
+        *,
+        per_guild: bool,
+    ) -> None:
+        if not cache:
+            self._autocomplete_caches.pop(name, None)
+            return
+
+        if isinstance(expire_after, datetime.timedelta):
+            expire_after = expire_after.total_seconds()
+
+        elif expire_after is not None:
+            expire_after = float(expire_after)
+
+        if expire_after is not None and expire_after <= 0:
+            error_message = "cache_expire_after must be more than 0 seconds"
+            raise ValueError(error_message)
+
+        if max_size is not None and max_size < 1:
+            error_message = "cache_max_size must be greater than 0"
+            raise ValueError(error_message)
+
+        self._autocomplete_caches[name] = (
+            _internal.TimedLRUCache(expire_after=expire_after, max_size=max_size),
+            per_guild,
+        )
+
+    def invalidate_autocomplete_cache(self, name: str | None = None, /) -> Self:
+        """Clear the cached autocomplete choices.
+
+        Parameters
+        ----------
+        name
+            Name of the option to clear the cached choices for.
+
+            If this is [None][] then the cached choices for all of this
+            command's options will be cleared.
+
+        Returns
+        -------
+        Self
+            The command object for chaining.
+        """
+        if name is None:
+            for cache, _ in self._autocomplete_caches.values():
+                cache.clear()
+
+        elif entry := self._autocomplete_caches.get(name):
+            entry[0].clear()
+
+        return self
+
+    def _compile_options(self) -> list[_OptionHandler]:
+        self._option_handlers = [option.compile() for option in self._tracked_options.values()]
+        return self._option_handlers
+
+    def _collect_args(
+        self,
+        ctx: tanjun.SlashContext,
+        keyword_args: dict[str, typing.Any],
+        conversions: list[tuple[str, collections.Coroutine[typing.Any, typing.Any, typing.Any]]],
+        /,
+    ) -> Exception | None:
+        # This returns the first error (rather than raising it) so that it can
+        # be raised after the errors from any conversions for options declared
+        # before it.
+        handlers = self._option_handlers
+        if handlers is None:
+            handlers = self._compile_options()
+
+        options = ctx.options
+        for name, key, default, resolve, convert in handlers:
+            if not (option := options.get(name)):
+                if default is tanjun.NO_DEFAULT:
                     error_message = (
-                        f"Required option {tracked_option.name} is missing data, are you sure your commands"
-                        " are up to date?"
+                        f"Required option {name} is missing data, are you sure your commands are up to date?"
                     )
-                    raise RuntimeError(error_message)  # TODO: ConversionError?
+                    return RuntimeError(error_message)  # TODO: ConversionError?
 
-                if tracked_option.default is not tanjun.NO_PASS:
-                    keyword_args[tracked_option.key] = tracked_option.default
+                if default is not tanjun.NO_PASS:
+                    keyword_args[key] = default
 
-            elif option.type is hikari.OptionType.USER:
-                member: hikari.InteractionMember | None = None
-                if tracked_option.is_only_member and not (member := option.resolve_to_member(default=None)):
-                    error_message = f"Couldn't find member for provided user: {option.value}"
-                    raise errors.ConversionError(error_message, tracked_option.name)
+            elif convert:
+                conversions.append((key, convert(ctx, option.value)))
 
-                keyword_args[tracked_option.key] = member or option.resolve_to_user()
+            else:
+                try:
+                    keyword_args[key] = resolve(option)
 
-            elif option.type is hikari.OptionType.CHANNEL:
-                keyword_args[tracked_option.key] = option.resolve_to_channel()
+                except errors.ConversionError as exc:
+                    return exc
 
-            elif option.type is hikari.OptionType.ROLE:
-                keyword_args[tracked_option.key] = option.resolve_to_role()
+        return None
 
-            elif option.type is hikari.OptionType.MENTIONABLE:
-                keyword_args[tracked_option.key] = option.resolve_to_mentionable()
+    async def _process_args(self, ctx: tanjun.SlashContext, /) -> collections.Mapping[str, typing.Any]:
+        keyword_args: dict[str, typing.Any] = {}
+        conversions: list[tuple[str, collections.Coroutine[typing.Any, typing.Any, typing.Any]]] = []
+        error = self._collect_args(ctx, keyword_args, conversions)
 
-            elif option.type is hikari.OptionType.ATTACHMENT:
-                keyword_args[tracked_option.key] = option.resolve_to_attachment()
+        if len(conversions) == 1:
+            key, coro = conversions[0]
+            keyword_args[key] = await coro
 
-            else:
-                value = option.value
-                # To be type safe we obfuscate the fact that discord's double type will provide an int or float
-                # depending on the value Discord inputs by always casting to float.
-                if tracked_option.type is hikari.OptionType.FLOAT and tracked_option.is_always_float:
-                    value = float(value)
+        elif conversions:
+            # Options which use converters are independent of each other so they're
+            # converted concurrently but errors are still raised in the order the
+            # options were declared in.
+            results = await asyncio.gather(*(coro for _, coro in conversions), return_exceptions=True)
+            for (key, _), result in zip(conversions, results, strict=True):
+                if isinstance(result, BaseException):
+                    raise result
 
-                if tracked_option.converters:
-                    value = await tracked_option.convert(ctx, option.value)
+                keyword_args[key] = result
 
-                keyword_args[tracked_option.key] = value
+        if error is not None:
+            raise error
 
         return keyword_args
 
@@ -3232,10 +3548,26 @@ class SlashCommand(BaseSlashCommand, tanjun.SlashCommand[_SlashCallbackSigT]):
             error_message = f"No autocomplete callback found for '{ctx.focused.name}' option"
             raise RuntimeError(error_message)
 
+        if not (entry := self._autocomplete_caches.get(ctx.focused.name)):
+            await ctx.call_with_async_di(callback, ctx, ctx.focused.value)
+            return
+
+        cache, per_guild = entry
+        key = (ctx.focused.value, ctx.interaction.locale, ctx.guild_id if per_guild else None)
+        if (choices := cache.get(key)) is not None:
+            await ctx.set_choices(choices)
+            return
+
+        record = _internal.record_choices(ctx)
         await ctx.call_with_async_di(callback, ctx, ctx.focused.value)
+        if record.choices is not None:
+            cache.set(key, record.choices)
 
     def copy(self, *, parent: tanjun.SlashCommandGroup | None = None) -> Self:
         # <<inherited docstring from tanjun.abc.ExecutableCommand>>.
         inst = super().copy(parent=parent)
+        inst._autocomplete_caches = {  # noqa: SLF001
+            name: (cache.copy_empty(), per_guild) for name, (cache, per_guild) in self._autocomplete_caches.items()
+        }
         inst._callback = copy.copy(self._callback)  # noqa: SLF001
         return inst
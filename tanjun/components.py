@@ -154,6 +154,8 @@ class Component(tanjun.Component):
     """
 
     __slots__ = (
+        "_app_command_routes",
+        "_check_mode",
         "_checks",
         "_client",
         "_client_callbacks",
@@ -166,6 +168,9 @@ class Component(tanjun.Component):
         "_loop",
         "_menu_commands",
         "_menu_hooks",
+        "_merged_menu_hooks",
+        "_merged_message_hooks",
+        "_merged_slash_hooks",
         "_message_commands",
         "_message_hooks",
         "_metadata",
@@ -194,6 +199,9 @@ class Component(tanjun.Component):
             When this is [True][], message command names will not be allowed to contain
             spaces and will have to be unique to one command within the component.
         """
+        # Client routing tables which should be kept up to date with this component's app commands.
+        self._app_command_routes: list[_internal.AppCommandRoutes] = []
+        self._check_mode = tanjun.CheckMode.GATHER
         self._checks: list[tanjun.AnyCheckSig] = []
         self._client: tanjun.Client | None = None
         self._client_callbacks: dict[str, list[tanjun.MetaEventSig]] = {}
@@ -206,6 +214,9 @@ class Component(tanjun.Component):
         self._loop: asyncio.AbstractEventLoop | None = None
         self._menu_commands: dict[tuple[hikari.CommandType, str], tanjun.MenuCommand[typing.Any, typing.Any]] = {}
         self._menu_hooks: tanjun.MenuHooks | None = None
+        self._merged_menu_hooks = _internal.MergedHooks[tanjun.MenuHooks]()
+        self._merged_message_hooks = _internal.MergedHooks[tanjun.MessageHooks]()
+        self._merged_slash_hooks = _internal.MergedHooks[tanjun.SlashHooks]()
         self._message_commands = _internal.MessageCommandIndex(strict=strict)
         self._message_hooks: tanjun.MessageHooks | None = None
         self._metadata: dict[typing.Any, typing.Any] = {}
@@ -230,6 +241,11 @@ class Component(tanjun.Component):
         """Collection of the checks being run against every command execution in this component."""
         return self._checks.copy()
 
+    @property
+    def check_mode(self) -> tanjun.CheckMode:
+        """The strategy used to evaluate this component's checks."""
+        return self._check_mode
+
     @property
     def client(self) -> tanjun.Client | None:
         # <<inherited docstring from tanjun.abc.Component>>.
@@ -322,6 +338,7 @@ class Component(tanjun.Component):
     def copy(self) -> Self:
         # <<inherited docstring from tanjun.abc.Component>>.
         inst = copy.copy(self)
+        inst._app_command_routes = []  # noqa: SLF001
         inst._checks = [copy.copy(check) for check in self._checks]  # noqa: SLF001
         inst._slash_commands = {name: command.copy() for name, command in self._slash_commands.items()}  # noqa: SLF001
         inst._hooks = self._hooks.copy() if self._hooks else None  # noqa: SLF001
@@ -429,6 +446,24 @@ class Component(tanjun.Component):
         self._is_case_sensitive = state
         return self
 
+    def set_check_mode(self, mode: tanjun.CheckMode, /) -> Self:
+        """Set the strategy used to evaluate this component's checks.
+
+        Parameters
+        ----------
+        mode
+            The check evaluation strategy.
+
+            This defaults to [CheckMode.GATHER][tanjun.abc.CheckMode.GATHER].
+
+        Returns
+        -------
+        Self
+            This component to enable method chaining.
+        """
+        self._check_mode = tanjun.CheckMode(mode)
+        return self
+
     def set_default_app_command_permissions(self, permissions: int | hikari.Permissions | None, /) -> Self:
         """Set the default member permissions needed for this component's commands.
 
@@ -517,6 +552,9 @@ class Component(tanjun.Component):
             This component to enable method chaining.
         """
         self._hooks = hooks
+        self._merged_menu_hooks.clear()
+        self._merged_message_hooks.clear()
+        self._merged_slash_hooks.clear()
         return self
 
     def set_menu_hooks(self, hooks: tanjun.MenuHooks | None, /) -> Self:
@@ -533,6 +571,7 @@ class Component(tanjun.Component):
             This component to enable method chaining.
         """
         self._menu_hooks = hooks
+        self._merged_menu_hooks.clear()
         return self
 
     def set_message_hooks(self, hooks: tanjun.MessageHooks | None, /) -> Self:
@@ -549,6 +588,7 @@ class Component(tanjun.Component):
             This component to enable method chaining.
         """
         self._message_hooks = hooks
+        self._merged_message_hooks.clear()
         return self
 
     def set_slash_hooks(self, hooks: tanjun.SlashHooks | None, /) -> Self:
@@ -565,6 +605,7 @@ class Component(tanjun.Component):
             This component to enable method chaining.
         """
         self._slash_hooks = hooks
+        self._merged_slash_hooks.clear()
         return self
 
     def add_check(self, *checks: tanjun.AnyCheckSig) -> Self:
@@ -875,16 +916,23 @@ class Component(tanjun.Component):
             command.bind_client(self._client)
 
         self._menu_commands[key] = command
+        for routes in self._app_command_routes:
+            routes.add_menu(self, key)
+
         return self
 
     def remove_menu_command(self, command: tanjun.MenuCommand[typing.Any, typing.Any], /) -> Self:
         # <<inherited docstring from tanjun.abc.Component>>.
+        key = (command.type, command.name)
         try:
-            del self._menu_commands[(command.type, command.name)]
+            del self._menu_commands[key]
         except KeyError:
             error_message = f"Command {command.name} not found"
             raise ValueError(error_message) from None
 
+        for routes in self._app_command_routes:
+            routes.remove_menu(self, key)
+
         return self
 
     @typing.overload
@@ -910,6 +958,9 @@ class Component(tanjun.Component):
             command.bind_client(self._client)
 
         self._slash_commands[command.name] = command
+        for routes in self._app_command_routes:
+            routes.add_slash(self, command.name)
+
         return self
 
     def remove_slash_command(self, command: tanjun.BaseSlashCommand, /) -> Self:
@@ -920,6 +971,9 @@ class Component(tanjun.Component):
             error_message = f"Command {command.name} not found"
             raise ValueError(error_message) from None
 
+        for routes in self._app_command_routes:
+            routes.remove_slash(self, command.name)
+
         return self
 
     @typing.overload
@@ -1167,18 +1221,17 @@ class Component(tanjun.Component):
         return self
 
     async def _check_context(self, ctx: tanjun.Context, /) -> bool:
-        return await _internal.gather_checks(ctx, self._checks)
+        return await _internal.gather_checks(ctx, self._checks, mode=self._check_mode)
 
     async def _check_message_context(
-        self, ctx: tanjun.MessageContext, /
+        self,
+        ctx: tanjun.MessageContext,
+        candidates: collections.Iterable[tuple[str, tanjun.MessageCommand[typing.Any]]],
+        /,
     ) -> collections.AsyncIterator[tuple[str, tanjun.MessageCommand[typing.Any]]]:
         ctx.set_component(self)
         checks_run = False
-        case_sensitive = self._is_case_sensitive
-        if case_sensitive is None:
-            case_sensitive = ctx.client.is_case_sensitive
-
-        for name, command in self.check_message_name(ctx.content, case_sensitive=case_sensitive):
+        for name, command in candidates:
             if not checks_run:
                 if not await self._check_context(ctx):
                     return
@@ -1217,24 +1270,15 @@ class Component(tanjun.Component):
         /,
         *,
         hooks: collections.MutableSet[tanjun.Hooks[_AppCommandContextT]] | None = None,
+        merged_hooks: _internal.MergedHooks[tanjun.Hooks[_AppCommandContextT]],
         other_hooks: tanjun.Hooks[_AppCommandContextT] | None = None,
     ) -> collections.Coroutine[typing.Any, typing.Any, None] | None:
         if not command or not await self._check_context(ctx) or not await command.check_context(ctx):
             return None
 
-        if self._hooks:
-            if hooks is None:
-                hooks = set()
-
-            hooks.add(self._hooks)
-
-        if other_hooks:
-            if hooks is None:
-                hooks = set()
-
-            hooks.add(other_hooks)
-
-        return command.execute(ctx, hooks=hooks)
+        return command.execute(
+            ctx, hooks=_internal.hooks_for(command, merged_hooks.merge(hooks, self._hooks, other_hooks))
+        )
 
     # To ensure that ctx.set_ephemeral_default is called as soon as possible if
     # a match is found the public function is kept sync to avoid yielding
@@ -1251,7 +1295,9 @@ class Component(tanjun.Component):
             elif self._defaults_to_ephemeral is not None:
                 ctx.set_ephemeral_default(self._defaults_to_ephemeral)
 
-        return self._execute_app(ctx, command, hooks=hooks, other_hooks=self._menu_hooks)
+        return self._execute_app(
+            ctx, command, hooks=hooks, merged_hooks=self._merged_menu_hooks, other_hooks=self._menu_hooks
+        )
 
     # To ensure that ctx.set_ephemeral_default is called as soon as possible if
     # a match is found the public function is kept sync to avoid yielding
@@ -1268,31 +1314,36 @@ class Component(tanjun.Component):
             elif self._defaults_to_ephemeral is not None:
                 ctx.set_ephemeral_default(self._defaults_to_ephemeral)
 
-        return self._execute_app(ctx, command, hooks=hooks, other_hooks=self._slash_hooks)
+        return self._execute_app(
+            ctx, command, hooks=hooks, merged_hooks=self._merged_slash_hooks, other_hooks=self._slash_hooks
+        )
 
     async def execute_message(
         self, ctx: tanjun.MessageContext, /, *, hooks: collections.MutableSet[tanjun.MessageHooks] | None = None
     ) -> bool:
         # <<inherited docstring from tanjun.abc.Component>>.
-        async for name, command in self._check_message_context(ctx):
+        case_sensitive = self._is_case_sensitive
+        if case_sensitive is None:
+            case_sensitive = ctx.client.is_case_sensitive
+
+        candidates = self.check_message_name(ctx.content, case_sensitive=case_sensitive)
+        return await self._execute_message(ctx, candidates, hooks=hooks)
+
+    async def _execute_message(
+        self,
+        ctx: tanjun.MessageContext,
+        candidates: collections.Iterable[tuple[str, tanjun.MessageCommand[typing.Any]]],
+        /,
+        *,
+        hooks: collections.MutableSet[tanjun.MessageHooks] | None = None,
+    ) -> bool:
+        async for name, command in self._check_message_context(ctx, candidates):
             ctx.set_triggering_name(name)
             ctx.set_content(ctx.content[len(name) :].lstrip())
             ctx.set_component(self)
             # Only add our hooks if we're sure we'll be executing the command here.
-
-            if self._message_hooks:
-                if hooks is None:
-                    hooks = set()
-
-                hooks.add(self._message_hooks)
-
-            if self._hooks:
-                if hooks is None:
-                    hooks = set()
-
-                hooks.add(self._hooks)
-
-            await command.execute(ctx, hooks=hooks)
+            merged_hooks = self._merged_message_hooks.merge(hooks, self._message_hooks, self._hooks)
+            await command.execute(ctx, hooks=_internal.hooks_for(command, merged_hooks))
             return True
 
         ctx.set_component(None)
@@ -56,7 +56,16 @@ _MAX_CHOICES = 25
 class AutocompleteContext(alluka.BasicContext, tanjun.AutocompleteContext):
     """Standard implementation of an autocomplete context."""
 
-    __slots__ = ("_command_name", "_focused", "_future", "_has_responded", "_interaction", "_options", "_tanjun_client")
+    __slots__ = (
+        "_command_name",
+        "_focused",
+        "_future",
+        "_has_responded",
+        "_interaction",
+        "_options",
+        "_raw_options",
+        "_tanjun_client",
+    )
 
     def __init__(
         self,
@@ -83,17 +92,14 @@ class AutocompleteContext(alluka.BasicContext, tanjun.AutocompleteContext):
         self._has_responded = False
         self._interaction = interaction
 
-        focused: hikari.AutocompleteInteractionOption | None = None
-        self._options: dict[str, hikari.AutocompleteInteractionOption] = {}
         command_name, options = _internal.flatten_options(interaction.command_name, interaction.options)
-        for option in options:
-            self._options[option.name] = option
-            if option.is_focused:
-                focused = self._options[option.name]
-
+        focused = next((option for option in options if option.is_focused), None)
         assert focused is not None
         self._command_name = command_name
         self._focused = focused
+        # The options mapping is lazily built on first access.
+        self._options: dict[str, hikari.AutocompleteInteractionOption] | None = None
+        self._raw_options = options
         (
             self._set_type_special_case(AutocompleteContext, self)._set_type_special_case(  # noqa: SLF001
                 tanjun.AutocompleteContext, self
@@ -197,6 +203,9 @@ class AutocompleteContext(alluka.BasicContext, tanjun.AutocompleteContext):
     @property
     def options(self) -> collections.Mapping[str, hikari.AutocompleteInteractionOption]:
         # <<inherited docstring from tanjun.abc.AutocompleteContext>>.
+        if self._options is None:
+            self._options = {option.name: option for option in self._raw_options}
+
         return self._options.copy()
 
     async def fetch_channel(self) -> hikari.TextableChannel:
@@ -232,6 +241,7 @@ class AutocompleteContext(alluka.BasicContext, tanjun.AutocompleteContext):
             raise ValueError(error_message)
 
         self._has_responded = True
+        _internal.set_recorded_choices(self, choices)
         choice_objects = [
             hikari.impl.AutocompleteChoiceBuilder(name=name, value=value) for name, value in choices.items()
         ]
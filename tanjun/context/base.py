@@ -38,6 +38,7 @@ import alluka
 import hikari
 from hikari import snowflakes
 
+from tanjun import _internal
 from tanjun import abc as tanjun
 
 if typing.TYPE_CHECKING:
@@ -156,13 +157,17 @@ class BaseContext(alluka.BasicContext, tanjun.Context):
 
     async def fetch_channel(self) -> hikari.TextableChannel:
         # <<inherited docstring from tanjun.abc.Context>>.
-        channel = await self._tanjun_client.rest.fetch_channel(self.channel_id)
+        client = self._tanjun_client
+        rest = client.injector.get_type_dependency(_internal.RestFlights, default=None) or client.rest
+        channel = await rest.fetch_channel(self.channel_id)
         assert isinstance(channel, hikari.TextableChannel)
         return channel
 
     async def fetch_guild(self) -> hikari.Guild | None:  # TODO: or raise?
         # <<inherited docstring from tanjun.abc.Context>>.
         if self.guild_id is not None:
-            return await self._tanjun_client.rest.fetch_guild(self.guild_id)
+            client = self._tanjun_client
+            rest = client.injector.get_type_dependency(_internal.RestFlights, default=None) or client.rest
+            return await rest.fetch_guild(self.guild_id)
 
         return None  # MyPy compat
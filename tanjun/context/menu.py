@@ -46,6 +46,8 @@ if typing.TYPE_CHECKING:
     from collections import abc as collections
     from typing import Self
 
+    from tanjun._internal import deletion
+
     _T = typing.TypeVar("_T")
     _ResponseTypeT = (
         hikari.api.InteractionMessageBuilder
@@ -71,6 +73,7 @@ class MenuContext(slash.AppCommandContext, tanjun.MenuContext):
         register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
         *,
         default_to_ephemeral: bool = False,
+        delete_scheduler: deletion.DeleteScheduler | None = None,
         future: asyncio.Future[_ResponseTypeT] | None = None,
         on_not_found: collections.Callable[[tanjun.MenuContext], collections.Awaitable[None]] | None = None,
     ) -> None:
@@ -89,10 +92,22 @@ class MenuContext(slash.AppCommandContext, tanjun.MenuContext):
             through the REST webhook flow.
         default_to_ephemeral
             Whether to default to ephemeral responses.
+        delete_scheduler
+            The scheduler to use for deleting responses after a delay.
+
+            If this isn't provided then a task will be spawned for each delayed
+            deletion.
         on_not_found
             Callback used to indicate no matching command was found.
         """
-        super().__init__(client, interaction, register_task, default_to_ephemeral=default_to_ephemeral, future=future)
+        super().__init__(
+            client,
+            interaction,
+            register_task,
+            default_to_ephemeral=default_to_ephemeral,
+            delete_scheduler=delete_scheduler,
+            future=future,
+        )
         self._command: tanjun.MenuCommand[typing.Any, typing.Any] | None = None
         self._marked_not_found = False
         self._on_not_found = on_not_found
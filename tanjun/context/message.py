@@ -47,6 +47,8 @@ if typing.TYPE_CHECKING:
     from collections import abc as collections
     from typing import Self
 
+    from tanjun._internal import deletion
+
 
 _LOGGER = logging.getLogger("hikari.tanjun.context")
 
@@ -61,6 +63,7 @@ class MessageContext(base.BaseContext, tanjun.MessageContext):
     __slots__ = (
         "_command",
         "_content",
+        "_delete_scheduler",
         "_initial_response_id",
         "_last_response_id",
         "_message",
@@ -77,6 +80,7 @@ class MessageContext(base.BaseContext, tanjun.MessageContext):
         message: hikari.Message,
         register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
         *,
+        delete_scheduler: deletion.DeleteScheduler | None = None,
         triggering_name: str = "",
         triggering_prefix: str = "",
     ) -> None:
@@ -92,6 +96,11 @@ class MessageContext(base.BaseContext, tanjun.MessageContext):
             The message that triggered the command.
         register_task
             Callback used to register long-running tasks spawned by this context.
+        delete_scheduler
+            The scheduler to use for deleting responses after a delay.
+
+            If this isn't provided then a task will be spawned for each delayed
+            deletion.
         triggering_name
             The name of the command that triggered this context.
         triggering_prefix
@@ -104,6 +113,7 @@ class MessageContext(base.BaseContext, tanjun.MessageContext):
         super().__init__(client)
         self._command: tanjun.MessageCommand[typing.Any] | None = None
         self._content = content
+        self._delete_scheduler = delete_scheduler
         self._initial_response_id: hikari.Snowflake | None = None
         self._last_response_id: hikari.Snowflake | None = None
         self._register_task = register_task
@@ -280,7 +290,7 @@ class MessageContext(base.BaseContext, tanjun.MessageContext):
             role_mentions=role_mentions,
         )
         if delete_after is not None:
-            self._register_task(asyncio.create_task(self._delete_after(delete_after, message)))
+            self._schedule_delete(delete_after, message)
 
         return message
 
@@ -321,7 +331,7 @@ class MessageContext(base.BaseContext, tanjun.MessageContext):
         )
 
         if delete_after is not None:
-            self._register_task(asyncio.create_task(self._delete_after(delete_after, message)))
+            self._schedule_delete(delete_after, message)
 
         return message
 
@@ -341,6 +351,15 @@ class MessageContext(base.BaseContext, tanjun.MessageContext):
         error_message = "No responses found for this context"
         raise LookupError(error_message)
 
+    def _schedule_delete(self, delete_after: float, message: hikari.Message, /) -> None:
+        if self._delete_scheduler:
+            self._delete_scheduler.schedule_message(
+                delete_after, message.channel_id, message.id, bulk=self._message.guild_id is not None
+            )
+
+        else:
+            self._register_task(asyncio.create_task(self._delete_after(delete_after, message)))
+
     @staticmethod
     async def _delete_after(delete_after: float, message: hikari.Message, /) -> None:
         await asyncio.sleep(delete_after)
@@ -395,6 +414,6 @@ class MessageContext(base.BaseContext, tanjun.MessageContext):
                 self._initial_response_id = message.id
 
             if delete_after is not None:
-                self._register_task(asyncio.create_task(self._delete_after(delete_after, message)))
+                self._schedule_delete(delete_after, message)
 
             return message
@@ -49,6 +49,8 @@ if typing.TYPE_CHECKING:
     from collections import abc as collections
     from typing import Self
 
+    from tanjun._internal import deletion
+
     _ResponseTypeT = (
         hikari.api.InteractionMessageBuilder
         | hikari.api.InteractionDeferredBuilder
@@ -304,6 +306,8 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
     __slots__ = (
         "_defaults_to_ephemeral",
         "_defer_task",
+        "_defer_timer",
+        "_delete_scheduler",
         "_has_been_deferred",
         "_has_responded",
         "_interaction",
@@ -320,11 +324,14 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
         register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
         *,
         default_to_ephemeral: bool = False,
+        delete_scheduler: deletion.DeleteScheduler | None = None,
         future: asyncio.Future[_ResponseTypeT] | None = None,
     ) -> None:
         super().__init__(client)
         self._defaults_to_ephemeral = default_to_ephemeral
         self._defer_task: asyncio.Task[None] | None = None
+        self._defer_timer: _internal.TimerEntry | None = None
+        self._delete_scheduler = delete_scheduler
         self._has_been_deferred = False
         self._has_responded = False
         self._interaction = interaction
@@ -394,12 +401,16 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
         # <<inherited docstring from tanjun.abc.AppCommandContext>>.
         return self._interaction
 
-    async def _auto_defer(self, countdown: int | float, /) -> None:
-        await asyncio.sleep(countdown)
-        await self.defer()
+    def _auto_defer(self) -> None:
+        # This is called by the defer timer and only creates a task for the
+        # (relatively rare) contexts which actually need deferring.
+        self._defer_task = asyncio.get_running_loop().create_task(self.defer())
 
     def cancel_defer(self) -> None:
         """Cancel the auto-deferral if its active."""
+        if self._defer_timer:
+            self._defer_timer.cancel()
+
         if self._defer_task:
             self._defer_task.cancel()
 
@@ -439,11 +450,11 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
             This context to allow for chaining.
         """
         self._assert_not_final()
-        if self._defer_task:
+        if self._defer_timer or self._defer_task:
             error_message = "Defer timer already set"
             raise RuntimeError(error_message)
 
-        self._defer_task = asyncio.create_task(self._auto_defer(count_down))
+        self._defer_timer = _internal.get_timer_wheel().call_later(count_down, self._auto_defer)
         return self
 
     def set_ephemeral_default(self, state: bool, /) -> Self:  # noqa: FBT001
@@ -490,12 +501,22 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
 
         return delete_after
 
-    async def _delete_followup_after(self, delete_after: float, message: hikari.Message, /) -> None:
-        await asyncio.sleep(delete_after)
+    async def _try_delete_followup(self, message: hikari.Message, /) -> None:
         try:
             await self._interaction.delete_message(message)
         except hikari.NotFoundError as exc:
-            _LOGGER.debug("Failed to delete response message after %.2f seconds", delete_after, exc_info=exc)
+            _LOGGER.debug("Failed to delete response message", exc_info=exc)
+
+    async def _delete_followup_after(self, delete_after: float, message: hikari.Message, /) -> None:
+        await asyncio.sleep(delete_after)
+        await self._try_delete_followup(message)
+
+    def _schedule_followup_delete(self, delete_after: float, message: hikari.Message, /) -> None:
+        if self._delete_scheduler:
+            self._delete_scheduler.schedule_callback(delete_after, lambda: self._try_delete_followup(message))
+
+        else:
+            self._register_task(asyncio.create_task(self._delete_followup_after(delete_after, message)))
 
     async def _create_followup(
         self,
@@ -538,7 +559,7 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
         self._has_responded = True
 
         if delete_after is not None:
-            self._register_task(asyncio.create_task(self._delete_followup_after(delete_after, message)))
+            self._schedule_followup_delete(delete_after, message)
 
         return message
 
@@ -579,12 +600,22 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
                 flags=flags,
             )
 
-    async def _delete_initial_response_after(self, delete_after: float, /) -> None:
-        await asyncio.sleep(delete_after)
+    async def _try_delete_initial_response(self) -> None:
         try:
             await self.delete_initial_response()
         except hikari.NotFoundError as exc:
-            _LOGGER.debug("Failed to delete response message after %.2f seconds", delete_after, exc_info=exc)
+            _LOGGER.debug("Failed to delete initial response message", exc_info=exc)
+
+    async def _delete_initial_response_after(self, delete_after: float, /) -> None:
+        await asyncio.sleep(delete_after)
+        await self._try_delete_initial_response()
+
+    def _schedule_initial_response_delete(self, delete_after: float, /) -> None:
+        if self._delete_scheduler:
+            self._delete_scheduler.schedule_callback(delete_after, self._try_delete_initial_response)
+
+        else:
+            self._register_task(asyncio.create_task(self._delete_initial_response_after(delete_after)))
 
     async def _create_initial_response(
         self,
@@ -658,7 +689,7 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
 
         self._has_responded = True
         if delete_after is not None:
-            self._register_task(asyncio.create_task(self._delete_initial_response_after(delete_after)))
+            self._schedule_initial_response_delete(delete_after)
 
     async def create_initial_response(
         self,
@@ -752,7 +783,7 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
         self._has_responded = True
 
         if delete_after is not None:
-            self._register_task(asyncio.create_task(self._delete_initial_response_after(delete_after)))
+            self._schedule_initial_response_delete(delete_after)
 
         return message
 
@@ -788,7 +819,7 @@ class AppCommandContext(base.BaseContext, tanjun.AppCommandContext):
                 role_mentions=role_mentions,
             )
             if delete_after is not None:
-                self._register_task(asyncio.create_task(self._delete_followup_after(delete_after, message)))
+                self._schedule_followup_delete(delete_after, message)
 
             return message
 
@@ -996,6 +1027,7 @@ class SlashContext(AppCommandContext, tanjun.SlashContext):
         register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
         *,
         default_to_ephemeral: bool = False,
+        delete_scheduler: deletion.DeleteScheduler | None = None,
         future: asyncio.Future[_ResponseTypeT] | None = None,
         on_not_found: collections.Callable[[tanjun.SlashContext], collections.Awaitable[None]] | None = None,
     ) -> None:
@@ -1011,20 +1043,32 @@ class SlashContext(AppCommandContext, tanjun.SlashContext):
             Callback used to register long-running tasks spawned by this context.
         default_to_ephemeral
             Whether to default to ephemeral responses.
+        delete_scheduler
+            The scheduler to use for deleting responses after a delay.
+
+            If this isn't provided then a task will be spawned for each delayed
+            deletion.
         future
             A future used to set the initial response if this is being called
             through the REST webhook flow.
         on_not_found
             Callback used to indicate no matching command was found.
         """
-        super().__init__(client, interaction, register_task, default_to_ephemeral=default_to_ephemeral, future=future)
+        super().__init__(
+            client,
+            interaction,
+            register_task,
+            default_to_ephemeral=default_to_ephemeral,
+            delete_scheduler=delete_scheduler,
+            future=future,
+        )
         self._marked_not_found = False
         self._on_not_found = on_not_found
 
         self._command: tanjun.BaseSlashCommand | None = None
-        command_name, options = _internal.flatten_options(interaction.command_name, interaction.options)
-        self._command_name = command_name
-        self._options = {option.name: SlashOption(interaction.resolved, option) for option in options}
+        # These are lazily flattened and wrapped on first access.
+        self._command_name: str | None = None
+        self._options: dict[str, tanjun.SlashOption] | None = None
         (
             self._set_type_special_case(tanjun.SlashContext, self)._set_type_special_case(  # noqa: SLF001
                 SlashContext, self
@@ -1039,13 +1083,26 @@ class SlashContext(AppCommandContext, tanjun.SlashContext):
     @property
     def options(self) -> collections.Mapping[str, tanjun.SlashOption]:
         # <<inherited docstring from tanjun.abc.SlashContext>>.
-        return self._options.copy()
+        if (options := self._options) is None:
+            options = self._flatten_options()
+
+        return options.copy()
 
     @property
     def triggering_name(self) -> str:
         # <<inherited docstring from tanjun.abc.Context>>.
+        if self._command_name is None:
+            self._command_name, _ = _internal.flatten_options(self._interaction.command_name, self._interaction.options)
+
         return self._command_name
 
+    def _flatten_options(self) -> dict[str, tanjun.SlashOption]:
+        command_name, options = _internal.flatten_options(self._interaction.command_name, self._interaction.options)
+        resolved = self._interaction.resolved
+        self._command_name = command_name
+        self._options = {option.name: SlashOption(resolved, option) for option in options}
+        return self._options
+
     @property
     def type(self) -> typing.Literal[hikari.CommandType.SLASH]:
         # <<inherited docstring from tanjun.abc.SlashContext>>.
@@ -338,6 +338,7 @@ class ToChannel(BaseConverter):
         cache: alluka.Injected[_GuildChannelCacheT | None] = None,
         dm_cache: alluka.Injected[_DmCacheT | None] = None,
         thread_cache: alluka.Injected[_ThreadCacheT | None] = None,
+        rest_flights: alluka.Injected[_internal.RestFlights | None] = None,
     ) -> hikari.PartialChannel:
         channel_id = parse_channel_id(argument, message="No valid channel mention or ID found")
         if ctx.cache and (channel_ := ctx.cache.get_guild_channel(channel_id)):
@@ -381,7 +382,7 @@ class ToChannel(BaseConverter):
 
         if not no_guild_channel:
             try:
-                return self._assert_type(await ctx.rest.fetch_channel(channel_id))
+                return self._assert_type(await (rest_flights or ctx.rest).fetch_channel(channel_id))
 
             except hikari.NotFoundError:
                 pass
@@ -488,6 +489,7 @@ class ToGuild(BaseConverter):
         ctx: alluka.Injected[tanjun.Context],
         *,
         cache: alluka.Injected[_GuildCacheT | None] = None,
+        rest_flights: alluka.Injected[_internal.RestFlights | None] = None,
     ) -> hikari.Guild:
         guild_id = parse_snowflake(argument, message="No valid guild ID found")
         if ctx.cache and (guild := ctx.cache.get_guild(guild_id)):
@@ -505,7 +507,7 @@ class ToGuild(BaseConverter):
                 pass
 
         try:
-            return await ctx.rest.fetch_guild(guild_id)
+            return await (rest_flights or ctx.rest).fetch_guild(guild_id)
 
         except hikari.NotFoundError:
             pass
@@ -650,6 +652,7 @@ class ToMember(BaseConverter):
         ctx: alluka.Injected[tanjun.Context],
         *,
         cache: alluka.Injected[_MemberCacheT | None] = None,
+        rest_flights: alluka.Injected[_internal.RestFlights | None] = None,
     ) -> hikari.Member:
         if ctx.guild_id is None:
             error_message = "Cannot get a member from a DM channel"
@@ -682,7 +685,7 @@ class ToMember(BaseConverter):
                     pass
 
             try:
-                return await ctx.rest.fetch_member(ctx.guild_id, user_id)
+                return await (rest_flights or ctx.rest).fetch_member(ctx.guild_id, user_id)
 
             except hikari.NotFoundError:
                 pass
@@ -781,6 +784,7 @@ class ToRole(BaseConverter):
         ctx: alluka.Injected[tanjun.Context],
         *,
         cache: alluka.Injected[_RoleCacheT | None] = None,
+        rest_flights: alluka.Injected[_internal.RestFlights | None] = None,
     ) -> hikari.Role:
         role_id = parse_role_id(argument, message="No valid role mention or ID found")
         if ctx.cache and (role := ctx.cache.get_role(role_id)):
@@ -798,7 +802,7 @@ class ToRole(BaseConverter):
                 pass
 
         if ctx.guild_id:
-            for role in await ctx.rest.fetch_roles(ctx.guild_id):
+            for role in await (rest_flights or ctx.rest).fetch_roles(ctx.guild_id):
                 if role.id == role_id:
                     return role
 
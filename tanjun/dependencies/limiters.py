@@ -67,6 +67,7 @@ from tanjun import abc as tanjun
 from tanjun import conversion
 from tanjun import errors
 from tanjun import hooks
+from tanjun import permissions
 from tanjun._internal import localisation
 
 from . import async_cache
@@ -466,6 +467,10 @@ async def _get_ctx_target(ctx: tanjun.Context, type_: BucketResource, /) -> hika
         if not ctx.member or len(ctx.member.role_ids) <= 1:  # If they only have 1 role ID then this is @everyone.
             return ctx.guild_id
 
+        roles_cache = ctx.get_type_dependency(permissions.GuildRolesCache, default=None)
+        if roles_cache and (role_id := roles_cache.get_top_role_id(ctx.guild_id, ctx.member.role_ids)):
+            return role_id
+
         roles: collections.Iterable[hikari.Role] = ctx.member.get_roles()
         try_rest = not roles
         if try_rest:  # noqa: SIM102
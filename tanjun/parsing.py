@@ -47,9 +47,11 @@ __all__: list[str] = [
 
 import abc
 import asyncio
+import collections as collections_
 import copy
+import functools
 import itertools
-import shlex
+import re
 import typing
 from collections import abc as collections
 
@@ -63,6 +65,7 @@ if typing.TYPE_CHECKING:
     from typing import Self
 
     _CommandT = typing.TypeVar("_CommandT", bound=tanjun.MessageCommand[typing.Any])
+    _ConversionT = collections.Callable[[], collections.Coroutine[typing.Any, typing.Any, typing.Any]]
     _T_contra = typing.TypeVar("_T_contra", contravariant=True)
 
     class _CmpProto(typing.Protocol[_T_contra]):
@@ -444,18 +447,45 @@ class AbstractParser(AbstractOptionParser):
     __slots__ = ()
 
 
+_SPACE_PATTERN = re.compile(" *")
+# This matches the same tokens as a POSIX shlex which only splits on spaces
+# and only treats double quotes as quotes.
+_TOKEN_PATTERN = re.compile(r'(?:[^ "\\]+|"(?:[^"\\]|\\.)*"|\\.)+', re.DOTALL)
+_TOKEN_PART_PATTERN = re.compile(r'([^ "\\]+)|"((?:[^"\\]|\\.)*)"|\\(.)', re.DOTALL)
+_OPEN_QUOTE_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*', re.DOTALL)
+# Only the escape character and quote can be escaped within quotes.
+_QUOTED_ESCAPE_PATTERN = re.compile(r'\\([\\"])')
+
+
+def _unescape_token(token: str, /) -> str:
+    parts: list[str] = []
+    for match in _TOKEN_PART_PATTERN.finditer(token):
+        word, quoted, escaped = match.groups()
+        if word is not None:
+            parts.append(word)
+
+        elif quoted is not None:
+            parts.append(_QUOTED_ESCAPE_PATTERN.sub(r"\1", quoted) if "\\" in quoted else quoted)
+
+        else:
+            parts.append(escaped)
+
+    return "".join(parts)
+
+
 class _ShlexTokenizer:
-    __slots__ = ("__arg_buffer", "__last_name", "__options_buffer", "__shlex")
+    __slots__ = ("__arg_buffer", "__content", "__last_name", "__options_buffer", "__position", "__split_tokens")
 
     def __init__(self, content: str, /) -> None:
-        self.__arg_buffer: list[str] = []
+        self.__arg_buffer: collections_.deque[str] = collections_.deque()
+        self.__content = content
         self.__last_name: str | None = None
-        self.__options_buffer: list[tuple[str, str | None]] = []
-        self.__shlex = shlex.shlex(content, posix=True)
-        self.__shlex.commenters = ""
-        self.__shlex.quotes = '"'
-        self.__shlex.whitespace = " "
-        self.__shlex.whitespace_split = True
+        self.__options_buffer: collections_.deque[tuple[str, str | None]] = collections_.deque()
+        self.__position = 0
+        # Content without any quotes or escapes can just be split on spaces.
+        self.__split_tokens: collections.Iterator[str] | None = (
+            filter(None, content.split(" ")) if '"' not in content and "\\" not in content else None
+        )
 
     def collect_raw_options(self) -> collections.Mapping[str, collections.Sequence[str | None]]:
         results: dict[str, list[str | None]] = {}
@@ -476,38 +506,66 @@ class _ShlexTokenizer:
 
     def next_raw_argument(self) -> str | None:
         if self.__arg_buffer:
-            return self.__arg_buffer.pop(0)
+            return self.__arg_buffer.popleft()
 
-        while (value := self.__seek_shlex()) and value[0] == 1:
+        while (value := self.__seek_token()) and value[0] == 1:
             self.__options_buffer.append(value[1])
 
         return value[1] if value else None
 
     def next_raw_option(self) -> tuple[str, str | None] | None:
         if self.__options_buffer:
-            return self.__options_buffer.pop(0)
+            return self.__options_buffer.popleft()
 
-        while (value := self.__seek_shlex()) and value[0] == 0:
+        while (value := self.__seek_token()) and value[0] == 0:
             self.__arg_buffer.append(value[1])
 
         return value[1] if value else None
 
-    def __seek_shlex(self) -> tuple[typing.Literal[0], str] | tuple[typing.Literal[1], tuple[str, str | None]] | None:
-        option_name = self.__last_name
+    def __next_token(self) -> str | None:
+        if self.__split_tokens is not None:
+            return next(self.__split_tokens, None)
+
+        content = self.__content
+        position = _SPACE_PATTERN.match(content, self.__position).end()
+        if position == len(content):
+            self.__position = position
+            return None
+
+        match = _TOKEN_PATTERN.match(content, position)
+        end = match.end() if match else position
+        if end != len(content) and content[end] != " ":
+            # The token's either got an unclosed quote or a trailing escape character.
+            quote_match = _OPEN_QUOTE_PATTERN.match(content, end)
+            if quote_match and quote_match.end() == len(content):
+                error_message = "No closing quotation"
+
+            else:
+                error_message = "No escaped character"
+
+            raise errors.ParserError(error_message, None)
+
+        self.__position = end
+        token = content[position:end]
+        if "\\" not in token:
+            if '"' not in token:
+                return token
 
-        try:
-            value = next(self.__shlex)
+            if token[0] == '"' and token.find('"', 1) == len(token) - 1:
+                return token[1:-1]
 
-        except StopIteration:
+        return _unescape_token(token)
+
+    def __seek_token(self) -> tuple[typing.Literal[0], str] | tuple[typing.Literal[1], tuple[str, str | None]] | None:
+        option_name = self.__last_name
+        value = self.__next_token()
+        if value is None:
             if option_name is not None:
                 self.__last_name = None
                 return (1, (option_name, None))
 
             return None
 
-        except ValueError as exc:
-            raise errors.ParserError(str(exc), None) from exc
-
         is_option = value.startswith("-")
         if is_option and option_name is not None:
             self.__last_name = value
@@ -515,7 +573,7 @@ class _ShlexTokenizer:
 
         if is_option:
             self.__last_name = value
-            return self.__seek_shlex()
+            return self.__seek_token()
 
         if option_name:
             self.__last_name = None
@@ -537,8 +595,18 @@ async def _covert_option_or_empty(
     raise errors.NotEnoughArgumentsError(error_message, option.key)
 
 
+async def _covert_options_or_empty(
+    ctx: tanjun.MessageContext, option: Option, values: list[str | None], /
+) -> list[typing.Any]:
+    return await asyncio.gather(*(_covert_option_or_empty(ctx, option, value) for value in values))
+
+
+async def _convert_arguments(ctx: tanjun.MessageContext, argument: Argument, values: list[str], /) -> list[typing.Any]:
+    return await asyncio.gather(*(argument.convert(ctx, value) for value in values))
+
+
 class _SemanticShlex(_ShlexTokenizer):
-    __slots__ = ("__arguments", "__ctx", "__options")
+    __slots__ = ("__arguments", "__concurrent", "__ctx", "__options")
 
     def __init__(
         self,
@@ -546,55 +614,62 @@ class _SemanticShlex(_ShlexTokenizer):
         arguments: collections.Sequence[Argument],
         options: collections.Sequence[Option],
         /,
+        *,
+        concurrent: bool = False,
     ) -> None:
         super().__init__(ctx.content)
         self.__arguments = arguments
+        self.__concurrent = concurrent
         self.__ctx = ctx
         self.__options = options
 
-    async def parse(self) -> dict[str, typing.Any]:
+    def __collect(
+        self, kwargs: dict[str, typing.Any], conversions: list[tuple[str, _ConversionT]], /
+    ) -> errors.ParserError | None:
+        # This tokenizes everything and returns the first structural error
+        # (rather than raising it) so that it can be raised after the errors
+        # from any conversions for parameters declared before it.
         raw_options = self.collect_raw_options()
-        kwargs: dict[str, typing.Any] = {}
 
         for option in self.__options:
             values_iter = itertools.chain.from_iterable(
                 raw_options[name] for name in option.names if name in raw_options
             )
             if option.is_multi and (values := list(values_iter)):
-                kwargs[option.key] = await asyncio.gather(
-                    *(_covert_option_or_empty(self.__ctx, option, value) for value in values)
+                conversions.append(
+                    (option.key, functools.partial(_covert_options_or_empty, self.__ctx, option, values))
                 )
 
             elif not option.is_multi and (value := next(values_iter, ...)) is not ...:
                 if next(values_iter, ...) is not ...:
                     error_message = f"Option `{option.key}` can only take a single value"
-                    raise errors.TooManyArgumentsError(error_message, option.key)
+                    return errors.TooManyArgumentsError(error_message, option.key)
 
-                kwargs[option.key] = await _covert_option_or_empty(self.__ctx, option, value)
+                conversions.append((option.key, functools.partial(_covert_option_or_empty, self.__ctx, option, value)))
 
             elif option.default is tanjun.NO_DEFAULT:
                 # If this is reached then no value was found.
                 error_message = f"Missing required option `{option.key}`"
-                raise errors.NotEnoughArgumentsError(error_message, option.key)
+                return errors.NotEnoughArgumentsError(error_message, option.key)
 
             elif option.default is not tanjun.NO_PASS:
                 kwargs[option.key] = option.default
 
         for argument in self.__arguments:
             if argument.is_greedy and (value := " ".join(self.iter_raw_arguments())):
-                kwargs[argument.key] = await argument.convert(self.__ctx, value)
+                conversions.append((argument.key, functools.partial(argument.convert, self.__ctx, value)))
 
             elif argument.is_multi and (values := list(self.iter_raw_arguments())):
-                kwargs[argument.key] = await asyncio.gather(*(argument.convert(self.__ctx, value) for value in values))
+                conversions.append((argument.key, functools.partial(_convert_arguments, self.__ctx, argument, values)))
 
             # If the previous two statements failed on getting raw arguments then this will as well.
             elif (optional_value := self.next_raw_argument()) is not None:
-                kwargs[argument.key] = await argument.convert(self.__ctx, optional_value)
+                conversions.append((argument.key, functools.partial(argument.convert, self.__ctx, optional_value)))
 
             elif argument.default is tanjun.NO_DEFAULT:
                 # If this is reached then no value was found.
                 error_message = f"Missing value for required argument '{argument.key}'"
-                raise errors.NotEnoughArgumentsError(error_message, argument.key)
+                return errors.NotEnoughArgumentsError(error_message, argument.key)
 
             elif argument.default is not tanjun.NO_PASS:
                 kwargs[argument.key] = argument.default
@@ -602,6 +677,29 @@ class _SemanticShlex(_ShlexTokenizer):
             if argument.is_greedy or argument.is_multi:
                 break  # Multi and Greedy parameters should always be the last parameter.
 
+        return None
+
+    async def parse(self) -> dict[str, typing.Any]:
+        kwargs: dict[str, typing.Any] = {}
+        conversions: list[tuple[str, _ConversionT]] = []
+        error = self.__collect(kwargs, conversions)
+
+        if self.__concurrent and len(conversions) > 1:
+            results = await asyncio.gather(*(convert() for _, convert in conversions), return_exceptions=True)
+            # Errors are raised in the order the parameters were declared in.
+            for (key, _), result in zip(conversions, results, strict=True):
+                if isinstance(result, BaseException):
+                    raise result
+
+                kwargs[key] = result
+
+        else:
+            for key, convert in conversions:
+                kwargs[key] = await convert()
+
+        if error is not None:
+            raise error
+
         return kwargs
 
 
@@ -1907,14 +2005,30 @@ class Option(Parameter):
 class ShlexParser(AbstractOptionParser):
     """A shlex based [AbstractOptionParser][tanjun.parsing.AbstractOptionParser] implementation."""
 
-    __slots__ = ("_arguments", "_callback_arg_names", "_client", "_component", "_options")
+    __slots__ = ("_arguments", "_callback_arg_names", "_client", "_component", "_concurrent_conversion", "_options")
 
-    def __init__(self) -> None:
-        """Initialise a shlex parser."""
+    def __init__(self, *, concurrent_conversion: bool = False) -> None:
+        """Initialise a shlex parser.
+
+        Parameters
+        ----------
+        concurrent_conversion
+            Whether the parameters should be converted concurrently.
+
+            When this is [True][] the message is fully tokenized before all
+            the parameters are converted at once, which avoids making several
+            sequential requests when using converters which make REST calls
+            (e.g. [tanjun.conversion.to_member][]). Any errors will still be
+            raised in the order the parameters were declared in.
+
+            When this is [False][] the parameters are converted one by one
+            and conversion stops at the first error.
+        """
         self._arguments: list[Argument] = []
         self._callback_arg_names: list[tuple[str, collections.Container[str]]] = []
         self._client: tanjun.Client | None = None
         self._component: tanjun.Component | None = None
+        self._concurrent_conversion = concurrent_conversion
         self._options: list[Option] = []  # TODO: maybe switch to dict[str, Option] and assert doesn't already exist
 
     @property
@@ -1922,6 +2036,11 @@ class ShlexParser(AbstractOptionParser):
         # <<inherited docstring from AbstractOptionParser>>.
         return self._arguments.copy()
 
+    @property
+    def converts_concurrently(self) -> bool:
+        """Whether this parser converts the parameters concurrently."""
+        return self._concurrent_conversion
+
     @property
     def options(self) -> collections.Sequence[Option]:
         # <<inherited docstring from AbstractOptionParser>>.
@@ -2191,7 +2310,7 @@ class ShlexParser(AbstractOptionParser):
         self, ctx: tanjun.MessageContext, /
     ) -> collections.Coroutine[typing.Any, typing.Any, dict[str, typing.Any]]:
         # <<inherited docstring from AbstractOptionParser>>.
-        return _SemanticShlex(ctx, self._arguments, self._options).parse()
+        return _SemanticShlex(ctx, self._arguments, self._options, concurrent=self._concurrent_conversion).parse()
 
     def validate_arg_keys(self, callback_name: str, names: collections.Container[str], /) -> None:
         # <<inherited docstring from AbstractOptionParser>>.
@@ -33,18 +33,26 @@ from __future__ import annotations
 __all__: list[str] = [
     "ALL_PERMISSIONS",
     "DM_PERMISSIONS",
+    "GuildRolesCache",
+    "OwnPermissionsCache",
+    "PermissionsCache",
     "calculate_everyone_permissions",
     "calculate_permissions",
+    "calculate_permissions_for_channels",
+    "calculate_permissions_for_members",
     "fetch_everyone_permissions",
     "fetch_permissions",
 ]
 
+import datetime
 import typing
 
 import hikari
 
+from . import _internal
 from ._internal import cache
 from .dependencies import async_cache
+from .dependencies import data
 
 if typing.TYPE_CHECKING:
     from collections import abc as collections
@@ -69,7 +77,7 @@ DM_PERMISSIONS: typing.Final[hikari.Permissions] = (
 """Bitfield of the permissions which are accessibly within DM channels."""
 
 
-def _calculate_channel_overwrites(
+def _calculate_role_overwrites(
     channel: hikari.PermissibleGuildChannel, member: hikari.Member, permissions: hikari.Permissions, /
 ) -> hikari.Permissions:
     if everyone_overwrite := channel.permission_overwrites.get(member.guild_id):
@@ -85,7 +93,12 @@ def _calculate_channel_overwrites(
 
     permissions &= ~deny
     permissions |= allow
+    return permissions
+
 
+def _calculate_member_overwrite(
+    channel: hikari.PermissibleGuildChannel, member: hikari.Member, permissions: hikari.Permissions, /
+) -> hikari.Permissions:
     if member_overwrite := channel.permission_overwrites.get(member.user.id):
         permissions &= ~member_overwrite.deny
         permissions |= member_overwrite.allow
@@ -93,6 +106,13 @@ def _calculate_channel_overwrites(
     return permissions
 
 
+def _calculate_channel_overwrites(
+    channel: hikari.PermissibleGuildChannel, member: hikari.Member, permissions: hikari.Permissions, /
+) -> hikari.Permissions:
+    permissions = _calculate_role_overwrites(channel, member, permissions)
+    return _calculate_member_overwrite(channel, member, permissions)
+
+
 def _calculate_role_permissions(
     roles: collections.Mapping[hikari.Snowflake, hikari.Role], member: hikari.Member, /
 ) -> hikari.Permissions:
@@ -155,6 +175,146 @@ def calculate_permissions(
     return _calculate_channel_overwrites(channel, member, permissions)
 
 
+def calculate_permissions_for_channels(
+    member: hikari.Member,
+    guild: hikari.Guild,
+    roles: collections.Mapping[hikari.Snowflake, hikari.Role],
+    channels: collections.Iterable[hikari.PermissibleGuildChannel],
+    /,
+) -> dict[hikari.Snowflake, hikari.Permissions]:
+    """Calculate the permissions a member has within multiple channels.
+
+    This only calculates the member's role permissions once.
+
+    Parameters
+    ----------
+    member
+        Object of the member to calculate the permissions for.
+    guild
+        Object of the guild to calculate their permissions within.
+    roles
+        Mapping of snowflake IDs to objects of the roles within the target
+        guild.
+    channels
+        Objects of the channels to calculate the member's permissions in.
+
+    Returns
+    -------
+    dict[hikari.snowflakes.Snowflake, hikari.permissions.Permissions]
+        Dictionary of channel IDs to the member's permissions within them.
+
+    Raises
+    ------
+    ValueError
+        If the member or any of the channels aren't from the provided guild.
+    """
+    if member.guild_id != guild.id:
+        error_message = "Member object isn't from the provided guild"
+        raise ValueError(error_message)
+
+    channels = list(channels)
+    for channel in channels:
+        if channel.guild_id != guild.id:
+            error_message = "Channel object isn't from the provided guild"
+            raise ValueError(error_message)
+
+    # Guild owners are implicitly admins.
+    if guild.owner_id == member.user.id:
+        return dict.fromkeys((channel.id for channel in channels), ALL_PERMISSIONS)
+
+    # Admin permission overrides all overwrites and is only applicable to roles.
+    if (permissions := _calculate_role_permissions(roles, member)) & permissions.ADMINISTRATOR:
+        return dict.fromkeys((channel.id for channel in channels), ALL_PERMISSIONS)
+
+    return {channel.id: _calculate_channel_overwrites(channel, member, permissions) for channel in channels}
+
+
+def calculate_permissions_for_members(
+    members: collections.Iterable[hikari.Member],
+    guild: hikari.Guild,
+    roles: collections.Mapping[hikari.Snowflake, hikari.Role],
+    /,
+    *,
+    channel: hikari.PermissibleGuildChannel | None = None,
+) -> dict[hikari.Snowflake, hikari.Permissions]:
+    """Calculate the permissions multiple members have within a guild.
+
+    Members with the same set of roles share the role and role overwrite
+    part of this calculation.
+
+    Parameters
+    ----------
+    members
+        Objects of the members to calculate the permissions for.
+    guild
+        Object of the guild to calculate their permissions within.
+    roles
+        Mapping of snowflake IDs to objects of the roles within the target
+        guild.
+    channel
+        Object of the channel to calculate the members' permissions in.
+
+        If this is left as [None][] then this will just calculate their
+        permissions on a guild level.
+
+    Returns
+    -------
+    dict[hikari.snowflakes.Snowflake, hikari.permissions.Permissions]
+        Dictionary of user IDs to the members' permissions.
+
+    Raises
+    ------
+    ValueError
+        If the channel or any of the members aren't from the provided guild.
+    """
+    if channel and channel.guild_id != guild.id:
+        error_message = "Channel object isn't from the provided guild"
+        raise ValueError(error_message)
+
+    results: dict[hikari.Snowflake, hikari.Permissions] = {}
+    # Tuples of (permissions, whether the member is an admin).
+    role_sets: dict[frozenset[hikari.Snowflake], tuple[hikari.Permissions, bool]] = {}
+
+    for member in members:
+        if member.guild_id != guild.id:
+            error_message = "Member object isn't from the provided guild"
+            raise ValueError(error_message)
+
+        # Guild owners are implicitly admins.
+        if guild.owner_id == member.user.id:
+            results[member.user.id] = ALL_PERMISSIONS
+            continue
+
+        role_ids = frozenset(member.role_ids)
+        if (cached := role_sets.get(role_ids)) is None:
+            cached = role_sets[role_ids] = _calculate_role_set_permissions(roles, member, channel)
+
+        permissions, is_admin = cached
+        if is_admin:
+            results[member.user.id] = ALL_PERMISSIONS
+            continue
+
+        results[member.user.id] = _calculate_member_overwrite(channel, member, permissions) if channel else permissions
+
+    return results
+
+
+def _calculate_role_set_permissions(
+    roles: collections.Mapping[hikari.Snowflake, hikari.Role],
+    member: hikari.Member,
+    channel: hikari.PermissibleGuildChannel | None,
+    /,
+) -> tuple[hikari.Permissions, bool]:
+    # Admin permission overrides all overwrites and is only applicable to roles.
+    if (permissions := _calculate_role_permissions(roles, member)) & permissions.ADMINISTRATOR:
+        return ALL_PERMISSIONS, True
+
+    if not channel:
+        return permissions, False
+
+    return _calculate_role_overwrites(channel, member, permissions), False
+
+
 async def _fetch_channel(
     client: tanjun.Client, channel: hikari.SnowflakeishOr[hikari.GuildChannel], /
 ) -> hikari.PermissibleGuildChannel:
@@ -169,6 +329,655 @@ async def _fetch_channel(
     return await cache.get_perm_channel(client, hikari.Snowflake(channel))
 
 
+class _Generations:
+    """Per-guild counters used to detect cache invalidations made during a fetch."""
+
+    __slots__ = ("_cleared_at", "_counter", "_guilds")
+
+    def __init__(self) -> None:
+        self._cleared_at = 0
+        self._counter = 0
+        self._guilds: dict[hikari.Snowflake, int] = {}
+
+    def get(self, guild_id: hikari.Snowflake, /) -> int:
+        return max(self._guilds.get(guild_id, 0), self._cleared_at)
+
+    def bump(self, guild_id: hikari.Snowflake, /) -> None:
+        self._counter += 1
+        self._guilds[guild_id] = self._counter
+
+    def bump_all(self) -> None:
+        self._counter += 1
+        self._cleared_at = self._counter
+        self._guilds.clear()
+
+
+class _MemberEntry:
+    __slots__ = ("channels", "role_ids")
+
+    def __init__(self, role_ids: frozenset[hikari.Snowflake], /) -> None:
+        self.channels: dict[hikari.Snowflake | None, tuple[hikari.Permissions, hikari.Snowflake | None]] = {}
+        self.role_ids = role_ids
+
+
+class PermissionsCache:
+    """Event-invalidated cache of calculated member permissions.
+
+    This stores the final permissions calculated by
+    [fetch_permissions][tanjun.permissions.fetch_permissions] for each guild
+    member and channel pair so repeat permission checks don't have to look up
+    the guild, its roles and the channel again.
+
+    Cached permissions are invalidated when the relevant role, member, channel
+    or guild events are received, meaning that this relies on the `GUILDS`
+    intent being declared. A member's cached permissions are also ignored if
+    their role IDs have changed, so member role changes are picked up even
+    without the `GUILD_MEMBERS` intent.
+
+    Permissions calculated for channel objects passed directly to
+    [fetch_permissions][tanjun.permissions.fetch_permissions] aren't cached.
+
+    Examples
+    --------
+    ```py
+    tanjun.permissions.PermissionsCache().add_to_client(client)
+    ```
+    """
+
+    __slots__ = ("_expire_after", "_generations", "_guilds", "_max_members")
+
+    def __init__(
+        self, *, expire_after: int | float | datetime.timedelta | None = None, max_members: int | None = 1000
+    ) -> None:
+        """Initialise a permissions cache.
+
+        Parameters
+        ----------
+        expire_after
+            How long a member's cached permissions should be kept for in seconds.
+
+            If this is [None][] then cached permissions will only be removed
+            when they're invalidated or evicted.
+        max_members
+            The maximum amount of members to cache the permissions of per guild.
+
+            If this is [None][] then the amount of members won't be bounded.
+
+        Raises
+        ------
+        ValueError
+            If `expire_after` is less than or equal to 0 seconds.
+            If `max_members` is less than 1.
+        """
+        if isinstance(expire_after, datetime.timedelta):
+            expire_after = expire_after.total_seconds()
+
+        elif expire_after is not None:
+            expire_after = float(expire_after)
+
+        if expire_after is not None and expire_after <= 0:
+            error_message = "expire_after must be more than 0 seconds"
+            raise ValueError(error_message)
+
+        if max_members is not None and max_members < 1:
+            error_message = "max_members must be greater than 0"
+            raise ValueError(error_message)
+
+        self._expire_after = expire_after
+        self._generations = _Generations()
+        self._guilds: dict[hikari.Snowflake, _internal.TimedLRUCache[hikari.Snowflake, _MemberEntry]] = {}
+        self._max_members = max_members
+
+    def add_to_client(self, client: tanjun.Client, /) -> None:
+        """Add this permissions cache to a Tanjun client.
+
+        This registers this as a type dependency and adds the event listeners
+        used to invalidate it.
+
+        Parameters
+        ----------
+        client
+            The client to add this cache to.
+        """
+        (
+            client.set_type_dependency(PermissionsCache, self)
+            .add_listener(hikari.GuildUpdateEvent, self._on_guild_event)
+            .add_listener(hikari.GuildAvailableEvent, self._on_guild_event)
+            .add_listener(hikari.GuildLeaveEvent, self._on_guild_event)
+            .add_listener(hikari.RoleUpdateEvent, self._on_guild_event)
+            .add_listener(hikari.RoleDeleteEvent, self._on_guild_event)
+            .add_listener(hikari.MemberUpdateEvent, self._on_member_event)
+            .add_listener(hikari.MemberDeleteEvent, self._on_member_event)
+            .add_listener(hikari.GuildChannelUpdateEvent, self._on_channel_event)
+            .add_listener(hikari.GuildChannelDeleteEvent, self._on_channel_event)
+            .add_listener(hikari.ShardReadyEvent, self._on_shard_ready)
+        )
+
+    def get(self, member: hikari.Member, channel_id: hikari.Snowflake | None, /) -> hikari.Permissions | None:
+        """Get a member's cached permissions.
+
+        Parameters
+        ----------
+        member
+            The member to get the cached permissions for.
+        channel_id
+            ID of the channel to get their permissions in.
+
+            If this is [None][] then this gets their guild level permissions.
+
+        Returns
+        -------
+        hikari.permissions.Permissions | None
+            The cached permissions or [None][] if they aren't cached.
+        """
+        if (guild := self._guilds.get(member.guild_id)) is None:
+            return None
+
+        entry = guild.get(member.user.id)
+        if entry is None or entry.role_ids != frozenset(member.role_ids):
+            return None
+
+        if result := entry.channels.get(channel_id):
+            return result[0]
+
+        return None
+
+    def get_generation(self, guild_id: hikari.Snowflakeish, /) -> int:
+        """Get the current generation of a guild's cached permissions.
+
+        This changes whenever the guild's cached permissions are invalidated
+        and should be passed to [PermissionsCache.set][tanjun.permissions.PermissionsCache.set]
+        to avoid caching permissions which were calculated from stale data.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild to get the generation for.
+
+        Returns
+        -------
+        int
+            The guild's current generation.
+        """
+        return self._generations.get(hikari.Snowflake(guild_id))
+
+    def set(
+        self,
+        member: hikari.Member,
+        channel_id: hikari.Snowflake | None,
+        permissions: hikari.Permissions,
+        /,
+        *,
+        generation: int | None = None,
+        parent_id: hikari.Snowflake | None = None,
+    ) -> None:
+        """Cache a member's permissions.
+
+        Parameters
+        ----------
+        member
+            The member to cache the permissions for.
+        channel_id
+            ID of the channel these permissions are for.
+
+            If this is [None][] then these are their guild level permissions.
+        permissions
+            The member's permissions.
+        generation
+            The guild's generation from before the permissions were calculated.
+
+            If this is passed and the guild's cached permissions have been
+            invalidated since then, these permissions won't be cached.
+        parent_id
+            ID of the channel these permissions were calculated from if
+            `channel_id` is a thread.
+        """
+        if generation is not None and generation != self.get_generation(member.guild_id):
+            return
+
+        if (guild := self._guilds.get(member.guild_id)) is None:
+            guild = self._guilds[member.guild_id] = _internal.TimedLRUCache(
+                expire_after=self._expire_after, max_size=self._max_members
+            )
+
+        role_ids = frozenset(member.role_ids)
+        entry = guild.get(member.user.id)
+        if entry is None or entry.role_ids != role_ids:
+            entry = _MemberEntry(role_ids)
+            guild.set(member.user.id, entry)
+
+        entry.channels[channel_id] = (permissions, parent_id)
+
+    def clear(self, guild_id: hikari.Snowflakeish | None = None, /) -> None:
+        """Clear the cached permissions.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild to clear the cached permissions for.
+
+            If this is [None][] then the cached permissions for every guild
+            are cleared.
+        """
+        if guild_id is None:
+            self._guilds.clear()
+            self._generations.bump_all()
+
+        else:
+            self._invalidate_guild(hikari.Snowflake(guild_id))
+
+    def _invalidate_guild(self, guild_id: hikari.Snowflake, /) -> None:
+        self._generations.bump(guild_id)
+        self._guilds.pop(guild_id, None)
+
+    async def _on_guild_event(
+        self,
+        event: (
+            hikari.GuildUpdateEvent
+            | hikari.GuildAvailableEvent
+            | hikari.GuildLeaveEvent
+            | hikari.RoleUpdateEvent
+            | hikari.RoleDeleteEvent
+        ),
+        /,
+    ) -> None:
+        self._invalidate_guild(event.guild_id)
+
+    async def _on_member_event(self, event: hikari.MemberUpdateEvent | hikari.MemberDeleteEvent, /) -> None:
+        self._generations.bump(event.guild_id)
+        if (guild := self._guilds.get(event.guild_id)) is not None:
+            guild.pop(event.user_id)
+
+    async def _on_channel_event(
+        self, event: hikari.GuildChannelUpdateEvent | hikari.GuildChannelDeleteEvent, /
+    ) -> None:
+        self._generations.bump(event.guild_id)
+        if (guild := self._guilds.get(event.guild_id)) is None:
+            return
+
+        channel_id = event.channel_id
+        for entry in guild.values():
+            entry.channels = {key: value for key, value in entry.channels.items() if channel_id not in (key, value[1])}
+
+    async def _on_shard_ready(self, _: hikari.ShardReadyEvent, /) -> None:
+        # Events may have been missed while the shard was disconnected.
+        self.clear()
+
+
+class OwnPermissionsCache:
+    """Event-invalidated cache of the bot's own permissions per guild channel.
+
+    This is used by [OwnPermissionCheck][tanjun.checks.OwnPermissionCheck] for
+    message commands to avoid looking up the bot's member object and
+    re-calculating its permissions on every call.
+
+    A guild's cached permissions are invalidated when its roles, channels or
+    the bot's own member are updated, meaning that this relies on the `GUILDS`
+    intent being declared.
+
+    Examples
+    --------
+    ```py
+    tanjun.permissions.OwnPermissionsCache().add_to_client(client)
+    ```
+    """
+
+    __slots__ = ("_generations", "_guilds", "_user_id")
+
+    def __init__(self) -> None:
+        """Initialise an own permissions cache."""
+        self._generations = _Generations()
+        self._guilds: dict[hikari.Snowflake, dict[hikari.Snowflake, hikari.Permissions]] = {}
+        self._user_id: hikari.Snowflake | None = None
+
+    def add_to_client(self, client: tanjun.Client, /) -> None:
+        """Add this own permissions cache to a Tanjun client.
+
+        This registers this as a type dependency and adds the event listeners
+        used to invalidate it.
+
+        Parameters
+        ----------
+        client
+            The client to add this cache to.
+        """
+        (
+            client.set_type_dependency(OwnPermissionsCache, self)
+            .add_listener(hikari.GuildUpdateEvent, self._on_guild_event)
+            .add_listener(hikari.GuildAvailableEvent, self._on_guild_event)
+            .add_listener(hikari.GuildLeaveEvent, self._on_guild_event)
+            .add_listener(hikari.RoleUpdateEvent, self._on_guild_event)
+            .add_listener(hikari.RoleDeleteEvent, self._on_guild_event)
+            .add_listener(hikari.GuildChannelUpdateEvent, self._on_guild_event)
+            .add_listener(hikari.GuildChannelDeleteEvent, self._on_guild_event)
+            .add_listener(hikari.MemberUpdateEvent, self._on_member_update)
+            .add_listener(hikari.ShardReadyEvent, self._on_shard_ready)
+        )
+        if self._user_id is not None:
+            return
+
+        # The own user is otherwise only learnt from the next ShardReadyEvent.
+        user = client.cache.get_me() if client.cache else None
+        if not user and (constant := client.get_type_dependency(data.LazyConstant[hikari.OwnUser], default=None)):
+            user = constant.get_value()
+
+        if user:
+            self._user_id = user.id
+
+    def get(self, guild_id: hikari.Snowflakeish, channel_id: hikari.Snowflakeish, /) -> hikari.Permissions | None:
+        """Get the bot's cached permissions in a channel.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild the channel is in.
+        channel_id
+            ID of the channel to get the bot's permissions in.
+
+        Returns
+        -------
+        hikari.permissions.Permissions | None
+            The cached permissions or [None][] if they aren't cached.
+        """
+        if (channels := self._guilds.get(hikari.Snowflake(guild_id))) is not None:
+            return channels.get(hikari.Snowflake(channel_id))
+
+        return None
+
+    def get_generation(self, guild_id: hikari.Snowflakeish, /) -> int:
+        """Get the current generation of a guild's cached permissions.
+
+        This changes whenever the guild's cached permissions are invalidated
+        and should be passed to [OwnPermissionsCache.set][tanjun.permissions.OwnPermissionsCache.set]
+        to avoid caching permissions which were calculated from stale data.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild to get the generation for.
+
+        Returns
+        -------
+        int
+            The guild's current generation.
+        """
+        return self._generations.get(hikari.Snowflake(guild_id))
+
+    def set(
+        self,
+        guild_id: hikari.Snowflakeish,
+        channel_id: hikari.Snowflakeish,
+        permissions: hikari.Permissions,
+        /,
+        *,
+        generation: int | None = None,
+    ) -> None:
+        """Cache the bot's permissions in a channel.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild the channel is in.
+        channel_id
+            ID of the channel these permissions are for.
+        permissions
+            The bot's permissions in the channel.
+        generation
+            The guild's generation from before the permissions were calculated.
+
+            If this is passed and the guild's cached permissions have been
+            invalidated since then, these permissions won't be cached.
+        """
+        guild_id = hikari.Snowflake(guild_id)
+        if generation is not None and generation != self._generations.get(guild_id):
+            return
+
+        self._guilds.setdefault(guild_id, {})[hikari.Snowflake(channel_id)] = permissions
+
+    def clear(self, guild_id: hikari.Snowflakeish | None = None, /) -> None:
+        """Clear the cached permissions.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild to clear the cached permissions for.
+
+            If this is [None][] then the cached permissions for every guild
+            are cleared.
+        """
+        if guild_id is None:
+            self._guilds.clear()
+            self._generations.bump_all()
+
+        else:
+            self._invalidate_guild(hikari.Snowflake(guild_id))
+
+    def _invalidate_guild(self, guild_id: hikari.Snowflake, /) -> None:
+        self._generations.bump(guild_id)
+        self._guilds.pop(guild_id, None)
+
+    async def _on_guild_event(
+        self,
+        event: (
+            hikari.GuildUpdateEvent
+            | hikari.GuildAvailableEvent
+            | hikari.GuildLeaveEvent
+            | hikari.RoleUpdateEvent
+            | hikari.RoleDeleteEvent
+            | hikari.GuildChannelUpdateEvent
+            | hikari.GuildChannelDeleteEvent
+        ),
+        /,
+    ) -> None:
+        # Thread permissions are cached under the thread's ID but come from its
+        # parent channel, so channel updates invalidate the whole guild.
+        self._invalidate_guild(event.guild_id)
+
+    async def _on_member_update(self, event: hikari.MemberUpdateEvent, /) -> None:
+        if self._user_id is None or event.user_id == self._user_id:
+            self._invalidate_guild(event.guild_id)
+
+    async def _on_shard_ready(self, event: hikari.ShardReadyEvent, /) -> None:
+        # Events may have been missed while the shard was disconnected.
+        self.clear()
+        self._user_id = event.my_user.id
+
+
+class _RoleView:
+    __slots__ = ("_positions", "_sorted", "roles")
+
+    def __init__(self, roles: collections.Iterable[hikari.Role], /) -> None:
+        self._positions: dict[hikari.Snowflake, int] | None = None
+        self._sorted: list[hikari.Role] | None = None
+        self.roles = {role.id: role for role in roles}
+
+    @property
+    def positions(self) -> dict[hikari.Snowflake, int]:
+        if self._positions is None:
+            self._positions = {role.id: role.position for role in self.roles.values()}
+
+        return self._positions
+
+    @property
+    def sorted(self) -> list[hikari.Role]:
+        if self._sorted is None:
+            self._sorted = sorted(self.roles.values(), key=lambda role: role.position, reverse=True)
+
+        return self._sorted
+
+    def invalidate(self) -> None:
+        self._positions = None
+        self._sorted = None
+
+
+class GuildRolesCache:
+    """Event-maintained per-guild views of guilds' roles.
+
+    This keeps each guild's @everyone role, its roles sorted by position and
+    a mapping of role IDs to positions so that
+    [fetch_everyone_permissions][tanjun.permissions.fetch_everyone_permissions]
+    and the [TOP_ROLE][tanjun.dependencies.BucketResource.TOP_ROLE] limiter
+    bucket don't have to fetch and sort a guild's roles on every call.
+
+    Guilds are added from the guild available, join and update events (as
+    well as when [fetch_everyone_permissions][tanjun.permissions.fetch_everyone_permissions]
+    has to fetch a guild's roles) and are then kept up to date using the role
+    events, meaning that this relies on the `GUILDS` intent being declared.
+
+    Examples
+    --------
+    ```py
+    tanjun.permissions.GuildRolesCache().add_to_client(client)
+    ```
+    """
+
+    __slots__ = ("_guilds",)
+
+    def __init__(self) -> None:
+        """Initialise a guild roles cache."""
+        self._guilds: dict[hikari.Snowflake, _RoleView] = {}
+
+    def add_to_client(self, client: tanjun.Client, /) -> None:
+        """Add this guild roles cache to a Tanjun client.
+
+        This registers this as a type dependency and adds the event listeners
+        used to keep it up to date.
+
+        Parameters
+        ----------
+        client
+            The client to add this cache to.
+        """
+        (
+            client.set_type_dependency(GuildRolesCache, self)
+            .add_listener(hikari.GuildAvailableEvent, self._on_guild_event)
+            .add_listener(hikari.GuildJoinEvent, self._on_guild_event)
+            .add_listener(hikari.GuildUpdateEvent, self._on_guild_event)
+            .add_listener(hikari.GuildLeaveEvent, self._on_guild_leave)
+            .add_listener(hikari.RoleCreateEvent, self._on_role_event)
+            .add_listener(hikari.RoleUpdateEvent, self._on_role_event)
+            .add_listener(hikari.RoleDeleteEvent, self._on_role_delete)
+            .add_listener(hikari.ShardReadyEvent, self._on_shard_ready)
+        )
+
+    def get_everyone_role(self, guild_id: hikari.Snowflakeish, /) -> hikari.Role | None:
+        """Get a guild's cached @everyone role.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild to get the @everyone role for.
+
+        Returns
+        -------
+        hikari.guilds.Role | None
+            The guild's @everyone role or [None][] if it isn't cached.
+        """
+        if view := self._guilds.get(hikari.Snowflake(guild_id)):
+            return view.roles.get(hikari.Snowflake(guild_id))
+
+        return None
+
+    def get_sorted_roles(self, guild_id: hikari.Snowflakeish, /) -> collections.Sequence[hikari.Role] | None:
+        """Get a guild's cached roles sorted by position.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild to get the roles for.
+
+        Returns
+        -------
+        collections.abc.Sequence[hikari.guilds.Role] | None
+            The guild's roles sorted from highest to lowest position or [None][]
+            if the guild isn't cached.
+        """
+        if view := self._guilds.get(hikari.Snowflake(guild_id)):
+            return view.sorted
+
+        return None
+
+    def get_top_role_id(
+        self, guild_id: hikari.Snowflakeish, role_ids: collections.Iterable[hikari.Snowflake], /
+    ) -> hikari.Snowflake | None:
+        """Get the ID of the highest positioned role out of a set of roles.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild the roles are in.
+        role_ids
+            IDs of the roles to find the highest positioned role in.
+
+        Returns
+        -------
+        hikari.snowflakes.Snowflake | None
+            ID of the highest positioned role or [None][] if the guild or any
+            of the roles aren't cached or `role_ids` is empty.
+        """
+        if not (view := self._guilds.get(hikari.Snowflake(guild_id))):
+            return None
+
+        try:
+            return max(role_ids, key=view.positions.__getitem__, default=None)
+
+        except KeyError:
+            return None
+
+    def set_roles(self, guild_id: hikari.Snowflakeish, roles: collections.Iterable[hikari.Role], /) -> None:
+        """Cache all of a guild's roles.
+
+        This replaces any roles which were already cached for the guild.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild to cache the roles for.
+        roles
+            All of the guild's roles.
+        """
+        self._guilds[hikari.Snowflake(guild_id)] = _RoleView(roles)
+
+    def clear(self, guild_id: hikari.Snowflakeish | None = None, /) -> None:
+        """Clear the cached roles.
+
+        Parameters
+        ----------
+        guild_id
+            ID of the guild to clear the cached roles for.
+
+            If this is [None][] then the cached roles for every guild are
+            cleared.
+        """
+        if guild_id is None:
+            self._guilds.clear()
+
+        else:
+            self._guilds.pop(hikari.Snowflake(guild_id), None)
+
+    async def _on_guild_event(
+        self, event: hikari.GuildAvailableEvent | hikari.GuildJoinEvent | hikari.GuildUpdateEvent, /
+    ) -> None:
+        self.set_roles(event.guild_id, event.roles.values())
+
+    async def _on_guild_leave(self, event: hikari.GuildLeaveEvent, /) -> None:
+        self._guilds.pop(event.guild_id, None)
+
+    async def _on_role_event(self, event: hikari.RoleCreateEvent | hikari.RoleUpdateEvent, /) -> None:
+        if view := self._guilds.get(event.guild_id):
+            view.roles[event.role.id] = event.role
+            view.invalidate()
+
+    async def _on_role_delete(self, event: hikari.RoleDeleteEvent, /) -> None:
+        if view := self._guilds.get(event.guild_id):
+            view.roles.pop(event.role_id, None)
+            view.invalidate()
+
+    async def _on_shard_ready(self, _: hikari.ShardReadyEvent, /) -> None:
+        # Events may have been missed while the shard was disconnected.
+        self._guilds.clear()
+
+
 _GuildCacheT = async_cache.SfCache[hikari.Guild]
 _RoleCacheT = async_cache.SfCache[hikari.Role]
 _GuldRoleCacheT = async_cache.SfGuildBound[hikari.Role]
@@ -198,11 +1007,34 @@ async def fetch_permissions(
         If left as [None][] then this will return their base guild
         permissions.
 
+        If a [PermissionsCache][tanjun.permissions.PermissionsCache] is
+        registered then it's bypassed when a permissible channel object is
+        passed here, so the passed object's overwrites are always used.
+
     Returns
     -------
     hikari.permissions.Permissions
         The calculated permissions.
     """
+    perm_cache = client.get_type_dependency(PermissionsCache, default=None)
+    if perm_cache is None or isinstance(channel, hikari.PermissibleGuildChannel):
+        return (await _fetch_permissions(client, member, channel))[0]
+
+    channel_id = hikari.Snowflake(channel) if channel is not None else None
+    if (permissions := perm_cache.get(member, channel_id)) is not None:
+        return permissions
+
+    generation = perm_cache.get_generation(member.guild_id)
+    permissions, parent_id = await _fetch_permissions(client, member, channel)
+    perm_cache.set(
+        member, channel_id, permissions, generation=generation, parent_id=parent_id if parent_id != channel_id else None
+    )
+    return permissions
+
+
+async def _fetch_permissions(
+    client: tanjun.Client, member: hikari.Member, channel: hikari.SnowflakeishOr[hikari.GuildChannel] | None, /
+) -> tuple[hikari.Permissions, hikari.Snowflake | None]:
     # The ordering of how this adds and removes permissions does matter.
     # For more information see https://discord.com/developers/docs/topics/permissions#permission-hierarchy.
     guild: hikari.Guild | None
@@ -220,13 +1052,14 @@ async def fetch_permissions(
             except async_cache.CacheMissError:
                 pass
 
+    rest = client.get_type_dependency(_internal.RestFlights, default=None) or client.rest
     if not guild:
-        guild = await client.rest.fetch_guild(member.guild_id)
+        guild = await rest.fetch_guild(member.guild_id)
         roles = guild.roles
 
     # Guild owners are implicitly admins.
     if guild.owner_id == member.user.id:
-        return ALL_PERMISSIONS
+        return ALL_PERMISSIONS, None
 
     roles = roles or (client.cache and client.cache.get_roles_view_for_guild(member.guild_id))
     if not roles:  # noqa: SIM102
@@ -235,22 +1068,22 @@ async def fetch_permissions(
             roles = {role.id: role for role in await role_cache.iter_for_guild(member.guild_id)}
 
     if not roles:
-        raw_roles = await client.rest.fetch_roles(member.guild_id)
+        raw_roles = await rest.fetch_roles(member.guild_id)
         roles = {role.id: role for role in raw_roles}
 
     # Admin permission overrides all overwrites and is only applicable to roles.
     if (permissions := _calculate_role_permissions(roles, member)) & permissions.ADMINISTRATOR:
-        return ALL_PERMISSIONS
+        return ALL_PERMISSIONS, None
 
     if not channel:
-        return permissions
+        return permissions, None
 
     channel = await _fetch_channel(client, channel)
     if channel.guild_id != guild.id:
         error_message = "Channel doesn't match up with the member's guild"
         raise ValueError(error_message)
 
-    return _calculate_channel_overwrites(channel, member, permissions)
+    return _calculate_channel_overwrites(channel, member, permissions), channel.id
 
 
 def calculate_everyone_permissions(
@@ -322,7 +1155,11 @@ async def fetch_everyone_permissions(
     """
     # The ordering of how this adds and removes permissions does matter.
     # For more information see https://discord.com/developers/docs/topics/permissions#permission-hierarchy.
-    role = client.cache.get_role(guild_id) if client.cache else None
+    roles_cache = client.get_type_dependency(GuildRolesCache, default=None)
+    role = roles_cache.get_everyone_role(guild_id) if roles_cache else None
+    if not role:
+        role = client.cache.get_role(guild_id) if client.cache else None
+
     if not role:  # noqa: SIM102
         # Has to be nested cause of pyright bug.
         if role_cache := client.get_type_dependency(_RoleCacheT, default=None):
@@ -336,7 +1173,12 @@ async def fetch_everyone_permissions(
                 pass
 
     if not role:
-        for role in await client.rest.fetch_roles(guild_id):
+        rest = client.get_type_dependency(_internal.RestFlights, default=None) or client.rest
+        roles = await rest.fetch_roles(guild_id)
+        if roles_cache:
+            roles_cache.set_roles(guild_id, roles)
+
+        for role in roles:
             if role.id == guild_id:
                 break
 
@@ -33,6 +33,7 @@
 # pyright: reportPrivateUsage=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
 import enum
 import inspect
 import re
@@ -41,6 +42,7 @@ import typing
 from collections import abc as collections
 from unittest import mock
 
+import alluka
 import hikari
 import pytest
 
@@ -600,6 +602,14 @@ class TestTrackedOption:
         )
 
 
+async def _set_choice(ctx: tanjun.abc.AutocompleteContext, value: str, /) -> None:
+    await ctx.set_choices({value: value})
+
+
+async def _call_converter(callback: collections.Callable[[str], collections.Awaitable[str]], value: str, /) -> str:
+    return await callback(value)
+
+
 @pytest.mark.skip(reason="TODO")
 class TestSlashCommandBuilder: ...
 
@@ -1246,7 +1256,7 @@ class TestSlashCommandGroup:
         mock_option = mock.Mock()
         mock_option.name = "sex"
         mock_context.interaction.options = [mock_option]
-        mock_hooks = mock.Mock()
+        mock_hooks = {mock.Mock()}
 
         await command_group.execute(mock_context, hooks=mock_hooks)
 
@@ -1264,7 +1274,7 @@ class TestSlashCommandGroup:
         mock_option = mock.Mock()
         mock_option.name = "sex"
         mock_context.interaction.options = [mock_option]
-        mock_hooks = mock.Mock()
+        mock_hooks = {mock.Mock()}
 
         await command_group.execute(mock_context, hooks=mock_hooks)
 
@@ -1315,7 +1325,7 @@ class TestSlashCommandGroup:
         mock_sub_option = mock.Mock()
         mock_sub_option.name = "hi"
         mock_option = mock.Mock(options=[mock_sub_option])
-        mock_hooks = mock.Mock()
+        mock_hooks = {mock.Mock()}
 
         await command_group.execute(mock_context, option=mock_option, hooks=mock_hooks)
 
@@ -3409,5 +3419,244 @@ class TestSlashCommand:
     @pytest.mark.asyncio
     async def test_execute(self) -> None: ...
 
+    @pytest.mark.asyncio
+    async def test__process_args_converts_options_concurrently(self) -> None:
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        async def converter(value: str) -> str:
+            started.append(value)
+            if len(started) == 2:
+                both_started.set()
+
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return value.upper()
+
+        command = tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description")
+        command.add_str_option("a", "A", converters=converter)
+        command.add_str_option("b", "B", converters=converter)
+        command.add_int_option("c", "C")
+        mock_context = mock.Mock(tanjun.abc.SlashContext)
+        mock_context.call_with_async_di = mock.AsyncMock(side_effect=_call_converter)
+        mock_context.options = {
+            "a": mock.Mock(type=hikari.OptionType.STRING, value="meow"),
+            "b": mock.Mock(type=hikari.OptionType.STRING, value="nyan"),
+            "c": mock.Mock(type=hikari.OptionType.INTEGER, value=42),
+        }
+
+        result = await command._process_args(mock_context)
+
+        assert result == {"a": "MEOW", "b": "NYAN", "c": 42}
+        assert started == ["meow", "nyan"]
+
+    @pytest.mark.asyncio
+    async def test__process_args_raises_conversion_errors_in_declaration_order(self) -> None:
+        async def slow_failing_converter(_: str) -> str:
+            await asyncio.sleep(0.01)
+            raise ValueError
+
+        async def failing_converter(_: str) -> str:
+            raise ValueError
+
+        command = tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description")
+        command.add_str_option("a", "A", converters=slow_failing_converter)
+        command.add_str_option("b", "B", converters=failing_converter)
+        mock_context = mock.Mock(tanjun.abc.SlashContext)
+        mock_context.call_with_async_di = mock.AsyncMock(side_effect=_call_converter)
+        mock_context.options = {
+            "a": mock.Mock(type=hikari.OptionType.STRING, value="meow"),
+            "b": mock.Mock(type=hikari.OptionType.STRING, value="nyan"),
+        }
+
+        with pytest.raises(tanjun.ConversionError) as exc_info:
+            await command._process_args(mock_context)
+
+        assert exc_info.value.parameter == "a"
+
+    @pytest.mark.asyncio
+    async def test__process_args_raises_conversion_error_before_later_missing_option(self) -> None:
+        async def failing_converter(_: str) -> str:
+            raise ValueError
+
+        command = tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description")
+        command.add_str_option("a", "A", converters=failing_converter)
+        command.add_str_option("b", "B")
+        mock_context = mock.Mock(tanjun.abc.SlashContext)
+        mock_context.call_with_async_di = mock.AsyncMock(side_effect=_call_converter)
+        mock_context.options = {"a": mock.Mock(type=hikari.OptionType.STRING, value="meow")}
+
+        with pytest.raises(tanjun.ConversionError) as exc_info:
+            await command._process_args(mock_context)
+
+        assert exc_info.value.parameter == "a"
+
+    @pytest.mark.asyncio
+    async def test__process_args_resolves_options(self) -> None:
+        command = (
+            tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description")
+            .add_member_option("member", "Member")
+            .add_user_option("user", "User")
+            .add_role_option("role", "Role")
+            .add_float_option("float", "Float")
+            .add_str_option("str", "Str", default="default")
+        )
+        mock_member = mock.Mock(type=hikari.OptionType.USER)
+        mock_user = mock.Mock(type=hikari.OptionType.USER)
+        mock_role = mock.Mock(type=hikari.OptionType.ROLE)
+        mock_context = mock.Mock(tanjun.abc.SlashContext)
+        mock_context.options = {
+            "member": mock_member,
+            "user": mock_user,
+            "role": mock_role,
+            "float": mock.Mock(type=hikari.OptionType.FLOAT, value=5),
+        }
+
+        result = await command._process_args(mock_context)
+
+        assert result == {
+            "member": mock_member.resolve_to_member.return_value,
+            "user": mock_user.resolve_to_user.return_value,
+            "role": mock_role.resolve_to_role.return_value,
+            "float": 5.0,
+            "str": "default",
+        }
+        assert isinstance(result["float"], float)
+        mock_member.resolve_to_member.assert_called_once_with(default=None)
+
+    @pytest.mark.asyncio
+    async def test__process_args_when_member_not_found(self) -> None:
+        command = tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description").add_member_option(
+            "member", "Member"
+        )
+        mock_option = mock.Mock(type=hikari.OptionType.USER, value=123)
+        mock_option.resolve_to_member.return_value = None
+        mock_context = mock.Mock(tanjun.abc.SlashContext)
+        mock_context.options = {"member": mock_option}
+
+        with pytest.raises(tanjun.ConversionError, match="Couldn't find member for provided user: 123"):
+            await command._process_args(mock_context)
+
+    @pytest.mark.asyncio
+    async def test__process_args_recompiles_after_option_added(self) -> None:
+        command = tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description").add_int_option("a", "A")
+        mock_context = mock.Mock(tanjun.abc.SlashContext)
+        mock_context.options = {
+            "a": mock.Mock(type=hikari.OptionType.INTEGER, value=1),
+            "b": mock.Mock(type=hikari.OptionType.INTEGER, value=2),
+        }
+
+        assert await command._process_args(mock_context) == {"a": 1}
+
+        command.add_int_option("b", "B")
+
+        assert await command._process_args(mock_context) == {"a": 1, "b": 2}
+
+    def _make_autocomplete_context(
+        self, value: str, /, *, guild_id: int = 123, locale: str = "en-US"
+    ) -> tanjun.context.AutocompleteContext:
+        mock_option = mock.Mock(type=hikari.OptionType.STRING, value=value, is_focused=True)
+        mock_option.name = "opt"
+        mock_interaction = mock.Mock(
+            options=[mock_option], guild_id=guild_id, locale=locale, create_response=mock.AsyncMock()
+        )
+        return tanjun.context.AutocompleteContext(mock.Mock(tanjun.Client, injector=alluka.Client()), mock_interaction)
+
+    @pytest.mark.asyncio
+    async def test_execute_autocomplete_when_cached(self) -> None:
+        callback = mock.AsyncMock(side_effect=_set_choice)
+        command = (
+            tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description")
+            .add_str_option("opt", "Option")
+            .set_str_autocomplete("opt", callback, cache=True)
+        )
+
+        first_ctx = self._make_autocomplete_context("meow")
+        await command.execute_autocomplete(first_ctx)
+        second_ctx = self._make_autocomplete_context("meow", guild_id=321)
+        await command.execute_autocomplete(second_ctx)
+
+        callback.assert_awaited_once_with(first_ctx, "meow")
+        second_ctx.interaction.create_response.assert_awaited_once()
+        choice = second_ctx.interaction.create_response.call_args.args[0][0]
+        assert choice.name == "meow"
+        assert choice.value == "meow"
+
+    @pytest.mark.asyncio
+    async def test_execute_autocomplete_when_cached_keys_on_value_locale_and_guild(self) -> None:
+        callback = mock.AsyncMock(side_effect=_set_choice)
+        command = (
+            tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description")
+            .add_str_option("opt", "Option")
+            .set_str_autocomplete("opt", callback, cache=True, cache_per_guild=True)
+        )
+
+        await command.execute_autocomplete(self._make_autocomplete_context("meow"))
+        await command.execute_autocomplete(self._make_autocomplete_context("nyan"))
+        await command.execute_autocomplete(self._make_autocomplete_context("meow", locale="de"))
+        await command.execute_autocomplete(self._make_autocomplete_context("meow", guild_id=321))
+        await command.execute_autocomplete(self._make_autocomplete_context("meow"))
+
+        assert callback.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_execute_autocomplete_when_cached_and_invalidated(self) -> None:
+        callback = mock.AsyncMock(side_effect=_set_choice)
+        command = (
+            tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description")
+            .add_str_option("opt", "Option")
+            .set_str_autocomplete("opt", callback, cache=True)
+        )
+
+        await command.execute_autocomplete(self._make_autocomplete_context("meow"))
+        command.invalidate_autocomplete_cache("opt")
+        await command.execute_autocomplete(self._make_autocomplete_context("meow"))
+
+        assert callback.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_autocomplete_when_cached_and_no_choices_set(self) -> None:
+        callback = mock.AsyncMock()
+        command = (
+            tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description")
+            .add_str_option("opt", "Option")
+            .set_str_autocomplete("opt", callback, cache=True)
+        )
+
+        await command.execute_autocomplete(self._make_autocomplete_context("meow"))
+        await command.execute_autocomplete(self._make_autocomplete_context("meow"))
+
+        assert callback.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_copy_doesnt_share_autocomplete_caches(self) -> None:
+        callback = mock.AsyncMock(side_effect=_set_choice)
+        command = (
+            tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description")
+            .add_str_option("opt", "Option")
+            .set_str_autocomplete("opt", callback, cache=True)
+        )
+        await command.execute_autocomplete(self._make_autocomplete_context("meow"))
+
+        copied = command.copy()
+        await copied.execute_autocomplete(self._make_autocomplete_context("meow"))
+        copied.set_str_autocomplete("opt", callback)
+        await command.execute_autocomplete(self._make_autocomplete_context("meow"))
+
+        assert callback.await_count == 2
+        assert list(command._autocomplete_caches) == ["opt"]
+        assert copied._autocomplete_caches == {}
+
+    def test_set_str_autocomplete_when_cache_expire_after_invalid(self) -> None:
+        command = tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description").add_str_option("opt", "a")
+
+        with pytest.raises(ValueError, match="cache_expire_after must be more than 0 seconds"):
+            command.set_str_autocomplete("opt", mock.AsyncMock(), cache=True, cache_expire_after=0)
+
+    def test_set_str_autocomplete_when_cache_max_size_invalid(self) -> None:
+        command = tanjun.SlashCommand[typing.Any](mock.AsyncMock(), "name", "description").add_str_option("opt", "a")
+
+        with pytest.raises(ValueError, match="cache_max_size must be greater than 0"):
+            command.set_str_autocomplete("opt", mock.AsyncMock(), cache=True, cache_max_size=0)
+
     @pytest.mark.skip(reason="TODO")
     def test_copy(self) -> None: ...
@@ -43,6 +43,7 @@ import pytest
 from hikari import traits
 
 import tanjun
+from tanjun import _internal
 from tanjun.context import base as base_context
 
 _T = typing.TypeVar("_T")
@@ -213,6 +214,17 @@ class TestBaseContext:
         assert result is mock_client.rest.fetch_channel.return_value
         mock_client.rest.fetch_channel.assert_called_once_with(context.channel_id)
 
+    @pytest.mark.asyncio
+    async def test_fetch_channel_when_rest_flights(self, mock_client: mock.Mock) -> None:
+        context = stub_class(base_context.BaseContext, channel_id=hikari.Snowflake(123), args=(mock_client,))
+        mock_client.rest.fetch_channel.return_value = mock.Mock(hikari.TextableChannel)
+        mock_client.injector.set_type_dependency(_internal.RestFlights, _internal.RestFlights(mock_client.rest))
+
+        result = await context.fetch_channel()
+
+        assert result is mock_client.rest.fetch_channel.return_value
+        mock_client.rest.fetch_channel.assert_called_once_with(123)
+
     @pytest.mark.asyncio
     async def test_fetch_guild(self, context: base_context.BaseContext, mock_client: mock.Mock) -> None:
         result = await context.fetch_guild()
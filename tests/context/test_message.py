@@ -551,3 +551,22 @@ class TestMessageContext:
         mock_delete_after.assert_called_once_with(123.0, context.message.respond.return_value)
         create_task.assert_called_once_with(mock_delete_after.return_value)
         mock_register_task.assert_called_once_with(create_task.return_value)
+
+    @pytest.mark.parametrize(("guild_id", "bulk"), [(hikari.Snowflake(4321), True), (None, False)])
+    @pytest.mark.asyncio
+    async def test_respond_when_delete_after_and_delete_scheduler(
+        self, mock_client: mock.Mock, guild_id: hikari.Snowflake | None, bulk: bool
+    ) -> None:
+        mock_scheduler = mock.Mock()
+        mock_register_task = mock.Mock()
+        mock_message = mock.AsyncMock(guild_id=guild_id)
+        context = tanjun.context.MessageContext(
+            mock_client, "e", mock_message, mock_register_task, delete_scheduler=mock_scheduler
+        )
+
+        await context.respond("hi", delete_after=datetime.timedelta(seconds=123))
+
+        mock_scheduler.schedule_message.assert_called_once_with(
+            123.0, mock_message.respond.return_value.channel_id, mock_message.respond.return_value.id, bulk=bulk
+        )
+        mock_register_task.assert_not_called()
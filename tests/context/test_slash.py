@@ -622,21 +622,24 @@ class TestAppCommandContext:
             args=(mock_client, mock.Mock(options=None), mock.Mock()),
         )
 
-        with mock.patch.object(asyncio, "sleep") as sleep:
-            await context._auto_defer(0.1)
+        context._auto_defer()
 
-            sleep.assert_awaited_once_with(0.1)
-            defer.assert_awaited_once_with()
+        assert context._defer_task is not None
+        await context._defer_task
+        defer.assert_awaited_once_with()
 
     def test_cancel_defer(self, context: tanjun.context.slash.AppCommandContext) -> None:
         context._defer_task = mock.Mock()
+        context._defer_timer = mock.Mock()
 
         context.cancel_defer()
 
         context._defer_task.cancel.assert_called_once_with()
+        context._defer_timer.cancel.assert_called_once_with()
 
     def test_cancel_defer_when_no_active_task(self, context: tanjun.context.slash.AppCommandContext) -> None:
         context._defer_task = None
+        context._defer_timer = None
         context.cancel_defer()
 
     @pytest.mark.parametrize(("flags", "result"), [(hikari.UNDEFINED, hikari.MessageFlag.NONE), (6666, 6666)])
@@ -662,23 +665,46 @@ class TestAppCommandContext:
 
         assert context._get_flags(flags) == result
 
-    def test_start_defer_timer(self, mock_client: mock.Mock) -> None:
-        auto_defer = mock.Mock()
+    def test_start_defer_timer(self, context: tanjun.context.slash.AppCommandContext) -> None:
+        with mock.patch.object(tanjun._internal, "get_timer_wheel") as get_timer_wheel:
+            context.start_defer_timer(534123)
+
+        get_timer_wheel.return_value.call_later.assert_called_once_with(534123, context._auto_defer)
+        assert context._defer_timer is get_timer_wheel.return_value.call_later.return_value
+        assert context._defer_task is None
+
+    @pytest.mark.asyncio
+    async def test_start_defer_timer_defers_when_timer_fires(self, mock_client: mock.Mock) -> None:
+        defer = mock.AsyncMock()
         context = stub_class(
             tanjun.context.slash.AppCommandContext,
-            _auto_defer=auto_defer,
+            defer=defer,
             args=(mock_client, mock.Mock(options=None), mock.Mock()),
         )
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            context.start_defer_timer(534123)
+        context.start_defer_timer(0.01)
+        await asyncio.sleep(0.1)
 
-            auto_defer.assert_called_once_with(534123)
-            create_task.assert_called_once_with(auto_defer.return_value)
-            assert context._defer_task is create_task.return_value
+        defer.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_start_defer_timer_when_cancelled(self, mock_client: mock.Mock) -> None:
+        defer = mock.AsyncMock()
+        context = stub_class(
+            tanjun.context.slash.AppCommandContext,
+            defer=defer,
+            args=(mock_client, mock.Mock(options=None), mock.Mock()),
+        )
+
+        context.start_defer_timer(0.01)
+        context.cancel_defer()
+        await asyncio.sleep(0.1)
+
+        defer.assert_not_called()
+        assert context._defer_task is None
 
     def test_start_defer_timer_when_already_started(self, context: tanjun.context.slash.AppCommandContext) -> None:
-        context._defer_task = mock.Mock()
+        context._defer_timer = mock.Mock()
 
         with pytest.raises(RuntimeError):
             context.start_defer_timer(321)
@@ -737,6 +763,28 @@ class TestAppCommandContext:
 
         context.interaction.delete_message.assert_awaited_once_with(mock_message)
 
+    @pytest.mark.asyncio
+    async def test_create_followup_when_delete_after_and_delete_scheduler(self, mock_client: mock.Mock) -> None:
+        mock_scheduler = mock.Mock()
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        context = stub_class(
+            tanjun.context.slash.AppCommandContext,
+            type=mock.Mock(),
+            mark_not_found=mock.AsyncMock(),
+            args=(mock_client, mock_interaction, mock.Mock()),
+            kwargs={"delete_scheduler": mock_scheduler},
+        )
+
+        await context.create_followup("bye", delete_after=123)
+
+        mock_scheduler.schedule_callback.assert_called_once_with(123, mock.ANY)
+        callback = mock_scheduler.schedule_callback.call_args.args[1]
+        mock_interaction.delete_message.assert_not_called()
+
+        await callback()
+
+        mock_interaction.delete_message.assert_awaited_once_with(mock_interaction.execute.return_value)
+
     @pytest.mark.skip(reason="not implemented")
     @pytest.mark.asyncio
     async def test_create_followup(self, context: tanjun.context.slash.AppCommandContext) -> None: ...
@@ -897,6 +945,25 @@ class TestAppCommandContext:
         create_task.assert_called_once_with(mock_delete_initial_response_after.return_value)
         mock_register_task.assert_called_once_with(create_task.return_value)
 
+    @pytest.mark.asyncio
+    async def test_edit_initial_response_when_delete_after_and_delete_scheduler(self, mock_client: mock.Mock) -> None:
+        mock_scheduler = mock.Mock()
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        mock_interaction.edit_initial_response.return_value.flags = hikari.MessageFlag.NONE
+        mock_register_task = mock.Mock()
+        context = stub_class(
+            tanjun.context.slash.AppCommandContext,
+            type=mock.Mock(),
+            mark_not_found=mock.AsyncMock(),
+            args=(mock_client, mock_interaction, mock_register_task),
+            kwargs={"delete_scheduler": mock_scheduler},
+        )
+
+        await context.edit_initial_response("bye", delete_after=545)
+
+        mock_scheduler.schedule_callback.assert_called_once_with(545, context._try_delete_initial_response)
+        mock_register_task.assert_not_called()
+
     @pytest.mark.parametrize("delete_after", [datetime.timedelta(seconds=901), 901, 901.0])
     @pytest.mark.asyncio
     async def test_edit_initial_response_when_delete_after_will_have_expired(
@@ -1032,6 +1099,21 @@ class TestSlashContext:
         assert context.options["nyaa"].name is mock_option_2.name
         assert isinstance(context.options["nyaa"], tanjun.context.SlashOption)
 
+    def test_options_property_is_lazily_built_and_cached(self, mock_client: mock.Mock) -> None:
+        mock_option = mock.Mock()
+        mock_option.name = "meow"
+        mock_interaction = mock.Mock(options=[mock_option])
+
+        with mock.patch.object(tanjun.context.slash, "SlashOption") as slash_option:
+            context = tanjun.context.SlashContext(mock_client, mock_interaction, mock.Mock())
+
+            slash_option.assert_not_called()
+
+            assert context.options == {"meow": slash_option.return_value}
+            assert context.options == {"meow": slash_option.return_value}
+
+        slash_option.assert_called_once_with(mock_interaction.resolved, mock_option)
+
     @pytest.mark.parametrize("raw_options", [None, []])
     def test_options_property_for_command_group_with_no_sub_option(
         self, mock_client: mock.Mock, raw_options: list[hikari.OptionType] | None
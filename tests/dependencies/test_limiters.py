@@ -652,12 +652,49 @@ async def test__get_ctx_target_when_top_role() -> None:
     mock_context.member.role_ids = [123, 312]
     mock_context.member.get_roles = mock.Mock(return_value=mock_roles)
     mock_context.member.fetch_roles = mock.AsyncMock()
+    mock_context.get_type_dependency.return_value = None
 
     assert await tanjun.dependencies.limiters._get_ctx_target(mock_context, tanjun.BucketResource.TOP_ROLE) == 123321
 
     mock_context.member.get_roles.assert_called_once_with()
     mock_context.member.fetch_roles.assert_not_called()
-    mock_context.get_type_dependency.assert_not_called()
+    mock_context.get_type_dependency.assert_called_once_with(tanjun.permissions.GuildRolesCache, default=None)
+
+
+@pytest.mark.asyncio
+async def test__get_ctx_target_when_top_role_and_guild_roles_cache() -> None:
+    mock_context = mock.Mock(base_context.BaseContext, guild_id=hikari.Snowflake(123))
+    mock_context.member.role_ids = [hikari.Snowflake(123), hikari.Snowflake(312), hikari.Snowflake(4234)]
+    roles_cache = tanjun.permissions.GuildRolesCache()
+    roles_cache.set_roles(
+        123,
+        [
+            mock.Mock(id=hikari.Snowflake(123), position=0),
+            mock.Mock(id=hikari.Snowflake(312), position=5),
+            mock.Mock(id=hikari.Snowflake(4234), position=3),
+            mock.Mock(id=hikari.Snowflake(5432), position=10),
+        ],
+    )
+    mock_context.get_type_dependency.return_value = roles_cache
+
+    assert await tanjun.dependencies.limiters._get_ctx_target(mock_context, tanjun.BucketResource.TOP_ROLE) == 312
+
+    mock_context.member.get_roles.assert_not_called()
+    mock_context.get_type_dependency.assert_called_once_with(tanjun.permissions.GuildRolesCache, default=None)
+
+
+@pytest.mark.asyncio
+async def test__get_ctx_target_when_top_role_and_guild_roles_cache_missing_role() -> None:
+    mock_context = mock.Mock(base_context.BaseContext, guild_id=hikari.Snowflake(123))
+    mock_context.member.role_ids = [hikari.Snowflake(123), hikari.Snowflake(312)]
+    mock_context.member.get_roles = mock.Mock(return_value=[mock.Mock(id=312, position=5)])
+    roles_cache = tanjun.permissions.GuildRolesCache()
+    roles_cache.set_roles(123, [mock.Mock(id=hikari.Snowflake(123), position=0)])
+    mock_context.get_type_dependency.return_value = roles_cache
+
+    assert await tanjun.dependencies.limiters._get_ctx_target(mock_context, tanjun.BucketResource.TOP_ROLE) == 312
+
+    mock_context.member.get_roles.assert_called_once_with()
 
 
 @pytest.mark.asyncio
@@ -672,13 +709,18 @@ async def test__get_ctx_target_when_top_role_and_async_cache() -> None:
         tanjun.dependencies.EntryNotFound,
         mock.Mock(position=23),
     ]
-    mock_context.get_type_dependency.return_value = mock_cache
+    mock_context.get_type_dependency.side_effect = [None, mock_cache]
 
     assert await tanjun.dependencies.limiters._get_ctx_target(mock_context, tanjun.BucketResource.TOP_ROLE) == 994949
 
     mock_context.member.get_roles.assert_called_once_with()
     mock_context.member.fetch_roles.assert_not_called()
-    mock_context.get_type_dependency.assert_called_once_with(tanjun.dependencies.SfCache[hikari.Role], default=None)
+    mock_context.get_type_dependency.assert_has_calls(
+        [
+            mock.call(tanjun.permissions.GuildRolesCache, default=None),
+            mock.call(tanjun.dependencies.SfCache[hikari.Role], default=None),
+        ]
+    )
     mock_cache.get.assert_has_awaits([mock.call(674345), mock.call(123876), mock.call(7643), mock.call(9999999)])
 
 
@@ -697,13 +739,18 @@ async def test__get_ctx_target_when_top_role_falls_back_to_rest_when_async_cache
     mock_context.member.fetch_roles = mock.AsyncMock(return_value=mock_roles)
     mock_cache = mock.AsyncMock()
     mock_cache.get.side_effect = [mock.Mock(), tanjun.dependencies.CacheMissError]
-    mock_context.get_type_dependency.return_value = mock_cache
+    mock_context.get_type_dependency.side_effect = [None, mock_cache]
 
     assert await tanjun.dependencies.limiters._get_ctx_target(mock_context, tanjun.BucketResource.TOP_ROLE) == 431
 
     mock_context.member.get_roles.assert_called_once_with()
     mock_context.member.fetch_roles.assert_awaited_once_with()
-    mock_context.get_type_dependency.assert_called_once_with(tanjun.dependencies.SfCache[hikari.Role], default=None)
+    mock_context.get_type_dependency.assert_has_calls(
+        [
+            mock.call(tanjun.permissions.GuildRolesCache, default=None),
+            mock.call(tanjun.dependencies.SfCache[hikari.Role], default=None),
+        ]
+    )
     mock_cache.get.assert_has_awaits([mock.call(123), mock.call(312)])
 
 
@@ -726,7 +773,12 @@ async def test__get_ctx_target_when_top_role_falls_back_to_rest() -> None:
 
     mock_context.member.get_roles.assert_called_once_with()
     mock_context.member.fetch_roles.assert_awaited_once_with()
-    mock_context.get_type_dependency.assert_called_once_with(tanjun.dependencies.SfCache[hikari.Role], default=None)
+    mock_context.get_type_dependency.assert_has_calls(
+        [
+            mock.call(tanjun.permissions.GuildRolesCache, default=None),
+            mock.call(tanjun.dependencies.SfCache[hikari.Role], default=None),
+        ]
+    )
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,271 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# pyright: reportUnknownMemberType=none
+# pyright: reportPrivateUsage=none
+# This leads to too many false-positives around mocks.
+
+import asyncio
+import contextlib
+import datetime
+import json
+import pathlib
+import time
+import typing
+from unittest import mock
+
+import hikari
+import pytest
+
+from tanjun._internal import deletion
+
+
+def _make_id(offset: int = 0, /, *, age: datetime.timedelta = datetime.timedelta()) -> hikari.Snowflake:
+    return hikari.Snowflake(hikari.Snowflake.from_datetime(datetime.datetime.now(tz=datetime.UTC) - age) + offset)
+
+
+@contextlib.contextmanager
+def _freeze_clocks() -> typing.Iterator[None]:
+    # Pins both the wall clock used for deadlines and the loop clock used for
+    # timer wheel buckets so that messages scheduled together share a bucket.
+    loop = asyncio.get_running_loop()
+    with (
+        mock.patch.object(time, "time", return_value=time.time()),
+        mock.patch.object(loop, "time", return_value=loop.time()),
+    ):
+        yield
+
+
+def _run_tasks(register_task: mock.Mock, /) -> typing.Awaitable[typing.Any]:
+    return asyncio.gather(*(call.args[0] for call in register_task.call_args_list))
+
+
+class TestDeleteScheduler:
+    @pytest.mark.asyncio
+    async def test_schedule_message_bulk_deletes_messages_in_the_same_channel(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_register_task = mock.Mock()
+        scheduler = deletion.DeleteScheduler(mock_rest, mock_register_task, resolution=0.01)
+        message_1 = _make_id(1)
+        message_2 = _make_id(2)
+        message_3 = _make_id(3)
+
+        with _freeze_clocks():
+            scheduler.schedule_message(0.02, 123, message_1, bulk=True)
+            scheduler.schedule_message(0.02, 123, message_2, bulk=True)
+            scheduler.schedule_message(0.02, 321, message_3, bulk=True)
+        assert len(scheduler) == 3
+        await asyncio.sleep(0.1)
+        await _run_tasks(mock_register_task)
+
+        assert mock_register_task.call_count == 2
+        assert len(scheduler) == 0
+        mock_rest.delete_messages.assert_awaited_once_with(123, [message_1, message_2])
+        mock_rest.delete_message.assert_awaited_once_with(321, message_3)
+
+    @pytest.mark.asyncio
+    async def test_schedule_message_when_not_bulk(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_register_task = mock.Mock()
+        scheduler = deletion.DeleteScheduler(mock_rest, mock_register_task, resolution=0.01)
+        message_1 = _make_id(1)
+        message_2 = _make_id(2)
+
+        with _freeze_clocks():
+            scheduler.schedule_message(0.02, 123, message_1)
+            scheduler.schedule_message(0.02, 123, message_2)
+        await asyncio.sleep(0.1)
+        await _run_tasks(mock_register_task)
+
+        mock_register_task.assert_called_once()
+        mock_rest.delete_messages.assert_not_called()
+        assert mock_rest.delete_message.await_args_list == [mock.call(123, message_1), mock.call(123, message_2)]
+
+    @pytest.mark.asyncio
+    async def test_schedule_message_doesnt_bulk_delete_old_messages(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_register_task = mock.Mock()
+        scheduler = deletion.DeleteScheduler(mock_rest, mock_register_task, resolution=0.01)
+        message_1 = _make_id(1, age=datetime.timedelta(days=15))
+        message_2 = _make_id(2)
+
+        with _freeze_clocks():
+            scheduler.schedule_message(0.02, 123, message_1, bulk=True)
+            scheduler.schedule_message(0.02, 123, message_2, bulk=True)
+        await asyncio.sleep(0.1)
+        await _run_tasks(mock_register_task)
+
+        mock_rest.delete_messages.assert_not_called()
+        assert mock_rest.delete_message.await_args_list == [mock.call(123, message_1), mock.call(123, message_2)]
+
+    @pytest.mark.asyncio
+    async def test_schedule_message_when_bulk_delete_fails(self) -> None:
+        message_1 = _make_id(1)
+        message_2 = _make_id(2)
+        message_3 = _make_id(3)
+        mock_rest = mock.AsyncMock()
+        mock_rest.delete_messages.side_effect = hikari.BulkDeleteError([message_1])
+        mock_rest.delete_message.side_effect = [hikari.NotFoundError(url="", headers={}, raw_body=None), None]
+        mock_register_task = mock.Mock()
+        scheduler = deletion.DeleteScheduler(mock_rest, mock_register_task, resolution=0.01)
+
+        with _freeze_clocks():
+            scheduler.schedule_message(0.02, 123, message_1, bulk=True)
+            scheduler.schedule_message(0.02, 123, message_2, bulk=True)
+            scheduler.schedule_message(0.02, 123, message_3, bulk=True)
+        await asyncio.sleep(0.1)
+        await _run_tasks(mock_register_task)
+
+        mock_rest.delete_messages.assert_awaited_once_with(123, [message_1, message_2, message_3])
+        assert mock_rest.delete_message.await_args_list == [mock.call(123, message_2), mock.call(123, message_3)]
+
+    @pytest.mark.asyncio
+    async def test_schedule_message_keeps_earliest_deadline(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_register_task = mock.Mock()
+        scheduler = deletion.DeleteScheduler(mock_rest, mock_register_task, resolution=0.01)
+        message = _make_id()
+
+        scheduler.schedule_message(60, 123, message)
+        scheduler.schedule_message(0.02, 123, message)
+        scheduler.schedule_message(30, 123, message)
+        assert len(scheduler) == 1
+        await asyncio.sleep(0.1)
+        await _run_tasks(mock_register_task)
+
+        mock_rest.delete_message.assert_awaited_once_with(123, message)
+        assert len(scheduler) == 0
+
+    def test_schedule_message_rearms_pending_deletions_on_new_loop(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_register_task = mock.Mock()
+        scheduler = deletion.DeleteScheduler(mock_rest, mock_register_task, resolution=0.01)
+        message = _make_id()
+
+        async def schedule() -> None:
+            scheduler.schedule_message(0.02, 123, message)
+
+        async def run() -> None:
+            scheduler.schedule_message(60, 123, message)
+            await asyncio.sleep(0.1)
+            await _run_tasks(mock_register_task)
+
+        asyncio.run(schedule())
+        asyncio.run(run())
+
+        mock_rest.delete_message.assert_awaited_once_with(123, message)
+        assert len(scheduler) == 0
+
+    @pytest.mark.asyncio
+    async def test_schedule_callback(self) -> None:
+        mock_register_task = mock.Mock()
+        scheduler = deletion.DeleteScheduler(mock.AsyncMock(), mock_register_task, resolution=0.01)
+        callback = mock.AsyncMock()
+
+        scheduler.schedule_callback(0.02, callback)
+        callback.assert_not_called()
+        await asyncio.sleep(0.1)
+        await _run_tasks(mock_register_task)
+
+        callback.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_cancel_messages(self) -> None:
+        mock_rest = mock.AsyncMock()
+        scheduler = deletion.DeleteScheduler(mock_rest, mock.Mock(), resolution=0.01)
+        message = _make_id()
+
+        with mock.patch.object(time, "time", return_value=1000.0):
+            scheduler.schedule_message(0.02, 123, message, bulk=True)
+
+        result = scheduler.cancel_messages()
+        await asyncio.sleep(0.1)
+
+        assert result == [(123, message, 1000.02, True)]
+        assert len(scheduler) == 0
+        mock_rest.delete_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "deletions.json"
+        scheduler = deletion.DeleteScheduler(mock.AsyncMock(), mock.Mock())
+        message_1 = _make_id(1)
+        message_2 = _make_id(2)
+        scheduler.schedule_message(60, 123, message_1, bulk=True)
+        scheduler.schedule_message(0, 321, message_2)
+
+        await scheduler.save(path)
+
+        assert len(scheduler) == 0
+        data = json.loads(path.read_text())
+        assert [entry[:2] for entry in data] == [[123, message_1], [321, message_2]]
+        assert [entry[3] for entry in data] == [True, False]
+
+        mock_rest = mock.AsyncMock()
+        mock_register_task = mock.Mock()
+        new_scheduler = deletion.DeleteScheduler(mock_rest, mock_register_task, resolution=0.01)
+        await new_scheduler.load(path)
+        assert len(new_scheduler) == 2
+        await asyncio.sleep(0.05)
+        await _run_tasks(mock_register_task)
+
+        mock_rest.delete_message.assert_awaited_once_with(321, message_2)
+        assert len(new_scheduler) == 1
+
+    @pytest.mark.asyncio
+    async def test_save_when_no_pending_deletions(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "deletions.json"
+        path.write_text("[]")
+
+        await deletion.DeleteScheduler(mock.AsyncMock(), mock.Mock()).save(path)
+
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_load_when_file_doesnt_exist(self, tmp_path: pathlib.Path) -> None:
+        scheduler = deletion.DeleteScheduler(mock.AsyncMock(), mock.Mock())
+
+        await scheduler.load(tmp_path / "deletions.json")
+
+        assert len(scheduler) == 0
+
+    @pytest.mark.parametrize("content", ["[[123, 4", '{"a": 1}', "[[123, 456, 1000.0]]", '[["a", "b", 1000.0, true]]'])
+    @pytest.mark.asyncio
+    async def test_load_when_file_invalid(self, tmp_path: pathlib.Path, content: str) -> None:
+        path = tmp_path / "deletions.json"
+        path.write_text(content)
+        scheduler = deletion.DeleteScheduler(mock.AsyncMock(), mock.Mock())
+
+        with mock.patch.object(deletion, "_LOGGER") as logger:
+            await scheduler.load(path)
+
+        assert len(scheduler) == 0
+        logger.warning.assert_called_once_with("Ignoring invalid pending deletions file %s", path, exc_info=mock.ANY)
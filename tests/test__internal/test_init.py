@@ -31,7 +31,10 @@
 # pyright: reportPrivateUsage=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
 import inspect
+import sys
+import time
 import typing
 from unittest import mock
 
@@ -95,6 +98,210 @@ async def test_gather_checks() -> None:
     )
 
 
+def _make_check(cost: tanjun.CheckCost, /) -> mock.Mock:
+    check = mock.Mock()
+    check.__tanjun_check_cost__ = cost
+    return check
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_ordered() -> None:
+    mock_ctx = mock.Mock()
+    mock_ctx.call_with_async_di = mock.AsyncMock(return_value=True)
+    check_1 = _make_check(tanjun.CheckCost.EXPENSIVE)
+    check_2 = _make_check(tanjun.CheckCost.CHEAP)
+    check_3 = _make_check(tanjun.CheckCost.EXPENSIVE)
+    check_4 = _make_check(tanjun.CheckCost.CHEAP)
+
+    result = await _internal.gather_checks(
+        mock_ctx, (check_1, check_2, check_3, check_4), mode=tanjun.CheckMode.ORDERED
+    )
+
+    assert result is True
+    assert mock_ctx.call_with_async_di.await_args_list == [
+        mock.call(check_2, mock_ctx),
+        mock.call(check_4, mock_ctx),
+        mock.call(check_1, mock_ctx),
+        mock.call(check_3, mock_ctx),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_ordered_and_cheap_check_fails() -> None:
+    mock_ctx = mock.Mock()
+    mock_ctx.call_with_async_di = mock.AsyncMock(side_effect=[True, False])
+    check_1 = _make_check(tanjun.CheckCost.EXPENSIVE)
+    check_2 = _make_check(tanjun.CheckCost.CHEAP)
+    check_3 = _make_check(tanjun.CheckCost.CHEAP)
+    check_4 = _make_check(tanjun.CheckCost.CHEAP)
+
+    result = await _internal.gather_checks(
+        mock_ctx, (check_1, check_2, check_3, check_4), mode=tanjun.CheckMode.ORDERED
+    )
+
+    assert result is False
+    assert mock_ctx.call_with_async_di.await_args_list == [mock.call(check_2, mock_ctx), mock.call(check_3, mock_ctx)]
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_ordered_and_expensive_check_fails() -> None:
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+    fast_check = _make_check(tanjun.CheckCost.EXPENSIVE)
+    slow_check = _make_check(tanjun.CheckCost.EXPENSIVE)
+
+    async def call_with_async_di(check: typing.Any, _: typing.Any) -> bool:
+        if check is fast_check:
+            await started.wait()
+            return False
+
+        started.set()
+        try:
+            await asyncio.sleep(60)
+
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+        return True
+
+    mock_ctx = mock.Mock()
+    mock_ctx.call_with_async_di = call_with_async_di
+
+    result = await _internal.gather_checks(mock_ctx, (slow_check, fast_check), mode=tanjun.CheckMode.ORDERED)
+
+    assert result is False
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_ordered_and_check_raises() -> None:
+    mock_ctx = mock.Mock()
+    mock_exception = Exception("meow")
+    mock_ctx.call_with_async_di = mock.AsyncMock(side_effect=[mock_exception, True])
+    check_1 = _make_check(tanjun.CheckCost.CHEAP)
+    check_2 = _make_check(tanjun.CheckCost.CHEAP)
+
+    with pytest.raises(Exception, match="meow") as exc:
+        await _internal.gather_checks(mock_ctx, (check_1, check_2), mode=tanjun.CheckMode.ORDERED)
+
+    assert exc.value is mock_exception
+    mock_ctx.call_with_async_di.assert_awaited_once_with(check_1, mock_ctx)
+
+
+def _make_memo_context() -> tanjun.context.MessageContext:
+    ctx = tanjun.context.MessageContext(tanjun.Client(mock.Mock()), "", mock.Mock(), register_task=mock.Mock())
+    _internal.enable_check_memo(ctx)
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_memoised() -> None:
+    ctx = _make_memo_context()
+    check_1 = mock.Mock(return_value=True)
+    check_2 = mock.Mock(return_value=True)
+
+    assert await _internal.gather_checks(ctx, (check_1, check_2)) is True
+    assert await _internal.gather_checks(ctx, (check_2, check_1)) is True
+
+    check_1.assert_called_once_with(ctx)
+    check_2.assert_called_once_with(ctx)
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_memoised_failure() -> None:
+    ctx = _make_memo_context()
+    check = mock.Mock(return_value=False)
+
+    assert await _internal.gather_checks(ctx, (check,)) is False
+    assert await _internal.gather_checks(ctx, (check,)) is False
+
+    check.assert_called_once_with(ctx)
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_memoised_failure_by_raise() -> None:
+    ctx = _make_memo_context()
+    check = mock.Mock(side_effect=tanjun.FailedCheck)
+
+    assert await _internal.gather_checks(ctx, (check,)) is False
+    assert await _internal.gather_checks(ctx, (check,)) is False
+
+    check.assert_called_once_with(ctx)
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_memoised_doesnt_memoise_other_errors() -> None:
+    ctx = _make_memo_context()
+    check = mock.Mock(side_effect=[tanjun.CommandError("meow"), True])
+
+    with pytest.raises(tanjun.CommandError):
+        await _internal.gather_checks(ctx, (check,))
+
+    assert await _internal.gather_checks(ctx, (check,)) is True
+
+    assert check.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_memoised_and_check_opted_out() -> None:
+    ctx = _make_memo_context()
+    check = tanjun.checks.set_check_memoisable(mock.Mock(return_value=True), False)
+
+    assert await _internal.gather_checks(ctx, (check,)) is True
+    assert await _internal.gather_checks(ctx, (check,)) is True
+
+    assert check.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_checks_when_not_memoised() -> None:
+    ctx = tanjun.context.MessageContext(tanjun.Client(mock.Mock()), "", mock.Mock(), register_task=mock.Mock())
+    check = mock.Mock(return_value=True)
+
+    assert await _internal.gather_checks(ctx, (check,)) is True
+    assert await _internal.gather_checks(ctx, (check,)) is True
+
+    assert check.call_count == 2
+
+
+class TestGetCheckCost:
+    def test_when_declared(self) -> None:
+        async def check(_: tanjun.abc.Context) -> bool:
+            raise NotImplementedError
+
+        tanjun.checks.set_check_cost(check, tanjun.CheckCost.CHEAP)
+
+        assert _internal.get_check_cost(check) is tanjun.CheckCost.CHEAP
+
+    def test_for_sync_function(self) -> None:
+        def check(_: tanjun.abc.Context) -> bool:
+            raise NotImplementedError
+
+        assert _internal.get_check_cost(check) is tanjun.CheckCost.CHEAP
+
+    def test_for_async_function(self) -> None:
+        async def check(_: tanjun.abc.Context) -> bool:
+            raise NotImplementedError
+
+        assert _internal.get_check_cost(check) is tanjun.CheckCost.EXPENSIVE
+
+    def test_for_sync_callable(self) -> None:
+        assert _internal.get_check_cost(tanjun.checks.GuildCheck()) is tanjun.CheckCost.CHEAP
+
+    def test_for_async_callable(self) -> None:
+        assert _internal.get_check_cost(tanjun.checks.NsfwCheck()) is tanjun.CheckCost.EXPENSIVE
+
+    def test_for_declared_class_attribute(self) -> None:
+        class Check:
+            __tanjun_check_cost__ = tanjun.CheckCost.CHEAP
+
+            async def __call__(self, _: tanjun.abc.Context) -> bool:
+                raise NotImplementedError
+
+        assert _internal.get_check_cost(Check()) is tanjun.CheckCost.CHEAP
+
+
 class TestCastedView:
     def test___getitem___for_non_existant_entry(self) -> None:
         mock_cast = mock.Mock()
@@ -141,6 +348,492 @@ class TestCastedView:
         assert len(view) == 43123
 
 
+class TestTimedLRUCache:
+    def test_get(self) -> None:
+        cache = _internal.TimedLRUCache[str, int]()
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_get_when_expired(self) -> None:
+        cache = _internal.TimedLRUCache[str, int](expire_after=5)
+
+        with mock.patch.object(time, "monotonic", return_value=100.0):
+            cache.set("a", 1)
+
+        with mock.patch.object(time, "monotonic", return_value=104.9):
+            assert cache.get("a") == 1
+
+        with mock.patch.object(time, "monotonic", return_value=105.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+
+    def test_set_evicts_least_recently_used(self) -> None:
+        cache = _internal.TimedLRUCache[str, int](max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_set_when_already_present(self) -> None:
+        cache = _internal.TimedLRUCache[str, int](max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.set("a", 3)
+        cache.set("c", 4)
+
+        assert cache.get("a") == 3
+        assert cache.get("b") is None
+
+    def test_pop(self) -> None:
+        cache = _internal.TimedLRUCache[str, int]()
+        cache.set("a", 1)
+
+        cache.pop("a")
+        cache.pop("b")
+
+        assert cache.get("a") is None
+
+    def test_values(self) -> None:
+        cache = _internal.TimedLRUCache[str, int](expire_after=5)
+
+        with mock.patch.object(time, "monotonic", return_value=100.0):
+            cache.set("a", 1)
+
+        with mock.patch.object(time, "monotonic", return_value=102.0):
+            cache.set("b", 2)
+
+        with mock.patch.object(time, "monotonic", return_value=105.0):
+            assert list(cache.values()) == [2]
+
+    def test_clear(self) -> None:
+        cache = _internal.TimedLRUCache[str, int]()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestRestFlights:
+    @pytest.mark.asyncio
+    async def test_fetch_channel_shares_concurrent_fetches(self) -> None:
+        event = asyncio.Event()
+        mock_channel = mock.Mock()
+
+        async def fetch_channel(_: hikari.Snowflake) -> mock.Mock:
+            await event.wait()
+            return mock_channel
+
+        mock_rest = mock.Mock(fetch_channel=mock.Mock(side_effect=fetch_channel))
+        flights = _internal.RestFlights(mock_rest)
+
+        calls = asyncio.gather(flights.fetch_channel(123), flights.fetch_channel(123), flights.fetch_channel(321))
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await calls == [mock_channel, mock_channel, mock_channel]
+        mock_rest.fetch_channel.assert_has_calls([mock.call(123), mock.call(321)])
+        assert mock_rest.fetch_channel.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_guild(self) -> None:
+        mock_rest = mock.AsyncMock()
+        flights = _internal.RestFlights(mock_rest)
+
+        result = await flights.fetch_guild(123)
+
+        assert result is mock_rest.fetch_guild.return_value
+        mock_rest.fetch_guild.assert_awaited_once_with(123)
+
+    @pytest.mark.asyncio
+    async def test_fetch_member(self) -> None:
+        event = asyncio.Event()
+
+        async def fetch_member(guild_id: hikari.Snowflake, user_id: hikari.Snowflake) -> tuple[int, int]:
+            await event.wait()
+            return (guild_id, user_id)
+
+        mock_rest = mock.Mock(fetch_member=mock.Mock(side_effect=fetch_member))
+        flights = _internal.RestFlights(mock_rest)
+
+        calls = asyncio.gather(
+            flights.fetch_member(123, 456), flights.fetch_member(123, 456), flights.fetch_member(123, 789)
+        )
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await calls == [(123, 456), (123, 456), (123, 789)]
+        assert mock_rest.fetch_member.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_roles_shares_errors(self) -> None:
+        event = asyncio.Event()
+
+        async def fetch_roles(_: hikari.Snowflake) -> list[hikari.Role]:
+            await event.wait()
+            error_message = "meow"
+            raise LookupError(error_message)
+
+        mock_rest = mock.Mock(fetch_roles=mock.Mock(side_effect=fetch_roles))
+        flights = _internal.RestFlights(mock_rest)
+
+        calls = asyncio.gather(flights.fetch_roles(123), flights.fetch_roles(123), return_exceptions=True)
+        await asyncio.sleep(0)
+        event.set()
+
+        results = await calls
+        assert all(isinstance(result, LookupError) for result in results)
+        mock_rest.fetch_roles.assert_called_once_with(123)
+
+
+class TestSeenIdSet:
+    def test_add(self) -> None:
+        seen = _internal.SeenIdSet[int](expire_after=60, max_size=10)
+
+        assert seen.add(123) is True
+        assert seen.add(123) is False
+        assert seen.add(321) is True
+        assert 123 in seen
+        assert 456 not in seen
+        assert len(seen) == 2
+
+    def test_add_when_expired(self) -> None:
+        seen = _internal.SeenIdSet[int](expire_after=5, max_size=10)
+
+        with mock.patch.object(time, "monotonic", return_value=100.0):
+            seen.add(123)
+
+        with mock.patch.object(time, "monotonic", return_value=102.0):
+            seen.add(321)
+
+        with mock.patch.object(time, "monotonic", return_value=104.9):
+            assert seen.add(123) is False
+
+        with mock.patch.object(time, "monotonic", return_value=105.0):
+            assert seen.add(123) is True
+            assert 321 in seen
+
+        assert len(seen) == 2
+
+    def test_add_evicts_oldest_when_full(self) -> None:
+        seen = _internal.SeenIdSet[int](expire_after=60, max_size=2)
+        seen.add(1)
+        seen.add(2)
+
+        seen.add(3)
+
+        assert 1 not in seen
+        assert 2 in seen
+        assert 3 in seen
+        assert len(seen) == 2
+
+    def test_clear(self) -> None:
+        seen = _internal.SeenIdSet[int](expire_after=60, max_size=10)
+        seen.add(123)
+
+        seen.clear()
+
+        assert len(seen) == 0
+        assert seen.add(123) is True
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_call(self) -> None:
+        single_flight = _internal.SingleFlight[str, int]()
+        callback = mock.AsyncMock(return_value=42)
+
+        assert await single_flight.call("a", callback) == 42
+
+        callback.assert_awaited_once_with()
+        assert single_flight._calls == {}
+
+    @pytest.mark.asyncio
+    async def test_call_shares_concurrent_calls(self) -> None:
+        single_flight = _internal.SingleFlight[str, int]()
+        event = asyncio.Event()
+        mock_callback = mock.Mock()
+
+        async def callback() -> int:
+            mock_callback()
+            await event.wait()
+            return 42
+
+        calls = asyncio.gather(single_flight.call("a", callback), single_flight.call("a", callback))
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await calls == [42, 42]
+        mock_callback.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_call_propagates_exception(self) -> None:
+        single_flight = _internal.SingleFlight[str, int]()
+        callback = mock.AsyncMock(side_effect=LookupError("meow"))
+
+        with pytest.raises(LookupError, match="meow"):
+            await single_flight.call("a", callback)
+
+        assert single_flight._calls == {}
+
+    @pytest.mark.asyncio
+    async def test_forget(self) -> None:
+        single_flight = _internal.SingleFlight[str, int]()
+        event = asyncio.Event()
+
+        async def callback_1() -> int:
+            await event.wait()
+            return 1
+
+        async def callback_2() -> int:
+            await event.wait()
+            return 2
+
+        first_call = asyncio.create_task(single_flight.call("a", callback_1))
+        await asyncio.sleep(0)
+        single_flight.forget("a")
+        second_call = asyncio.create_task(single_flight.call("a", callback_2))
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await first_call == 1
+        assert await second_call == 2
+        assert single_flight._calls == {}
+
+    @pytest.mark.asyncio
+    async def test_forget_all(self) -> None:
+        single_flight = _internal.SingleFlight[str, int]()
+        event = asyncio.Event()
+
+        async def callback() -> int:
+            await event.wait()
+            return 1
+
+        call_1 = asyncio.create_task(single_flight.call("a", callback))
+        call_2 = asyncio.create_task(single_flight.call("b", callback))
+        await asyncio.sleep(0)
+
+        single_flight.forget_all()
+
+        assert single_flight._calls == {}
+        event.set()
+        assert await call_1 == 1
+        assert await call_2 == 1
+
+
+class TestPrefixTrie:
+    def test___init__(self) -> None:
+        trie = _internal.PrefixTrie(["a", "b", "a"])
+
+        assert list(trie) == ["a", "b"]
+
+    def test___contains__(self) -> None:
+        trie = _internal.PrefixTrie(["!", "?"])
+
+        assert "!" in trie
+        assert "?" in trie
+        assert "." not in trie
+
+    def test___len__(self) -> None:
+        trie = _internal.PrefixTrie(["a", "bb", "ccc"])
+
+        assert len(trie) == 3
+
+    def test_add(self) -> None:
+        trie = _internal.PrefixTrie()
+
+        assert trie.add("!") is True
+        assert trie.add("!!") is True
+
+        assert list(trie) == ["!", "!!"]
+
+    def test_add_when_already_present(self) -> None:
+        trie = _internal.PrefixTrie(["!"])
+
+        assert trie.add("!") is False
+
+        assert list(trie) == ["!"]
+
+    def test_match(self) -> None:
+        trie = _internal.PrefixTrie(["!", "?", "bot "])
+
+        assert trie.match("?help") == "?"
+        assert trie.match("bot help") == "bot "
+
+    def test_match_returns_longest_prefix(self) -> None:
+        trie = _internal.PrefixTrie(["!", "!!!", "!!"])
+
+        assert trie.match("!!!help") == "!!!"
+        assert trie.match("!!help") == "!!"
+        assert trie.match("!help") == "!"
+
+    def test_match_when_no_match(self) -> None:
+        trie = _internal.PrefixTrie(["!", "bot "])
+
+        assert trie.match("bo help") is None
+        assert trie.match("") is None
+        assert trie.match("help") is None
+
+    def test_match_with_empty_prefix(self) -> None:
+        trie = _internal.PrefixTrie(["", "!"])
+
+        assert trie.match("help") == ""
+        assert trie.match("!help") == "!"
+
+    def test_remove(self) -> None:
+        trie = _internal.PrefixTrie(["!", "!!", "?"])
+
+        trie.remove("!!")
+
+        assert list(trie) == ["!", "?"]
+        assert trie.match("!!help") == "!"
+        assert trie._root == {"!": {_internal._IndexKeys.PREFIX: "!"}, "?": {_internal._IndexKeys.PREFIX: "?"}}
+
+    def test_remove_prunes_branches(self) -> None:
+        trie = _internal.PrefixTrie(["bot ", "b"])
+
+        trie.remove("bot ")
+        trie.remove("b")
+
+        assert list(trie) == []
+        assert trie._root == {}
+        assert trie.match("bot help") is None
+
+    def test_remove_keeps_shared_branches(self) -> None:
+        trie = _internal.PrefixTrie(["bot ", "b"])
+
+        trie.remove("b")
+
+        assert trie.match("bot help") == "bot "
+        assert trie.match("b help") is None
+
+    def test_remove_when_not_found(self) -> None:
+        trie = _internal.PrefixTrie(["!"])
+
+        with pytest.raises(ValueError, match="Prefix '!!' not found"):
+            trie.remove("!!")
+
+        assert list(trie) == ["!"]
+
+
+class TestTimerWheel:
+    @pytest.mark.asyncio
+    async def test_call_later(self) -> None:
+        wheel = _internal.TimerWheel(asyncio.get_running_loop(), resolution=0.01)
+        callback = mock.Mock()
+
+        entry = wheel.call_later(0.02, callback)
+        assert len(wheel) == 1
+        await asyncio.sleep(0.1)
+
+        callback.assert_called_once_with()
+        assert entry.cancelled()
+        assert len(wheel) == 0
+
+    @pytest.mark.asyncio
+    async def test_call_later_when_cancelled(self) -> None:
+        wheel = _internal.TimerWheel(asyncio.get_running_loop(), resolution=0.01)
+        callback = mock.Mock()
+        other_callback = mock.Mock()
+
+        wheel.call_later(0.02, callback).cancel()
+        wheel.call_later(0.02, other_callback)
+        await asyncio.sleep(0.1)
+
+        callback.assert_not_called()
+        other_callback.assert_called_once_with()
+
+    def test_call_later_batches_timers(self) -> None:
+        loop = mock.Mock(time=mock.Mock(return_value=10.0))
+        wheel = _internal.TimerWheel(loop, resolution=1)
+
+        wheel.call_later(2.5, mock.Mock())
+        wheel.call_later(2.2, mock.Mock())
+        wheel.call_later(5, mock.Mock())
+
+        loop.call_at.assert_called_once_with(13, wheel._fire)
+        assert len(wheel) == 3
+
+    def test_call_later_reschedules_for_earlier_deadline(self) -> None:
+        loop = mock.Mock(time=mock.Mock(return_value=10.0))
+        wheel = _internal.TimerWheel(loop, resolution=1)
+
+        wheel.call_later(5, mock.Mock())
+        wheel.call_later(1, mock.Mock())
+
+        assert loop.call_at.call_args_list == [mock.call(15, wheel._fire), mock.call(11, wheel._fire)]
+        loop.call_at.return_value.cancel.assert_called_once_with()
+
+    def test__fire(self) -> None:
+        loop = mock.Mock(time=mock.Mock(return_value=10.0))
+        wheel = _internal.TimerWheel(loop, resolution=1)
+        due_callback = mock.Mock(side_effect=RuntimeError("meow"))
+        other_due_callback = mock.Mock()
+        later_callback = mock.Mock()
+        wheel.call_later(1, due_callback)
+        wheel.call_later(2, other_due_callback)
+        wheel.call_later(5, later_callback)
+        loop.time.return_value = 12.0
+        loop.call_at.reset_mock()
+
+        wheel._fire()
+
+        due_callback.assert_called_once_with()
+        other_due_callback.assert_called_once_with()
+        later_callback.assert_not_called()
+        loop.call_exception_handler.assert_called_once_with(
+            {"message": "Exception in timer wheel callback", "exception": due_callback.side_effect}
+        )
+        loop.call_at.assert_called_once_with(15, wheel._fire)
+        assert len(wheel) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_timer_wheel() -> None:
+    wheel = _internal.get_timer_wheel()
+
+    assert _internal.get_timer_wheel() is wheel
+
+
+@pytest.mark.asyncio
+async def test_create_eager_task() -> None:
+    async def callback() -> int:
+        await asyncio.sleep(0)
+        return 123
+
+    task = _internal.create_eager_task(asyncio.get_running_loop(), callback(), name="meow")
+
+    assert task.get_name() == "meow"
+    assert await task == 123
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="Eager tasks were added in Python 3.12")
+@pytest.mark.asyncio
+async def test_create_eager_task_runs_until_first_suspension() -> None:
+    current_tasks: list[asyncio.Task[typing.Any] | None] = []
+
+    async def callback() -> int:
+        current_tasks.append(asyncio.current_task())
+        return 123
+
+    task = _internal.create_eager_task(asyncio.get_running_loop(), callback())
+
+    assert task.done()
+    assert task.result() == 123
+    assert current_tasks == [task]
+
+
 def test_ensure_parse_channel_types_has_every_channel_class() -> None:
     for _, attribute in inspect.getmembers(hikari):
         if isinstance(attribute, type) and issubclass(attribute, hikari.PartialChannel):
@@ -160,3 +853,313 @@ def test_ensure_repr_channel_has_every_real_channel_type() -> None:
 
 def test_ensure_repr_channel_defaults_to_unknown() -> None:
     assert _internal.repr_channel(hikari.ChannelType(-1)) == "Unknown"
+
+
+class TestMergedMessageIndex:
+    def test_add_component(self) -> None:
+        component = mock.Mock(is_case_sensitive=None)
+        command_1 = mock.Mock(names=["meow", "nyan"])
+        command_2 = mock.Mock(names=["meow uwu"])
+        index = _internal.MessageCommandIndex(strict=False)
+        index.add(command_1)
+        index.add(command_2)
+        merged_index = _internal.MergedMessageIndex()
+
+        merged_index.add_component(component, index)
+
+        assert index.watchers == {merged_index: component}
+        assert merged_index.find("nyan", case_sensitive=True) == [(component, [("nyan", command_1)])]
+        assert merged_index.find("meow uwu", case_sensitive=True) == [
+            (component, [("meow uwu", command_2), ("meow", command_1)])
+        ]
+
+    def test_add_component_without_index(self) -> None:
+        component = mock.Mock(is_case_sensitive=None)
+        merged_index = _internal.MergedMessageIndex()
+
+        merged_index.add_component(component, None)
+
+        assert merged_index.find("meow", case_sensitive=True) == [(component, None)]
+
+    def test_remove_component(self) -> None:
+        component_1 = mock.Mock(is_case_sensitive=None)
+        component_2 = mock.Mock(is_case_sensitive=None)
+        command_1 = mock.Mock(names=["meow"])
+        command_2 = mock.Mock(names=["meow"])
+        index_1 = _internal.MessageCommandIndex(strict=True)
+        index_1.add(command_1)
+        index_2 = _internal.MessageCommandIndex(strict=False)
+        index_2.add(command_2)
+        merged_index = _internal.MergedMessageIndex()
+        merged_index.add_component(component_1, index_1)
+        merged_index.add_component(component_2, index_2)
+
+        merged_index.remove_component(component_1)
+
+        assert index_1.watchers == {}
+        assert merged_index.find("meow", case_sensitive=True) == [(component_2, [("meow", command_2)])]
+
+    def test_remove_component_prunes_tree(self) -> None:
+        component = mock.Mock(is_case_sensitive=None)
+        index = _internal.MessageCommandIndex(strict=False)
+        index.add(mock.Mock(names=["meow uwu", "nyan"]))
+        merged_index = _internal.MergedMessageIndex()
+        merged_index.add_component(component, index)
+
+        merged_index.remove_component(component)
+
+        assert merged_index._search_tree == {}
+        assert merged_index.find("meow uwu", case_sensitive=True) == []
+
+    def test_tracks_index_changes(self) -> None:
+        component = mock.Mock(is_case_sensitive=None)
+        command_1 = mock.Mock(names=["meow"])
+        command_2 = mock.Mock(names=["nyan"])
+        index = _internal.MessageCommandIndex(strict=False)
+        index.add(command_1)
+        merged_index = _internal.MergedMessageIndex()
+        merged_index.add_component(component, index)
+
+        index.add(command_2)
+        index.remove(command_1)
+
+        assert merged_index.find("meow", case_sensitive=True) == []
+        assert merged_index.find("nyan", case_sensitive=True) == [(component, [("nyan", command_2)])]
+
+    def test_copied_index_isnt_tracked(self) -> None:
+        component = mock.Mock(is_case_sensitive=None)
+        index = _internal.MessageCommandIndex(strict=False)
+        merged_index = _internal.MergedMessageIndex()
+        merged_index.add_component(component, index)
+
+        index.copy().add(mock.Mock(names=["meow"]))
+
+        assert merged_index.find("meow", case_sensitive=True) == []
+
+    def test_find_orders_by_component_priority(self) -> None:
+        component_1 = mock.Mock(is_case_sensitive=None)
+        component_2 = mock.Mock(is_case_sensitive=None)
+        component_3 = mock.Mock(is_case_sensitive=None)
+        command_1 = mock.Mock(names=["meow"])
+        command_2 = mock.Mock(names=["meow uwu"])
+        index_1 = _internal.MessageCommandIndex(strict=False)
+        index_2 = _internal.MessageCommandIndex(strict=False)
+        merged_index = _internal.MergedMessageIndex()
+        merged_index.add_component(component_1, index_1)
+        merged_index.add_component(component_2, None)
+        merged_index.add_component(component_3, index_2)
+
+        index_2.add(command_2)
+        index_1.add(command_1)
+
+        assert merged_index.find("meow uwu", case_sensitive=True) == [
+            (component_1, [("meow", command_1)]),
+            (component_2, None),
+            (component_3, [("meow uwu", command_2)]),
+        ]
+
+    def test_find_when_case_insensitive(self) -> None:
+        component = mock.Mock(is_case_sensitive=None)
+        command = mock.Mock(names=["Meow"])
+        index = _internal.MessageCommandIndex(strict=False)
+        index.add(command)
+        merged_index = _internal.MergedMessageIndex()
+        merged_index.add_component(component, index)
+
+        assert merged_index.find("meOW", case_sensitive=True) == []
+        assert merged_index.find("meOW", case_sensitive=False) == [(component, [("meOW", command)])]
+
+    def test_find_when_component_overrides_case_sensitivity(self) -> None:
+        component_1 = mock.Mock(is_case_sensitive=False)
+        component_2 = mock.Mock(is_case_sensitive=True)
+        command_1 = mock.Mock(names=["Meow"])
+        command_2 = mock.Mock(names=["Meow"])
+        index_1 = _internal.MessageCommandIndex(strict=False)
+        index_1.add(command_1)
+        index_2 = _internal.MessageCommandIndex(strict=False)
+        index_2.add(command_2)
+        merged_index = _internal.MergedMessageIndex()
+        merged_index.add_component(component_1, index_1)
+        merged_index.add_component(component_2, index_2)
+
+        assert merged_index.find("meow", case_sensitive=True) == [(component_1, [("meow", command_1)])]
+
+
+class TestAppCommandRoutes:
+    def test_add_component(self) -> None:
+        component = mock.Mock()
+        routes = _internal.AppCommandRoutes()
+
+        routes.add_component(
+            component, tracked=True, menu_keys=[(hikari.CommandType.USER, "meow")], slash_names=["nyan", "uwu"]
+        )
+
+        assert routes.find_menu(hikari.CommandType.USER, "meow") == (component,)
+        assert routes.find_menu(hikari.CommandType.MESSAGE, "meow") == ()
+        assert routes.find_slash("nyan") == (component,)
+        assert routes.find_slash("uwu") == (component,)
+        assert routes.find_slash("meow") == ()
+
+    def test_add_component_when_untracked(self) -> None:
+        component_1 = mock.Mock()
+        component_2 = mock.Mock()
+        component_3 = mock.Mock()
+        routes = _internal.AppCommandRoutes()
+        routes.add_component(component_1, tracked=True, slash_names=["meow"])
+        routes.add_component(component_2, tracked=False)
+        routes.add_component(component_3, tracked=True, slash_names=["meow"])
+
+        assert routes.find_slash("meow") == (component_1, component_2, component_3)
+        assert routes.find_slash("nyan") == (component_2,)
+        assert routes.find_menu(hikari.CommandType.USER, "meow") == (component_2,)
+
+    def test_add_slash_keeps_component_priority(self) -> None:
+        component_1 = mock.Mock()
+        component_2 = mock.Mock()
+        routes = _internal.AppCommandRoutes()
+        routes.add_component(component_1, tracked=True)
+        routes.add_component(component_2, tracked=True)
+
+        routes.add_slash(component_2, "meow")
+        routes.add_slash(component_1, "meow")
+        routes.add_slash(component_1, "meow")
+
+        assert routes.find_slash("meow") == (component_1, component_2)
+
+    def test_add_slash_for_unknown_component(self) -> None:
+        routes = _internal.AppCommandRoutes()
+
+        routes.add_slash(mock.Mock(), "meow")
+
+        assert routes.find_slash("meow") == ()
+
+    def test_add_menu_keeps_component_priority(self) -> None:
+        component_1 = mock.Mock()
+        component_2 = mock.Mock()
+        routes = _internal.AppCommandRoutes()
+        routes.add_component(component_1, tracked=True)
+        routes.add_component(component_2, tracked=True)
+
+        routes.add_menu(component_2, (hikari.CommandType.MESSAGE, "meow"))
+        routes.add_menu(component_1, (hikari.CommandType.MESSAGE, "meow"))
+
+        assert routes.find_menu(hikari.CommandType.MESSAGE, "meow") == (component_1, component_2)
+
+    def test_remove_slash(self) -> None:
+        component_1 = mock.Mock()
+        component_2 = mock.Mock()
+        routes = _internal.AppCommandRoutes()
+        routes.add_component(component_1, tracked=True, slash_names=["meow", "nyan"])
+        routes.add_component(component_2, tracked=True, slash_names=["meow"])
+
+        routes.remove_slash(component_1, "meow")
+        routes.remove_slash(component_1, "nyan")
+
+        assert routes.find_slash("meow") == (component_2,)
+        assert routes.find_slash("nyan") == ()
+        assert routes._slash_routes == {"meow": (component_2,)}
+
+    def test_remove_menu(self) -> None:
+        component = mock.Mock()
+        routes = _internal.AppCommandRoutes()
+        routes.add_component(component, tracked=True, menu_keys=[(hikari.CommandType.USER, "meow")])
+
+        routes.remove_menu(component, (hikari.CommandType.USER, "meow"))
+
+        assert routes.find_menu(hikari.CommandType.USER, "meow") == ()
+        assert routes._menu_routes == {}
+
+    def test_remove_component(self) -> None:
+        component_1 = mock.Mock()
+        component_2 = mock.Mock()
+        component_3 = mock.Mock()
+        routes = _internal.AppCommandRoutes()
+        routes.add_component(
+            component_1, tracked=True, menu_keys=[(hikari.CommandType.USER, "meow")], slash_names=["meow"]
+        )
+        routes.add_component(component_2, tracked=False)
+        routes.add_component(component_3, tracked=True, slash_names=["meow"])
+
+        routes.remove_component(component_1)
+        routes.remove_component(component_2)
+
+        assert routes.find_slash("meow") == (component_3,)
+        assert routes.find_menu(hikari.CommandType.USER, "meow") == ()
+        assert routes._menu_routes == {}
+
+
+def test_hooks_for() -> None:
+    hooks = {mock.Mock()}
+
+    result = _internal.hooks_for(mock.Mock(), hooks)
+
+    assert result == hooks
+    assert result is not hooks
+
+
+def test_hooks_for_when_standard_command() -> None:
+    hooks = {mock.Mock()}
+
+    assert _internal.hooks_for(tanjun.MessageCommand(mock.AsyncMock(), "meow"), hooks) is hooks
+
+
+def test_hooks_for_when_no_hooks() -> None:
+    assert _internal.hooks_for(mock.Mock(), None) is None
+
+
+class TestMergedHooks:
+    def test_merge(self) -> None:
+        parent = {mock.Mock()}
+        first = mock.Mock()
+        second = mock.Mock()
+        merged = _internal.MergedHooks[typing.Any]()
+
+        result = merged.merge(parent, first, second)
+
+        assert result == {*parent, first, second}
+        assert result is not parent
+        assert len(parent) == 1
+
+    def test_merge_caches_result(self) -> None:
+        parent = {mock.Mock()}
+        first = mock.Mock()
+        merged = _internal.MergedHooks[typing.Any]()
+
+        result = merged.merge(parent, first)
+
+        assert merged.merge(parent, first) is result
+
+    def test_merge_when_parent_changes(self) -> None:
+        first = mock.Mock()
+        merged = _internal.MergedHooks[typing.Any]()
+        result = merged.merge({mock.Mock()}, first)
+        new_parent = {mock.Mock()}
+
+        new_result = merged.merge(new_parent, first)
+
+        assert new_result is not result
+        assert new_result == {*new_parent, first}
+
+    def test_merge_when_no_parent(self) -> None:
+        first = mock.Mock()
+        merged = _internal.MergedHooks[typing.Any]()
+
+        assert merged.merge(None, first) == {first}
+
+    def test_merge_when_no_own_hooks(self) -> None:
+        parent = {mock.Mock()}
+        merged = _internal.MergedHooks[typing.Any]()
+
+        assert merged.merge(parent, None, None) is parent
+        assert merged.merge(None, None) is None
+
+    def test_clear(self) -> None:
+        parent = {mock.Mock()}
+        merged = _internal.MergedHooks[typing.Any]()
+        result = merged.merge(parent, mock.Mock())
+
+        merged.clear()
+        new_first = mock.Mock()
+
+        assert merged.merge(parent, new_first) == {*parent, new_first}
+        assert merged.merge(parent, new_first) is not result
@@ -0,0 +1,143 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from unittest import mock
+
+import hikari
+import pytest
+
+import tanjun
+
+
+class TestChoiceSource:
+    @pytest.fixture
+    def source(self) -> tanjun.autocomplete.ChoiceSource:
+        return tanjun.autocomplete.ChoiceSource(
+            ["Red", "Green", "Blue", "Greenland", "Dark Red", "Reddish Brown", "Yellow"]
+        )
+
+    def test_init_with_mapping(self) -> None:
+        source = tanjun.autocomplete.ChoiceSource({"Red": "red", "Blue": "blue"})
+
+        assert source.search("r") == [("Red", "red")]
+        assert "red" in source
+        assert "Red" not in source
+        assert len(source) == 2
+
+    @pytest.mark.parametrize("max_results", [0, 26])
+    def test_init_when_max_results_out_of_range(self, max_results: int) -> None:
+        with pytest.raises(ValueError, match="max_results must be between 1 and 25"):
+            tanjun.autocomplete.ChoiceSource(max_results=max_results)
+
+    @pytest.mark.parametrize("fuzzy_threshold", [-0.1, 1.1])
+    def test_init_when_fuzzy_threshold_out_of_range(self, fuzzy_threshold: float) -> None:
+        with pytest.raises(ValueError, match="fuzzy_threshold must be between 0 and 1"):
+            tanjun.autocomplete.ChoiceSource(fuzzy_threshold=fuzzy_threshold)
+
+    def test_search_returns_prefix_matches_before_substring_matches(
+        self, source: tanjun.autocomplete.ChoiceSource
+    ) -> None:
+        assert source.search("RED") == [("Red", "Red"), ("Reddish Brown", "Reddish Brown"), ("Dark Red", "Dark Red")]
+
+    def test_search_with_short_substring(self, source: tanjun.autocomplete.ChoiceSource) -> None:
+        assert source.search("ll") == [("Yellow", "Yellow")]
+
+    def test_search_with_fuzzy_match(self, source: tanjun.autocomplete.ChoiceSource) -> None:
+        assert source.search("gren") == [("Green", "Green")]
+
+    def test_search_when_fuzzy_disabled(self) -> None:
+        source = tanjun.autocomplete.ChoiceSource(["Green"], fuzzy_threshold=None)
+
+        assert source.search("gren") == []
+
+    def test_search_with_empty_query(self, source: tanjun.autocomplete.ChoiceSource) -> None:
+        assert [name for name, _ in source.search("", limit=3)] == ["Blue", "Dark Red", "Green"]
+
+    def test_search_respects_limit(self) -> None:
+        source = tanjun.autocomplete.ChoiceSource([f"name {index:03}" for index in range(1000)])
+
+        results = source.search("name")
+
+        assert len(results) == 25
+        assert results[0] == ("name 000", "name 000")
+        assert results[-1] == ("name 024", "name 024")
+
+    @pytest.mark.parametrize("query", ["me", "name"])
+    def test_search_respects_limit_for_substring_matches(self, query: str) -> None:
+        source = tanjun.autocomplete.ChoiceSource(
+            [f"{query} prefix", *(f"the {index:03} name" for index in reversed(range(1000)))]
+        )
+
+        results = source.search(query, limit=5)
+
+        assert [name for name, _ in results] == [
+            f"{query} prefix",
+            "the 000 name",
+            "the 001 name",
+            "the 002 name",
+            "the 003 name",
+        ]
+
+    def test_search_with_locale(self, source: tanjun.autocomplete.ChoiceSource) -> None:
+        source.add("Red", localisations={hikari.Locale.DE: "Rot"})
+
+        assert source.search("ro", locale=hikari.Locale.DE) == [("Rot", "Red"), ("Reddish Brown", "Reddish Brown")]
+        assert source.search("red", locale="de")[0] == ("Rot", "Red")
+        assert source.search("ro") == [("Reddish Brown", "Reddish Brown")]
+
+    def test_add_replaces_existing_choice(self, source: tanjun.autocomplete.ChoiceSource) -> None:
+        source.add("Crimson", "Red")
+
+        assert source.search("crim") == [("Crimson", "Red")]
+        assert ("Red", "Red") not in source.search("red")
+        assert len(source) == 7
+
+    def test_remove(self, source: tanjun.autocomplete.ChoiceSource) -> None:
+        source.add("Red", localisations={"de": "Rot"})
+
+        source.remove("Red").remove("Unknown")
+
+        assert "Red" not in source
+        assert source.search("red") == [("Reddish Brown", "Reddish Brown"), ("Dark Red", "Dark Red")]
+        assert source.search("rot", locale="de") == []
+
+    def test_clear(self, source: tanjun.autocomplete.ChoiceSource) -> None:
+        source.clear()
+
+        assert len(source) == 0
+        assert source.search("") == []
+
+    @pytest.mark.asyncio
+    async def test_call(self, source: tanjun.autocomplete.ChoiceSource) -> None:
+        mock_ctx = mock.AsyncMock(interaction=mock.Mock(locale="en-US"))
+
+        await source(mock_ctx, "blu")
+
+        mock_ctx.set_choices.assert_awaited_once_with([("Blue", "Blue")])
@@ -1677,6 +1677,69 @@ class TestOwnPermissionCheck:
         mock_context.cache.get_member.assert_called_once_with(mock_context.guild_id, mock_own_user)
         mock_context.rest.fetch_member.assert_awaited_once_with(mock_context.guild_id, mock_own_user.id)
 
+    @pytest.mark.parametrize(*PERMISSIONS)
+    async def test_when_own_permissions_cached(
+        self, required_perms: hikari.Permissions, actual_perms: hikari.Permissions
+    ) -> None:
+        mock_context = mock.Mock(tanjun.abc.Context, guild_id=hikari.Snowflake(123), channel_id=hikari.Snowflake(456))
+        mock_context.rest = mock.AsyncMock()
+        own_permissions_cache = tanjun.permissions.OwnPermissionsCache()
+        own_permissions_cache.set(123, 456, actual_perms)
+        check = tanjun.checks.OwnPermissionCheck(required_perms)
+
+        with mock.patch.object(tanjun.permissions, "fetch_permissions") as fetch_permissions:
+            result = await check(
+                mock_context, member_cache=None, my_user=mock.Mock(), own_permissions_cache=own_permissions_cache
+            )
+
+        assert result is True
+        fetch_permissions.assert_not_called()
+        mock_context.cache.get_member.assert_not_called()
+        mock_context.rest.fetch_member.assert_not_called()
+
+    @pytest.mark.parametrize(*PERMISSIONS)
+    async def test_when_own_permissions_not_cached(
+        self, required_perms: hikari.Permissions, actual_perms: hikari.Permissions
+    ) -> None:
+        mock_context = mock.Mock(tanjun.abc.Context, guild_id=hikari.Snowflake(123), channel_id=hikari.Snowflake(456))
+        mock_context.rest = mock.AsyncMock()
+        mock_own_user = mock.Mock()
+        own_permissions_cache = tanjun.permissions.OwnPermissionsCache()
+        check = tanjun.checks.OwnPermissionCheck(required_perms)
+
+        with mock.patch.object(tanjun.permissions, "fetch_permissions", return_value=actual_perms) as fetch_permissions:
+            result = await check(
+                mock_context, member_cache=None, my_user=mock_own_user, own_permissions_cache=own_permissions_cache
+            )
+
+        assert result is True
+        assert own_permissions_cache.get(123, 456) is actual_perms
+        fetch_permissions.assert_awaited_once_with(
+            mock_context.client, mock_context.cache.get_member.return_value, channel=mock_context.channel_id
+        )
+        mock_context.cache.get_member.assert_called_once_with(mock_context.guild_id, mock_own_user)
+
+    @pytest.mark.parametrize(*PERMISSIONS)
+    async def test_when_own_permissions_invalidated_during_fetch(
+        self, required_perms: hikari.Permissions, actual_perms: hikari.Permissions
+    ) -> None:
+        mock_context = mock.Mock(tanjun.abc.Context, guild_id=hikari.Snowflake(123), channel_id=hikari.Snowflake(456))
+        mock_context.rest = mock.AsyncMock()
+        own_permissions_cache = tanjun.permissions.OwnPermissionsCache()
+        check = tanjun.checks.OwnPermissionCheck(required_perms)
+
+        async def fetch_permissions(*_: typing.Any, **__: typing.Any) -> hikari.Permissions:
+            own_permissions_cache.clear(123)
+            return actual_perms
+
+        with mock.patch.object(tanjun.permissions, "fetch_permissions", side_effect=fetch_permissions):
+            result = await check(
+                mock_context, member_cache=None, my_user=mock.Mock(), own_permissions_cache=own_permissions_cache
+            )
+
+        assert result is True
+        assert own_permissions_cache.get(123, 456) is None
+
     @pytest.mark.parametrize(*PERMISSIONS)
     async def test_when_no_caches(self, required_perms: hikari.Permissions, actual_perms: hikari.Permissions) -> None:
         mock_context = mock.Mock(tanjun.abc.Context)
@@ -3089,6 +3152,46 @@ def test_with_check(command: mock.Mock) -> None:
     command.add_check.assert_called_once_with(mock_check)
 
 
+def test_set_check_cost() -> None:
+    def check(_: tanjun.abc.Context) -> bool:
+        raise NotImplementedError
+
+    result = tanjun.checks.set_check_cost(check, tanjun.CheckCost.EXPENSIVE)
+
+    assert result is check
+    assert check.__tanjun_check_cost__ is tanjun.CheckCost.EXPENSIVE  # type: ignore
+
+
+def test_set_check_memoisable() -> None:
+    def check(_: tanjun.abc.Context) -> bool:
+        raise NotImplementedError
+
+    result = tanjun.checks.set_check_memoisable(check, False)
+
+    assert result is check
+    assert check.__tanjun_check_memoise__ is False  # type: ignore
+
+
+def test_all_checks_memoisable() -> None:
+    check = tanjun.checks.all_checks(mock.Mock(), mock.Mock())
+
+    assert check.__tanjun_check_memoise__ is True  # type: ignore
+
+
+def test_all_checks_memoisable_when_sub_check_opted_out() -> None:
+    check = tanjun.checks.all_checks(mock.Mock(), tanjun.checks.set_check_memoisable(mock.Mock(), False))
+
+    assert check.__tanjun_check_memoise__ is False  # type: ignore
+
+
+def test_any_checks_memoisable_when_sub_check_opted_out() -> None:
+    check = tanjun.checks.any_checks(
+        mock.Mock(), tanjun.checks.set_check_memoisable(mock.Mock(), False), error_message=None
+    )
+
+    assert check.__tanjun_check_memoise__ is False  # type: ignore
+
+
 @pytest.mark.asyncio
 async def test_all_checks() -> None:
     mock_check_1 = mock.Mock()
@@ -33,12 +33,15 @@
 # pyright: reportPrivateUsage=none
 # This leads to too many false-positives around mocks.
 import asyncio
+import datetime
 import importlib
 import inspect
+import json
 import pathlib
 import shutil
 import tempfile
 import textwrap
+import time
 import typing
 import uuid
 from collections import abc as collections
@@ -48,6 +51,7 @@ import hikari
 import pytest
 
 import tanjun
+from tanjun import _internal
 
 
 class TestMessageAcceptsEnum:
@@ -274,6 +278,11 @@ class TestClient:
     @pytest.mark.skip(reason="TODO")
     def test___init__(self) -> None: ...
 
+    def test___init___sets_rest_flights(self) -> None:
+        client = tanjun.Client(mock.AsyncMock())
+
+        assert isinstance(client.get_type_dependency(_internal.RestFlights), _internal.RestFlights)
+
     @pytest.mark.skip(reason="TODO")
     def test_from_gateway_bot(self) -> None: ...
 
@@ -968,6 +977,142 @@ class TestClient:
             ]
         )
 
+    @pytest.mark.asyncio
+    async def test_check_when_ordered(self) -> None:
+        mock_check_1 = mock.Mock(__tanjun_check_cost__=tanjun.CheckCost.EXPENSIVE)
+        mock_check_2 = mock.Mock()
+        mock_check_3 = mock.Mock()
+        mock_context = mock.Mock()
+        mock_context.call_with_async_di = mock.AsyncMock(side_effect=[False, True])
+        client = (
+            tanjun.Client(mock.Mock())
+            .add_check(mock_check_1)
+            .add_check(mock_check_2)
+            .add_check(mock_check_3)
+            .set_check_mode(tanjun.CheckMode.ORDERED)
+        )
+
+        assert await client.check(mock_context) is False
+
+        mock_context.call_with_async_di.assert_awaited_once_with(mock_check_2, mock_context)
+
+    def test_set_check_mode(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_check_mode(tanjun.CheckMode.ORDERED)
+
+        assert result is client
+        assert client.check_mode is tanjun.CheckMode.ORDERED
+
+    def test_check_mode_default(self) -> None:
+        assert tanjun.Client(mock.Mock()).check_mode is tanjun.CheckMode.GATHER
+
+    def test_set_memoise_checks(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_memoise_checks(True)
+
+        assert result is client
+        assert client.memoises_checks is True
+
+    def test_memoises_checks_default(self) -> None:
+        assert tanjun.Client(mock.Mock()).memoises_checks is False
+
+    def test_set_supersede_autocompletes(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_supersede_autocompletes(True)
+
+        assert result is client
+        assert client.supersedes_autocompletes is True
+
+    def test_supersedes_autocompletes_default(self) -> None:
+        assert tanjun.Client(mock.Mock()).supersedes_autocompletes is False
+
+    def test_set_deduplicate_interactions(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_deduplicate_interactions(True, expire_after=datetime.timedelta(seconds=30), max_size=5)
+
+        assert result is client
+        assert client.deduplicates_interactions is True
+        assert client._seen_interactions is not None
+        assert client._seen_interactions._expire_after == 30
+        assert client._seen_interactions._max_size == 5
+
+    def test_set_deduplicate_interactions_when_false(self) -> None:
+        client = tanjun.Client(mock.Mock()).set_deduplicate_interactions(True)
+
+        result = client.set_deduplicate_interactions(False)
+
+        assert result is client
+        assert client.deduplicates_interactions is False
+
+    @pytest.mark.parametrize("expire_after", [0, -1, datetime.timedelta()])
+    def test_set_deduplicate_interactions_when_expire_after_invalid(
+        self, expire_after: int | datetime.timedelta
+    ) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        with pytest.raises(ValueError, match="expire_after must be more than 0 seconds"):
+            client.set_deduplicate_interactions(True, expire_after=expire_after)
+
+    def test_set_deduplicate_interactions_when_max_size_invalid(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        with pytest.raises(ValueError, match="max_size must be greater than 0"):
+            client.set_deduplicate_interactions(True, max_size=0)
+
+    def test_deduplicates_interactions_default(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        assert client.deduplicates_interactions is False
+        assert client.dropped_duplicate_interactions == 0
+
+    @pytest.mark.asyncio
+    async def test_set_pending_deletions_path(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "deletions.json"
+        mock_rest = mock.AsyncMock()
+        client = tanjun.Client(mock_rest)
+
+        result = client.set_pending_deletions_path(str(path))
+        await client.open()
+        client._delete_scheduler.schedule_message(600, 123, 456)
+        await client.close()
+
+        assert result is client
+        assert len(client._delete_scheduler) == 0
+        assert [entry[:2] for entry in json.loads(path.read_text())] == [[123, 456]]
+
+        await client.open()
+        await client.close()
+
+        assert [entry[:2] for entry in json.loads(path.read_text())] == [[123, 456]]
+        mock_rest.delete_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_open_when_pending_deletions_file_invalid(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "deletions.json"
+        path.write_text("[[123, 4")
+        client = tanjun.Client(mock.AsyncMock()).set_pending_deletions_path(path)
+
+        await client.open()
+
+        assert len(client._delete_scheduler) == 0
+        await client.close()
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_close_doesnt_persist_pending_deletions_by_default(self) -> None:
+        client = tanjun.Client(mock.AsyncMock())
+        await client.open()
+        client._delete_scheduler.schedule_message(600, 123, 456)
+
+        await client.close()
+
+        assert len(client._delete_scheduler) == 1
+        client._delete_scheduler.cancel_messages()
+
     @pytest.mark.skip(reason="TODO")
     def test_add_component(self) -> None: ...
 
@@ -1465,6 +1610,66 @@ class TestClient:
         with pytest.raises(ValueError, match=".+"):
             client.remove_prefix("lmao")
 
+    def test_add_guild_prefix(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        result = client.add_guild_prefix(hikari.Snowflake(123), "aye")
+
+        assert result is client
+        assert client.guild_prefixes == {hikari.Snowflake(123): ["aye"]}
+        assert client.prefixes == []
+
+    def test_add_guild_prefix_when_iterable_and_already_present(self) -> None:
+        client = tanjun.Client(mock.Mock()).add_guild_prefix(hikari.Snowflake(123), ["naye", "laala"])
+
+        result = client.add_guild_prefix(123, ["naye", "OBAMA"])
+
+        assert result is client
+        assert client.guild_prefixes == {hikari.Snowflake(123): ["naye", "laala", "OBAMA"]}
+
+    def test_remove_guild_prefix(self) -> None:
+        client = tanjun.Client(mock.Mock()).add_guild_prefix(hikari.Snowflake(123), ["lmao", "yeet"])
+
+        result = client.remove_guild_prefix(hikari.Snowflake(123), "lmao")
+
+        assert result is client
+        assert client.guild_prefixes == {hikari.Snowflake(123): ["yeet"]}
+
+    def test_remove_guild_prefix_when_last_prefix(self) -> None:
+        client = tanjun.Client(mock.Mock()).add_guild_prefix(hikari.Snowflake(123), "lmao")
+
+        client.remove_guild_prefix(123, "lmao")
+
+        assert client.guild_prefixes == {}
+
+    def test_remove_guild_prefix_when_not_present(self) -> None:
+        client = tanjun.Client(mock.Mock()).add_guild_prefix(hikari.Snowflake(123), "lmao")
+
+        with pytest.raises(ValueError, match="Prefix 'aye' not found"):
+            client.remove_guild_prefix(hikari.Snowflake(123), "aye")
+
+    def test_remove_guild_prefix_when_guild_not_present(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        with pytest.raises(ValueError, match="Prefix 'lmao' not found"):
+            client.remove_guild_prefix(hikari.Snowflake(123), "lmao")
+
+    def test_set_guild_prefixes(self) -> None:
+        client = tanjun.Client(mock.Mock()).add_guild_prefix(hikari.Snowflake(123), ["lmao", "yeet"])
+
+        result = client.set_guild_prefixes(hikari.Snowflake(123), ["ok", "meow"])
+
+        assert result is client
+        assert client.guild_prefixes == {hikari.Snowflake(123): ["ok", "meow"]}
+
+    def test_set_guild_prefixes_when_empty(self) -> None:
+        client = tanjun.Client(mock.Mock()).add_guild_prefix(hikari.Snowflake(123), ["lmao", "yeet"])
+
+        result = client.set_guild_prefixes(hikari.Snowflake(123), [])
+
+        assert result is client
+        assert client.guild_prefixes == {}
+
     def test_set_prefix_getter(self) -> None:
         mock_getter = mock.Mock()
         client = tanjun.Client(mock.Mock())
@@ -1474,6 +1679,17 @@ class TestClient:
         assert result is client
         assert client.prefix_getter is mock_getter
 
+    def test_set_prefix_getter_with_candidate_check(self) -> None:
+        mock_getter = mock.Mock()
+        mock_check = mock.Mock()
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_prefix_getter(mock_getter, candidate_check=mock_check)
+
+        assert result is client
+        assert client.prefix_getter is mock_getter
+        assert client.prefix_candidate_check is mock_check
+
     def test_set_prefix_getter_when_none(self) -> None:
         client = tanjun.Client(mock.Mock()).set_prefix_getter(mock.Mock())
 
@@ -1481,6 +1697,201 @@ class TestClient:
 
         assert result is client
         assert client.prefix_getter is None
+        assert client.prefix_candidate_check is None
+
+    def test_set_prefix_getter_when_cache_expire_after_is_invalid(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        with pytest.raises(ValueError, match="cache_expire_after must be more than 0 seconds"):
+            client.set_prefix_getter(mock.Mock(), cache=True, cache_expire_after=datetime.timedelta(0))
+
+    def test_set_prefix_getter_when_cache_max_size_is_invalid(self) -> None:
+        client = tanjun.Client(mock.Mock())
+
+        with pytest.raises(ValueError, match="cache_max_size must be greater than 0"):
+            client.set_prefix_getter(mock.Mock(), cache=True, cache_max_size=0)
+
+    @pytest.mark.asyncio
+    async def test_check_prefix_when_prefix_getter_uses_longest_prefix(self) -> None:
+        client = tanjun.Client(mock.Mock()).add_prefix("!!!").set_prefix_getter(mock.Mock())
+        mock_ctx = mock.Mock(content="!!!help", call_with_async_di=mock.AsyncMock(return_value=["!", "?", "!!"]))
+
+        assert await client._check_prefix(mock_ctx) == "!!"
+
+    @pytest.mark.asyncio
+    async def test_check_prefix_when_prefix_getter_cached(self) -> None:
+        mock_getter = mock.Mock()
+        client = tanjun.Client(mock.Mock()).set_prefix_getter(mock_getter, cache=True)
+        mock_ctx_1 = mock.Mock(
+            content="!help", guild_id=hikari.Snowflake(123), call_with_async_di=mock.AsyncMock(return_value=["!", "?"])
+        )
+        mock_ctx_2 = mock.Mock(content="?help", guild_id=hikari.Snowflake(123), call_with_async_di=mock.AsyncMock())
+
+        assert await client._check_prefix(mock_ctx_1) == "!"
+        assert await client._check_prefix(mock_ctx_2) == "?"
+
+        mock_ctx_1.call_with_async_di.assert_awaited_once_with(mock_getter, mock_ctx_1)
+        mock_ctx_2.call_with_async_di.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check_prefix_when_prefix_getter_cached_for_dm(self) -> None:
+        client = tanjun.Client(mock.Mock()).set_prefix_getter(mock.Mock(), cache=True)
+        mock_ctx_1 = mock.Mock(
+            content="!help",
+            guild_id=None,
+            channel_id=hikari.Snowflake(543),
+            call_with_async_di=mock.AsyncMock(return_value=["!"]),
+        )
+        mock_ctx_2 = mock.Mock(
+            content="!help",
+            guild_id=None,
+            channel_id=hikari.Snowflake(345),
+            call_with_async_di=mock.AsyncMock(return_value=["?"]),
+        )
+
+        assert await client._check_prefix(mock_ctx_1) == "!"
+        assert await client._check_prefix(mock_ctx_2) is None
+
+        mock_ctx_1.call_with_async_di.assert_awaited_once()
+        mock_ctx_2.call_with_async_di.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_check_prefix_when_prefix_getter_cached_shares_concurrent_calls(self) -> None:
+        event = asyncio.Event()
+        mock_getter = mock.Mock()
+
+        async def call_with_async_di(*_: typing.Any) -> list[str]:
+            await event.wait()
+            return ["!"]
+
+        client = tanjun.Client(mock.Mock()).set_prefix_getter(mock_getter, cache=True)
+        mock_ctx_1 = mock.Mock(
+            content="!help",
+            guild_id=hikari.Snowflake(123),
+            call_with_async_di=mock.Mock(side_effect=call_with_async_di),
+        )
+        mock_ctx_2 = mock.Mock(content="!help", guild_id=hikari.Snowflake(123), call_with_async_di=mock.Mock())
+
+        calls = asyncio.gather(client._check_prefix(mock_ctx_1), client._check_prefix(mock_ctx_2))
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await calls == ["!", "!"]
+        mock_ctx_1.call_with_async_di.assert_called_once_with(mock_getter, mock_ctx_1)
+        mock_ctx_2.call_with_async_di.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check_prefix_when_prefix_getter_cached_falls_back_to_static_prefixes(self) -> None:
+        client = tanjun.Client(mock.Mock()).add_prefix("?").set_prefix_getter(mock.Mock(), cache=True)
+        mock_ctx = mock.Mock(
+            content="?help", guild_id=hikari.Snowflake(123), call_with_async_di=mock.AsyncMock(return_value=["!"])
+        )
+
+        assert await client._check_prefix(mock_ctx) == "?"
+
+    @pytest.mark.asyncio
+    async def test_check_prefix_when_prefix_getter_cache_expired(self) -> None:
+        client = tanjun.Client(mock.Mock()).set_prefix_getter(mock.Mock(), cache=True, cache_expire_after=60)
+        mock_ctx = mock.Mock(
+            content="!help", guild_id=hikari.Snowflake(123), call_with_async_di=mock.AsyncMock(return_value=["!"])
+        )
+
+        with mock.patch.object(time, "monotonic", return_value=100.0):
+            assert await client._check_prefix(mock_ctx) == "!"
+
+        with mock.patch.object(time, "monotonic", return_value=160.0):
+            assert await client._check_prefix(mock_ctx) == "!"
+
+        assert mock_ctx.call_with_async_di.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_prefixes(self) -> None:
+        client = tanjun.Client(mock.Mock()).set_prefix_getter(mock.Mock(), cache=True)
+        mock_ctx_1 = mock.Mock(
+            content="!help", guild_id=hikari.Snowflake(123), call_with_async_di=mock.AsyncMock(return_value=["!"])
+        )
+        mock_ctx_2 = mock.Mock(
+            content="!help", guild_id=hikari.Snowflake(321), call_with_async_di=mock.AsyncMock(return_value=["!"])
+        )
+        await client._check_prefix(mock_ctx_1)
+        await client._check_prefix(mock_ctx_2)
+
+        result = client.invalidate_prefixes(hikari.Snowflake(123))
+
+        assert result is client
+        await client._check_prefix(mock_ctx_1)
+        await client._check_prefix(mock_ctx_2)
+        assert mock_ctx_1.call_with_async_di.await_count == 2
+        assert mock_ctx_2.call_with_async_di.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_prefixes_for_all(self) -> None:
+        client = tanjun.Client(mock.Mock()).set_prefix_getter(mock.Mock(), cache=True)
+        mock_ctx_1 = mock.Mock(
+            content="!help", guild_id=hikari.Snowflake(123), call_with_async_di=mock.AsyncMock(return_value=["!"])
+        )
+        mock_ctx_2 = mock.Mock(
+            content="!help", guild_id=hikari.Snowflake(321), call_with_async_di=mock.AsyncMock(return_value=["!"])
+        )
+        await client._check_prefix(mock_ctx_1)
+        await client._check_prefix(mock_ctx_2)
+
+        result = client.invalidate_prefixes()
+
+        assert result is client
+        await client._check_prefix(mock_ctx_1)
+        await client._check_prefix(mock_ctx_2)
+        assert mock_ctx_1.call_with_async_di.await_count == 2
+        assert mock_ctx_2.call_with_async_di.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_prefixes_during_getter_call(self) -> None:
+        event = asyncio.Event()
+        results = iter((["!"], ["?"]))
+
+        async def call_with_async_di(*_: typing.Any) -> list[str]:
+            await event.wait()
+            return next(results)
+
+        client = tanjun.Client(mock.Mock()).set_prefix_getter(mock.Mock(), cache=True)
+        mock_ctx = mock.Mock(
+            content="?help",
+            guild_id=hikari.Snowflake(123),
+            call_with_async_di=mock.Mock(side_effect=call_with_async_di),
+        )
+
+        first_call = asyncio.create_task(client._check_prefix(mock_ctx))
+        await asyncio.sleep(0)
+        client.invalidate_prefixes(hikari.Snowflake(123))
+        event.set()
+
+        assert await first_call is None
+        assert await client._check_prefix(mock_ctx) == "?"
+        assert mock_ctx.call_with_async_di.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_prefixes_for_other_guild_during_getter_call(self) -> None:
+        event = asyncio.Event()
+
+        async def call_with_async_di(*_: typing.Any) -> list[str]:
+            await event.wait()
+            return ["!"]
+
+        client = tanjun.Client(mock.Mock()).set_prefix_getter(mock.Mock(), cache=True)
+        mock_ctx = mock.Mock(
+            content="!help",
+            guild_id=hikari.Snowflake(123),
+            call_with_async_di=mock.Mock(side_effect=call_with_async_di),
+        )
+
+        first_call = asyncio.create_task(client._check_prefix(mock_ctx))
+        await asyncio.sleep(0)
+        client.invalidate_prefixes(hikari.Snowflake(321))
+        event.set()
+
+        assert await first_call == "!"
+        assert await client._check_prefix(mock_ctx) == "!"
+        mock_ctx.call_with_async_di.assert_called_once()
 
     def test_with_prefix_getter(self) -> None:
         mock_getter = mock.Mock()
@@ -1786,6 +2197,40 @@ class TestClient:
         assert result is client
         assert client.slash_hooks is None
 
+    def test__get_slash_hooks_caches_merged_set(self) -> None:
+        mock_hooks = mock.Mock()
+        mock_slash_hooks = mock.Mock()
+        client = tanjun.Client(mock.Mock()).set_hooks(mock_hooks).set_slash_hooks(mock_slash_hooks)
+
+        result = client._get_slash_hooks()
+
+        assert result == {mock_hooks, mock_slash_hooks}
+        assert client._get_slash_hooks() is result
+
+    def test__get_slash_hooks_after_set_slash_hooks(self) -> None:
+        mock_hooks = mock.Mock()
+        client = tanjun.Client(mock.Mock()).set_hooks(mock_hooks).set_slash_hooks(mock.Mock())
+        client._get_slash_hooks()
+        mock_slash_hooks = mock.Mock()
+
+        client.set_slash_hooks(mock_slash_hooks)
+
+        assert client._get_slash_hooks() == {mock_hooks, mock_slash_hooks}
+
+    def test__get_menu_hooks_after_set_hooks(self) -> None:
+        mock_menu_hooks = mock.Mock()
+        client = tanjun.Client(mock.Mock()).set_hooks(mock.Mock()).set_menu_hooks(mock_menu_hooks)
+        client._get_menu_hooks()
+
+        client.set_hooks(None)
+
+        assert client._get_menu_hooks() == {mock_menu_hooks}
+
+    def test__get_menu_hooks_when_no_hooks(self) -> None:
+        client = tanjun.Client(mock.Mock()).set_hooks(None)
+
+        assert client._get_menu_hooks() is None
+
     def test_load_directory(self) -> None:
         mock_load_modules = mock.Mock()
 
@@ -3616,15 +4061,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.check, mock.AsyncMock)
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.return_value = True
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -3635,6 +4081,218 @@ class TestClient:
         mock_component_2.execute_message.assert_not_called()
         command_dispatch_client.dispatch_client_callback.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_only_tries_components_with_matching_commands(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        class StubComponent(tanjun.Component):
+            _execute_message = mock.AsyncMock()
+
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="!meow  42", respond=mock.AsyncMock()))
+        ctx_maker.return_value.set_content.return_value = ctx_maker.return_value
+        ctx_maker.return_value.content = "meow 42"
+        command = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+        component_1 = StubComponent(name="1").add_message_command(tanjun.MessageCommand(mock.AsyncMock(), "nyan"))
+        component_2 = StubComponent(name="2").add_message_command(command)
+        command_dispatch_client.add_component(component_1).add_component(component_2).add_prefix(
+            "!"
+        ).set_message_ctx_maker(ctx_maker)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+        StubComponent._execute_message.return_value = True
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow  42")))
+
+        StubComponent._execute_message.assert_awaited_once_with(
+            ctx_maker.return_value,
+            [("meow", command)],
+            hooks={command_dispatch_client.hooks, command_dispatch_client.message_hooks},
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_keeps_component_priority(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="!meow  42", respond=mock.AsyncMock()))
+        ctx_maker.return_value.set_content.return_value = ctx_maker.return_value
+        ctx_maker.return_value.content = "meow 42"
+        command_1 = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+        command_2 = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+        component_1 = tanjun.Component(name="1")
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        component_3 = tanjun.Component(name="3").add_message_command(command_2)
+        command_dispatch_client.add_component(component_1).add_component(mock_component).add_component(
+            component_3
+        ).add_prefix("!").set_message_ctx_maker(ctx_maker)
+        # Commands added after the component is added to the client should be tracked.
+        component_1.add_message_command(command_1)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+        mock_component.execute_message.return_value = False
+        call_order: list[typing.Any] = []
+
+        with (
+            mock.patch.object(
+                tanjun.Component,
+                "_execute_message",
+                side_effect=lambda _, candidates, **__: call_order.append(candidates[0][1]) or False,
+            ) as execute_message,
+            mock.patch.object(tanjun.Component, "check_message_name") as check_message_name,
+        ):
+            mock_component.execute_message.side_effect = lambda *_, **__: call_order.append(mock_component)
+            await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow  42")))
+
+        assert call_order == [command_1, mock_component, command_2]
+        assert execute_message.call_count == 2
+        check_message_name.assert_not_called()
+        mock_component.execute_message.assert_awaited_once_with(
+            ctx_maker.return_value, hooks={command_dispatch_client.hooks, command_dispatch_client.message_hooks}
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_calls_overridden_execute_message(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        class StubComponent(tanjun.Component):
+            _execute_message = mock.AsyncMock()
+            execute_message = mock.AsyncMock(return_value=True)
+
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="!meow  42", respond=mock.AsyncMock()))
+        ctx_maker.return_value.set_content.return_value = ctx_maker.return_value
+        ctx_maker.return_value.content = "meow 42"
+        component = StubComponent().add_message_command(tanjun.MessageCommand(mock.AsyncMock(), "nyan"))
+        command_dispatch_client.add_component(component).add_prefix("!").set_message_ctx_maker(ctx_maker)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow  42")))
+
+        StubComponent.execute_message.assert_awaited_once_with(
+            ctx_maker.return_value, hooks={command_dispatch_client.hooks, command_dispatch_client.message_hooks}
+        )
+        StubComponent._execute_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_when_check_message_name_overridden(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        class StubComponent(tanjun.Component):
+            _execute_message = mock.AsyncMock()
+            execute_message = mock.AsyncMock(return_value=True)
+
+            def check_message_name(
+                self, content: str, /, *, case_sensitive: bool = True
+            ) -> collections.Iterator[tuple[str, tanjun.MessageCommand[typing.Any]]]:
+                raise NotImplementedError
+
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="!meow  42", respond=mock.AsyncMock()))
+        ctx_maker.return_value.set_content.return_value = ctx_maker.return_value
+        ctx_maker.return_value.content = "meow 42"
+        command_dispatch_client.add_component(StubComponent()).add_prefix("!").set_message_ctx_maker(ctx_maker)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow  42")))
+
+        StubComponent.execute_message.assert_awaited_once_with(
+            ctx_maker.return_value, hooks={command_dispatch_client.hooks, command_dispatch_client.message_hooks}
+        )
+        StubComponent._execute_message.assert_not_called()
+
+    def test_remove_component_stops_tracking_app_commands(self) -> None:
+        component = tanjun.Component()
+        client = tanjun.Client(mock.Mock()).add_component(component)
+
+        client.remove_component(component)
+        component.add_slash_command(tanjun.SlashCommand(mock.AsyncMock(), "meow", "meow"))
+
+        assert client._app_command_routes.find_slash("meow") == ()
+        assert component._app_command_routes == []
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_ignores_removed_component(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        class StubComponent(tanjun.Component):
+            _execute_message = mock.AsyncMock()
+
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="!meow  42", respond=mock.AsyncMock()))
+        ctx_maker.return_value.set_content.return_value = ctx_maker.return_value
+        ctx_maker.return_value.content = "meow 42"
+        component = StubComponent().add_message_command(tanjun.MessageCommand(mock.AsyncMock(), "meow"))
+        command_dispatch_client.add_component(component).add_prefix("!").set_message_ctx_maker(ctx_maker)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        command_dispatch_client.remove_component(component)
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow  42")))
+
+        StubComponent._execute_message.assert_not_called()
+        command_dispatch_client.dispatch_client_callback.assert_awaited_once_with(
+            tanjun.ClientCallbackNames.MESSAGE_COMMAND_NOT_FOUND, ctx_maker.return_value
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_uses_longest_prefix(self, command_dispatch_client: tanjun.Client) -> None:
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="!!  42", respond=mock.AsyncMock()))
+        ctx_maker.return_value.set_content.return_value = ctx_maker.return_value
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.add_component(mock_component).add_prefix(["!", "!!"]).set_message_ctx_maker(ctx_maker)
+        mock_component.execute_message.return_value = True
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+        mock_event = mock.Mock(message=mock.Mock(content="!!  42"))
+
+        await command_dispatch_client.on_message_create_event(mock_event)
+
+        ctx_maker.return_value.set_content.assert_called_once_with("42")
+        ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!!")
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_when_guild_prefix(self, command_dispatch_client: tanjun.Client) -> None:
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="bot!  42", respond=mock.AsyncMock()))
+        ctx_maker.return_value.set_content.return_value = ctx_maker.return_value
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.add_component(mock_component).add_prefix("bot").add_guild_prefix(
+            hikari.Snowflake(654), "bot!"
+        ).set_message_ctx_maker(ctx_maker)
+        mock_component.execute_message.return_value = True
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+        mock_event = mock.Mock(message=mock.Mock(content="bot!  42", guild_id=hikari.Snowflake(654)))
+
+        await command_dispatch_client.on_message_create_event(mock_event)
+
+        ctx_maker.assert_called_once_with(
+            client=command_dispatch_client,
+            content="bot!  42",
+            message=mock_event.message,
+            register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
+        )
+        ctx_maker.return_value.set_content.assert_called_once_with("42")
+        ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("bot!")
+        mock_component.execute_message.assert_awaited_once_with(
+            ctx_maker.return_value, hooks={command_dispatch_client.hooks, command_dispatch_client.message_hooks}
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_when_guild_prefix_for_other_guild(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        ctx_maker = mock.Mock()
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.add_component(mock_component).add_guild_prefix(
+            hikari.Snowflake(654), "bot!"
+        ).set_message_ctx_maker(ctx_maker)
+        mock_event = mock.Mock(message=mock.Mock(content="bot!  42", guild_id=hikari.Snowflake(321)))
+
+        await command_dispatch_client.on_message_create_event(mock_event)
+
+        ctx_maker.assert_not_called()
+        mock_component.execute_message.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_on_message_create_event_when_prefix_getter(self, command_dispatch_client: tanjun.Client) -> None:
         ctx_maker = mock.Mock(return_value=mock.Mock(content="!  42", respond=mock.AsyncMock()))
@@ -3659,6 +4317,7 @@ class TestClient:
             content="eye",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -3701,14 +4360,98 @@ class TestClient:
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
+        ctx_maker.assert_not_called()
+        mock_component_1.execute_message.assert_not_called()
+        mock_component_2.execute_message.assert_not_called()
+        command_dispatch_client.dispatch_client_callback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_when_prefix_candidate_check(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="!  42", respond=mock.AsyncMock()))
+        ctx_maker.return_value.set_content.return_value = ctx_maker.return_value
+        ctx_maker.return_value.call_with_async_di = mock.AsyncMock(return_value=["sex", "!"])
+        prefix_getter = mock.Mock()
+        candidate_check = mock.Mock(return_value=True)
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.add_component(mock_component).set_message_ctx_maker(ctx_maker).set_prefix_getter(
+            prefix_getter, candidate_check=candidate_check
+        )
+        mock_component.execute_message.return_value = True
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+
+        await command_dispatch_client.on_message_create_event(mock_event)
+
+        candidate_check.assert_called_once_with(mock_event.message)
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
             content="eye",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
-        mock_component_1.execute_message.assert_not_called()
-        mock_component_2.execute_message.assert_not_called()
+        ctx_maker.return_value.call_with_async_di.assert_awaited_once_with(prefix_getter, ctx_maker.return_value)
+        ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
+        mock_component.execute_message.assert_awaited_once_with(
+            ctx_maker.return_value, hooks={command_dispatch_client.hooks, command_dispatch_client.message_hooks}
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_when_prefix_candidate_check_fails_but_static_prefix_matches(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="!  42", respond=mock.AsyncMock()))
+        ctx_maker.return_value.set_content.return_value = ctx_maker.return_value
+        ctx_maker.return_value.call_with_async_di = mock.AsyncMock()
+        prefix_getter = mock.Mock()
+        candidate_check = mock.Mock(return_value=False)
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.add_component(mock_component).add_prefix("!").set_message_ctx_maker(
+            ctx_maker
+        ).set_prefix_getter(prefix_getter, candidate_check=candidate_check)
+        mock_component.execute_message.return_value = True
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
+
+        await command_dispatch_client.on_message_create_event(mock_event)
+
+        candidate_check.assert_called_once_with(mock_event.message)
+        ctx_maker.assert_called_once_with(
+            client=command_dispatch_client,
+            content="!  42",
+            message=mock_event.message,
+            register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
+        )
+        ctx_maker.return_value.call_with_async_di.assert_not_called()
+        ctx_maker.return_value.set_content.assert_called_once_with("42")
+        ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
+        mock_component.execute_message.assert_awaited_once_with(
+            ctx_maker.return_value, hooks={command_dispatch_client.hooks, command_dispatch_client.message_hooks}
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_message_create_event_when_prefix_candidate_check_fails(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        ctx_maker = mock.Mock()
+        candidate_check = mock.Mock(return_value=False)
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.add_component(mock_component).add_prefix("!").set_message_ctx_maker(
+            ctx_maker
+        ).set_prefix_getter(mock.Mock(), candidate_check=candidate_check)
+        assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
+        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+
+        await command_dispatch_client.on_message_create_event(mock_event)
+
+        candidate_check.assert_called_once_with(mock_event.message)
+        ctx_maker.assert_not_called()
+        mock_component.execute_message.assert_not_called()
         command_dispatch_client.dispatch_client_callback.assert_not_called()
 
     @pytest.mark.asyncio
@@ -3733,6 +4476,7 @@ class TestClient:
             content="eye",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         mock_component_1.execute_message.assert_not_called()
         mock_component_2.execute_message.assert_not_called()
@@ -3754,15 +4498,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.check, mock.AsyncMock)
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.return_value = True
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -3788,15 +4533,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.check, mock.AsyncMock)
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.return_value = True
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -3820,15 +4566,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.check, mock.AsyncMock)
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.return_value = True
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -3852,15 +4599,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.side_effect = tanjun.CommandError("eee")
         command_dispatch_client.check.side_effect.send = mock.AsyncMock()
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -3884,15 +4632,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.check, mock.AsyncMock)
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.side_effect = tanjun.HaltExecution()
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -3917,15 +4666,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.check, mock.AsyncMock)
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.return_value = False
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -3953,15 +4703,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.check, mock.AsyncMock)
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.return_value = True
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -3991,15 +4742,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.check, mock.AsyncMock)
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.return_value = True
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -4028,15 +4780,16 @@ class TestClient:
         assert isinstance(command_dispatch_client.check, mock.AsyncMock)
         assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
         command_dispatch_client.check.return_value = True
-        mock_event = mock.Mock(message=mock.Mock(content="eye"))
+        mock_event = mock.Mock(message=mock.Mock(content="!  42"))
 
         await command_dispatch_client.on_message_create_event(mock_event)
 
         ctx_maker.assert_called_once_with(
             client=command_dispatch_client,
-            content="eye",
+            content="!  42",
             message=mock_event.message,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
         )
         ctx_maker.return_value.set_content.assert_called_once_with("42")
         ctx_maker.return_value.set_triggering_prefix.assert_called_once_with("!")
@@ -4164,6 +4917,41 @@ class TestClient:
         mock_component_2.execute_autocomplete.assert_awaited_once_with(mock_make_ctx.return_value)
         mock_component_3.execute_autocomplete.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_on_gateway_autocomplete_create_when_duplicate(self, command_dispatch_client: tanjun.Client) -> None:
+        mock_component = mock.Mock(execute_autocomplete=mock.AsyncMock())
+        mock_make_ctx = mock.Mock()
+        (
+            command_dispatch_client.set_autocomplete_ctx_maker(mock_make_ctx)
+            .add_component(mock_component)
+            .set_deduplicate_interactions(True)
+        )
+        mock_interaction = mock.Mock(id=hikari.Snowflake(123321))
+
+        await command_dispatch_client.on_gateway_autocomplete_create(mock_interaction)
+        await command_dispatch_client.on_gateway_autocomplete_create(mock_interaction)
+
+        mock_make_ctx.assert_called_once_with(command_dispatch_client, mock_interaction)
+        mock_component.execute_autocomplete.assert_awaited_once_with(mock_make_ctx.return_value)
+        assert command_dispatch_client.dropped_duplicate_interactions == 1
+
+    @pytest.mark.asyncio
+    async def test_on_gateway_command_create_when_duplicate(self, command_dispatch_client: tanjun.Client) -> None:
+        mock_make_ctx = mock.Mock()
+        command_dispatch_client.set_slash_ctx_maker(mock_make_ctx).set_deduplicate_interactions(True)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = False
+        mock_interaction = mock.Mock(
+            hikari.CommandInteraction, id=hikari.Snowflake(5431), command_type=hikari.CommandType.SLASH
+        )
+        command_dispatch_client._seen_interactions.add(mock_interaction.id)
+
+        await command_dispatch_client.on_gateway_command_create(mock_interaction)
+
+        mock_make_ctx.assert_not_called()
+        command_dispatch_client.check.assert_not_called()
+        assert command_dispatch_client.dropped_duplicate_interactions == 1
+
     @pytest.mark.asyncio
     async def test_on_gateway_autocomplete_create_when_not_found(self, command_dispatch_client: tanjun.Client) -> None:
         mock_component_1 = mock.Mock(execute_autocomplete=mock.Mock(return_value=None))
@@ -4185,6 +4973,190 @@ class TestClient:
         mock_component_2.execute_autocomplete.assert_called_once_with(mock_make_ctx.return_value)
         mock_component_3.execute_autocomplete.assert_called_once_with(mock_make_ctx.return_value)
 
+    @pytest.mark.asyncio
+    async def test_on_gateway_autocomplete_create_only_tries_components_with_matching_command(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        component_1 = tanjun.Component().add_slash_command(tanjun.SlashCommand(mock.AsyncMock(), "nyan", "meow"))
+        component_2 = tanjun.Component()
+        mock_component = mock.Mock(execute_autocomplete=mock.Mock(return_value=None))
+        command_dispatch_client.set_autocomplete_ctx_maker(mock.Mock()).add_component(component_1).add_component(
+            component_2
+        ).add_component(mock_component)
+        component_2.add_slash_command(tanjun.SlashCommand(mock.AsyncMock(), "meow", "meow"))
+
+        with mock.patch.object(
+            tanjun.Component, "execute_autocomplete", autospec=True, side_effect=mock.AsyncMock()
+        ) as execute_autocomplete:
+            await command_dispatch_client.on_gateway_autocomplete_create(mock.Mock(command_name="meow"))
+
+        execute_autocomplete.assert_called_once_with(component_2, mock.ANY)
+        mock_component.execute_autocomplete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_gateway_autocomplete_create_when_superseded(self, command_dispatch_client: tanjun.Client) -> None:
+        started = asyncio.Event()
+        cancelled = False
+
+        async def execute_autocomplete(ctx: tanjun.abc.AutocompleteContext) -> None:
+            nonlocal cancelled
+            if ctx is first_ctx:
+                started.set()
+                try:
+                    await asyncio.Event().wait()
+
+                except asyncio.CancelledError:
+                    cancelled = True
+                    raise
+
+        first_ctx = mock.Mock(triggering_name="meow", author=mock.Mock(id=123), focused=mock.Mock())
+        second_ctx = mock.Mock(triggering_name="meow", author=mock.Mock(id=123), focused=first_ctx.focused)
+        mock_component = mock.Mock(execute_autocomplete=mock.Mock(side_effect=execute_autocomplete))
+        (
+            command_dispatch_client.set_autocomplete_ctx_maker(mock.Mock(side_effect=[first_ctx, second_ctx]))
+            .set_supersede_autocompletes(True)
+            .add_component(mock_component)
+        )
+
+        first_task = asyncio.create_task(command_dispatch_client.on_gateway_autocomplete_create(mock.Mock()))
+        await started.wait()
+        await command_dispatch_client.on_gateway_autocomplete_create(mock.Mock())
+
+        assert await first_task is None
+        assert cancelled is True
+        assert command_dispatch_client._autocomplete_tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_on_gateway_autocomplete_create_when_superseding_and_different_option(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def execute_autocomplete(ctx: tanjun.abc.AutocompleteContext) -> None:
+            if ctx is first_ctx:
+                started.set()
+                await release.wait()
+
+            else:
+                release.set()
+
+        first_ctx = mock.Mock(triggering_name="meow", author=mock.Mock(id=123))
+        second_ctx = mock.Mock(triggering_name="meow", author=mock.Mock(id=123))
+        mock_component = mock.Mock(execute_autocomplete=mock.Mock(side_effect=execute_autocomplete))
+        (
+            command_dispatch_client.set_autocomplete_ctx_maker(mock.Mock(side_effect=[first_ctx, second_ctx]))
+            .set_supersede_autocompletes(True)
+            .add_component(mock_component)
+        )
+
+        first_task = asyncio.create_task(command_dispatch_client.on_gateway_autocomplete_create(mock.Mock()))
+        await started.wait()
+        await command_dispatch_client.on_gateway_autocomplete_create(mock.Mock())
+
+        assert await asyncio.wait_for(first_task, timeout=1) is None
+
+    @pytest.mark.asyncio
+    async def test_on_gateway_autocomplete_create_when_superseding_and_callback_raises(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        mock_component = mock.Mock(execute_autocomplete=mock.AsyncMock(side_effect=LookupError))
+        (
+            command_dispatch_client.set_autocomplete_ctx_maker(mock.Mock())
+            .set_supersede_autocompletes(True)
+            .add_component(mock_component)
+        )
+
+        with pytest.raises(LookupError):
+            await command_dispatch_client.on_gateway_autocomplete_create(mock.Mock())
+
+    @pytest.mark.asyncio
+    async def test_on_gateway_command_create_only_tries_components_with_matching_slash_command(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        mock_ctx_maker = mock.Mock(
+            return_value=mock.Mock(
+                tanjun.context.SlashContext,
+                respond=mock.AsyncMock(),
+                mark_not_found=mock.AsyncMock(),
+                type=hikari.CommandType.SLASH,
+            )
+        )
+        mock_ctx_maker.return_value.interaction.command_name = "meow"
+        component_1 = tanjun.Component().add_slash_command(tanjun.SlashCommand(mock.AsyncMock(), "nyan", "meow"))
+        component_2 = tanjun.Component()
+        component_3 = tanjun.Component()
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        mock_component.execute_slash.return_value = None
+        (
+            command_dispatch_client.set_slash_ctx_maker(mock_ctx_maker)
+            .add_component(component_1)
+            .add_component(component_2)
+            .add_component(mock_component)
+            .add_component(component_3)
+        )
+        component_2.add_slash_command(tanjun.SlashCommand(mock.AsyncMock(), "meow", "meow"))
+        command = tanjun.SlashCommand(mock.AsyncMock(), "meow", "meow")
+        component_3.add_slash_command(command).remove_slash_command(command)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+        mock_interaction = mock.Mock(hikari.CommandInteraction, command_type=hikari.CommandType.SLASH)
+
+        with mock.patch.object(
+            tanjun.Component, "execute_slash", autospec=True, side_effect=mock.AsyncMock(return_value=None)
+        ) as execute_slash:
+            await command_dispatch_client.on_gateway_command_create(mock_interaction)
+
+        execute_slash.assert_called_once_with(
+            component_2,
+            mock_ctx_maker.return_value,
+            hooks={command_dispatch_client.hooks, command_dispatch_client.slash_hooks},
+        )
+        mock_component.execute_slash.assert_awaited_once_with(
+            mock_ctx_maker.return_value, hooks={command_dispatch_client.hooks, command_dispatch_client.slash_hooks}
+        )
+        mock_ctx_maker.return_value.mark_not_found.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_on_gateway_command_create_only_tries_components_with_matching_menu_command(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        mock_ctx_maker = mock.Mock(
+            return_value=mock.Mock(
+                tanjun.context.MenuContext,
+                respond=mock.AsyncMock(),
+                mark_not_found=mock.AsyncMock(),
+                type=hikari.CommandType.USER,
+            )
+        )
+        mock_ctx_maker.return_value.interaction.command_name = "meow"
+        component_1 = tanjun.Component().add_menu_command(tanjun.as_message_menu("meow")(mock.AsyncMock()))
+        component_2 = tanjun.Component().add_menu_command(tanjun.as_user_menu("meow")(mock.AsyncMock()))
+        component_3 = tanjun.Component().add_menu_command(tanjun.as_user_menu("nyan")(mock.AsyncMock()))
+        (
+            command_dispatch_client.set_menu_ctx_maker(mock_ctx_maker)
+            .add_component(component_1)
+            .add_component(component_2)
+            .add_component(component_3)
+        )
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+        mock_interaction = mock.Mock(hikari.CommandInteraction, command_type=hikari.CommandType.USER)
+        mock_future = mock.AsyncMock()
+
+        with mock.patch.object(
+            tanjun.Component, "execute_menu", autospec=True, side_effect=mock.AsyncMock(return_value=mock_future())
+        ) as execute_menu:
+            await command_dispatch_client.on_gateway_command_create(mock_interaction)
+
+        execute_menu.assert_called_once_with(
+            component_2,
+            mock_ctx_maker.return_value,
+            hooks={command_dispatch_client.hooks, command_dispatch_client.menu_hooks},
+        )
+        mock_future.assert_awaited_once_with()
+        mock_ctx_maker.return_value.mark_not_found.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_on_gateway_command_create_for_slash_command(self, command_dispatch_client: tanjun.Client) -> None:
         mock_ctx_maker = mock.Mock(
@@ -4217,6 +5189,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4268,6 +5241,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=True,
         )
@@ -4314,6 +5288,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4363,6 +5338,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4408,6 +5384,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4457,6 +5434,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4503,6 +5481,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4550,6 +5529,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4593,6 +5573,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4636,6 +5617,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4683,6 +5665,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4729,6 +5712,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_slash_not_found,
             default_to_ephemeral=False,
         )
@@ -4770,6 +5754,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -4821,6 +5806,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=True,
         )
@@ -4867,6 +5853,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -4916,6 +5903,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -4961,6 +5949,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -5010,6 +5999,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -5056,6 +6046,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -5103,6 +6094,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -5142,6 +6134,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -5185,6 +6178,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -5232,6 +6226,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -5278,6 +6273,7 @@ class TestClient:
             client=command_dispatch_client,
             interaction=mock_interaction,
             register_task=command_dispatch_client._add_task,
+            delete_scheduler=command_dispatch_client._delete_scheduler,
             on_not_found=command_dispatch_client._on_menu_not_found,
             default_to_ephemeral=False,
         )
@@ -5364,6 +6360,36 @@ class TestClient:
         command_dispatch_client.on_gateway_command_create.assert_not_called()
         command_dispatch_client.on_gateway_autocomplete_create.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_on_autocomplete_interaction_request_when_duplicate(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        mock_make_ctx = mock.Mock()
+        command_dispatch_client.set_autocomplete_ctx_maker(mock_make_ctx).set_deduplicate_interactions(True)
+        mock_interaction = mock.Mock(id=hikari.Snowflake(123321))
+        command_dispatch_client._seen_interactions.add(mock_interaction.id)
+
+        result = await command_dispatch_client.on_autocomplete_interaction_request(mock_interaction)
+
+        assert result is None
+        mock_make_ctx.assert_not_called()
+        assert command_dispatch_client.dropped_duplicate_interactions == 1
+
+    @pytest.mark.asyncio
+    async def test_on_command_interaction_request_when_duplicate(self, command_dispatch_client: tanjun.Client) -> None:
+        mock_make_ctx = mock.Mock()
+        command_dispatch_client.set_slash_ctx_maker(mock_make_ctx).set_deduplicate_interactions(True)
+        mock_interaction = mock.Mock(
+            hikari.CommandInteraction, id=hikari.Snowflake(5431), command_type=hikari.CommandType.SLASH
+        )
+        command_dispatch_client._seen_interactions.add(mock_interaction.id)
+
+        result = await command_dispatch_client.on_command_interaction_request(mock_interaction)
+
+        assert result is None
+        mock_make_ctx.assert_not_called()
+        assert command_dispatch_client.dropped_duplicate_interactions == 1
+
     @pytest.mark.asyncio
     async def test_on_autocomplete_interaction_request(self, command_dispatch_client: tanjun.Client) -> None:
         mock_result = mock.Mock()
@@ -5430,6 +6456,46 @@ class TestClient:
         mock_component_3.execute_autocomplete.assert_not_called()
         mock_add_task.assert_called_once_with(task)
 
+    @pytest.mark.asyncio
+    async def test_on_autocomplete_interaction_request_when_superseded(
+        self, command_dispatch_client: tanjun.Client
+    ) -> None:
+        started = asyncio.Event()
+        cancelled = False
+        mock_result = mock.Mock()
+
+        async def execute_autocomplete(ctx: tanjun.abc.AutocompleteContext) -> None:
+            nonlocal cancelled
+            if ctx is first_ctx:
+                started.set()
+                try:
+                    await asyncio.Event().wait()
+
+                except asyncio.CancelledError:
+                    cancelled = True
+                    raise
+
+            mock_make_ctx.call_args.kwargs["future"].set_result(mock_result)
+
+        first_ctx = mock.Mock(triggering_name="meow", author=mock.Mock(id=123), focused=mock.Mock())
+        second_ctx = mock.Mock(triggering_name="meow", author=mock.Mock(id=123), focused=first_ctx.focused)
+        mock_make_ctx = mock.Mock(side_effect=[first_ctx, second_ctx])
+        mock_component = mock.Mock(execute_autocomplete=mock.Mock(side_effect=execute_autocomplete))
+        (
+            command_dispatch_client.set_autocomplete_ctx_maker(mock_make_ctx)
+            .set_supersede_autocompletes(True)
+            .add_component(mock_component)
+        )
+
+        first_task = asyncio.create_task(command_dispatch_client.on_autocomplete_interaction_request(mock.Mock()))
+        await started.wait()
+        result = await command_dispatch_client.on_autocomplete_interaction_request(mock.Mock())
+
+        assert result is mock_result
+        assert await first_task is None
+        assert cancelled is True
+        assert command_dispatch_client._autocomplete_tasks == {}
+
     @pytest.mark.asyncio
     async def test_on_autocomplete_interaction_request_when_not_found(
         self, command_dispatch_client: tanjun.Client
@@ -5504,8 +6570,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -5569,8 +6636,9 @@ class TestClient:
             await command_dispatch_client.on_command_interaction_request(mock_interaction)
 
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -5635,8 +6703,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -5691,8 +6760,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -5757,8 +6827,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -5819,8 +6890,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -5885,8 +6957,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -5940,8 +7013,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -5992,8 +7066,9 @@ class TestClient:
             await command_dispatch_client.on_command_interaction_request(mock_interaction)
 
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -6049,8 +7124,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -6101,8 +7177,9 @@ class TestClient:
             await command_dispatch_client.on_command_interaction_request(mock_interaction)
 
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -6153,8 +7230,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -6208,8 +7286,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -6265,8 +7344,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -6320,8 +7400,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_slash_not_found
@@ -6379,8 +7460,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6444,8 +7526,9 @@ class TestClient:
             await command_dispatch_client.on_command_interaction_request(mock_interaction)
 
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6510,8 +7593,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6566,8 +7650,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6632,8 +7717,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6694,8 +7780,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6760,8 +7847,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6815,8 +7903,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6867,8 +7956,9 @@ class TestClient:
             await command_dispatch_client.on_command_interaction_request(mock_interaction)
 
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6924,8 +8014,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -6976,8 +8067,9 @@ class TestClient:
             await command_dispatch_client.on_command_interaction_request(mock_interaction)
 
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -7028,8 +8120,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -7083,8 +8176,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -7140,8 +8234,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -7195,8 +8290,9 @@ class TestClient:
 
         assert result is mock_result
         assert not mock_ctx_maker.call_args.args
-        assert len(mock_ctx_maker.call_args.kwargs) == 6
+        assert len(mock_ctx_maker.call_args.kwargs) == 7
         assert mock_ctx_maker.call_args.kwargs["client"] is command_dispatch_client
+        assert mock_ctx_maker.call_args.kwargs["delete_scheduler"] is command_dispatch_client._delete_scheduler
         assert mock_ctx_maker.call_args.kwargs["interaction"] is mock_interaction
         assert mock_ctx_maker.call_args.kwargs["register_task"] == command_dispatch_client._add_task
         assert mock_ctx_maker.call_args.kwargs["on_not_found"] == command_dispatch_client._on_menu_not_found
@@ -219,6 +219,14 @@ class TestComponent:
         ):
             component.load_from_scope()
 
+    def test_set_check_mode(self) -> None:
+        component = tanjun.Component()
+
+        result = component.set_check_mode(tanjun.CheckMode.ORDERED)
+
+        assert result is component
+        assert component.check_mode is tanjun.CheckMode.ORDERED
+
     def test_set_default_app_command_permissions(self) -> None:
         component = tanjun.Component().set_default_app_command_permissions(3123)
 
@@ -1622,6 +1630,20 @@ class TestComponent:
     @pytest.mark.skip(reason="TODO")
     def test_execute_message(self) -> None: ...  # Includes _check_message_context and _check_context
 
+    @pytest.mark.asyncio
+    async def test_execute_message_copies_cached_hooks_for_non_standard_command(self) -> None:
+        mock_hooks = mock.Mock()
+        mock_command = mock.AsyncMock()
+        mock_command.check_context.return_value = True
+        mock_command.execute.side_effect = lambda _, *, hooks: hooks.add(mock.Mock())
+        component = tanjun.Component().set_message_hooks(mock_hooks)
+
+        await component._execute_message(mock.Mock(content="meow nyan"), [("meow", mock_command)], hooks=None)
+        await component._execute_message(mock.Mock(content="meow nyan"), [("meow", mock_command)], hooks=None)
+
+        assert mock_command.execute.await_count == 2
+        assert component._merged_message_hooks.merge(None, mock_hooks) == {mock_hooks}
+
     @pytest.mark.skip(reason="TODO")
     def test_execute_slash(self) -> None: ...  # includes _execute_interaction, and _check_context
 
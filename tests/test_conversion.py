@@ -1226,6 +1226,18 @@ class TestToMember:
         mock_context.rest.fetch_member.assert_awaited_once_with(mock_context.guild_id, 5123123)
         mock_context.rest.search_members.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test___call___when_cacheless_and_rest_flights(self) -> None:
+        mock_context = mock.Mock(rest=mock.AsyncMock(), guild_id=hikari.Snowflake(123))
+        mock_context.cache = None
+        mock_flights = mock.AsyncMock()
+
+        result = await tanjun.to_member("5123123", mock_context, rest_flights=mock_flights)
+
+        assert result is mock_flights.fetch_member.return_value
+        mock_flights.fetch_member.assert_awaited_once_with(123, 5123123)
+        mock_context.rest.fetch_member.assert_not_called()
+
     @pytest.mark.asyncio
     async def test___call___when_mock_cache_raises_not_found(self) -> None:
         mock_context = mock.Mock(rest=mock.AsyncMock())
@@ -28,14 +28,90 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+# pyright: reportPrivateUsage=none
 # pyright: reportUnknownMemberType=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
+import inspect
+import typing
+from unittest import mock
+
 import pytest
 
+import tanjun
+from tanjun import parsing
 
-@pytest.mark.skip(reason="TODO")
-class TestShlexTokenizer: ...
+
+class TestShlexTokenizer:
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("", []),
+            ("   ", []),
+            ("meow nyaa", ["meow", "nyaa"]),
+            ("  meow   nyaa  ", ["meow", "nyaa"]),
+            ('"meow nyaa" echo', ["meow nyaa", "echo"]),
+            ('meow" nyaa "echo', ["meow nyaa echo"]),
+            ('""', [""]),
+            ('"" meow', ["", "meow"]),
+            ("meow\\ nyaa", ["meow nyaa"]),
+            ('\\"meow\\"', ['"meow"']),
+            ('"\\"meow\\\\"', ['"meow\\']),
+            ('"meow\\n"', ["meow\\n"]),
+            ("meow\\n", ["meown"]),
+            ("'meow nyaa'", ["'meow", "nyaa'"]),
+            ("meow\nnyaa\tbin", ["meow\nnyaa\tbin"]),
+        ],
+    )
+    def test_iter_raw_arguments(self, content: str, expected: list[str]) -> None:
+        assert list(parsing._ShlexTokenizer(content).iter_raw_arguments()) == expected
+
+    @pytest.mark.parametrize(
+        ("content", "error_message"),
+        [
+            ('meow "nyaa', "No closing quotation"),
+            ('meow nyaa"', "No closing quotation"),
+            ("meow nyaa\\", "No escaped character"),
+            ('meow "nyaa\\', "No escaped character"),
+        ],
+    )
+    def test_iter_raw_arguments_when_invalid(self, content: str, error_message: str) -> None:
+        with pytest.raises(tanjun.ParserError) as exc:
+            list(parsing._ShlexTokenizer(content).iter_raw_arguments())
+
+        assert exc.value.message == error_message
+
+    def test_iter_raw_arguments_is_lazy(self) -> None:
+        arguments = parsing._ShlexTokenizer('meow nyaa "echo').iter_raw_arguments()
+
+        assert next(arguments) == "meow"
+        assert next(arguments) == "nyaa"
+
+        with pytest.raises(tanjun.ParserError):
+            next(arguments)
+
+    def test_collect_raw_options(self) -> None:
+        tokenizer = parsing._ShlexTokenizer('meow --name nyaa -f "--echo" "bye bye" --name boop --empty')
+
+        assert tokenizer.collect_raw_options() == {
+            "--name": ["nyaa", "boop"],
+            "-f": [None],
+            "--echo": ["bye bye"],
+            "--empty": [None],
+        }
+        assert list(tokenizer.iter_raw_arguments()) == ["meow"]
+
+    def test_interleaved(self) -> None:
+        tokenizer = parsing._ShlexTokenizer("a --opt b c -x d e")
+
+        assert tokenizer.next_raw_option() == ("--opt", "b")
+        assert tokenizer.next_raw_argument() == "a"
+        assert tokenizer.next_raw_option() == ("-x", "d")
+        assert tokenizer.next_raw_argument() == "c"
+        assert tokenizer.next_raw_argument() == "e"
+        assert tokenizer.next_raw_argument() is None
+        assert tokenizer.next_raw_option() is None
 
 
 @pytest.mark.skip(reason="TODO")
@@ -75,4 +151,126 @@ class TestArgument: ...
 class TestOption: ...
 
 
-class TestShlexParser: ...
+def _make_context(content: str, /) -> mock.Mock:
+    async def call_with_async_di(callback: typing.Any, *args: typing.Any) -> typing.Any:
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            return await result
+
+        return result
+
+    return mock.Mock(content=content, call_with_async_di=call_with_async_di)
+
+
+class TestShlexParser:
+    def test_converts_concurrently(self) -> None:
+        assert parsing.ShlexParser(concurrent_conversion=True).converts_concurrently is True
+
+    def test_converts_concurrently_default(self) -> None:
+        assert parsing.ShlexParser().converts_concurrently is False
+
+    @pytest.mark.parametrize("concurrent_conversion", [True, False])
+    @pytest.mark.asyncio
+    async def test_parse(self, concurrent_conversion: bool) -> None:
+        parser = (
+            parsing.ShlexParser(concurrent_conversion=concurrent_conversion)
+            .add_argument("a", converters=int)
+            .add_argument("b", default="meow")
+            .add_option("c", "--c", converters=int, default=None)
+            .add_option("d", "--d", default=None, multi=True)
+            .add_argument("e", multi=True, converters=float)
+        )
+
+        result = await parser.parse(_make_context("1 --c 3 --d x --d y 2 1.5 2.5"))
+
+        assert result == {"a": 1, "b": "2", "c": 3, "d": ["x", "y"], "e": [1.5, 2.5]}
+
+    @pytest.mark.asyncio
+    async def test_parse_when_concurrent_converts_concurrently(self) -> None:
+        started = 0
+        event = asyncio.Event()
+
+        async def converter(value: str) -> str:
+            nonlocal started
+            started += 1
+            if started == 3:
+                event.set()
+
+            await event.wait()
+            return value
+
+        parser = (
+            parsing.ShlexParser(concurrent_conversion=True)
+            .add_argument("a", converters=converter)
+            .add_argument("b", converters=converter)
+            .add_option("c", "--c", converters=converter, default=None)
+        )
+
+        result = await asyncio.wait_for(parser.parse(_make_context("1 2 --c 3")), 1)
+
+        assert result == {"a": "1", "b": "2", "c": "3"}
+
+    @pytest.mark.asyncio
+    async def test_parse_when_concurrent_raises_errors_in_declaration_order(self) -> None:
+        async def first_converter(_: str) -> str:
+            await asyncio.sleep(0.01)
+            error_message = "first"
+            raise ValueError(error_message)
+
+        async def second_converter(_: str) -> str:
+            error_message = "second"
+            raise ValueError(error_message)
+
+        parser = (
+            parsing.ShlexParser(concurrent_conversion=True)
+            .add_option("a", "--a", converters=first_converter, default=None)
+            .add_argument("b", converters=second_converter)
+        )
+
+        with pytest.raises(tanjun.ConversionError) as exc:
+            await parser.parse(_make_context("--a 1 2"))
+
+        assert exc.value.parameter == "a"
+
+    @pytest.mark.parametrize("concurrent_conversion", [True, False])
+    @pytest.mark.asyncio
+    async def test_parse_raises_conversion_error_before_later_missing_argument(
+        self, concurrent_conversion: bool
+    ) -> None:
+        parser = (
+            parsing.ShlexParser(concurrent_conversion=concurrent_conversion)
+            .add_argument("a", converters=int)
+            .add_argument("b")
+        )
+
+        with pytest.raises(tanjun.ConversionError) as exc:
+            await parser.parse(_make_context("meow"))
+
+        assert exc.value.parameter == "a"
+
+    @pytest.mark.parametrize("concurrent_conversion", [True, False])
+    @pytest.mark.asyncio
+    async def test_parse_raises_missing_argument_after_successful_conversions(
+        self, concurrent_conversion: bool
+    ) -> None:
+        parser = (
+            parsing.ShlexParser(concurrent_conversion=concurrent_conversion)
+            .add_argument("a", converters=int)
+            .add_argument("b")
+            .add_argument("c", converters=int)
+        )
+
+        with pytest.raises(tanjun.NotEnoughArgumentsError) as exc:
+            await parser.parse(_make_context("123"))
+
+        assert exc.value.parameter == "b"
+
+    @pytest.mark.asyncio
+    async def test_parse_when_not_concurrent_stops_at_first_error(self) -> None:
+        mock_converter = mock.Mock(return_value="ok")
+        parser = parsing.ShlexParser().add_argument("a", converters=int).add_argument("b", converters=mock_converter)
+
+        with pytest.raises(tanjun.ConversionError):
+            await parser.parse(_make_context("meow nyaa"))
+
+        mock_converter.assert_not_called()
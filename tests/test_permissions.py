@@ -31,8 +31,583 @@
 # pyright: reportPrivateUsage=none
 # This leads to too many false-positives around mocks.
 
+import time
+from unittest import mock
+
+import hikari
 import pytest
 
+import tanjun
+from tanjun import permissions
+
+
+def _member(guild_id: int = 123, user_id: int = 456, role_ids: list[int] | None = None) -> mock.Mock:
+    member = mock.Mock(hikari.Member, guild_id=hikari.Snowflake(guild_id), role_ids=role_ids or [])
+    member.user.id = hikari.Snowflake(user_id)
+    return member
+
+
+class TestPermissionsCache:
+    def test_init_when_max_members_too_small(self) -> None:
+        with pytest.raises(ValueError, match="max_members must be greater than 0"):
+            permissions.PermissionsCache(max_members=0)
+
+    def test_init_when_expire_after_too_small(self) -> None:
+        with pytest.raises(ValueError, match="expire_after must be more than 0 seconds"):
+            permissions.PermissionsCache(expire_after=0)
+
+    def test_add_to_client(self) -> None:
+        cache = permissions.PermissionsCache()
+        client = mock.Mock(tanjun.Client)
+        client.set_type_dependency.return_value = client
+        client.add_listener.return_value = client
+
+        cache.add_to_client(client)
+
+        client.set_type_dependency.assert_called_once_with(permissions.PermissionsCache, cache)
+        client.add_listener.assert_has_calls(
+            [
+                mock.call(hikari.GuildUpdateEvent, cache._on_guild_event),
+                mock.call(hikari.GuildAvailableEvent, cache._on_guild_event),
+                mock.call(hikari.GuildLeaveEvent, cache._on_guild_event),
+                mock.call(hikari.RoleUpdateEvent, cache._on_guild_event),
+                mock.call(hikari.RoleDeleteEvent, cache._on_guild_event),
+                mock.call(hikari.MemberUpdateEvent, cache._on_member_event),
+                mock.call(hikari.MemberDeleteEvent, cache._on_member_event),
+                mock.call(hikari.GuildChannelUpdateEvent, cache._on_channel_event),
+                mock.call(hikari.GuildChannelDeleteEvent, cache._on_channel_event),
+                mock.call(hikari.ShardReadyEvent, cache._on_shard_ready),
+            ]
+        )
+
+    def test_get_and_set(self) -> None:
+        cache = permissions.PermissionsCache()
+        member = _member(role_ids=[1, 2])
+
+        cache.set(member, None, hikari.Permissions.SEND_MESSAGES)
+        cache.set(member, hikari.Snowflake(789), hikari.Permissions.NONE)
+
+        assert cache.get(member, None) is hikari.Permissions.SEND_MESSAGES
+        assert cache.get(member, hikari.Snowflake(789)) is hikari.Permissions.NONE
+        assert cache.get(member, hikari.Snowflake(321)) is None
+        assert cache.get(_member(user_id=654), None) is None
+        assert cache.get(_member(guild_id=987), None) is None
+
+    def test_get_when_expired(self) -> None:
+        cache = permissions.PermissionsCache(expire_after=60)
+        member = _member()
+
+        with mock.patch.object(time, "monotonic", return_value=1000.0):
+            cache.set(member, None, hikari.Permissions.SEND_MESSAGES)
+
+        with mock.patch.object(time, "monotonic", return_value=1059.0):
+            assert cache.get(member, None) is hikari.Permissions.SEND_MESSAGES
+
+        with mock.patch.object(time, "monotonic", return_value=1061.0):
+            assert cache.get(member, None) is None
+
+    def test_set_when_generation_outdated(self) -> None:
+        cache = permissions.PermissionsCache()
+        generation_1 = cache.get_generation(1)
+        generation_2 = cache.get_generation(2)
+
+        cache.clear(1)
+        cache.set(_member(guild_id=1), None, hikari.Permissions.SEND_MESSAGES, generation=generation_1)
+        cache.set(_member(guild_id=2), None, hikari.Permissions.SEND_MESSAGES, generation=generation_2)
+
+        assert cache.get(_member(guild_id=1), None) is None
+        assert cache.get(_member(guild_id=2), None) is hikari.Permissions.SEND_MESSAGES
+
+    def test_set_when_generation_outdated_by_full_clear(self) -> None:
+        cache = permissions.PermissionsCache()
+        generation = cache.get_generation(1)
+
+        cache.clear()
+        cache.set(_member(guild_id=1), None, hikari.Permissions.SEND_MESSAGES, generation=generation)
+
+        assert cache.get(_member(guild_id=1), None) is None
+
+    def test_get_when_role_ids_changed(self) -> None:
+        cache = permissions.PermissionsCache()
+        cache.set(_member(role_ids=[1, 2]), None, hikari.Permissions.SEND_MESSAGES)
+
+        assert cache.get(_member(role_ids=[2, 1]), None) is hikari.Permissions.SEND_MESSAGES
+        assert cache.get(_member(role_ids=[1]), None) is None
+
+    def test_set_when_role_ids_changed(self) -> None:
+        cache = permissions.PermissionsCache()
+        cache.set(_member(role_ids=[1]), None, hikari.Permissions.SEND_MESSAGES)
+
+        cache.set(_member(role_ids=[1, 2]), hikari.Snowflake(789), hikari.Permissions.ADD_REACTIONS)
+
+        assert cache.get(_member(role_ids=[1, 2]), None) is None
+        assert cache.get(_member(role_ids=[1, 2]), hikari.Snowflake(789)) is hikari.Permissions.ADD_REACTIONS
+
+    def test_set_evicts_members_past_max_members(self) -> None:
+        cache = permissions.PermissionsCache(max_members=1)
+        cache.set(_member(user_id=1), None, hikari.Permissions.SEND_MESSAGES)
+
+        cache.set(_member(user_id=2), None, hikari.Permissions.SEND_MESSAGES)
+
+        assert cache.get(_member(user_id=1), None) is None
+        assert cache.get(_member(user_id=2), None) is hikari.Permissions.SEND_MESSAGES
+
+    def test_clear(self) -> None:
+        cache = permissions.PermissionsCache()
+        cache.set(_member(guild_id=1), None, hikari.Permissions.SEND_MESSAGES)
+        cache.set(_member(guild_id=2), None, hikari.Permissions.SEND_MESSAGES)
+
+        cache.clear()
+
+        assert cache.get(_member(guild_id=1), None) is None
+        assert cache.get(_member(guild_id=2), None) is None
+
+    def test_clear_for_guild(self) -> None:
+        cache = permissions.PermissionsCache()
+        cache.set(_member(guild_id=1), None, hikari.Permissions.SEND_MESSAGES)
+        cache.set(_member(guild_id=2), None, hikari.Permissions.SEND_MESSAGES)
+
+        cache.clear(1)
+
+        assert cache.get(_member(guild_id=1), None) is None
+        assert cache.get(_member(guild_id=2), None) is hikari.Permissions.SEND_MESSAGES
+
+    @pytest.mark.asyncio
+    async def test__on_guild_event(self) -> None:
+        cache = permissions.PermissionsCache()
+        cache.set(_member(guild_id=1), None, hikari.Permissions.SEND_MESSAGES)
+        cache.set(_member(guild_id=2), None, hikari.Permissions.SEND_MESSAGES)
+
+        await cache._on_guild_event(mock.Mock(hikari.RoleUpdateEvent, guild_id=hikari.Snowflake(1)))
+
+        assert cache.get(_member(guild_id=1), None) is None
+        assert cache.get(_member(guild_id=2), None) is hikari.Permissions.SEND_MESSAGES
+
+    @pytest.mark.asyncio
+    async def test__on_member_event(self) -> None:
+        cache = permissions.PermissionsCache()
+        cache.set(_member(user_id=1), None, hikari.Permissions.SEND_MESSAGES)
+        cache.set(_member(user_id=2), None, hikari.Permissions.SEND_MESSAGES)
+
+        await cache._on_member_event(
+            mock.Mock(hikari.MemberUpdateEvent, guild_id=hikari.Snowflake(123), user_id=hikari.Snowflake(1))
+        )
+        await cache._on_member_event(
+            mock.Mock(hikari.MemberDeleteEvent, guild_id=hikari.Snowflake(321), user_id=hikari.Snowflake(2))
+        )
+
+        assert cache.get(_member(user_id=1), None) is None
+        assert cache.get(_member(user_id=2), None) is hikari.Permissions.SEND_MESSAGES
+
+    @pytest.mark.asyncio
+    async def test__on_channel_event(self) -> None:
+        cache = permissions.PermissionsCache()
+        member = _member()
+        cache.set(member, None, hikari.Permissions.SEND_MESSAGES)
+        cache.set(member, hikari.Snowflake(1), hikari.Permissions.SEND_MESSAGES)
+        cache.set(member, hikari.Snowflake(2), hikari.Permissions.SEND_MESSAGES, parent_id=hikari.Snowflake(1))
+        cache.set(member, hikari.Snowflake(3), hikari.Permissions.SEND_MESSAGES)
+
+        await cache._on_channel_event(
+            mock.Mock(hikari.GuildChannelUpdateEvent, guild_id=hikari.Snowflake(123), channel_id=hikari.Snowflake(1))
+        )
+
+        assert cache.get(member, None) is hikari.Permissions.SEND_MESSAGES
+        assert cache.get(member, hikari.Snowflake(1)) is None
+        assert cache.get(member, hikari.Snowflake(2)) is None
+        assert cache.get(member, hikari.Snowflake(3)) is hikari.Permissions.SEND_MESSAGES
+
+    @pytest.mark.asyncio
+    async def test__on_shard_ready(self) -> None:
+        cache = permissions.PermissionsCache()
+        cache.set(_member(), None, hikari.Permissions.SEND_MESSAGES)
+
+        await cache._on_shard_ready(mock.Mock())
+
+        assert cache.get(_member(), None) is None
+
+
+class TestOwnPermissionsCache:
+    def test_add_to_client(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        client = mock.Mock(tanjun.Client)
+        client.set_type_dependency.return_value = client
+        client.add_listener.return_value = client
+
+        cache.add_to_client(client)
+
+        client.set_type_dependency.assert_called_once_with(permissions.OwnPermissionsCache, cache)
+        client.add_listener.assert_has_calls(
+            [
+                mock.call(hikari.GuildUpdateEvent, cache._on_guild_event),
+                mock.call(hikari.GuildAvailableEvent, cache._on_guild_event),
+                mock.call(hikari.GuildLeaveEvent, cache._on_guild_event),
+                mock.call(hikari.RoleUpdateEvent, cache._on_guild_event),
+                mock.call(hikari.RoleDeleteEvent, cache._on_guild_event),
+                mock.call(hikari.GuildChannelUpdateEvent, cache._on_guild_event),
+                mock.call(hikari.GuildChannelDeleteEvent, cache._on_guild_event),
+                mock.call(hikari.MemberUpdateEvent, cache._on_member_update),
+                mock.call(hikari.ShardReadyEvent, cache._on_shard_ready),
+            ]
+        )
+
+    def test_add_to_client_learns_own_user_from_cache(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        client = mock.Mock(tanjun.Client)
+        client.set_type_dependency.return_value = client
+        client.add_listener.return_value = client
+        client.cache.get_me.return_value = mock.Mock(id=hikari.Snowflake(999))
+
+        cache.add_to_client(client)
+
+        assert cache._user_id == 999
+        client.get_type_dependency.assert_not_called()
+
+    def test_add_to_client_learns_own_user_from_lazy_constant(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        client = mock.Mock(tanjun.Client, cache=None)
+        client.set_type_dependency.return_value = client
+        client.add_listener.return_value = client
+        client.get_type_dependency.return_value.get_value.return_value = mock.Mock(id=hikari.Snowflake(999))
+
+        cache.add_to_client(client)
+
+        assert cache._user_id == 999
+        client.get_type_dependency.assert_called_once_with(
+            tanjun.dependencies.LazyConstant[hikari.OwnUser], default=None
+        )
+
+    def test_add_to_client_when_own_user_unknown(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        client = mock.Mock(tanjun.Client)
+        client.set_type_dependency.return_value = client
+        client.add_listener.return_value = client
+        client.cache.get_me.return_value = None
+        client.get_type_dependency.return_value = None
+
+        cache.add_to_client(client)
+
+        assert cache._user_id is None
+
+    def test_get_and_set(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+
+        cache.set(123, 456, hikari.Permissions.NONE)
+        cache.set(123, 789, hikari.Permissions.SEND_MESSAGES)
+
+        assert cache.get(123, 456) is hikari.Permissions.NONE
+        assert cache.get(123, 789) is hikari.Permissions.SEND_MESSAGES
+        assert cache.get(123, 321) is None
+        assert cache.get(321, 456) is None
+
+    def test_clear(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        cache.set(1, 456, hikari.Permissions.SEND_MESSAGES)
+        cache.set(2, 456, hikari.Permissions.SEND_MESSAGES)
+
+        cache.clear(1)
+
+        assert cache.get(1, 456) is None
+        assert cache.get(2, 456) is hikari.Permissions.SEND_MESSAGES
+
+        cache.clear()
+
+        assert cache.get(2, 456) is None
+
+    def test_set_when_generation_outdated(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        generation = cache.get_generation(123)
+        other_generation = cache.get_generation(321)
+
+        cache.clear(123)
+        cache.set(123, 456, hikari.Permissions.SEND_MESSAGES, generation=generation)
+        cache.set(321, 456, hikari.Permissions.SEND_MESSAGES, generation=other_generation)
+
+        assert cache.get(123, 456) is None
+        assert cache.get(321, 456) is hikari.Permissions.SEND_MESSAGES
+
+    def test_set_when_generation_outdated_by_full_clear(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        generation = cache.get_generation(123)
+
+        cache.clear()
+        cache.set(123, 456, hikari.Permissions.SEND_MESSAGES, generation=generation)
+
+        assert cache.get(123, 456) is None
+
+    @pytest.mark.asyncio
+    async def test__on_guild_event(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        cache.set(1, 456, hikari.Permissions.SEND_MESSAGES)
+        cache.set(2, 456, hikari.Permissions.SEND_MESSAGES)
+
+        await cache._on_guild_event(mock.Mock(hikari.GuildChannelUpdateEvent, guild_id=hikari.Snowflake(1)))
+
+        assert cache.get(1, 456) is None
+        assert cache.get(2, 456) is hikari.Permissions.SEND_MESSAGES
+
+    @pytest.mark.asyncio
+    async def test__on_member_update(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        await cache._on_shard_ready(mock.Mock(hikari.ShardReadyEvent, my_user=mock.Mock(id=hikari.Snowflake(999))))
+        cache.set(1, 456, hikari.Permissions.SEND_MESSAGES)
+        cache.set(2, 456, hikari.Permissions.SEND_MESSAGES)
+
+        await cache._on_member_update(
+            mock.Mock(hikari.MemberUpdateEvent, guild_id=hikari.Snowflake(1), user_id=hikari.Snowflake(888))
+        )
+        await cache._on_member_update(
+            mock.Mock(hikari.MemberUpdateEvent, guild_id=hikari.Snowflake(2), user_id=hikari.Snowflake(999))
+        )
+
+        assert cache.get(1, 456) is hikari.Permissions.SEND_MESSAGES
+        assert cache.get(2, 456) is None
+
+    @pytest.mark.asyncio
+    async def test__on_member_update_when_own_user_unknown(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        cache.set(1, 456, hikari.Permissions.SEND_MESSAGES)
+
+        await cache._on_member_update(
+            mock.Mock(hikari.MemberUpdateEvent, guild_id=hikari.Snowflake(1), user_id=hikari.Snowflake(888))
+        )
+
+        assert cache.get(1, 456) is None
+
+    @pytest.mark.asyncio
+    async def test__on_shard_ready(self) -> None:
+        cache = permissions.OwnPermissionsCache()
+        cache.set(1, 456, hikari.Permissions.SEND_MESSAGES)
+
+        await cache._on_shard_ready(mock.Mock(hikari.ShardReadyEvent, my_user=mock.Mock(id=hikari.Snowflake(999))))
+
+        assert cache.get(1, 456) is None
+
+
+class TestGuildRolesCache:
+    def test_add_to_client(self) -> None:
+        cache = permissions.GuildRolesCache()
+        client = mock.Mock(tanjun.Client)
+        client.set_type_dependency.return_value = client
+        client.add_listener.return_value = client
+
+        cache.add_to_client(client)
+
+        client.set_type_dependency.assert_called_once_with(permissions.GuildRolesCache, cache)
+        client.add_listener.assert_has_calls(
+            [
+                mock.call(hikari.GuildAvailableEvent, cache._on_guild_event),
+                mock.call(hikari.GuildJoinEvent, cache._on_guild_event),
+                mock.call(hikari.GuildUpdateEvent, cache._on_guild_event),
+                mock.call(hikari.GuildLeaveEvent, cache._on_guild_leave),
+                mock.call(hikari.RoleCreateEvent, cache._on_role_event),
+                mock.call(hikari.RoleUpdateEvent, cache._on_role_event),
+                mock.call(hikari.RoleDeleteEvent, cache._on_role_delete),
+                mock.call(hikari.ShardReadyEvent, cache._on_shard_ready),
+            ]
+        )
+
+    def test_get_everyone_role(self) -> None:
+        cache = permissions.GuildRolesCache()
+        cache.set_roles(123, _ROLES.values())
+
+        assert cache.get_everyone_role(123) is _ROLES[hikari.Snowflake(123)]
+        assert cache.get_everyone_role(321) is None
+
+    def test_get_sorted_roles(self) -> None:
+        cache = permissions.GuildRolesCache()
+        roles = [mock.Mock(id=hikari.Snowflake(id_), position=position) for id_, position in [(1, 2), (2, 0), (3, 5)]]
+        cache.set_roles(123, roles)
+
+        assert cache.get_sorted_roles(123) == [roles[2], roles[0], roles[1]]
+        assert cache.get_sorted_roles(321) is None
+
+    def test_get_top_role_id(self) -> None:
+        cache = permissions.GuildRolesCache()
+        roles = [mock.Mock(id=hikari.Snowflake(id_), position=position) for id_, position in [(1, 2), (2, 0), (3, 5)]]
+        cache.set_roles(123, roles)
+
+        assert cache.get_top_role_id(123, [hikari.Snowflake(1), hikari.Snowflake(2)]) == 1
+        assert cache.get_top_role_id(123, [hikari.Snowflake(1), hikari.Snowflake(3)]) == 3
+        assert cache.get_top_role_id(123, [hikari.Snowflake(1), hikari.Snowflake(4)]) is None
+        assert cache.get_top_role_id(123, []) is None
+        assert cache.get_top_role_id(321, [hikari.Snowflake(1)]) is None
+
+    def test_clear(self) -> None:
+        cache = permissions.GuildRolesCache()
+        cache.set_roles(1, [mock.Mock(id=hikari.Snowflake(1))])
+        cache.set_roles(2, [mock.Mock(id=hikari.Snowflake(2))])
+
+        cache.clear(1)
+
+        assert cache.get_everyone_role(1) is None
+        assert cache.get_everyone_role(2) is not None
+
+        cache.clear()
+
+        assert cache.get_everyone_role(2) is None
+
+    @pytest.mark.asyncio
+    async def test__on_guild_event(self) -> None:
+        cache = permissions.GuildRolesCache()
+        role = mock.Mock(id=hikari.Snowflake(123))
+
+        await cache._on_guild_event(
+            mock.Mock(hikari.GuildAvailableEvent, guild_id=hikari.Snowflake(123), roles={role.id: role})
+        )
+
+        assert cache.get_everyone_role(123) is role
+
+    @pytest.mark.asyncio
+    async def test__on_guild_leave(self) -> None:
+        cache = permissions.GuildRolesCache()
+        cache.set_roles(123, [mock.Mock(id=hikari.Snowflake(123))])
+
+        await cache._on_guild_leave(mock.Mock(hikari.GuildLeaveEvent, guild_id=hikari.Snowflake(123)))
+
+        assert cache.get_everyone_role(123) is None
+
+    @pytest.mark.asyncio
+    async def test__on_role_event(self) -> None:
+        cache = permissions.GuildRolesCache()
+        cache.set_roles(
+            123, [mock.Mock(id=hikari.Snowflake(1), position=2), mock.Mock(id=hikari.Snowflake(2), position=1)]
+        )
+        assert cache.get_top_role_id(123, [hikari.Snowflake(1), hikari.Snowflake(2)]) == 1
+        new_role = mock.Mock(id=hikari.Snowflake(2), position=3)
+
+        await cache._on_role_event(mock.Mock(hikari.RoleUpdateEvent, guild_id=hikari.Snowflake(123), role=new_role))
+        await cache._on_role_event(mock.Mock(hikari.RoleCreateEvent, guild_id=hikari.Snowflake(321), role=new_role))
+
+        assert cache.get_top_role_id(123, [hikari.Snowflake(1), hikari.Snowflake(2)]) == 2
+        assert cache.get_sorted_roles(123)[0] is new_role  # type: ignore[index]
+        assert cache.get_sorted_roles(321) is None
+
+    @pytest.mark.asyncio
+    async def test__on_role_delete(self) -> None:
+        cache = permissions.GuildRolesCache()
+        cache.set_roles(
+            123, [mock.Mock(id=hikari.Snowflake(1), position=2), mock.Mock(id=hikari.Snowflake(2), position=1)]
+        )
+        assert len(cache.get_sorted_roles(123) or ()) == 2
+
+        await cache._on_role_delete(
+            mock.Mock(hikari.RoleDeleteEvent, guild_id=hikari.Snowflake(123), role_id=hikari.Snowflake(1))
+        )
+
+        assert cache.get_top_role_id(123, [hikari.Snowflake(1)]) is None
+        assert len(cache.get_sorted_roles(123) or ()) == 1
+
+    @pytest.mark.asyncio
+    async def test__on_shard_ready(self) -> None:
+        cache = permissions.GuildRolesCache()
+        cache.set_roles(123, [mock.Mock(id=hikari.Snowflake(123))])
+
+        await cache._on_shard_ready(mock.Mock())
+
+        assert cache.get_everyone_role(123) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_everyone_permissions_uses_guild_roles_cache() -> None:
+    cache = permissions.GuildRolesCache()
+    cache.set_roles(123, _ROLES.values())
+    client = mock.Mock(tanjun.Client)
+    client.get_type_dependency.return_value = cache
+
+    result = await permissions.fetch_everyone_permissions(client, hikari.Snowflake(123))
+
+    assert result == hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES
+    client.cache.get_role.assert_not_called()
+    client.rest.fetch_roles.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_everyone_permissions_populates_guild_roles_cache() -> None:
+    cache = permissions.GuildRolesCache()
+    client = mock.Mock(tanjun.Client, cache=None)
+    client.get_type_dependency.side_effect = lambda type_, default: (
+        cache if type_ is permissions.GuildRolesCache else default
+    )
+    client.rest.fetch_roles = mock.AsyncMock(return_value=list(_ROLES.values()))
+
+    result = await permissions.fetch_everyone_permissions(client, hikari.Snowflake(123))
+
+    assert result == hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES
+    assert cache.get_everyone_role(123) is _ROLES[hikari.Snowflake(123)]
+    client.rest.fetch_roles.assert_awaited_once_with(123)
+
+
+@pytest.mark.asyncio
+async def test_fetch_permissions_uses_permissions_cache() -> None:
+    cache = permissions.PermissionsCache()
+    member = _member()
+    cache.set(member, hikari.Snowflake(789), hikari.Permissions.ADD_REACTIONS)
+    client = mock.Mock(tanjun.Client)
+    client.get_type_dependency.return_value = cache
+
+    result = await permissions.fetch_permissions(client, member, channel=789)
+
+    assert result is hikari.Permissions.ADD_REACTIONS
+    client.get_type_dependency.assert_called_once_with(permissions.PermissionsCache, default=None)
+    client.rest.fetch_guild.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_permissions_populates_permissions_cache() -> None:
+    cache = permissions.PermissionsCache()
+    member = _member()
+    client = mock.Mock(tanjun.Client, cache=None)
+    client.get_type_dependency.side_effect = lambda type_, default: (
+        cache if type_ is permissions.PermissionsCache else default
+    )
+    client.rest.fetch_guild = mock.AsyncMock(return_value=mock.Mock(owner_id=hikari.Snowflake(456)))
+
+    result = await permissions.fetch_permissions(client, member)
+
+    assert result is permissions.ALL_PERMISSIONS
+    assert cache.get(member, None) is permissions.ALL_PERMISSIONS
+    client.rest.fetch_guild.assert_awaited_once_with(123)
+
+
+@pytest.mark.asyncio
+async def test_fetch_permissions_when_invalidated_during_fetch() -> None:
+    cache = permissions.PermissionsCache()
+    member = _member()
+    client = mock.Mock(tanjun.Client, cache=None)
+    client.get_type_dependency.side_effect = lambda type_, default: (
+        cache if type_ is permissions.PermissionsCache else default
+    )
+    guild = mock.Mock(owner_id=hikari.Snowflake(456))
+
+    async def fetch_guild(_: hikari.Snowflake) -> mock.Mock:
+        await cache._on_guild_event(mock.Mock(hikari.RoleUpdateEvent, guild_id=hikari.Snowflake(123)))
+        return guild
+
+    client.rest.fetch_guild = mock.AsyncMock(side_effect=fetch_guild)
+
+    result = await permissions.fetch_permissions(client, member)
+
+    assert result is permissions.ALL_PERMISSIONS
+    assert cache.get(member, None) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_permissions_when_channel_object_bypasses_permissions_cache() -> None:
+    cache = permissions.PermissionsCache()
+    member = _member()
+    cache.set(member, hikari.Snowflake(789), hikari.Permissions.NONE)
+    client = mock.Mock(tanjun.Client, cache=None)
+    client.get_type_dependency.side_effect = lambda type_, default: (
+        cache if type_ is permissions.PermissionsCache else default
+    )
+    client.rest.fetch_guild = mock.AsyncMock(return_value=mock.Mock(owner_id=hikari.Snowflake(456)))
+
+    result = await permissions.fetch_permissions(client, member, channel=_channel(789))
+
+    assert result is permissions.ALL_PERMISSIONS
+    assert cache.get(member, hikari.Snowflake(789)) is hikari.Permissions.NONE
+
 
 @pytest.mark.skip(reason="Not implemented")
 def test_calculate_permissions() -> None: ...
@@ -50,6 +625,101 @@ def test_calculate_permissions_when_admin_role() -> None: ...
 def test_calculate_permissions_when_no_channel() -> None: ...
 
 
+def _role(role_id: int, permissions: hikari.Permissions) -> mock.Mock:
+    return mock.Mock(hikari.Role, id=hikari.Snowflake(role_id), permissions=permissions)
+
+
+def _channel(
+    channel_id: int, *overwrites: tuple[int, hikari.Permissions, hikari.Permissions], guild_id: int = 123
+) -> mock.Mock:
+    return mock.Mock(
+        hikari.PermissibleGuildChannel,
+        id=hikari.Snowflake(channel_id),
+        guild_id=hikari.Snowflake(guild_id),
+        permission_overwrites={
+            hikari.Snowflake(id_): hikari.PermissionOverwrite(
+                id=hikari.Snowflake(id_), type=hikari.PermissionOverwriteType.ROLE, allow=allow, deny=deny
+            )
+            for id_, allow, deny in overwrites
+        },
+    )
+
+
+_ROLES = {
+    hikari.Snowflake(123): _role(123, hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES),
+    hikari.Snowflake(1): _role(1, hikari.Permissions.ADD_REACTIONS),
+    hikari.Snowflake(2): _role(2, hikari.Permissions.MANAGE_MESSAGES),
+    hikari.Snowflake(3): _role(3, hikari.Permissions.ADMINISTRATOR),
+}
+_GUILD = mock.Mock(hikari.Guild, id=hikari.Snowflake(123), owner_id=hikari.Snowflake(999))
+_CHANNELS = [
+    _channel(10),
+    _channel(11, (123, hikari.Permissions.NONE, hikari.Permissions.SEND_MESSAGES)),
+    _channel(
+        12,
+        (123, hikari.Permissions.NONE, hikari.Permissions.VIEW_CHANNEL),
+        (1, hikari.Permissions.VIEW_CHANNEL, hikari.Permissions.NONE),
+        (456, hikari.Permissions.NONE, hikari.Permissions.ADD_REACTIONS),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("user_id", "role_ids"), [(456, [1]), (456, [1, 2]), (789, [2]), (999, []), (456, [3]), (789, [])]
+)
+def test_calculate_permissions_for_channels(user_id: int, role_ids: list[int]) -> None:
+    member = _member(user_id=user_id, role_ids=role_ids)
+
+    result = permissions.calculate_permissions_for_channels(member, _GUILD, _ROLES, _CHANNELS)
+
+    assert result == {
+        channel.id: permissions.calculate_permissions(member, _GUILD, _ROLES, channel=channel) for channel in _CHANNELS
+    }
+
+
+def test_calculate_permissions_for_channels_when_member_from_other_guild() -> None:
+    with pytest.raises(ValueError, match="Member object isn't from the provided guild"):
+        permissions.calculate_permissions_for_channels(_member(guild_id=321), _GUILD, _ROLES, _CHANNELS)
+
+
+def test_calculate_permissions_for_channels_when_channel_from_other_guild() -> None:
+    with pytest.raises(ValueError, match="Channel object isn't from the provided guild"):
+        permissions.calculate_permissions_for_channels(
+            _member(user_id=999), _GUILD, _ROLES, [*_CHANNELS, _channel(13, guild_id=321)]
+        )
+
+
+@pytest.mark.parametrize("channel", [None, *_CHANNELS])
+def test_calculate_permissions_for_members(channel: hikari.PermissibleGuildChannel | None) -> None:
+    members = [
+        _member(user_id=456, role_ids=[1]),
+        _member(user_id=457, role_ids=[1]),
+        _member(user_id=789, role_ids=[1, 2]),
+        _member(user_id=790, role_ids=[2, 1]),
+        _member(user_id=999, role_ids=[]),
+        _member(user_id=111, role_ids=[3]),
+        _member(user_id=112, role_ids=[]),
+    ]
+
+    result = permissions.calculate_permissions_for_members(members, _GUILD, _ROLES, channel=channel)
+
+    assert result == {
+        member.user.id: permissions.calculate_permissions(member, _GUILD, _ROLES, channel=channel) for member in members
+    }
+
+
+def test_calculate_permissions_for_members_when_member_from_other_guild() -> None:
+    with pytest.raises(ValueError, match="Member object isn't from the provided guild"):
+        permissions.calculate_permissions_for_members([_member(), _member(guild_id=321)], _GUILD, _ROLES)
+
+
+def test_calculate_permissions_for_members_when_channel_from_other_guild() -> None:
+    with pytest.raises(ValueError, match="Channel object isn't from the provided guild"):
+        permissions.calculate_permissions_for_members(
+            [_member(user_id=999)], _GUILD, _ROLES, channel=_channel(13, guild_id=321)
+        )
+
+
 @pytest.mark.skip(reason="Not implemented")
 @pytest.mark.asyncio
 async def test_fetch_permissions() -> None: ...